@@ -0,0 +1,44 @@
+"""add reconciliation_merchant_patterns (per-user merchant-token history projection)
+
+One row per (user_id, token) caching the accepted-match history that
+``score_pattern`` would otherwise fetch with one leading-wildcard ``ILIKE`` scan
+per merchant token. The composite primary key is the conflict target for the
+seeding upsert.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0058_merchant_patterns"
+down_revision = "0057_drop_confidence_metrics"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reconciliation_merchant_patterns",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("token", sa.String(length=255), nullable=False),
+        sa.Column(
+            "history",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column("last_matched_on", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name="reconciliation_merchant_patterns_user_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id", "token", name="pk_reconciliation_merchant_patterns"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("reconciliation_merchant_patterns")
@@ -0,0 +1,37 @@
+"""add reconciliation_watermarks (per-user incremental matching high-water marks)
+
+One row per user recording the newest atomic-transaction ``created_at`` and
+journal-entry ``updated_at`` the last complete matching run considered, so an
+incremental run can restrict itself to what changed since.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0059_reconciliation_watermarks"
+down_revision = "0058_merchant_patterns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reconciliation_watermarks",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("transactions_through", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("entries_through", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name="reconciliation_watermarks_user_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id", name="pk_reconciliation_watermarks"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("reconciliation_watermarks")
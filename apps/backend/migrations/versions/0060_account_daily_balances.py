@@ -0,0 +1,293 @@
+"""add account_daily_balances (maintained per-day cumulative balance read model)
+
+One row per (user, account, currency, day with counted activity) holding the
+running debit/credit totals of the posted/reconciled journal lines dated on or
+before that day. Triggers on ``journal_lines`` and ``journal_entries`` keep it
+current inside the posting transaction; the upgrade backfills it from the
+existing ledger.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0060_account_daily_balances"
+down_revision = "0059_reconciliation_watermarks"
+branch_labels = None
+depends_on = None
+
+
+ACCOUNT_DAILY_BALANCE_DDL = """
+CREATE OR REPLACE FUNCTION fr_apply_account_daily_balance(
+    p_user_id uuid,
+    p_account_id uuid,
+    p_currency text,
+    p_balance_date date,
+    p_debit numeric,
+    p_credit numeric,
+    p_fx_debit numeric,
+    p_fx_credit numeric,
+    p_unrated integer,
+    p_lines integer
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Serialize writers per user: the seed row below copies the previous
+    -- cumulative row, which a concurrent backdated write could otherwise miss.
+    -- One lock per user (not per series) so multi-account entries cannot deadlock.
+    PERFORM pg_advisory_xact_lock(hashtextextended('account_daily_balances:' || p_user_id::text, 0));
+
+    INSERT INTO account_daily_balances (
+        user_id, account_id, currency, balance_date,
+        debit_total, credit_total, fx_debit_total, fx_credit_total,
+        unrated_line_count, line_count
+    )
+    SELECT
+        p_user_id, p_account_id, p_currency, p_balance_date,
+        COALESCE(prev.debit_total, 0), COALESCE(prev.credit_total, 0),
+        COALESCE(prev.fx_debit_total, 0), COALESCE(prev.fx_credit_total, 0),
+        COALESCE(prev.unrated_line_count, 0), COALESCE(prev.line_count, 0)
+    FROM (SELECT 1) AS seed
+    LEFT JOIN LATERAL (
+        SELECT *
+        FROM account_daily_balances
+        WHERE user_id = p_user_id
+          AND account_id = p_account_id
+          AND currency = p_currency
+          AND balance_date < p_balance_date
+        ORDER BY balance_date DESC
+        LIMIT 1
+    ) AS prev ON true
+    ON CONFLICT (user_id, account_id, currency, balance_date) DO NOTHING;
+
+    UPDATE account_daily_balances
+    SET debit_total = debit_total + p_debit,
+        credit_total = credit_total + p_credit,
+        fx_debit_total = fx_debit_total + p_fx_debit,
+        fx_credit_total = fx_credit_total + p_fx_credit,
+        unrated_line_count = unrated_line_count + p_unrated,
+        line_count = line_count + p_lines
+    WHERE user_id = p_user_id
+      AND account_id = p_account_id
+      AND currency = p_currency
+      AND balance_date >= p_balance_date;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_apply_journal_line_balance(p_line journal_lines, p_sign integer)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_status text;
+    v_user_id uuid;
+    v_entry_date date;
+BEGIN
+    SELECT status::text, user_id, entry_date
+    INTO v_status, v_user_id, v_entry_date
+    FROM journal_entries
+    WHERE id = p_line.journal_entry_id;
+
+    IF NOT FOUND OR v_status NOT IN ('posted', 'reconciled') THEN
+        RETURN;
+    END IF;
+
+    PERFORM fr_apply_account_daily_balance(
+        v_user_id,
+        p_line.account_id,
+        p_line.currency,
+        v_entry_date,
+        CASE WHEN p_line.direction::text = 'DEBIT' THEN p_sign * p_line.amount ELSE 0 END,
+        CASE WHEN p_line.direction::text = 'CREDIT' THEN p_sign * p_line.amount ELSE 0 END,
+        CASE WHEN p_line.direction::text = 'DEBIT'
+            THEN p_sign * COALESCE(p_line.amount * p_line.fx_rate, 0) ELSE 0 END,
+        CASE WHEN p_line.direction::text = 'CREDIT'
+            THEN p_sign * COALESCE(p_line.amount * p_line.fx_rate, 0) ELSE 0 END,
+        CASE WHEN p_line.fx_rate IS NULL THEN p_sign ELSE 0 END,
+        p_sign
+    );
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_apply_journal_entry_balance(
+    p_entry_id uuid,
+    p_user_id uuid,
+    p_entry_date date,
+    p_sign integer
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_series record;
+BEGIN
+    FOR v_series IN
+        SELECT
+            account_id,
+            currency,
+            COALESCE(sum(amount) FILTER (WHERE direction::text = 'DEBIT'), 0) AS debit,
+            COALESCE(sum(amount) FILTER (WHERE direction::text = 'CREDIT'), 0) AS credit,
+            COALESCE(sum(amount * fx_rate) FILTER (WHERE direction::text = 'DEBIT'), 0) AS fx_debit,
+            COALESCE(sum(amount * fx_rate) FILTER (WHERE direction::text = 'CREDIT'), 0) AS fx_credit,
+            count(*) FILTER (WHERE fx_rate IS NULL)::integer AS unrated,
+            count(*)::integer AS lines
+        FROM journal_lines
+        WHERE journal_entry_id = p_entry_id
+        GROUP BY account_id, currency
+        ORDER BY account_id, currency
+    LOOP
+        PERFORM fr_apply_account_daily_balance(
+            p_user_id,
+            v_series.account_id,
+            v_series.currency,
+            p_entry_date,
+            p_sign * v_series.debit,
+            p_sign * v_series.credit,
+            p_sign * v_series.fx_debit,
+            p_sign * v_series.fx_credit,
+            p_sign * v_series.unrated,
+            p_sign * v_series.lines
+        );
+    END LOOP;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_track_journal_line_balance()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM fr_apply_journal_line_balance(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM fr_apply_journal_line_balance(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_track_journal_entry_balance()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_old_counted boolean := OLD.status::text IN ('posted', 'reconciled');
+    v_new_counted boolean := NEW.status::text IN ('posted', 'reconciled');
+BEGIN
+    -- posted -> reconciled keeps the entry counted on the same day: no delta.
+    IF v_old_counted = v_new_counted
+        AND (NOT v_new_counted
+            OR (OLD.entry_date = NEW.entry_date AND OLD.user_id = NEW.user_id))
+    THEN
+        RETURN NULL;
+    END IF;
+
+    IF v_old_counted THEN
+        PERFORM fr_apply_journal_entry_balance(OLD.id, OLD.user_id, OLD.entry_date, -1);
+    END IF;
+    IF v_new_counted THEN
+        PERFORM fr_apply_journal_entry_balance(NEW.id, NEW.user_id, NEW.entry_date, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_journal_lines_daily_balance ON journal_lines;
+CREATE TRIGGER trg_journal_lines_daily_balance
+AFTER INSERT OR UPDATE OR DELETE ON journal_lines
+FOR EACH ROW EXECUTE FUNCTION fr_track_journal_line_balance();
+
+DROP TRIGGER IF EXISTS trg_journal_entries_daily_balance ON journal_entries;
+CREATE TRIGGER trg_journal_entries_daily_balance
+AFTER UPDATE OF status, entry_date, user_id ON journal_entries
+FOR EACH ROW EXECUTE FUNCTION fr_track_journal_entry_balance();
+"""
+
+DROP_ACCOUNT_DAILY_BALANCE_DDL = """
+DROP TRIGGER IF EXISTS trg_journal_entries_daily_balance ON journal_entries;
+DROP TRIGGER IF EXISTS trg_journal_lines_daily_balance ON journal_lines;
+DROP FUNCTION IF EXISTS fr_track_journal_entry_balance();
+DROP FUNCTION IF EXISTS fr_track_journal_line_balance();
+DROP FUNCTION IF EXISTS fr_apply_journal_entry_balance(uuid, uuid, date, integer);
+DROP FUNCTION IF EXISTS fr_apply_journal_line_balance(journal_lines, integer);
+DROP FUNCTION IF EXISTS fr_apply_account_daily_balance(uuid, uuid, text, date, numeric, numeric, numeric, numeric, integer, integer);
+"""
+
+BACKFILL_ACCOUNT_DAILY_BALANCES = """
+INSERT INTO account_daily_balances (
+    user_id, account_id, currency, balance_date,
+    debit_total, credit_total, fx_debit_total, fx_credit_total,
+    unrated_line_count, line_count
+)
+SELECT
+    user_id, account_id, currency, balance_date,
+    sum(debit) OVER series,
+    sum(credit) OVER series,
+    sum(fx_debit) OVER series,
+    sum(fx_credit) OVER series,
+    (sum(unrated) OVER series)::integer,
+    (sum(lines) OVER series)::integer
+FROM (
+    SELECT
+        e.user_id,
+        l.account_id,
+        l.currency,
+        e.entry_date AS balance_date,
+        COALESCE(sum(l.amount) FILTER (WHERE l.direction::text = 'DEBIT'), 0) AS debit,
+        COALESCE(sum(l.amount) FILTER (WHERE l.direction::text = 'CREDIT'), 0) AS credit,
+        COALESCE(sum(l.amount * l.fx_rate) FILTER (WHERE l.direction::text = 'DEBIT'), 0) AS fx_debit,
+        COALESCE(sum(l.amount * l.fx_rate) FILTER (WHERE l.direction::text = 'CREDIT'), 0) AS fx_credit,
+        count(*) FILTER (WHERE l.fx_rate IS NULL) AS unrated,
+        count(*) AS lines
+    FROM journal_lines AS l
+    JOIN journal_entries AS e ON e.id = l.journal_entry_id
+    WHERE e.status::text IN ('posted', 'reconciled')
+    GROUP BY e.user_id, l.account_id, l.currency, e.entry_date
+) AS daily
+WINDOW series AS (PARTITION BY user_id, account_id, currency ORDER BY balance_date)
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "account_daily_balances",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("account_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("balance_date", sa.Date(), nullable=False),
+        sa.Column("debit_total", sa.DECIMAL(precision=24, scale=2), nullable=False),
+        sa.Column("credit_total", sa.DECIMAL(precision=24, scale=2), nullable=False),
+        sa.Column("fx_debit_total", sa.Numeric(), nullable=False),
+        sa.Column("fx_credit_total", sa.Numeric(), nullable=False),
+        sa.Column("unrated_line_count", sa.Integer(), nullable=False),
+        sa.Column("line_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name="account_daily_balances_user_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.id"],
+            name="account_daily_balances_account_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id",
+            "account_id",
+            "currency",
+            "balance_date",
+            name="pk_account_daily_balances",
+        ),
+    )
+    op.execute(ACCOUNT_DAILY_BALANCE_DDL)
+    op.execute(BACKFILL_ACCOUNT_DAILY_BALANCES)
+
+
+def downgrade() -> None:
+    op.execute(DROP_ACCOUNT_DAILY_BALANCE_DDL)
+    op.drop_table("account_daily_balances")
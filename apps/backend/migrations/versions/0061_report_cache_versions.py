@@ -0,0 +1,123 @@
+"""add report_cache_versions (trigger-stamped ledger/pricing versions for the report cache)
+
+Every write statement on a table a balance sheet, income statement or cash
+flow reads inserts a version stamp for the touched scope — ``user:<uuid>``
+for per-user data, ``pricing`` for ``fx_rates``/``stock_prices`` — from a
+statement-level trigger; the report cache keys entries by the surviving stamp
+ids of both scopes. No backfill: a scope without stamps is simply version ().
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0061_report_cache_versions"
+down_revision = "0060_account_daily_balances"
+branch_labels = None
+depends_on = None
+
+
+REPORT_CACHE_VERSION_FUNCTION_DDL = """
+CREATE OR REPLACE FUNCTION fr_bump_report_cache_versions()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_changed text;
+BEGIN
+    -- TG_ARGV[0] selects the scope keys of the changed rows from {rows}.
+    IF TG_OP = 'INSERT' THEN
+        v_changed := replace(TG_ARGV[0], '{rows}', 'new_rows');
+    ELSIF TG_OP = 'DELETE' THEN
+        v_changed := replace(TG_ARGV[0], '{rows}', 'old_rows');
+    ELSE
+        v_changed := replace(TG_ARGV[0], '{rows}', 'old_rows')
+            || ' UNION ' || replace(TG_ARGV[0], '{rows}', 'new_rows');
+    END IF;
+
+    -- One stamp per touched scope; then drop the older stamps nobody else is
+    -- pruning right now (SKIP LOCKED: writers never wait on each other).
+    EXECUTE $sql$
+        WITH stamped AS (
+            INSERT INTO report_cache_versions (scope_key)
+            SELECT DISTINCT changed.scope_key
+            FROM ($sql$ || v_changed || $sql$) AS changed (scope_key)
+            WHERE changed.scope_key IS NOT NULL
+            RETURNING scope_key, id
+        ),
+        superseded AS (
+            SELECT v.id
+            FROM report_cache_versions AS v
+            JOIN stamped AS s ON s.scope_key = v.scope_key AND v.id < s.id
+            FOR UPDATE OF v SKIP LOCKED
+        )
+        DELETE FROM report_cache_versions
+        WHERE id IN (SELECT id FROM superseded)
+    $sql$;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_USER_ID_SCOPE = "SELECT 'user:' || user_id::text FROM {rows}"
+WATCHED_TABLE_SCOPES = {
+    "accounts": _USER_ID_SCOPE,
+    "journal_entries": _USER_ID_SCOPE,
+    "journal_lines": (
+        "SELECT 'user:' || e.user_id::text FROM {rows} AS r JOIN journal_entries AS e ON e.id = r.journal_entry_id"
+    ),
+    "atomic_transactions": _USER_ID_SCOPE,
+    "atomic_positions": _USER_ID_SCOPE,
+    "transaction_classification": (
+        "SELECT 'user:' || t.user_id::text FROM {rows} AS r JOIN atomic_transactions AS t ON t.id = r.atomic_txn_id"
+    ),
+    "reconciliation_matches": (
+        "SELECT 'user:' || t.user_id::text FROM {rows} AS r JOIN atomic_transactions AS t ON t.id = r.atomic_txn_id"
+    ),
+    "reconciliation_match_journal_entries": (
+        "SELECT 'user:' || e.user_id::text FROM {rows} AS r JOIN journal_entries AS e ON e.id = r.journal_entry_id"
+    ),
+    "managed_positions": _USER_ID_SCOPE,
+    "investment_transactions": _USER_ID_SCOPE,
+    "investment_lots": _USER_ID_SCOPE,
+    "dividend_income": _USER_ID_SCOPE,
+    "manual_valuation_snapshots": _USER_ID_SCOPE,
+    "market_data_override": _USER_ID_SCOPE,
+    "statement_price_observations": _USER_ID_SCOPE,
+    "fx_conversions": _USER_ID_SCOPE,
+    "fx_rates": "SELECT 'pricing' FROM {rows}",
+    "stock_prices": "SELECT 'pricing' FROM {rows}",
+}
+_TRIGGER_EVENTS = (
+    ("INSERT", "NEW TABLE AS new_rows"),
+    ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("DELETE", "OLD TABLE AS old_rows"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_cache_versions",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("scope_key", sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint("id", name="pk_report_cache_versions"),
+    )
+    op.create_index("ix_report_cache_versions_scope_id", "report_cache_versions", ["scope_key", "id"])
+    op.execute(REPORT_CACHE_VERSION_FUNCTION_DDL)
+    for table, scope_sql in WATCHED_TABLE_SCOPES.items():
+        argument = scope_sql.replace("'", "''")
+        for event_name, referencing in _TRIGGER_EVENTS:
+            op.execute(
+                f"CREATE TRIGGER trg_{table}_report_cache_{event_name.lower()}\n"
+                f"AFTER {event_name} ON {table}\n"
+                f"REFERENCING {referencing}\n"
+                f"FOR EACH STATEMENT EXECUTE FUNCTION fr_bump_report_cache_versions('{argument}')"
+            )
+
+
+def downgrade() -> None:
+    for table in WATCHED_TABLE_SCOPES:
+        for event_name, _ in _TRIGGER_EVENTS:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_report_cache_{event_name.lower()} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS fr_bump_report_cache_versions()")
+    op.drop_index("ix_report_cache_versions_scope_id", table_name="report_cache_versions")
+    op.drop_table("report_cache_versions")
@@ -0,0 +1,47 @@
+"""watch statement and trace-decision writes in report_cache_versions
+
+The package readiness summary is memoized with the report cache, keyed by
+the user's version; readiness also reads statement results and the tenant
+trace decisions that make a contribution authoritative, so those writes
+must bump ``user:<uuid>`` too. Reuses ``fr_bump_report_cache_versions()``
+from 0061.
+"""
+
+from alembic import op
+
+revision = "0062_report_cache_ready_scopes"
+down_revision = "0061_report_cache_versions"
+branch_labels = None
+depends_on = None
+
+
+_USER_ID_SCOPE = "SELECT 'user:' || user_id::text FROM {rows}"
+WATCHED_TABLE_SCOPES = {
+    "statement_summaries": _USER_ID_SCOPE,
+    "statement_extraction_results": _USER_ID_SCOPE,
+    "reviewed_statement_envelopes": _USER_ID_SCOPE,
+    "trace_records": "SELECT 'user:' || scope_id FROM {rows} WHERE scope_kind = 'TENANT'",
+}
+_TRIGGER_EVENTS = (
+    ("INSERT", "NEW TABLE AS new_rows"),
+    ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("DELETE", "OLD TABLE AS old_rows"),
+)
+
+
+def upgrade() -> None:
+    for table, scope_sql in WATCHED_TABLE_SCOPES.items():
+        argument = scope_sql.replace("'", "''")
+        for event_name, referencing in _TRIGGER_EVENTS:
+            op.execute(
+                f"CREATE TRIGGER trg_{table}_report_cache_{event_name.lower()}\n"
+                f"AFTER {event_name} ON {table}\n"
+                f"REFERENCING {referencing}\n"
+                f"FOR EACH STATEMENT EXECUTE FUNCTION fr_bump_report_cache_versions('{argument}')"
+            )
+
+
+def downgrade() -> None:
+    for table in WATCHED_TABLE_SCOPES:
+        for event_name, _ in _TRIGGER_EVENTS:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_report_cache_{event_name.lower()} ON {table}")
@@ -0,0 +1,25 @@
+"""add ix_journal_entries_user_entry_date_id (keyset order of the journal export)
+
+The streamed line-level journal export reads one user's entries in
+``(entry_date, id)`` order and resumes with a keyset predicate on the same
+columns; this index serves both without sorting the user's whole ledger.
+"""
+
+from alembic import op
+
+revision = "0063_journal_export_keyset_index"
+down_revision = "0062_report_cache_ready_scopes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_journal_entries_user_entry_date_id",
+        "journal_entries",
+        ["user_id", "entry_date", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_journal_entries_user_entry_date_id", table_name="journal_entries")
@@ -0,0 +1,54 @@
+"""add consistency_checks.related_txn_fingerprint + transfer-pair candidate index
+
+The consistency-check detectors decide idempotency against one set of the
+user's pending checks keyed by an order-insensitive fingerprint of
+``related_txn_ids`` instead of one JSON-equality query per candidate group.
+Existing rows are backfilled with the same SHA-256 of the sorted,
+comma-joined ids the ORM default computes.
+
+``ix_atomic_transactions_user_direction_amount_date`` serves the transfer
+detector's OUT/IN self-join on (amount, date window).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0064_consistency_fingerprints"
+down_revision = "0063_journal_export_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("consistency_checks", sa.Column("related_txn_fingerprint", sa.String(length=64), nullable=True))
+    op.execute(
+        """
+        UPDATE consistency_checks
+        SET related_txn_fingerprint = encode(
+            sha256(
+                convert_to(
+                    COALESCE(
+                        (
+                            SELECT string_agg(txn_id, ',' ORDER BY txn_id COLLATE "C")
+                            FROM jsonb_array_elements_text(related_txn_ids) AS txn_id
+                        ),
+                        ''
+                    ),
+                    'UTF8'
+                )
+            ),
+            'hex'
+        )
+        """
+    )
+    op.alter_column("consistency_checks", "related_txn_fingerprint", nullable=False)
+    op.create_index(
+        "ix_atomic_transactions_user_direction_amount_date",
+        "atomic_transactions",
+        ["user_id", "direction", "amount", "txn_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_atomic_transactions_user_direction_amount_date", table_name="atomic_transactions")
+    op.drop_column("consistency_checks", "related_txn_fingerprint")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Rebuild or verify the ledger's daily-balance read model.
+
+``account_daily_balances`` is maintained by database triggers inside every
+posting/voiding transaction, so this is an operator tool, not a cron job:
+
+* ``verify`` compares the stored rows with a recomputation from the raw
+  journal lines and exits non-zero when any series-day has drifted;
+* ``rebuild`` replaces the stored rows with that recomputation (one
+  transaction) — the repair after a reported drift.
+
+Both accept ``--user-id`` to scope the work to one user. Run from the backend
+root with ``DATABASE_URL`` set, e.g. ``python scripts/ledger_daily_balances.py verify``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from uuid import UUID
+
+
+async def _run(command: str, user_id: UUID | None) -> int:
+    from src.database import async_session_maker
+    from src.ledger import find_account_daily_balance_drift, rebuild_account_daily_balances
+
+    async with async_session_maker() as session:
+        if command == "rebuild":
+            written = await rebuild_account_daily_balances(session, user_id=user_id)
+            await session.commit()
+            print(f"Rebuilt account_daily_balances: {written} rows.")
+            return 0
+
+        drift = await find_account_daily_balance_drift(session, user_id=user_id)
+        for row in drift:
+            print(
+                f"drift user={row.user_id} account={row.account_id} currency={row.currency} "
+                f"date={row.balance_date.isoformat()} stored={row.stored} expected={row.expected}"
+            )
+        print(f"{len(drift)} drifted series-day(s).")
+        return 1 if drift else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("verify", "rebuild"))
+    parser.add_argument("--user-id", type=UUID, default=None, help="limit to one user's ledger")
+    args = parser.parse_args()
+    return asyncio.run(_run(args.command, args.user_id))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -247,6 +247,20 @@ class Settings(BaseSettings):
         description="Bridge currency used for FX cross-rate resolution.",
         json_schema_extra={"group": "App Settings"},
     )
+    market_data_provider_connections_per_host: int = Field(
+        default=4,
+        ge=1,
+        validation_alias="MARKET_DATA_PROVIDER_CONNECTIONS_PER_HOST",
+        description="Concurrent connections the shared market-data provider client opens to one provider host.",
+        json_schema_extra={"group": "App Settings"},
+    )
+    market_data_sync_concurrency: int = Field(
+        default=8,
+        ge=1,
+        validation_alias="MARKET_DATA_SYNC_CONCURRENCY",
+        description="Provider series fetched concurrently by one FX / stock price sync run.",
+        json_schema_extra={"group": "App Settings"},
+    )
     market_data_yahoo_timeout_seconds: int = Field(
         default=5,
         ge=1,
@@ -255,6 +269,65 @@ class Settings(BaseSettings):
         description="Timeout (seconds) for outbound Yahoo Finance market-data calls.",
         json_schema_extra={"group": "App Settings"},
     )
+    fx_rate_cache_max_entries: int = Field(
+        default=10_000,
+        ge=0,
+        validation_alias="FX_RATE_CACHE_MAX_ENTRIES",
+        description=(
+            "Resolved FX rates kept in the process-wide LRU cache behind get_exchange_rate/get_average_rate. "
+            "0 disables the cache."
+        ),
+        json_schema_extra={"group": "App Settings"},
+    )
+    fx_rate_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=1,
+        validation_alias="FX_RATE_CACHE_TTL_SECONDS",
+        description=(
+            "Lifetime (seconds) of a cached FX rate. In-process writes invalidate immediately; the TTL bounds "
+            "how long a rate written by another process can stay hidden."
+        ),
+        json_schema_extra={"group": "App Settings"},
+    )
+    report_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        validation_alias="REPORT_CACHE_MAX_ENTRIES",
+        description=(
+            "Generated balance sheets / income statements / cash flows kept in the process-wide report cache. "
+            "0 disables the cache."
+        ),
+        json_schema_extra={"group": "App Settings"},
+    )
+    report_cache_ttl_seconds: int = Field(
+        default=900,
+        ge=1,
+        validation_alias="REPORT_CACHE_TTL_SECONDS",
+        description=(
+            "Lifetime (seconds) of a cached report. Entries are keyed by ledger/pricing versions, so the TTL only "
+            "bounds memory held by reports nobody asks for again."
+        ),
+        json_schema_extra={"group": "App Settings"},
+    )
+    package_section_concurrency: int = Field(
+        default=4,
+        ge=1,
+        validation_alias="PACKAGE_SECTION_CONCURRENCY",
+        description=(
+            "Report package sections built concurrently, each on its own database session sharing one read "
+            "snapshot. 1 builds them one after another on the request session."
+        ),
+        json_schema_extra={"group": "App Settings"},
+    )
+    journal_export_batch_size: int = Field(
+        default=2000,
+        ge=1,
+        validation_alias="JOURNAL_EXPORT_BATCH_SIZE",
+        description=(
+            "Journal lines fetched per round trip by the server-side cursor behind the streamed journal export."
+        ),
+        json_schema_extra={"group": "App Settings"},
+    )
     redis_url: str | None = Field(
         default=None,
         validation_alias="REDIS_URL",
@@ -572,6 +645,26 @@ class Settings(BaseSettings):
         description=("EPIC-018: enable AI-assisted reconciliation scoring (default false, opt-in to avoid API costs)."),
         json_schema_extra={"group": "Feature Flags"},
     )
+    reconciliation_job_workers: int = Field(
+        default=2,
+        ge=1,
+        validation_alias="RECONCILIATION_JOB_WORKERS",
+        description=(
+            "Worker processes that score reconciliation runs off the event loop. Runs for the same user are "
+            "serialized; runs for different users score in parallel up to this count."
+        ),
+        json_schema_extra={"group": "Feature Flags"},
+    )
+    reconciliation_watermark_lag_seconds: int = Field(
+        default=300,
+        ge=0,
+        validation_alias="RECONCILIATION_WATERMARK_LAG_SECONDS",
+        description=(
+            "Incremental reconciliation stores its watermark this far behind the oldest open database "
+            "transaction, so rows stamped before a slow commit (or on a host with a skewed clock) are rescored."
+        ),
+        json_schema_extra={"group": "Feature Flags"},
+    )
     enable_ai_classification: bool = Field(
         default=False,
         description=(
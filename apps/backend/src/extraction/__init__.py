@@ -54,6 +54,7 @@ from src.extraction.base.disposition import (
     StatementDispositionPolicySnapshot,
     StatementTransaction,
 )
+from src.extraction.base.events import EVENT_TYPE as STATEMENT_POSTED_EVENT_TYPE, StatementPosted
 from src.extraction.base.result import (
     SOURCE_CAPABILITIES,
     ExtractedPositionFact,
@@ -276,6 +277,7 @@ __all__ = [
     "SourceProvenance",
     "SYSTEM_PROMPT",
     "Stage1Status",
+    "STATEMENT_POSTED_EVENT_TYPE",
     "StatementIngestionConfigurationError",
     "StatementIngestionError",
     "StatementIngestionOutcome",
@@ -286,6 +288,7 @@ __all__ = [
     "StatementEvidenceType",
     "StatementExtractionResult",
     "StatementPostingDependencies",
+    "StatementPosted",
     "StatementPostingOutcome",
     "StatementPostingStatus",
     "StatementSourceType",
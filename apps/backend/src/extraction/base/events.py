@@ -0,0 +1,59 @@
+"""``StatementPosted`` — the domain event announcing a posted statement.
+
+Published by ``auto_create_posted_entries_for_statement`` through the platform
+outbox once a statement's Layer-2 transactions have been turned into posted
+journal entries, in the same session as those writes (the outbox row commits
+or rolls back with them). Downstream reactors — reconciliation's incremental
+matching run first — subscribe by ``EVENT_TYPE`` and never call back into
+extraction: the payload carries the statement id and owner only, and the
+consumer reads its own watermark to decide what is new.
+
+``statement_id`` doubles as the natural dedup key for at-least-once delivery.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.platform.base import DomainEvent
+
+#: The stable, namespaced routing key the bus/relay dispatch this event on.
+EVENT_TYPE = "extraction.StatementPosted"
+
+
+@dataclass(frozen=True)
+class StatementPosted(DomainEvent):
+    """A fact: statement ``statement_id`` posted ``created_count`` journal entries for ``user_id``."""
+
+    statement_id: UUID
+    user_id: UUID
+    created_count: int
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        statement_id: UUID,
+        user_id: UUID,
+        created_count: int,
+        occurred_at: datetime,
+    ) -> StatementPosted:
+        """Build a ``StatementPosted`` with the fixed ``extraction.StatementPosted`` type."""
+        return cls(
+            event_type=EVENT_TYPE,
+            occurred_at=occurred_at,
+            statement_id=statement_id,
+            user_id=user_id,
+            created_count=created_count,
+        )
+
+    def payload(self) -> dict:
+        """JSON body persisted to the outbox."""
+        return {
+            "aggregate_id": str(self.statement_id),
+            "statement_id": str(self.statement_id),
+            "user_id": str(self.user_id),
+            "created_count": self.created_count,
+        }
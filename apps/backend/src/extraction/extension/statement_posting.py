@@ -31,6 +31,7 @@ from src.extraction.base.disposition import (
     StatementTransaction,
     intent_matches_counter_account,
 )
+from src.extraction.base.events import StatementPosted
 from src.extraction.base.types import (
     StatementIngestionConfigurationError,
     StatementPostingOutcome,
@@ -56,9 +57,12 @@ from src.ledger import (
     current_anchored_journal_entries,
 )
 from src.observability import get_logger
+from src.platform import OutboxEventBus
 
 logger = get_logger(__name__)
 
+SOURCE_PKG = "extraction"
+
 HIGH_CONFIDENCE_AUTO_APPROVE_THRESHOLD = 85
 
 # "Which of these atomic txns are already covered by an accepted transfer
@@ -323,6 +327,16 @@ async def auto_create_posted_entries_for_statement(
         )
         created += 1
 
+    # Enqueued in the posting session, so the event commits with the entries;
+    # reconciliation's incremental run reacts once the relay drains it.
+    OutboxEventBus(db, source_pkg=SOURCE_PKG).publish(
+        StatementPosted.create(
+            statement_id=statement.id,
+            user_id=user_id,
+            created_count=created,
+            occurred_at=datetime.now(UTC),
+        )
+    )
     return StatementPostingOutcome(status=StatementPostingStatus.POSTED, created_count=created)
 
 
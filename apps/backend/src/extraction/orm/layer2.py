@@ -68,6 +68,7 @@ class AtomicTransaction(Base, UUIDMixin, UserOwnedMixin, TimestampMixin):
     __table_args__ = (
         UniqueConstraint("user_id", "dedup_hash", name="uq_atomic_transactions_user_dedup_hash"),
         CheckConstraint("amount > 0", name="ck_atomic_transactions_amount_positive"),
+        Index("ix_atomic_transactions_user_direction_amount_date", "user_id", "direction", "amount", "txn_date"),
     )
 
     txn_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -47,11 +47,19 @@ if TYPE_CHECKING:
         validate_journal_posting_invariants,
     )
     from src.ledger.data import (
+        JOURNAL_EXPORT_COLUMNS,
+        AccountCurrencyTotals,
+        AccountDailyBalanceDrift,
+        JournalExportCursor,
         StatementCoverageRow,
         calculate_account_balance,
         calculate_account_balances,
         calculate_account_balances_in_base_currency,
+        find_account_daily_balance_drift,
+        load_account_currency_totals,
+        rebuild_account_daily_balances,
         register_statement_coverage_reader,
+        stream_journal_lines,
         verify_accounting_equation,
     )
     from src.ledger.extension import (
@@ -87,6 +95,9 @@ if TYPE_CHECKING:
 # re-exported here: the provenance/trust vocabulary is owned by ``audit``
 # (``from src.audit import JournalEntrySourceType``).
 from src.ledger.orm.account import Account, AccountType
+from src.ledger.orm.daily_balance import (
+    AccountDailyBalance as _AccountDailyBalance,  # noqa: F401  (mapper registration)
+)
 from src.ledger.orm.journal import (
     ConfidenceTier,
     Direction,
@@ -101,6 +112,8 @@ from src.ledger.orm.journal import (
 
 __all__ = [
     "Account",
+    "AccountCurrencyTotals",
+    "AccountDailyBalanceDrift",
     "AccountNotFoundError",
     "AccountType",
     "AccountingError",
@@ -113,10 +126,12 @@ __all__ = [
     "DecisionAnchorError",
     "Direction",
     "Entry",
+    "JOURNAL_EXPORT_COLUMNS",
     "JournalAuditLog",
     "JournalEntry",
     "JournalEntryAuthorityState",
     "JournalEntryStatus",
+    "JournalExportCursor",
     "JournalLine",
     "JournalLineContribution",
     "LedgerError",
@@ -139,6 +154,7 @@ __all__ = [
     "create_transfer_out_entry",
     "derive_confidence_tier",
     "detect_transfer_pattern",
+    "find_account_daily_balance_drift",
     "find_transfer_pairs",
     "get_account_statement_coverage",
     "get_opening_balance_readiness",
@@ -149,14 +165,17 @@ __all__ = [
     "ledger_trace_policy_registry",
     "list_journal_contributions",
     "list_processing_transfer_legs",
+    "load_account_currency_totals",
     "post_entry",
     "submit_anchored_journal_entry",
     "submit_manual_journal_entry",
     "validate_manual_journal_entry_for_post",
     "post_journal_entry",
     "post_opening_balance_entry",
+    "rebuild_account_daily_balances",
     "register_fx_revaluation_provider",
     "register_statement_coverage_reader",
+    "stream_journal_lines",
     "used_currencies",
     "worst_confidence_tier",
     "validate_fx_rates",
@@ -219,13 +238,21 @@ _EXTENSION_NAMES = {
     "void_journal_entry",
 }
 _DATA_NAMES = {
+    "AccountCurrencyTotals",
+    "AccountDailyBalanceDrift",
     "DEFAULT_STALE_AFTER_DAYS",
+    "JOURNAL_EXPORT_COLUMNS",
+    "JournalExportCursor",
     "StatementCoverageRow",
     "calculate_account_balance",
     "get_account_statement_coverage",
     "calculate_account_balances",
     "calculate_account_balances_in_base_currency",
+    "find_account_daily_balance_drift",
+    "load_account_currency_totals",
+    "rebuild_account_daily_balances",
     "register_statement_coverage_reader",
+    "stream_journal_lines",
     "verify_accounting_equation",
 }
 
@@ -0,0 +1,306 @@
+"""``transfer_pairing`` — the transfer-pairing engine over Processing legs (base layer).
+
+Pure half of ``find_transfer_pairs``: given the Transfer OUT legs (Processing
+debited) and Transfer IN legs (Processing credited) of one user, pick the set of
+pairs whose summed ``_calculate_pair_confidence`` is maximal, subject to every
+pair clearing the threshold and every leg being used at most once.
+
+The confidence is ``0.40 * amount + 0.30 * description + 0.20 * date`` (history
+is always 0), so with the description at its ceiling of 100 a pair can only
+clear ``threshold`` when its amount and date scores are close enough. The engine
+turns that bound into search windows instead of scoring every OUT × IN
+combination:
+
+1. IN legs are bucketed by (Processing-line currency, entry date) and each
+   bucket keeps its amounts sorted;
+2. each OUT leg sweeps only the day buckets whose date score can still reach the
+   threshold, and inside each bucket bisects the amount band whose amount score
+   can (tighter for farther days);
+3. only the survivors get the exact confidence — the expensive description
+   comparison included, and skipped too when the caller supplies a cheap
+   description ceiling that already rules the pair out;
+4. the surviving edges fall apart into small connected components, and each is
+   solved as a max-weight bipartite assignment (Hungarian algorithm).
+
+Pruning is conservative: every pair the windows skip would have scored below
+the threshold, so the result is the optimum over all pairs. The one exception
+is a component larger than ``_MAX_ASSIGNMENT_LEGS`` (e.g. hundreds of identical
+standing-order transfers on one day): the O(k³) assignment is not affordable
+there, so its edges are taken greedily, best confidence first.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from math import inf
+from typing import Any
+from uuid import UUID
+
+from src.ledger.base.processing import (
+    AMOUNT_WEIGHT,
+    DATE_WEIGHT,
+    DESCRIPTION_WEIGHT,
+    TransferPair,
+    _calculate_pair_confidence,
+    _score_date_proximity,
+)
+
+# Date scores are flat (0) from this many days apart onwards.
+_DATE_SCORE_HORIZON = 10
+# The amount-score ladder of ``_score_amount_match``, loosest first: (max diff, score).
+_AMOUNT_STEPS = ((5.0, 70.0), (1.0, 85.0), (0.10, 95.0), (0.01, 100.0))
+# Any anchor day: date scores only depend on the gap.
+_EPOCH = date(2000, 1, 1)
+# Slack that keeps float window arithmetic conservative against the Decimal scorers.
+_SLACK = 1e-6
+# Components with more legs than this are paired greedily instead of by assignment.
+_MAX_ASSIGNMENT_LEGS = 128
+
+
+@dataclass(frozen=True)
+class TransferLeg:
+    """One Transfer OUT / IN journal entry and the Processing line its score reads."""
+
+    entry: Any  # the ``JournalEntry``; base cannot import the ORM
+    currency: str
+    amount: Decimal
+
+
+def _amount_reach(min_score: float, out_amount: float) -> float:
+    """Largest |out - in| whose amount score can still reach ``min_score``."""
+    if min_score <= 0:
+        return inf
+    step = -1.0
+    for max_diff, score in _AMOUNT_STEPS:
+        if score >= min_score - _SLACK:
+            step = max_diff
+            break
+    # Proportional tail: round(100 - diff / out * 100, 2) >= min_score.
+    proportional = (100.0 - min_score + 0.01) / 100.0 * out_amount
+    return max(step, proportional)
+
+
+def _amount_ceiling(out_amount: float, diff: float) -> float:
+    """A value never below ``_score_amount_match`` for amounts ``diff`` apart."""
+    proportional = 100.0 - diff / out_amount * 100.0 + 0.01 if out_amount > 0 else 0.0
+    for max_diff, score in reversed(_AMOUNT_STEPS):
+        if diff <= max_diff + _SLACK:
+            return max(score, proportional)
+    return proportional
+
+
+def _min_cost_assignment(cost: list[list[int]]) -> list[int]:
+    """Hungarian algorithm: column assigned to each row of a rows <= cols matrix."""
+    rows, cols = len(cost), len(cost[0])
+    u = [0] * (rows + 1)
+    v = [0] * (cols + 1)
+    owner = [0] * (cols + 1)
+    way = [0] * (cols + 1)
+    for row in range(1, rows + 1):
+        owner[0] = row
+        col0 = 0
+        minv = [inf] * (cols + 1)
+        used = [False] * (cols + 1)
+        while True:
+            used[col0] = True
+            row0 = owner[col0]
+            delta = inf
+            col1 = 0
+            for col in range(1, cols + 1):
+                if not used[col]:
+                    reduced = cost[row0 - 1][col - 1] - u[row0] - v[col]
+                    if reduced < minv[col]:
+                        minv[col] = reduced
+                        way[col] = col0
+                    if minv[col] < delta:
+                        delta = minv[col]
+                        col1 = col
+            for col in range(cols + 1):
+                if used[col]:
+                    u[owner[col]] += delta
+                    v[col] -= delta
+                else:
+                    minv[col] -= delta
+            col0 = col1
+            if owner[col0] == 0:
+                break
+        while col0:
+            col1 = way[col0]
+            owner[col0] = owner[col1]
+            col0 = col1
+    assignment = [-1] * rows
+    for col in range(1, cols + 1):
+        if owner[col]:
+            assignment[owner[col] - 1] = col - 1
+    return assignment
+
+
+def _max_weight_matching(
+    out_ids: list[int], in_ids: list[int], weights: dict[tuple[int, int], int]
+) -> list[tuple[int, int]]:
+    """Max-weight matching of one component; missing edges cost 0 and are dropped."""
+    transpose = len(out_ids) > len(in_ids)
+    rows, cols = (in_ids, out_ids) if transpose else (out_ids, in_ids)
+    cost = [[-weights.get((c, r) if transpose else (r, c), 0) for c in cols] for r in rows]
+    pairs = []
+    for row, col in enumerate(_min_cost_assignment(cost)):
+        if col < 0 or cost[row][col] == 0:
+            continue
+        pairs.append((cols[col], rows[row]) if transpose else (rows[row], cols[col]))
+    return pairs
+
+
+def _greedy_matching(edges: list[tuple[int, int]], weights: dict[tuple[int, int], int]) -> list[tuple[int, int]]:
+    """Best-confidence-first matching of one component; ties go to the earlier OUT, then IN, leg."""
+    used_outs: set[int] = set()
+    used_ins: set[int] = set()
+    pairs = []
+    for out_index, in_index in sorted(edges, key=lambda edge: (-weights[edge], edge)):
+        if out_index in used_outs or in_index in used_ins:
+            continue
+        used_outs.add(out_index)
+        used_ins.add(in_index)
+        pairs.append((out_index, in_index))
+    return pairs
+
+
+def pair_transfer_legs(
+    out_legs: Sequence[TransferLeg],
+    in_legs: Sequence[TransferLeg],
+    processing_account_id: UUID,
+    *,
+    description_scorer: Callable[[str | None, str | None], float],
+    threshold: int,
+    description_bound: Callable[[str | None, str | None], float] | None = None,
+) -> list[TransferPair]:
+    """Pair Transfer OUT with Transfer IN legs by max-weight assignment.
+
+    Args:
+        out_legs: Legs whose entry debits the Processing account.
+        in_legs: Legs whose entry credits the Processing account.
+        processing_account_id: The Processing account the legs post to.
+        description_scorer: Memo similarity (0-100) used by the confidence score.
+        threshold: Minimum confidence for a pair.
+        description_bound: Optional cheap ceiling on ``description_scorer``; a
+            candidate whose amount and date scores plus this ceiling
+            cannot clear ``threshold`` is dropped before the exact comparison.
+
+    Returns:
+        Pairs with confidence >= threshold, maximizing the total confidence
+        (greedily inside components above ``_MAX_ASSIGNMENT_LEGS`` legs),
+        ordered as their OUT legs are in ``out_legs``.
+    """
+    # Best total a pair can reach with a perfect description, per date gap.
+    # ``int(round(total))`` clears the threshold only from ``threshold - 0.5`` up.
+    floor = threshold - 0.5 - _SLACK
+    description_weight = float(DESCRIPTION_WEIGHT)
+    description_max = description_weight * 100.0
+    amount_weight = float(AMOUNT_WEIGHT)
+    date_weight = float(DATE_WEIGHT)
+    date_scores = [
+        _score_date_proximity(_EPOCH, _EPOCH + timedelta(days=days)) for days in range(_DATE_SCORE_HORIZON + 1)
+    ]
+    min_amount_score = [(floor - description_max - date_weight * score) / amount_weight for score in date_scores]
+    reachable_days = [days for days, score in enumerate(min_amount_score) if score <= 100.0 + _SLACK]
+    if not reachable_days:
+        return []
+    # Beyond the horizon every gap scores like the horizon itself.
+    max_days = None if reachable_days[-1] == _DATE_SCORE_HORIZON else reachable_days[-1]
+
+    # (currency, day ordinal) -> sorted amounts + the IN leg index of each.
+    buckets: dict[tuple[str, int], tuple[list[float], list[int]]] = {}
+    for index in sorted(range(len(in_legs)), key=lambda index: in_legs[index].amount):
+        leg = in_legs[index]
+        amounts, indexes = buckets.setdefault((leg.currency, leg.entry.entry_date.toordinal()), ([], []))
+        amounts.append(float(leg.amount))
+        indexes.append(index)
+    days_by_currency: dict[str, list[int]] = {}
+    for currency, ordinal in buckets:
+        days_by_currency.setdefault(currency, []).append(ordinal)
+
+    weights: dict[tuple[int, int], int] = {}
+    breakdowns: dict[tuple[int, int], dict[str, float]] = {}
+    parent = list(range(len(out_legs) + len(in_legs)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for out_index, out_leg in enumerate(out_legs):
+        out_entry = out_leg.entry
+        out_amount = float(out_leg.amount)
+        ordinal = out_entry.entry_date.toordinal()
+        if max_days is None:
+            days = days_by_currency.get(out_leg.currency, [])
+        else:
+            days = range(ordinal - max_days, ordinal + max_days + 1)
+        for day in days:
+            bucket = buckets.get((out_leg.currency, day))
+            if bucket is None:
+                continue
+            gap = min(abs(day - ordinal), _DATE_SCORE_HORIZON)
+            reach = _amount_reach(min_amount_score[gap], out_amount)
+            if reach < 0:
+                continue
+            amounts, indexes = bucket
+            if reach == inf:
+                window = range(len(amounts))
+            else:
+                window = range(
+                    bisect.bisect_left(amounts, out_amount - reach - _SLACK),
+                    bisect.bisect_right(amounts, out_amount + reach + _SLACK),
+                )
+            for position in window:
+                in_index = indexes[position]
+                in_entry = in_legs[in_index].entry
+                if description_bound is not None:
+                    best = (
+                        amount_weight * _amount_ceiling(out_amount, abs(out_amount - amounts[position]))
+                        + date_weight * date_scores[gap]
+                        + description_weight * description_bound(out_entry.memo, in_entry.memo)
+                    )
+                    if best < floor:
+                        continue
+                confidence, breakdown = _calculate_pair_confidence(
+                    out_entry,
+                    in_entry,
+                    processing_account_id,
+                    description_scorer=description_scorer,
+                )
+                if confidence < threshold:
+                    continue
+                weights[(out_index, in_index)] = confidence
+                breakdowns[(out_index, in_index)] = breakdown
+                parent[find(out_index)] = find(len(out_legs) + in_index)
+
+    components: dict[int, tuple[set[int], set[int], list[tuple[int, int]]]] = {}
+    for out_index, in_index in weights:
+        outs, ins, edges = components.setdefault(find(out_index), (set(), set(), []))
+        outs.add(out_index)
+        ins.add(in_index)
+        edges.append((out_index, in_index))
+
+    matched: list[tuple[int, int]] = []
+    for outs, ins, edges in components.values():
+        if len(outs) == 1 and len(ins) == 1:
+            matched.append((next(iter(outs)), next(iter(ins))))
+        elif len(outs) + len(ins) > _MAX_ASSIGNMENT_LEGS:
+            matched.extend(_greedy_matching(edges, weights))
+        else:
+            matched.extend(_max_weight_matching(sorted(outs), sorted(ins), weights))
+
+    return [
+        TransferPair(
+            out_entry=out_legs[out_index].entry,
+            in_entry=in_legs[in_index].entry,
+            confidence=weights[(out_index, in_index)],
+            score_breakdown=breakdowns[(out_index, in_index)],
+        )
+        for out_index, in_index in sorted(matched)
+    ]
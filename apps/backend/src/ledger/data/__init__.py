@@ -2,7 +2,8 @@
 
 Computed FROM the posted write side; nothing in ``base/`` or ``extension/`` imports
 this layer (the gate enforces ``data`` as a sink). Holds the signed account-balance
-projections and the accounting-equation check derived from them.
+projections and the accounting-equation check derived from them, plus the readers,
+rebuild and consistency check of the trigger-maintained daily-balance totals.
 """
 
 from __future__ import annotations
@@ -19,14 +20,34 @@ from src.ledger.data.balance import (
     calculate_account_balances_in_base_currency,
     verify_accounting_equation,
 )
+from src.ledger.data.daily_balance import (
+    AccountCurrencyTotals,
+    AccountDailyBalanceDrift,
+    find_account_daily_balance_drift,
+    load_account_currency_totals,
+    rebuild_account_daily_balances,
+)
+from src.ledger.data.journal_export import (
+    JOURNAL_EXPORT_COLUMNS,
+    JournalExportCursor,
+    stream_journal_lines,
+)
 
 __all__ = [
+    "AccountCurrencyTotals",
+    "AccountDailyBalanceDrift",
     "DEFAULT_STALE_AFTER_DAYS",
+    "JOURNAL_EXPORT_COLUMNS",
+    "JournalExportCursor",
     "StatementCoverageRow",
     "calculate_account_balance",
     "calculate_account_balances",
     "calculate_account_balances_in_base_currency",
+    "find_account_daily_balance_drift",
     "get_account_statement_coverage",
+    "load_account_currency_totals",
+    "rebuild_account_daily_balances",
     "register_statement_coverage_reader",
+    "stream_journal_lines",
     "verify_accounting_equation",
 ]
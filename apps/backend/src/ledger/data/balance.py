@@ -9,21 +9,24 @@ the projection safe (the write side never depends on its own read model).
 Balances include only ``posted`` and ``reconciled`` entries and follow account-type
 sign rules: Asset/Expense increase on debit; Liability/Equity/Income increase on
 credit. Amounts are raw ``Decimal`` (the projection's existing contract).
+
+The balances read the maintained per-day cumulative totals
+(``data/daily_balance.py``) — the latest row per (account, currency) — instead of
+summing every journal line since inception.
 """
 
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.audit.money import Currency
 from src.ledger.base.validators import ValidationError
+from src.ledger.data.daily_balance import load_account_currency_totals
 from src.ledger.orm.account import Account, AccountType
-from src.ledger.orm.journal import Direction, JournalEntry, JournalEntryStatus, JournalLine
 
 
 async def calculate_account_balance(db: AsyncSession, account_id: UUID, user_id: UUID) -> Decimal:
@@ -51,36 +54,9 @@ async def calculate_account_balance(db: AsyncSession, account_id: UUID, user_id:
     if account.user_id != user_id:
         raise ValidationError("Account does not belong to user")
 
-    # Sum journal lines for posted/reconciled entries
-    # Use separate queries for debit and credit sums
-    debit_query = (
-        select(func.coalesce(func.sum(JournalLine.amount), Decimal("0")))
-        .select_from(JournalLine)
-        .join(JournalEntry)
-        .where(JournalLine.account_id == account_id)
-        .where(JournalLine.direction == Direction.DEBIT)
-        .where(JournalEntry.user_id == user_id)
-        .where(JournalEntry.status.in_([JournalEntryStatus.POSTED, JournalEntryStatus.RECONCILED]))
-    )
-
-    credit_query = (
-        select(func.coalesce(func.sum(JournalLine.amount), Decimal("0")))
-        .select_from(JournalLine)
-        .join(JournalEntry)
-        .where(JournalLine.account_id == account_id)
-        .where(JournalLine.direction == Direction.CREDIT)
-        .where(JournalEntry.user_id == user_id)
-        .where(JournalEntry.status.in_([JournalEntryStatus.POSTED, JournalEntryStatus.RECONCILED]))
-    )
-
-    debit_result = await db.execute(debit_query)
-    credit_result = await db.execute(credit_query)
-
-    total_debit = debit_result.scalar() or Decimal("0")
-    total_credit = credit_result.scalar() or Decimal("0")
-
-    # Net balance = debit - credit
-    net_balance = total_debit - total_credit
+    # Latest cumulative row per currency from the daily-balance read model.
+    totals = await load_account_currency_totals(db, user_id, account_ids=[account_id])
+    net_balance = sum((row.net_debit for row in totals), Decimal("0"))
 
     # Adjust based on account type
     # Asset/Expense: DEBIT increases (positive), CREDIT decreases (negative)
@@ -97,92 +73,47 @@ async def calculate_account_balances(
     user_id: UUID,
 ) -> dict[UUID, Decimal]:
     """Calculate nominal balances in each account's own currency space."""
-    return await _calculate_account_balances(
-        db,
-        accounts,
-        user_id,
-        amount_expr=JournalLine.amount,
-    )
-
-
-async def calculate_account_balances_in_base_currency(
-    db: AsyncSession,
-    accounts: list[Account],
-    user_id: UUID,
-    *,
-    base_currency: str,
-) -> dict[UUID, Decimal]:
-    """Calculate balances converted into the caller's effective base currency."""
-    base_currency = Currency.of(base_currency).code
     if not accounts:
         return {}
 
-    account_ids = [account.id for account in accounts]
-    missing_fx = await db.execute(
-        select(JournalLine.id)
-        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
-        .where(JournalEntry.user_id == user_id)
-        .where(JournalLine.account_id.in_(account_ids))
-        .where(JournalEntry.status.in_([JournalEntryStatus.POSTED, JournalEntryStatus.RECONCILED]))
-        .where(func.coalesce(func.upper(JournalLine.currency), base_currency) != base_currency)
-        .where(JournalLine.fx_rate.is_(None))
-        .limit(1)
-    )
-    if missing_fx.first() is not None:
-        raise ValidationError(f"fx_rate required for non-base-currency ledger lines (base {base_currency})")
-
-    amount_expr: Any = case(
-        (func.coalesce(func.upper(JournalLine.currency), base_currency) == base_currency, JournalLine.amount),
-        else_=JournalLine.amount * JournalLine.fx_rate,
-    )
-    return await _calculate_account_balances(
-        db,
-        accounts,
-        user_id,
-        amount_expr=amount_expr,
-    )
+    totals = await load_account_currency_totals(db, user_id, account_ids=[account.id for account in accounts])
+    net_by_account: dict[UUID, Decimal] = {}
+    for row in totals:
+        net_by_account[row.account_id] = net_by_account.get(row.account_id, Decimal("0")) + row.net_debit
+    return _signed_balances(accounts, net_by_account)
 
 
-async def _calculate_account_balances(
+async def calculate_account_balances_in_base_currency(
     db: AsyncSession,
     accounts: list[Account],
     user_id: UUID,
     *,
-    amount_expr: Any,
+    base_currency: str,
 ) -> dict[UUID, Decimal]:
-    """Calculate balances with one caller-selected currency-space expression.
+    """Calculate balances converted into the caller's effective base currency.
 
-    Returns a mapping of account_id -> balance, with account type adjustments applied.
+    Base-currency lines count at face value; every other line at
+    ``amount * fx_rate``, which the read model keeps pre-summed per currency.
     """
+    base_currency = Currency.of(base_currency).code
     if not accounts:
         return {}
 
-    account_ids = [account.id for account in accounts]
-    net_query = (
-        select(
-            JournalLine.account_id,
-            func.coalesce(
-                func.sum(
-                    case(
-                        (JournalLine.direction == Direction.DEBIT, amount_expr),
-                        else_=-amount_expr,
-                    )
-                ),
-                Decimal("0"),
-            ).label("net_balance"),
-        )
-        .select_from(JournalLine)
-        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
-        .join(Account, JournalLine.account_id == Account.id)
-        .where(Account.user_id == user_id)
-        .where(JournalEntry.user_id == user_id)
-        .where(JournalLine.account_id.in_(account_ids))
-        .where(JournalEntry.status.in_([JournalEntryStatus.POSTED, JournalEntryStatus.RECONCILED]))
-        .group_by(JournalLine.account_id)
-    )
-    result = await db.execute(net_query)
-    net_by_account = {row.account_id: row.net_balance for row in result.all()}
+    totals = await load_account_currency_totals(db, user_id, account_ids=[account.id for account in accounts])
+    net_by_account: dict[UUID, Decimal] = {}
+    for row in totals:
+        if row.currency.upper() == base_currency:
+            net = row.net_debit
+        elif row.unrated_line_count > 0:
+            raise ValidationError(f"fx_rate required for non-base-currency ledger lines (base {base_currency})")
+        else:
+            net = row.fx_net_debit
+        net_by_account[row.account_id] = net_by_account.get(row.account_id, Decimal("0")) + net
+    return _signed_balances(accounts, net_by_account)
+
 
+def _signed_balances(accounts: list[Account], net_by_account: dict[UUID, Decimal]) -> dict[UUID, Decimal]:
+    """Apply account-type sign rules to net debit balances (missing accounts are zero)."""
     balances: dict[UUID, Decimal] = {}
     for account in accounts:
         net = net_by_account.get(account.id, Decimal("0"))
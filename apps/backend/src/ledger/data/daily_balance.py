@@ -0,0 +1,272 @@
+"""Readers, rebuild and consistency check for the daily-balance read model.
+
+``account_daily_balances`` (see ``orm/daily_balance.py``) is maintained by
+database triggers; this module only reads it. A balance as of ``D`` is the
+latest cumulative row ``<= D`` per (account, currency) — at most one row per
+series instead of every line since inception — and a balance over
+``[since, D]`` subtracts the latest row before ``since``.
+
+``rebuild_account_daily_balances`` recomputes the rows from the raw journal
+lines (backfill, or repair after drift), and
+``find_account_daily_balance_drift`` compares the stored rows with that raw
+recomputation without writing.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Collection
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Integer, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ledger.orm.account import Account, AccountType
+from src.ledger.orm.daily_balance import AccountDailyBalance
+from src.ledger.orm.journal import Direction, JournalEntry, JournalEntryStatus, JournalLine
+
+_COUNTED_STATUSES = (JournalEntryStatus.POSTED, JournalEntryStatus.RECONCILED)
+_TOTAL_FIELDS = (
+    "debit_total",
+    "credit_total",
+    "fx_debit_total",
+    "fx_credit_total",
+    "unrated_line_count",
+    "line_count",
+)
+
+
+@dataclass(frozen=True)
+class AccountCurrencyTotals:
+    """Counted debit/credit totals of one account in one stored line currency."""
+
+    account_id: UUID
+    account_type: AccountType
+    currency: str
+    debit_total: Decimal
+    credit_total: Decimal
+    fx_debit_total: Decimal
+    fx_credit_total: Decimal
+    unrated_line_count: int
+    line_count: int
+
+    @property
+    def net_debit(self) -> Decimal:
+        """Native debit minus credit."""
+        return self.debit_total - self.credit_total
+
+    @property
+    def fx_net_debit(self) -> Decimal:
+        """``amount * fx_rate`` debit minus credit over the rated lines."""
+        return self.fx_debit_total - self.fx_credit_total
+
+
+@dataclass(frozen=True)
+class AccountDailyBalanceDrift:
+    """One series-day where the stored row disagrees with the raw line sums.
+
+    ``stored``/``expected`` are ``None`` when the row is missing on that side.
+    """
+
+    user_id: UUID
+    account_id: UUID
+    currency: str
+    balance_date: date
+    stored: dict[str, Decimal | int] | None
+    expected: dict[str, Decimal | int] | None
+
+
+async def load_account_currency_totals(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    account_ids: Collection[UUID] | None = None,
+    account_types: Collection[AccountType] | None = None,
+    as_of: date | None = None,
+    since: date | None = None,
+) -> list[AccountCurrencyTotals]:
+    """Counted per-(account, currency) totals of entries dated in ``[since, as_of]``.
+
+    Either bound may be ``None`` (open). Series with no counted line in the
+    window are omitted.
+    """
+    if account_ids is not None and not account_ids:
+        return []
+
+    closing = await _latest_rows(db, user_id, account_ids=account_ids, account_types=account_types, through=as_of)
+    if since is not None and closing:
+        opening = await _latest_rows(
+            db,
+            user_id,
+            account_ids=account_ids,
+            account_types=account_types,
+            through=since - timedelta(days=1),
+        )
+        for key, before in opening.items():
+            after = closing.get(key)
+            if after is not None:
+                closing[key] = replace(
+                    after, **{field: getattr(after, field) - getattr(before, field) for field in _TOTAL_FIELDS}
+                )
+
+    return [totals for totals in closing.values() if totals.line_count > 0]
+
+
+async def _latest_rows(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    account_ids: Collection[UUID] | None,
+    account_types: Collection[AccountType] | None,
+    through: date | None,
+) -> dict[tuple[UUID, str], AccountCurrencyTotals]:
+    stmt = (
+        select(AccountDailyBalance, Account.type)
+        .join(Account, AccountDailyBalance.account_id == Account.id)
+        .where(AccountDailyBalance.user_id == user_id)
+        .where(Account.user_id == user_id)
+        # PostgreSQL DISTINCT ON: the newest row per series, one index range scan each.
+        .distinct(AccountDailyBalance.account_id, AccountDailyBalance.currency)
+        .order_by(
+            AccountDailyBalance.account_id,
+            AccountDailyBalance.currency,
+            AccountDailyBalance.balance_date.desc(),
+        )
+    )
+    if account_ids is not None:
+        stmt = stmt.where(AccountDailyBalance.account_id.in_(list(account_ids)))
+    if account_types is not None:
+        stmt = stmt.where(Account.type.in_(list(account_types)))
+    if through is not None:
+        stmt = stmt.where(AccountDailyBalance.balance_date <= through)
+
+    result = await db.execute(stmt)
+    return {
+        (row.account_id, row.currency): AccountCurrencyTotals(
+            account_id=row.account_id,
+            account_type=account_type,
+            currency=row.currency,
+            debit_total=Decimal(row.debit_total),
+            credit_total=Decimal(row.credit_total),
+            fx_debit_total=Decimal(row.fx_debit_total),
+            fx_credit_total=Decimal(row.fx_credit_total),
+            unrated_line_count=row.unrated_line_count,
+            line_count=row.line_count,
+        )
+        for row, account_type in result.all()
+    }
+
+
+def _expected_rows_select(user_id: UUID | None) -> Any:
+    """Cumulative rows recomputed from the raw counted journal lines."""
+    debit = JournalLine.direction == Direction.DEBIT
+    credit = JournalLine.direction == Direction.CREDIT
+    fx_amount = func.coalesce(JournalLine.amount * JournalLine.fx_rate, 0)
+    daily = (
+        select(
+            JournalEntry.user_id.label("user_id"),
+            JournalLine.account_id.label("account_id"),
+            JournalLine.currency.label("currency"),
+            JournalEntry.entry_date.label("balance_date"),
+            func.sum(case((debit, JournalLine.amount), else_=0)).label("debit_total"),
+            func.sum(case((credit, JournalLine.amount), else_=0)).label("credit_total"),
+            func.sum(case((debit, fx_amount), else_=0)).label("fx_debit_total"),
+            func.sum(case((credit, fx_amount), else_=0)).label("fx_credit_total"),
+            func.sum(case((JournalLine.fx_rate.is_(None), 1), else_=0)).label("unrated_line_count"),
+            func.count().label("line_count"),
+        )
+        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
+        .where(JournalEntry.status.in_(_COUNTED_STATUSES))
+        .group_by(JournalEntry.user_id, JournalLine.account_id, JournalLine.currency, JournalEntry.entry_date)
+    )
+    if user_id is not None:
+        daily = daily.where(JournalEntry.user_id == user_id)
+    daily = daily.subquery("daily")
+
+    series = (daily.c.user_id, daily.c.account_id, daily.c.currency)
+    return select(
+        *series,
+        daily.c.balance_date,
+        *(
+            func.sum(daily.c[field])
+            .over(partition_by=series, order_by=daily.c.balance_date)
+            .cast(Integer if field.endswith("_count") else AccountDailyBalance.__table__.c[field].type)
+            .label(field)
+            for field in _TOTAL_FIELDS
+        ),
+    )
+
+
+async def rebuild_account_daily_balances(db: AsyncSession, *, user_id: UUID | None = None) -> int:
+    """Replace the stored rows (one user's, or all) with a raw recomputation.
+
+    Runs in the caller's transaction; returns the number of rows written.
+    """
+    purge = delete(AccountDailyBalance)
+    if user_id is not None:
+        purge = purge.where(AccountDailyBalance.user_id == user_id)
+    await db.execute(purge)
+
+    columns = ["user_id", "account_id", "currency", "balance_date", *_TOTAL_FIELDS]
+    result = await db.execute(insert(AccountDailyBalance).from_select(columns, _expected_rows_select(user_id)))
+    return result.rowcount or 0
+
+
+async def find_account_daily_balance_drift(
+    db: AsyncSession,
+    *,
+    user_id: UUID | None = None,
+) -> list[AccountDailyBalanceDrift]:
+    """Series-days where the stored read model differs from the raw line sums.
+
+    Every day with counted activity must have an identical stored row. A stored
+    row on any other day — left behind when the entries that created it were
+    voided — must carry the cumulative totals of the days before it.
+    """
+    stored_stmt = select(AccountDailyBalance)
+    if user_id is not None:
+        stored_stmt = stored_stmt.where(AccountDailyBalance.user_id == user_id)
+    stored = {
+        (row.user_id, row.account_id, row.currency, row.balance_date): _totals_of(row)
+        for row in (await db.execute(stored_stmt)).scalars().all()
+    }
+    expected = {
+        (row.user_id, row.account_id, row.currency, row.balance_date): _totals_of(row)
+        for row in (await db.execute(_expected_rows_select(user_id))).all()
+    }
+
+    expected_days: dict[tuple[UUID, UUID, str], list[date]] = {}
+    for series_user, account_id, currency, balance_date in sorted(expected, key=lambda key: key[3]):
+        expected_days.setdefault((series_user, account_id, currency), []).append(balance_date)
+    zero: dict[str, Decimal | int] = {field: 0 for field in _TOTAL_FIELDS}
+
+    drift: list[AccountDailyBalanceDrift] = []
+    for key in sorted(stored.keys() | expected.keys(), key=lambda k: (str(k[0]), str(k[1]), k[2], k[3])):
+        have, want = stored.get(key), expected.get(key)
+        if want is None:
+            days = expected_days.get(key[:3], [])
+            index = bisect_left(days, key[3])
+            carried = expected[(*key[:3], days[index - 1])] if index else zero
+            if have == carried:
+                continue
+        elif have == want:
+            continue
+        drift.append(
+            AccountDailyBalanceDrift(
+                user_id=key[0],
+                account_id=key[1],
+                currency=key[2],
+                balance_date=key[3],
+                stored=have,
+                expected=want,
+            )
+        )
+    return drift
+
+
+def _totals_of(row: Any) -> dict[str, Decimal | int]:
+    return {field: getattr(row, field) for field in _TOTAL_FIELDS}
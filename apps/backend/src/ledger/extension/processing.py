@@ -8,8 +8,8 @@ the ORM and on the pure policy in ``ledger.base.processing``:
 - ``create_transfer_out_entry`` / ``create_transfer_in_entry`` — post a transfer leg
   (Dr Processing / Cr source, resp. Dr destination / Cr Processing), guarding balance
   through :class:`~src.ledger.base.types.entry.Entry` before persisting;
-- ``find_transfer_pairs`` — the pairing domain service: scores persisted Processing
-  entries pairwise and returns matches above the confidence threshold;
+- ``find_transfer_pairs`` — the pairing domain service: loads persisted Processing
+  entries and hands them to the ``base.transfer_pairing`` assignment engine;
 - ``get_processing_balance`` / ``get_unpaired_transfers`` /
   ``list_processing_transfer_legs`` — read projections over the persisted entries.
 
@@ -40,9 +40,9 @@ from src.ledger.base.processing import (
     ProcessingCurrencyConflictError,
     TransferAccountCurrencyMismatchError,
     TransferPair,
-    _calculate_pair_confidence,
     _validate_transfer_params,
 )
+from src.ledger.base.transfer_pairing import TransferLeg, pair_transfer_legs
 from src.ledger.base.types.entry import Entry
 from src.ledger.base.validators import ValidationError
 from src.ledger.extension.post import post_entry
@@ -91,19 +91,22 @@ async def find_transfer_pairs(
     currency: str,
     description_scorer: Callable[[str | None, str | None], float],
     threshold: int = AUTO_PAIR_THRESHOLD,
-    max_entries: int = 500,
+    description_bound: Callable[[str | None, str | None], float] | None = None,
 ) -> list[TransferPair]:
     """Find matching transfer pairs based on confidence scoring.
-    and attempts to match them based on amount, description, and date proximity.
-    Note: The pairing algorithm is O(n²) where n = max(out_entries, in_entries).
-    The max_entries parameter limits the number of entries processed to prevent
-    performance degradation with high transaction volumes.
+
+    Loads every posted SYSTEM entry on the user's Processing account, splits
+    them into Transfer OUT / IN legs and pairs them with ``pair_transfer_legs``:
+    a max-weight assignment on the amount/description/date confidence, searched
+    only inside the date and amount windows that can still clear ``threshold``.
+    There is no cap on the number of legs considered.
 
     Args:
         db: Database session
         user_id: User ID to search transfers for
         threshold: Minimum confidence score (default: 85)
-        max_entries: Maximum number of entries to process per side (default: 500)
+        description_bound: Optional cheap ceiling on ``description_scorer`` that
+            lets the engine skip pairs before comparing their memos
     Returns:
         List of TransferPair objects with confidence >= threshold
     """
@@ -122,55 +125,30 @@ async def find_transfer_pairs(
     )
     entries = result.scalars().unique().all()
 
-    # Separate OUT and IN entries
-    out_entries = []
-    in_entries = []
+    # Separate OUT and IN legs
+    out_legs: list[TransferLeg] = []
+    in_legs: list[TransferLeg] = []
 
     for entry in entries:
         for line in entry.lines:
             if line.account_id == processing_account.id:
+                leg = TransferLeg(entry=entry, currency=line.currency, amount=line.amount)
                 # Transfer OUT: Processing is DEBITED
                 if line.direction == Direction.DEBIT:
-                    out_entries.append(entry)
+                    out_legs.append(leg)
                 # Transfer IN: Processing is CREDITED
                 elif line.direction == Direction.CREDIT:
-                    in_entries.append(entry)
+                    in_legs.append(leg)
                 break
 
-    # Limit entries to prevent O(n²) performance degradation with large datasets
-    out_entries = out_entries[:max_entries]
-    in_entries = in_entries[:max_entries]
-
-    # Find pairs with confidence >= threshold
-    pairs: list[TransferPair] = []
-    matched_in_entries: set[int] = set()  # Track already-matched IN entries
-    for out_entry in out_entries:
-        best_match: TransferPair | None = None
-        for in_entry in in_entries:
-            if id(in_entry) in matched_in_entries:
-                continue
-
-            confidence, breakdown = _calculate_pair_confidence(
-                out_entry,
-                in_entry,
-                processing_account.id,
-                description_scorer=description_scorer,
-            )
-            if confidence >= threshold:
-                pair = TransferPair(
-                    out_entry=out_entry,
-                    in_entry=in_entry,
-                    confidence=confidence,
-                    score_breakdown=breakdown,
-                )
-                # Keep only the best match for this out_entry
-                if best_match is None or confidence > best_match.confidence:
-                    best_match = pair
-        if best_match:
-            pairs.append(best_match)
-            matched_in_entries.add(id(best_match.in_entry))
-
-    return pairs
+    return pair_transfer_legs(
+        out_legs,
+        in_legs,
+        processing_account.id,
+        description_scorer=description_scorer,
+        threshold=threshold,
+        description_bound=description_bound,
+    )
 
 
 async def create_transfer_out_entry(
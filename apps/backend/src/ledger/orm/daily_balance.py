@@ -0,0 +1,263 @@
+"""Maintained per-day cumulative account totals (the balance read model's storage).
+
+One row per (user, account, currency, day with counted activity) holding the
+running debit/credit totals of every ``posted``/``reconciled`` line dated on or
+before that day. A balance "as of D" is therefore the latest row ``<= D``; a
+windowed balance is that minus the latest row before the window.
+
+The rows are kept current by PostgreSQL triggers on ``journal_lines`` and
+``journal_entries`` — a line attached to a counted entry, or an entry whose
+status enters/leaves the counted set (post, void; reconcile stays counted),
+applies its delta inside the same transaction, so ``post_journal_entry`` and
+``void_journal_entry`` never see a stale read model and the write side does not
+import its projection. ``ledger.data.daily_balance`` owns the rebuild and the
+consistency check against the raw line sums.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import DECIMAL, Date, ForeignKey, Integer, Numeric, String, event
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+from src.ledger.orm.journal import _split_postgresql_ddl
+
+
+class AccountDailyBalance(Base):
+    """Cumulative per-(account, currency) totals through ``balance_date``.
+
+    ``debit_total``/``credit_total`` are native-currency sums. ``fx_debit_total``
+    and ``fx_credit_total`` sum ``amount * fx_rate`` over the lines that carry a
+    rate, and ``unrated_line_count`` counts the lines that do not — together they
+    reproduce the base-currency projection without re-reading lines.
+    """
+
+    __tablename__ = "account_daily_balances"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    account_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True
+    )
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
+    balance_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    debit_total: Mapped[Decimal] = mapped_column(DECIMAL(24, 2), nullable=False, default=Decimal("0"))
+    credit_total: Mapped[Decimal] = mapped_column(DECIMAL(24, 2), nullable=False, default=Decimal("0"))
+    # Unconstrained NUMERIC: amount * fx_rate sums stay exact (no rounding drift).
+    fx_debit_total: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=Decimal("0"))
+    fx_credit_total: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=Decimal("0"))
+    unrated_line_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    line_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<AccountDailyBalance {self.account_id} {self.currency} {self.balance_date}>"
+
+
+_ACCOUNT_DAILY_BALANCE_SQL = """
+CREATE OR REPLACE FUNCTION fr_apply_account_daily_balance(
+    p_user_id uuid,
+    p_account_id uuid,
+    p_currency text,
+    p_balance_date date,
+    p_debit numeric,
+    p_credit numeric,
+    p_fx_debit numeric,
+    p_fx_credit numeric,
+    p_unrated integer,
+    p_lines integer
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Serialize writers per user: the seed row below copies the previous
+    -- cumulative row, which a concurrent backdated write could otherwise miss.
+    -- One lock per user (not per series) so multi-account entries cannot deadlock.
+    PERFORM pg_advisory_xact_lock(hashtextextended('account_daily_balances:' || p_user_id::text, 0));
+
+    INSERT INTO account_daily_balances (
+        user_id, account_id, currency, balance_date,
+        debit_total, credit_total, fx_debit_total, fx_credit_total,
+        unrated_line_count, line_count
+    )
+    SELECT
+        p_user_id, p_account_id, p_currency, p_balance_date,
+        COALESCE(prev.debit_total, 0), COALESCE(prev.credit_total, 0),
+        COALESCE(prev.fx_debit_total, 0), COALESCE(prev.fx_credit_total, 0),
+        COALESCE(prev.unrated_line_count, 0), COALESCE(prev.line_count, 0)
+    FROM (SELECT 1) AS seed
+    LEFT JOIN LATERAL (
+        SELECT *
+        FROM account_daily_balances
+        WHERE user_id = p_user_id
+          AND account_id = p_account_id
+          AND currency = p_currency
+          AND balance_date < p_balance_date
+        ORDER BY balance_date DESC
+        LIMIT 1
+    ) AS prev ON true
+    ON CONFLICT (user_id, account_id, currency, balance_date) DO NOTHING;
+
+    UPDATE account_daily_balances
+    SET debit_total = debit_total + p_debit,
+        credit_total = credit_total + p_credit,
+        fx_debit_total = fx_debit_total + p_fx_debit,
+        fx_credit_total = fx_credit_total + p_fx_credit,
+        unrated_line_count = unrated_line_count + p_unrated,
+        line_count = line_count + p_lines
+    WHERE user_id = p_user_id
+      AND account_id = p_account_id
+      AND currency = p_currency
+      AND balance_date >= p_balance_date;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_apply_journal_line_balance(p_line journal_lines, p_sign integer)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_status text;
+    v_user_id uuid;
+    v_entry_date date;
+BEGIN
+    SELECT status::text, user_id, entry_date
+    INTO v_status, v_user_id, v_entry_date
+    FROM journal_entries
+    WHERE id = p_line.journal_entry_id;
+
+    IF NOT FOUND OR v_status NOT IN ('posted', 'reconciled') THEN
+        RETURN;
+    END IF;
+
+    PERFORM fr_apply_account_daily_balance(
+        v_user_id,
+        p_line.account_id,
+        p_line.currency,
+        v_entry_date,
+        CASE WHEN p_line.direction::text = 'DEBIT' THEN p_sign * p_line.amount ELSE 0 END,
+        CASE WHEN p_line.direction::text = 'CREDIT' THEN p_sign * p_line.amount ELSE 0 END,
+        CASE WHEN p_line.direction::text = 'DEBIT'
+            THEN p_sign * COALESCE(p_line.amount * p_line.fx_rate, 0) ELSE 0 END,
+        CASE WHEN p_line.direction::text = 'CREDIT'
+            THEN p_sign * COALESCE(p_line.amount * p_line.fx_rate, 0) ELSE 0 END,
+        CASE WHEN p_line.fx_rate IS NULL THEN p_sign ELSE 0 END,
+        p_sign
+    );
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_apply_journal_entry_balance(
+    p_entry_id uuid,
+    p_user_id uuid,
+    p_entry_date date,
+    p_sign integer
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_series record;
+BEGIN
+    FOR v_series IN
+        SELECT
+            account_id,
+            currency,
+            COALESCE(sum(amount) FILTER (WHERE direction::text = 'DEBIT'), 0) AS debit,
+            COALESCE(sum(amount) FILTER (WHERE direction::text = 'CREDIT'), 0) AS credit,
+            COALESCE(sum(amount * fx_rate) FILTER (WHERE direction::text = 'DEBIT'), 0) AS fx_debit,
+            COALESCE(sum(amount * fx_rate) FILTER (WHERE direction::text = 'CREDIT'), 0) AS fx_credit,
+            count(*) FILTER (WHERE fx_rate IS NULL)::integer AS unrated,
+            count(*)::integer AS lines
+        FROM journal_lines
+        WHERE journal_entry_id = p_entry_id
+        GROUP BY account_id, currency
+        ORDER BY account_id, currency
+    LOOP
+        PERFORM fr_apply_account_daily_balance(
+            p_user_id,
+            v_series.account_id,
+            v_series.currency,
+            p_entry_date,
+            p_sign * v_series.debit,
+            p_sign * v_series.credit,
+            p_sign * v_series.fx_debit,
+            p_sign * v_series.fx_credit,
+            p_sign * v_series.unrated,
+            p_sign * v_series.lines
+        );
+    END LOOP;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_track_journal_line_balance()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM fr_apply_journal_line_balance(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM fr_apply_journal_line_balance(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION fr_track_journal_entry_balance()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_old_counted boolean := OLD.status::text IN ('posted', 'reconciled');
+    v_new_counted boolean := NEW.status::text IN ('posted', 'reconciled');
+BEGIN
+    -- posted -> reconciled keeps the entry counted on the same day: no delta.
+    IF v_old_counted = v_new_counted
+        AND (NOT v_new_counted
+            OR (OLD.entry_date = NEW.entry_date AND OLD.user_id = NEW.user_id))
+    THEN
+        RETURN NULL;
+    END IF;
+
+    IF v_old_counted THEN
+        PERFORM fr_apply_journal_entry_balance(OLD.id, OLD.user_id, OLD.entry_date, -1);
+    END IF;
+    IF v_new_counted THEN
+        PERFORM fr_apply_journal_entry_balance(NEW.id, NEW.user_id, NEW.entry_date, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_journal_lines_daily_balance ON journal_lines;
+CREATE TRIGGER trg_journal_lines_daily_balance
+AFTER INSERT OR UPDATE OR DELETE ON journal_lines
+FOR EACH ROW EXECUTE FUNCTION fr_track_journal_line_balance();
+
+DROP TRIGGER IF EXISTS trg_journal_entries_daily_balance ON journal_entries;
+CREATE TRIGGER trg_journal_entries_daily_balance
+AFTER UPDATE OF status, entry_date, user_id ON journal_entries
+FOR EACH ROW EXECUTE FUNCTION fr_track_journal_entry_balance();
+"""
+
+
+def _install_account_daily_balance_ddl(target: Any, connection: Any, **_: Any) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+
+    # The triggers live on journal_lines/journal_entries, so install once the
+    # whole metadata exists rather than on this table's own after_create.
+    for statement in _split_postgresql_ddl(_ACCOUNT_DAILY_BALANCE_SQL):
+        connection.exec_driver_sql(statement)
+
+
+event.listen(Base.metadata, "after_create", _install_account_daily_balance_ddl)
@@ -9,7 +9,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Literal
 from uuid import UUID
 
-from sqlalchemy import DECIMAL, CheckConstraint, Date, DateTime, Enum, ForeignKey, String, Text, event
+from sqlalchemy import DECIMAL, CheckConstraint, Date, DateTime, Enum, ForeignKey, Index, String, Text, event
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -109,6 +109,8 @@ class JournalEntry(Base, UUIDMixin, UserOwnedMixin, TimestampMixin):
             "AND decision_anchor_id IS NULL)",
             name="ck_journal_entries_decision_anchor_complete",
         ),
+        # Keyset order of the streamed line-level export (data/journal_export.py).
+        Index("ix_journal_entries_user_entry_date_id", "user_id", "entry_date", "id"),
     )
 
     entry_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
@@ -60,6 +60,7 @@ from src.pricing import (
     PrefetchedFxRates,
     PricingError,
     build_manual_valuation_lines,
+    close_market_data_client,
     convert_amount,
     convert_money,
     get_average_rate,
@@ -67,6 +68,7 @@ from src.pricing import (
     run_market_data_scheduler,
     subscribe_price_ingest,
 )
+from src.reconciliation import shutdown_reconciliation_jobs, subscribe_incremental_matching
 from src.reporting import (
     register_fx_gateway,
     register_manual_valuation_lines_provider,
@@ -171,9 +173,11 @@ register_position_reconciler(PositionService().reconcile_positions)
 # to them — platform (L1) must not import a domain package (L3), so the
 # registration happens here, the same inversion as the provider ports above.
 # First (precedent-setting) subscriber: pricing ingests extraction's
-# statement-extracted PriceObserved publications.
+# statement-extracted PriceObserved publications. Reconciliation reacts to
+# extraction's StatementPosted with an incremental matching run.
 outbox_subscribers = SubscriberRegistry()
 subscribe_price_ingest(outbox_subscribers, session_factory=async_session_maker)
+subscribe_incremental_matching(outbox_subscribers, session_factory=async_session_maker)
 outbox_relay = OutboxRelay(outbox_subscribers)
 
 #: Seconds the outbox-relay background task sleeps between drain passes.
@@ -292,6 +296,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await sweep_task
     with suppress(asyncio.CancelledError):
         await outbox_relay_task
+    await close_market_data_client()
+    shutdown_reconciliation_jobs()
     logger.info("Application shutting down")
 
 
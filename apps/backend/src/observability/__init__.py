@@ -53,9 +53,14 @@ from src.observability.telemetry_metrics import (
     is_metrics_export_active,
     record_ai_provider_call,
     record_financial_invariant_violation,
+    record_fx_rate_cache_eviction,
+    record_fx_rate_cache_lookup,
     record_http_request,
     record_rate_limit_rejected,
+    record_reconciliation_job,
     record_reconciliation_match_outcome,
+    record_report_cache_eviction,
+    record_report_cache_lookup,
     record_statement_parse_outcome,
     run_with_async_parse_tracking,
 )
@@ -86,9 +91,14 @@ __all__ = [
     "mark_fastapi_instrumentation_active",
     "record_ai_provider_call",
     "record_financial_invariant_violation",
+    "record_fx_rate_cache_eviction",
+    "record_fx_rate_cache_lookup",
     "record_http_request",
     "record_rate_limit_rejected",
+    "record_reconciliation_job",
     "record_reconciliation_match_outcome",
+    "record_report_cache_eviction",
+    "record_report_cache_lookup",
     "record_statement_parse_outcome",
     "run_with_async_parse_tracking",
     "safe_error_message",
@@ -123,6 +123,36 @@ def _create_instruments(meter: Any) -> None:
         unit="1",
         description="Reconciliation match outcomes.",
     )
+    _instruments["reconciliation_job_duration"] = meter.create_histogram(
+        "finance.reconciliation.job.duration",
+        unit="ms",
+        description="Reconciliation job latency by stage (queued, scoring, total) and outcome.",
+    )
+    _instruments["reconciliation_job_transactions"] = meter.create_counter(
+        "finance.reconciliation.job.transactions",
+        unit="1",
+        description="Pending transactions scored by reconciliation jobs, by outcome.",
+    )
+    _instruments["fx_rate_cache_lookup"] = meter.create_counter(
+        "finance.fx_rate_cache.lookup",
+        unit="1",
+        description="Process-wide FX rate cache lookups by outcome (hit, miss).",
+    )
+    _instruments["fx_rate_cache_eviction"] = meter.create_counter(
+        "finance.fx_rate_cache.eviction",
+        unit="1",
+        description="FX rate cache entries dropped, by reason (capacity, expired, invalidated).",
+    )
+    _instruments["report_cache_lookup"] = meter.create_counter(
+        "finance.report_cache.lookup",
+        unit="1",
+        description="Report result cache lookups by report kind and outcome (hit, miss).",
+    )
+    _instruments["report_cache_eviction"] = meter.create_counter(
+        "finance.report_cache.eviction",
+        unit="1",
+        description="Report cache entries dropped, by reason (capacity, expired).",
+    )
     _instruments["confidence_north_star"] = meter.create_histogram(
         "finance.confidence_north_star",
         unit="1",
@@ -333,6 +363,53 @@ def record_reconciliation_match_outcome(*, outcome: str) -> None:
         counter.add(1, {"outcome": outcome})
 
 
+def record_reconciliation_job(
+    *,
+    outcome: str,
+    queued_ms: float,
+    scoring_ms: float,
+    total_ms: float,
+    transactions: int,
+) -> None:
+    """Record one reconciliation job's per-stage latency and its transaction throughput.
+
+    ``queued_ms`` is the wait for the user's previous job, ``scoring_ms`` the
+    worker-side scoring time and ``total_ms`` the whole run including the
+    in-session reads and writes.
+    """
+    histogram = _instruments.get("reconciliation_job_duration")
+    if histogram is not None:
+        for stage, duration_ms in (("queued", queued_ms), ("scoring", scoring_ms), ("total", total_ms)):
+            histogram.record(duration_ms, {"stage": stage, "outcome": outcome})
+    counter = _instruments.get("reconciliation_job_transactions")
+    if counter is not None:
+        counter.add(transactions, {"outcome": outcome})
+
+
+def record_fx_rate_cache_lookup(*, outcome: str) -> None:
+    counter = _instruments.get("fx_rate_cache_lookup")
+    if counter is not None:
+        counter.add(1, {"outcome": outcome})
+
+
+def record_fx_rate_cache_eviction(*, reason: str, count: int = 1) -> None:
+    counter = _instruments.get("fx_rate_cache_eviction")
+    if counter is not None:
+        counter.add(count, {"reason": reason})
+
+
+def record_report_cache_lookup(*, kind: str, outcome: str) -> None:
+    counter = _instruments.get("report_cache_lookup")
+    if counter is not None:
+        counter.add(1, {"kind": kind, "outcome": outcome})
+
+
+def record_report_cache_eviction(*, reason: str, count: int = 1) -> None:
+    counter = _instruments.get("report_cache_eviction")
+    if counter is not None:
+        counter.add(count, {"reason": reason})
+
+
 def record_confidence_north_star(*, score: float, source: str = "scheduled") -> None:
     histogram = _instruments.get("confidence_north_star")
     if histogram is not None:
@@ -41,6 +41,7 @@ from src.portfolio.extension import (
     calculate_money_weighted_return,
     calculate_time_weighted_return,
     calculate_xirr,
+    calculate_xirr_by_account,
     get_asset_class_allocation,
     get_geography_allocation,
     get_sector_allocation,
@@ -92,6 +93,7 @@ __all__ = [
     "calculate_money_weighted_return",
     "calculate_time_weighted_return",
     "calculate_xirr",
+    "calculate_xirr_by_account",
     "get_asset_class_allocation",
     "get_geography_allocation",
     "get_sector_allocation",
@@ -34,6 +34,7 @@ from src.portfolio.extension.performance import (
     calculate_money_weighted_return,
     calculate_time_weighted_return,
     calculate_xirr,
+    calculate_xirr_by_account,
 )
 from src.portfolio.extension.performance_report import (
     build_investment_performance_report_schedule,
@@ -49,6 +50,7 @@ __all__ = [
     "calculate_money_weighted_return",
     "calculate_time_weighted_return",
     "calculate_xirr",
+    "calculate_xirr_by_account",
     "get_asset_class_allocation",
     "get_geography_allocation",
     "get_sector_allocation",
@@ -2,14 +2,18 @@
 
 Moved from ``services/portfolio.py`` (#1643, standard-preserving move): the
 error classes now live in ``base/errors.py`` and every FX conversion goes
-through ``pricing``'s published surface (``convert_amount``/``convert_money``
-with ``lazy_load=True`` — same crawler-fallback behavior the old
-``services/fx.py`` path had). A conversion miss therefore surfaces as
-``pricing.PricingError`` (``NoObservationError``), not the retired
+through ``pricing``'s published surface (``convert_amount`` or a
+``PrefetchedFxRates`` batch with ``lazy_load=True`` — same crawler-fallback
+behavior the old ``services/fx.py`` path had). A conversion miss therefore
+surfaces as ``pricing.PricingError`` (``NoObservationError``), not the retired
 ``FxRateError``.
+
+Holdings, summary and P&L resolve prices in bulk (``extension/prices.py``),
+read classification snapshots in one query and convert every leg from one
+FX prefetch, so their round trips do not grow with the position count.
 """
 
-from collections.abc import Sequence
+from collections.abc import Collection, Iterable, Sequence
 from datetime import date
 from decimal import Decimal
 from uuid import UUID
@@ -31,8 +35,13 @@ from src.portfolio.base.errors import (
     InvalidDateRangeError,
     PortfolioNotFoundError,
 )
+from src.portfolio.extension.prices import (
+    PORTFOLIO_QUANTITY_UNIT,
+    latest_synced_stock_prices,
+    resolve_latest_prices,
+)
 from src.portfolio.orm.portfolio import DividendIncome, InvestmentTransaction, InvestmentTransactionType
-from src.pricing import MarketDataOverride, PriceSource, StockPrice, convert_amount, convert_money
+from src.pricing import MarketDataOverride, PrefetchedFxRates, PriceSource, convert_amount
 from src.schemas.portfolio import (
     HoldingResponse,
     PortfolioSummaryResponse,
@@ -48,8 +57,6 @@ settings = src.config.settings
 
 logger = get_logger(__name__)
 
-PORTFOLIO_QUANTITY_UNIT = "units"
-
 
 async def _account_names_by_id(
     db: AsyncSession,
@@ -89,8 +96,8 @@ def _derive_provenance(source_documents: object) -> DataProvenance | None:
     return None
 
 
-async def _convert_pnl(
-    db: AsyncSession,
+def _convert_pnl(
+    fx_rates: PrefetchedFxRates,
     *,
     value: Money,
     value_rate_date: date,
@@ -105,9 +112,16 @@ async def _convert_pnl(
     snapshot paths: convert each leg at its own FX rate-date (no-op when already
     in target), optionally quantize per-value, then ``pnl = value - cost`` and the
     ``pnl / cost`` ratio. Returns ``(converted_value, converted_cost, pnl, ratio)``.
+    Both legs' rates must already be in ``fx_rates`` (see :func:`_prefetch_pnl_rates`).
     """
-    converted_value = await convert_money(db, value, target_currency, rate_date=value_rate_date, lazy_load=True)
-    converted_cost = await convert_money(db, cost, target_currency, rate_date=cost_rate_date, lazy_load=True)
+    converted_value = Money(
+        fx_rates.convert_amount(value.amount, value.currency.code, target_currency, value_rate_date),
+        target_currency,
+    )
+    converted_cost = Money(
+        fx_rates.convert_amount(cost.amount, cost.currency.code, target_currency, cost_rate_date),
+        target_currency,
+    )
     if quantize:
         converted_value = converted_value.quantize()
         converted_cost = converted_cost.quantize()
@@ -116,6 +130,57 @@ async def _convert_pnl(
     return converted_value, converted_cost, pnl, ratio
 
 
+async def _prefetch_pnl_rates(
+    db: AsyncSession,
+    legs: Iterable[tuple[str, date]],
+    target_currency: str,
+) -> PrefetchedFxRates:
+    """Prefetch every ``(source_currency, rate_date)`` leg into ``target_currency`` in one batch."""
+    fx_rates = PrefetchedFxRates(lazy_load=True)
+    await fx_rates.prefetch(db, [(currency, target_currency, rate_date, None, None) for currency, rate_date in legs])
+    return fx_rates
+
+
+def _position_pnl_legs(position: ManagedPosition, value_rate_date: date) -> tuple[tuple[str, date], tuple[str, date]]:
+    """A managed position's value leg (at ``value_rate_date``) and cost leg (at acquisition)."""
+    return (
+        (position.currency, value_rate_date),
+        (position.cost_basis_money.currency.code, position.acquisition_date),
+    )
+
+
+def _require_price(prices: dict[tuple[UUID, date], Decimal], position: ManagedPosition, eval_date: date) -> Decimal:
+    price = prices.get((position.id, eval_date))
+    if price is None:
+        raise AssetNotFoundError(f"No price data available for {position.asset_identifier} on {eval_date}")
+    return price
+
+
+def _match_managed_position(
+    positions: Sequence[ManagedPosition],
+    account_names: dict[UUID, str],
+    snapshot: AtomicPosition,
+) -> ManagedPosition | None:
+    """Pick the reconciled managed position (same asset) that corresponds to an atomic snapshot.
+
+    The broker match (position metadata or account name) wins; otherwise the
+    first active position, otherwise the first candidate.
+    """
+    if not positions:
+        return None
+
+    broker = (snapshot.broker or "").strip().lower()
+    if broker:
+        for position in positions:
+            metadata_broker = str((position.position_metadata or {}).get("broker", "")).strip().lower()
+            account_name = (account_names.get(position.account_id) or "").strip().lower()
+            if metadata_broker == broker or account_name == broker:
+                return position
+
+    active_position = next((position for position in positions if position.status == PositionStatus.ACTIVE), None)
+    return active_position or positions[0]
+
+
 class PortfolioService:
     """Service for managing portfolio holdings and P&L calculations."""
 
@@ -179,19 +244,26 @@ class PortfolioService:
             raise PortfolioNotFoundError(f"No holdings found for user {user_id}")
 
         account_names = await _account_names_by_id(db, user_id, {p.account_id for p in positions})
+        prices = await self._get_latest_prices(db, [(position, eval_date) for position in positions], user_id)
+        latest_atomics = await self._get_latest_atomics(db, [p.asset_identifier for p in positions], user_id)
+        fx_rates = await _prefetch_pnl_rates(
+            db,
+            [leg for position in positions for leg in _position_pnl_legs(position, eval_date)],
+            settings.base_currency,
+        )
 
         holdings: list[HoldingResponse] = []
 
         for position in positions:
-            # Get latest market price from AtomicPosition (per-unit price)
-            latest_price = await self._get_latest_price(db, position, eval_date, user_id)
+            # Latest per-unit market price (override > synced price > snapshot)
+            latest_price = _require_price(prices, position, eval_date)
 
             # Market value as money-per-unit × quantity, converted to base currency.
-            # convert_money is a no-op when already in base, so no if/else branch.
+            # Conversion is a no-op when already in base, so no if/else branch.
             position_quantity = position.quantity_qty.quantize()
             market_value = UnitPrice(latest_price, position.currency, PORTFOLIO_QUANTITY_UNIT) * position_quantity
-            converted_value, converted_cost, unrealized_pnl, unrealized_pnl_ratio = await _convert_pnl(
-                db,
+            converted_value, converted_cost, unrealized_pnl, unrealized_pnl_ratio = _convert_pnl(
+                fx_rates,
                 value=market_value,
                 value_rate_date=eval_date,
                 cost=position.cost_basis_money,
@@ -207,7 +279,7 @@ class PortfolioService:
             geography = None
 
             provenance = None
-            latest_atomic = await self._get_latest_atomic(db, position.asset_identifier, user_id)
+            latest_atomic = latest_atomics.get(position.asset_identifier)
             if latest_atomic:
                 asset_type = latest_atomic.asset_type
                 sector = latest_atomic.sector
@@ -279,15 +351,38 @@ class PortfolioService:
         if not snapshots:
             raise PortfolioNotFoundError(f"No holdings found for user {user_id} as of {as_of_date}")
 
-        holdings: list[HoldingResponse] = []
-        account_names: dict[UUID, str] = {}
+        # Candidate managed positions, their account names and the synced prices
+        # for every snapshot are each read once, then matched in memory.
+        positions_result = await db.execute(
+            select(ManagedPosition)
+            .where(ManagedPosition.user_id == user_id)
+            .where(ManagedPosition.asset_identifier.in_({snapshot.asset_identifier for snapshot in snapshots}))
+        )
+        positions_by_asset: dict[str, list[ManagedPosition]] = {}
+        for candidate in positions_result.scalars().all():
+            positions_by_asset.setdefault(candidate.asset_identifier, []).append(candidate)
+        account_names = await _account_names_by_id(
+            db,
+            user_id,
+            {candidate.account_id for candidates in positions_by_asset.values() for candidate in candidates},
+        )
+        synced_prices = await latest_synced_stock_prices(
+            db,
+            {(snapshot.asset_identifier, as_of_date) for snapshot in snapshots},
+        )
+
+        matched: list[tuple[AtomicPosition, PositionStatus, ManagedPosition, Money, Money, date]] = []
         for snapshot in snapshots:
             snapshot_quantity = Quantity(snapshot.quantity, PORTFOLIO_QUANTITY_UNIT).quantize()
             status = PositionStatus.DISPOSED if snapshot_quantity.is_zero() else PositionStatus.ACTIVE
             if status == PositionStatus.DISPOSED and not include_disposed:
                 continue
 
-            position = await self._get_managed_position_for_snapshot(db, user_id=user_id, snapshot=snapshot)
+            position = _match_managed_position(
+                positions_by_asset.get(snapshot.asset_identifier, []),
+                account_names,
+                snapshot,
+            )
             if position is None:
                 logger.warning(
                     "Skipping atomic snapshot without reconciled managed position",
@@ -310,10 +405,7 @@ class PortfolioService:
                     )
                 continue
 
-            if position.account_id not in account_names:
-                account_names.update(await _account_names_by_id(db, user_id, {position.account_id}))
-
-            synced_price = await self._get_latest_synced_stock_price(db, snapshot.asset_identifier, as_of_date)
+            synced_price = synced_prices.get((snapshot.asset_identifier, as_of_date))
             if synced_price is not None and not snapshot_quantity.is_zero():
                 market_money = (
                     UnitPrice(synced_price.price, synced_price.currency, PORTFOLIO_QUANTITY_UNIT) * snapshot_quantity
@@ -328,11 +420,24 @@ class PortfolioService:
                 market_money = Money(snapshot.market_value, snapshot.currency)
                 cost_money = Money(snapshot.market_value, snapshot.currency)
                 cost_rate_date = as_of_date
+            matched.append((snapshot, status, position, market_money, cost_money, cost_rate_date))
+
+        fx_rates = await _prefetch_pnl_rates(
+            db,
+            [
+                leg
+                for *_, market_money, cost_money, cost_rate_date in matched
+                for leg in ((market_money.currency.code, as_of_date), (cost_money.currency.code, cost_rate_date))
+            ],
+            settings.base_currency,
+        )
 
+        holdings: list[HoldingResponse] = []
+        for snapshot, status, position, market_money, cost_money, cost_rate_date in matched:
             # Market and cost may carry different source currencies (and rate-dates);
             # convert each to base (no-op when already base) and derive P&L.
-            converted_market_value, converted_cost_basis, unrealized_pnl, unrealized_pnl_ratio = await _convert_pnl(
-                db,
+            converted_market_value, converted_cost_basis, unrealized_pnl, unrealized_pnl_ratio = _convert_pnl(
+                fx_rates,
                 value=market_money,
                 value_rate_date=as_of_date,
                 cost=cost_money,
@@ -375,35 +480,6 @@ class PortfolioService:
         await db.flush()
         return holdings
 
-    async def _get_managed_position_for_snapshot(
-        self,
-        db: AsyncSession,
-        *,
-        user_id: UUID,
-        snapshot: AtomicPosition,
-    ) -> ManagedPosition | None:
-        """Find the reconciled managed position that corresponds to an atomic snapshot."""
-        result = await db.execute(
-            select(ManagedPosition)
-            .where(ManagedPosition.user_id == user_id)
-            .where(ManagedPosition.asset_identifier == snapshot.asset_identifier)
-        )
-        positions = list(result.scalars().all())
-        if not positions:
-            return None
-
-        broker = (snapshot.broker or "").strip().lower()
-        if broker:
-            account_names = await _account_names_by_id(db, user_id, {p.account_id for p in positions})
-            for position in positions:
-                metadata_broker = str((position.position_metadata or {}).get("broker", "")).strip().lower()
-                account_name = (account_names.get(position.account_id) or "").strip().lower()
-                if metadata_broker == broker or account_name == broker:
-                    return position
-
-        active_position = next((position for position in positions if position.status == PositionStatus.ACTIVE), None)
-        return active_position or positions[0]
-
     async def calculate_realized_pnl(
         self,
         db: AsyncSession,
@@ -458,18 +534,26 @@ class PortfolioService:
         total_converted_cost = Decimal("0")
         details: list[dict] = []
 
+        # disposal_date is guaranteed non-None by the isnot(None) filter above
+        disposals = [(position, position.disposal_date) for position in disposed_positions if position.disposal_date]
+        prices = await self._get_latest_prices(db, disposals, user_id)
+        fx_rates = await _prefetch_pnl_rates(
+            db,
+            [leg for position, disposal_date in disposals for leg in _position_pnl_legs(position, disposal_date)],
+            settings.base_currency,
+        )
+
         for position in disposed_positions:
-            # Get disposal price from latest AtomicPosition (per-unit price)
-            # disposal_date is guaranteed non-None by the isnot(None) filter above
             assert position.disposal_date is not None
-            disposal_price = await self._get_latest_price(db, position, position.disposal_date, user_id)
+            # Disposal price: latest per-unit price on the disposal date
+            disposal_price = _require_price(prices, position, position.disposal_date)
             position_quantity = position.quantity_qty.quantize()
             disposal_value = UnitPrice(disposal_price, position.currency, PORTFOLIO_QUANTITY_UNIT) * position_quantity
 
             # Disposal valued at disposal-date FX, cost at acquisition-date FX; per-position
             # values are not quantized here — only the response total is.
-            converted_disposal, converted_cost, realized_pnl, realized_pnl_ratio = await _convert_pnl(
-                db,
+            converted_disposal, converted_cost, realized_pnl, realized_pnl_ratio = _convert_pnl(
+                fx_rates,
                 value=disposal_value,
                 value_rate_date=position.disposal_date,
                 cost=position.cost_basis_money,
@@ -552,18 +636,24 @@ class PortfolioService:
         total_cost_basis = Decimal("0")
         total_unrealized_pnl = Decimal("0")
         details: list[dict] = []
+        prices = await self._get_latest_prices(db, [(position, eval_date) for position in positions], user_id)
+        fx_rates = await _prefetch_pnl_rates(
+            db,
+            [leg for position in positions for leg in _position_pnl_legs(position, eval_date)],
+            settings.base_currency,
+        )
 
         for position in positions:
-            # Get latest market price from AtomicPosition (per-unit price)
-            latest_price = await self._get_latest_price(db, position, eval_date, user_id)
+            # Latest per-unit market price (override > synced price > snapshot)
+            latest_price = _require_price(prices, position, eval_date)
 
             # Calculate market value
             position_quantity = position.quantity_qty.quantize()
             market_value = UnitPrice(latest_price, position.currency, PORTFOLIO_QUANTITY_UNIT) * position_quantity
 
             # Per-position values are not quantized here — only the response total is.
-            converted_market, converted_cost, unrealized_pnl, unrealized_pnl_ratio = await _convert_pnl(
-                db,
+            converted_market, converted_cost, unrealized_pnl, unrealized_pnl_ratio = _convert_pnl(
+                fx_rates,
                 value=market_value,
                 value_rate_date=eval_date,
                 cost=position.cost_basis_money,
@@ -742,7 +832,8 @@ class PortfolioService:
         """
         Get latest per-unit market price for a position from override or AtomicPosition.
 
-        Priority: MarketDataOverride > AtomicPosition snapshot on eval_date > earliest available.
+        Priority: MarketDataOverride > synced StockPrice > latest AtomicPosition snapshot
+        on or before eval_date. Single-position form of :meth:`_get_latest_prices`.
 
         Args:
             db: Database session
@@ -756,75 +847,51 @@ class PortfolioService:
         Raises:
             AssetNotFoundError: If no price data available
         """
-        # Check for manual override first (scoped by user_id)
-        override_query = (
-            select(MarketDataOverride)
-            .where(MarketDataOverride.user_id == user_id)
-            .where(MarketDataOverride.asset_identifier == position.asset_identifier)
-            .where(MarketDataOverride.price_date == eval_date)
-            .where(MarketDataOverride.source == PriceSource.MANUAL)
-        )
-        override_result = await db.execute(override_query)
-        override = override_result.scalar_one_or_none()
-
-        if override:
-            return override.price
-
-        synced_price = await self._get_latest_synced_stock_price(db, position.asset_identifier, eval_date)
-        if synced_price is not None:
-            if synced_price.currency == position.currency:
-                return synced_price.price
-            return await convert_amount(
-                db,
-                amount=synced_price.price,
-                currency=synced_price.currency,
-                target_currency=position.currency,
-                rate_date=eval_date,
-                lazy_load=True,
-            )
-
-        # Get latest snapshot from AtomicPosition (scoped by user_id)
-        snapshot_query = (
-            select(AtomicPosition)
-            .where(AtomicPosition.user_id == user_id)
-            .where(AtomicPosition.asset_identifier == position.asset_identifier)
-            .where(AtomicPosition.snapshot_date <= eval_date)
-            .order_by(AtomicPosition.snapshot_date.desc())
-            .limit(1)
-        )
-        snapshot_result = await db.execute(snapshot_query)
-        snapshot = snapshot_result.scalar_one_or_none()
-
-        if snapshot:
-            # Return per-unit price (market_value is total position value)
-            snapshot_quantity = Quantity(snapshot.quantity, PORTFOLIO_QUANTITY_UNIT).quantize()
-            if not snapshot_quantity.is_zero():
-                return snapshot.market_value / snapshot_quantity.value
-            return snapshot.market_value
-
-        # No price data available
-        raise AssetNotFoundError(f"No price data available for {position.asset_identifier} on {eval_date}")
+        prices = await self._get_latest_prices(db, [(position, eval_date)], user_id)
+        return _require_price(prices, position, eval_date)
 
-    async def _get_latest_synced_stock_price(
+    async def _get_latest_prices(
         self,
         db: AsyncSession,
-        asset_identifier: str,
-        eval_date: date,
-    ) -> StockPrice | None:
-        """Return the latest synced daily stock price on or before eval_date."""
-        return await db.scalar(
-            select(StockPrice)
-            .where(StockPrice.symbol == asset_identifier.strip().upper())
-            .where(StockPrice.price_date <= eval_date)
-            .order_by(
-                StockPrice.price_date.desc(),
-                StockPrice.created_at.desc(),
-                StockPrice.source.asc(),
-                StockPrice.currency.asc(),
-                StockPrice.id.asc(),
-            )
-            .limit(1)
+        requests: Collection[tuple[ManagedPosition, date]],
+        user_id: UUID,
+    ) -> dict[tuple[UUID, date], Decimal]:
+        """
+        Get latest per-unit market prices for many ``(position, eval_date)`` requests at once.
+
+        One query per price source (see ``extension/prices.py`` for the
+        precedence) plus one FX batch that converts synced prices quoted in
+        another currency into each position's currency at its eval_date.
+
+        Returns:
+            dict mapping (position.id, eval_date) -> per-unit price in the
+            position's currency; requests with no price data are absent
+        """
+        quotes = await resolve_latest_prices(
+            db,
+            user_id,
+            {(position.asset_identifier, eval_date) for position, eval_date in requests},
         )
+        fx_needs: list[tuple[str, str, date, date | None, date | None]] = []
+        for position, eval_date in requests:
+            quote = quotes.get((position.asset_identifier, eval_date))
+            if quote is not None and quote.currency is not None and quote.currency != position.currency:
+                fx_needs.append((quote.currency, position.currency, eval_date, None, None))
+        fx_rates = PrefetchedFxRates(lazy_load=True)
+        await fx_rates.prefetch(db, fx_needs)
+
+        prices: dict[tuple[UUID, date], Decimal] = {}
+        for position, eval_date in requests:
+            quote = quotes.get((position.asset_identifier, eval_date))
+            if quote is None:
+                continue
+            if quote.currency is None or quote.currency == position.currency:
+                prices[(position.id, eval_date)] = quote.price
+            else:
+                prices[(position.id, eval_date)] = fx_rates.convert_amount(
+                    quote.price, quote.currency, position.currency, eval_date
+                )
+        return prices
 
     async def _default_holdings_eval_date(self, db: AsyncSession, user_id: UUID) -> date:
         """Use today unless the latest imported portfolio snapshot is newer."""
@@ -855,15 +922,36 @@ class PortfolioService:
         Returns:
             Latest AtomicPosition or None if not found
         """
-        query = (
-            select(AtomicPosition)
+        latest = await self._get_latest_atomics(db, [asset_identifier], user_id)
+        return latest.get(asset_identifier)
+
+    async def _get_latest_atomics(
+        self,
+        db: AsyncSession,
+        asset_identifiers: Collection[str],
+        user_id: UUID,
+    ) -> dict[str, AtomicPosition]:
+        """Batch form of :meth:`_get_latest_atomic`: latest snapshot per asset identifier, one query."""
+        if not asset_identifiers:
+            return {}
+        row_num = (
+            func.row_number()
+            .over(
+                partition_by=AtomicPosition.asset_identifier,
+                order_by=[AtomicPosition.snapshot_date.desc(), AtomicPosition.created_at.desc()],
+            )
+            .label("rn")
+        )
+        subq = (
+            select(AtomicPosition.id, row_num)
             .where(AtomicPosition.user_id == user_id)
-            .where(AtomicPosition.asset_identifier == asset_identifier)
-            .order_by(AtomicPosition.snapshot_date.desc())
-            .limit(1)
+            .where(AtomicPosition.asset_identifier.in_(set(asset_identifiers)))
+            .subquery()
+        )
+        result = await db.execute(
+            select(AtomicPosition).join(subq, AtomicPosition.id == subq.c.id).where(subq.c.rn == 1)
         )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        return {snapshot.asset_identifier: snapshot for snapshot in result.scalars().all()}
 
     async def get_realized_pnl_by_asset(
         self,
@@ -2,9 +2,21 @@
 
 Moved from ``services/performance.py`` (#1643, standard-preserving move):
 the error classes now live in ``base/errors.py`` and FX conversion goes
-through ``pricing``'s published ``convert_amount``.
+through ``pricing``'s published surface. Each metric resolves the rates it
+needs with ONE ``PrefetchedFxRates`` batch (every cash-flow date plus the
+valuation dates) and converts in memory with ``convert_amount``'s rate and
+``Money`` rounding, instead of one FX resolution per transaction.
+
+XIRR roots are located in float64 (Newton, then Brent over the bisection
+bracket) on dimensionless weights and accepted only through a Decimal Newton
+step at that rate, so the returned rate carries the Decimal solver's
+tolerance guarantee; the float search just saves the Decimal iterations.
 """
 
+import math
+import sys
+from collections import defaultdict
+from collections.abc import Callable, Collection, Iterable
 from datetime import date, timedelta
 from decimal import Decimal, localcontext
 from uuid import UUID
@@ -13,20 +25,30 @@ from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.config
+from src.audit.money import Money
+from src.audit.quantity import Quantity
 from src.audit.ratio import Ratio
+from src.audit.unit_price import UnitPrice
 from src.extraction.orm.layer2 import AtomicPosition
 from src.extraction.orm.layer3 import ManagedPosition
 from src.ledger import Account
 from src.observability import get_logger
 from src.portfolio.base.errors import InsufficientDataError, XIRRCalculationError
+from src.portfolio.extension.prices import PORTFOLIO_QUANTITY_UNIT, resolve_latest_prices
 from src.portfolio.orm.portfolio import DividendIncome, InvestmentTransaction, InvestmentTransactionType
-from src.pricing import convert_amount
+from src.pricing import PrefetchedFxRates
 
 # Bound from the bare published root (config publishes no named symbols).
 settings = src.config.settings
 
 logger = get_logger(__name__)
 
+# Float64 root search: Newton from the Decimal solver's default guess, then
+# Brent over the same bracket _xirr_bisection searches.
+_XIRR_FLOAT_BRACKET = (-0.99, 10.0)
+_XIRR_FLOAT_MAX_ITER = 100
+_XIRR_FLOAT_TOLERANCE = 1e-12
+
 
 async def batch_latest_atomic_positions(
     db: AsyncSession,
@@ -112,11 +134,6 @@ async def calculate_xirr(
     if as_of_date is None:
         as_of_date = date.today()
 
-    # Collect cash flows (transactions)
-    cash_flows: list[tuple[date, Decimal]] = []
-    dates: list[date] = []
-    amounts: list[Decimal] = []
-
     # Get investment cash flows up to as_of_date. Bank atomic transactions are
     # general ledger cash movements and must not contaminate portfolio returns.
     query = select(InvestmentTransaction).where(
@@ -126,25 +143,104 @@ async def calculate_xirr(
     result = await db.execute(query)
     transactions = result.scalars().all()
 
-    # Convert transactions to cash flows using XIRR convention:
-    # BUY = negative investor cash outflow; SELL/DIVIDEND = positive inflow.
-    for txn in transactions:
-        amount_base = await convert_amount(
-            db,
-            txn.gross_amount,
-            txn.currency,
-            settings.base_currency,
-            txn.transaction_date,
-        )
-        sign = -1 if txn.transaction_type == InvestmentTransactionType.BUY else 1
-        cash_flows.append((txn.transaction_date, amount_base * sign))
-        dates.append(txn.transaction_date)
-        amounts.append(amount_base * sign)
+    held = await _held_positions(db, user_id, as_of_date)
+    fx_rates = await _prefetch_base_rates(
+        db,
+        [
+            *((txn.currency, txn.transaction_date) for txn in transactions),
+            *((market_value.currency.code, as_of_date) for _account_id, market_value in held),
+        ],
+    )
 
-    # Get position value as of as_of_date as the final cash flow (positive =
+    cash_flows = [(txn.transaction_date, _xirr_cash_flow(fx_rates, txn)) for txn in transactions]
+    # Position value as of as_of_date is the final cash flow (positive =
     # portfolio value).
-    total_value = await _get_portfolio_value(db, user_id, as_of_date)
+    return _solve_xirr(cash_flows, as_of_date, _held_value(fx_rates, held, as_of_date))
+
+
+async def calculate_xirr_by_account(
+    db: AsyncSession,
+    user_id: UUID,
+    account_ids: Collection[UUID],
+    as_of_date: date | None = None,
+) -> dict[UUID, Decimal | None]:
+    """
+    Calculate XIRR for several investment accounts in one call.
+
+    Same cash-flow convention as :func:`calculate_xirr`, scoped per account: a
+    transaction belongs to the account of its ``ManagedPosition`` (rows with no
+    ``position_id`` cannot be attributed and are left out), and the final cash
+    flow is that account's own holdings value. One transaction query, one
+    holdings read and one FX prefetch serve every account.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        account_ids: Investment (broker) account IDs
+        as_of_date: Calculate as of this date (default: today)
+
+    Returns:
+        dict mapping each requested account ID to its annualized return as a
+        percentage, or None when the account has too few cash flows or its
+        XIRR fails to converge -- one account never fails the batch
+    """
+    if as_of_date is None:
+        as_of_date = date.today()
+    wanted = list(dict.fromkeys(account_ids))
+    if not wanted:
+        return {}
+
+    query = (
+        select(ManagedPosition.account_id, InvestmentTransaction)
+        .join(ManagedPosition, InvestmentTransaction.position_id == ManagedPosition.id)
+        .where(
+            InvestmentTransaction.user_id == user_id,
+            InvestmentTransaction.transaction_date <= as_of_date,
+            ManagedPosition.account_id.in_(wanted),
+        )
+    )
+    result = await db.execute(query)
+    rows = result.all()
+
+    held = await _held_positions(db, user_id, as_of_date, wanted)
+    fx_rates = await _prefetch_base_rates(
+        db,
+        [
+            *((txn.currency, txn.transaction_date) for _account_id, txn in rows),
+            *((market_value.currency.code, as_of_date) for _account_id, market_value in held),
+        ],
+    )
 
+    cash_flows: dict[UUID, list[tuple[date, Decimal]]] = defaultdict(list)
+    for account_id, txn in rows:
+        cash_flows[account_id].append((txn.transaction_date, _xirr_cash_flow(fx_rates, txn)))
+    holdings: dict[UUID, list[tuple[UUID, Money]]] = defaultdict(list)
+    for account_id, market_value in held:
+        holdings[account_id].append((account_id, market_value))
+
+    xirrs: dict[UUID, Decimal | None] = {}
+    for account_id in wanted:
+        try:
+            xirrs[account_id] = _solve_xirr(
+                cash_flows[account_id],
+                as_of_date,
+                _held_value(fx_rates, holdings[account_id], as_of_date),
+            )
+        except (InsufficientDataError, XIRRCalculationError):
+            xirrs[account_id] = None
+    return xirrs
+
+
+def _xirr_cash_flow(fx_rates: PrefetchedFxRates, txn: InvestmentTransaction) -> Decimal:
+    """XIRR convention: BUY = negative investor cash outflow; SELL/DIVIDEND = positive inflow."""
+    amount_base = _to_base(fx_rates, txn.gross_amount, txn.currency, txn.transaction_date)
+    return -amount_base if txn.transaction_type == InvestmentTransactionType.BUY else amount_base
+
+
+def _solve_xirr(cash_flows: list[tuple[date, Decimal]], as_of_date: date, total_value: Decimal) -> Decimal:
+    """Solve the annualized XIRR (as a percentage) of base-currency cash flows plus the closing value."""
+    dates = [flow_date for flow_date, _amount in cash_flows]
+    amounts = [amount for _flow_date, amount in cash_flows]
     if total_value > Decimal("0"):
         dates.append(as_of_date)
         amounts.append(total_value)
@@ -157,10 +253,14 @@ async def calculate_xirr(
     first_date = min(dates)
     day_offsets = [(d - first_date).days for d in dates]
 
-    # Solve for XIRR using Newton's method with bisection fallback
+    # Solve for XIRR: float64 root search, then Newton's method in Decimal
+    # (bisection fallback) seeded at that root -- its first step is the
+    # residual check that accepts it.
     # XIRR formula: Sum of (cash_flow_i / (1 + xirr)^(days_i / 365)) = 0
     try:
-        xirr = _xirr_newton(amounts, day_offsets, guess=Decimal("0.1"), max_iter=100, tolerance=Decimal("1e-6"))
+        seed = _xirr_float_root(amounts, day_offsets)
+        guess = Decimal("0.1") if seed is None else seed
+        xirr = _xirr_newton(amounts, day_offsets, guess=guess, max_iter=100, tolerance=Decimal("1e-6"))
         xirr_ratio = Ratio(xirr)
         return xirr_ratio.to_percent()
     except (ValueError, RuntimeError) as e:
@@ -168,12 +268,96 @@ async def calculate_xirr(
         raise XIRRCalculationError(f"XIRR calculation failed to converge: {e}") from e
 
 
+def _xirr_float_root(amounts: list[Decimal], days: list[int]) -> Decimal | None:
+    """
+    Locate the XIRR root in float64, or None if the float search finds none.
+
+    Only a starting point for :func:`_xirr_newton`. The flows are divided by
+    the largest magnitude in Decimal first, so the search runs on
+    dimensionless weights in [-1, 1] -- never on monetary amounts -- and the
+    year fractions and ``log1p(rate)`` are computed once per evaluation rather
+    than one Decimal ``ln``/``exp`` pair per cash flow.
+    """
+    scale = max(abs(amount) for amount in amounts)
+    if scale == Decimal("0"):
+        return None
+    weights = [float(amount / scale) for amount in amounts]
+    years = [day / 365.0 for day in days]
+
+    def npv(rate: float) -> float:
+        log_base = math.log1p(rate)
+        return math.fsum(weight * math.exp(-year * log_base) for weight, year in zip(weights, years))
+
+    try:
+        rate = 0.1
+        for _ in range(_XIRR_FLOAT_MAX_ITER):
+            log_base = math.log1p(rate)
+            discounted = [weight * math.exp(-year * log_base) for weight, year in zip(weights, years)]
+            slope = -math.fsum(year * flow for year, flow in zip(years, discounted)) / (1.0 + rate)
+            if slope == 0.0:
+                break
+            step = math.fsum(discounted) / slope
+            rate -= step
+            if not _XIRR_FLOAT_BRACKET[0] < rate < math.inf:
+                break
+            if abs(step) < _XIRR_FLOAT_TOLERANCE * max(1.0, abs(rate)):
+                return Decimal(repr(rate))
+        root = _brent_root(npv, *_XIRR_FLOAT_BRACKET)
+    except (OverflowError, ValueError, ZeroDivisionError):
+        return None
+    return None if root is None else Decimal(repr(root))
+
+
+def _brent_root(f: Callable[[float], float], lo: float, hi: float) -> float | None:
+    """Brent's method on a sign-changing bracket; None if ``[lo, hi]`` does not bracket a root."""
+    a, b = lo, hi
+    fa, fb = f(a), f(b)
+    if fa * fb > 0.0:
+        return None
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(_XIRR_FLOAT_MAX_ITER):
+        if fb * fc > 0.0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2.0 * sys.float_info.epsilon * abs(b) + 0.5 * _XIRR_FLOAT_TOLERANCE
+        half = 0.5 * (c - b)
+        if abs(half) <= tol or fb == 0.0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation, or secant when only two points differ.
+            s = fb / fa
+            if a == c:
+                p, q = 2.0 * half * s, 1.0 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2.0 * half * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * half * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = half
+        else:
+            d = e = half
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, half)
+        fb = f(b)
+    return None
+
+
 def _xirr_newton(amounts: list[Decimal], days: list[int], guess: Decimal, max_iter: int, tolerance: Decimal) -> Decimal:
     """
     Calculate XIRR using Newton's method with bisection fallback.
 
     Accepts Decimal parameters and returns a Decimal result without converting
-    monetary cash flows to float.
+    monetary cash flows to float. Each iteration takes one ``ln`` of the rate
+    base and one ``exp`` per cash flow, shared by the NPV and its derivative.
 
     Args:
         amounts: Cash flow amounts (negative for outflows, positive for inflows)
@@ -194,10 +378,14 @@ def _xirr_newton(amounts: list[Decimal], days: list[int], guess: Decimal, max_it
         if base <= Decimal("0"):
             break
 
-        npv = sum(cf / _decimal_power(base, Decimal(day) / Decimal("365")) for cf, day in zip(amounts, days))
+        with localcontext() as ctx:
+            ctx.prec = max(ctx.prec, 34)
+            log_base = base.ln()
+            discounts = [(log_base * Decimal(day) / Decimal("365")).exp() for day in days]
+        npv = sum(cf / discount for cf, discount in zip(amounts, discounts))
         d_npv = sum(
-            -(Decimal(day) / Decimal("365")) * cf / _decimal_power(base, (Decimal(day) / Decimal("365")) + Decimal("1"))
-            for cf, day in zip(amounts, days)
+            -(Decimal(day) / Decimal("365")) * cf / (discount * base)
+            for cf, day, discount in zip(amounts, days, discounts)
         )
         if abs(d_npv) < Decimal("1e-10"):
             break
@@ -291,8 +479,8 @@ async def calculate_time_weighted_return(
         InsufficientDataError: Need at least two position snapshots
     """
     # Get position snapshots at start and end of period
-    start_value = await _get_portfolio_value(db, user_id, period_start)
-    end_value = await _get_portfolio_value(db, user_id, period_end)
+    start_held = await _held_positions(db, user_id, period_start)
+    end_held = await _held_positions(db, user_id, period_end)
 
     # Get net investment cash flows during period. Positive values are money
     # added to the portfolio; negative values are money withdrawn.
@@ -306,15 +494,20 @@ async def calculate_time_weighted_return(
     result = await db.execute(query)
     transactions = result.scalars().all()
 
+    fx_rates = await _prefetch_base_rates(
+        db,
+        [
+            *((market_value.currency.code, period_start) for _account_id, market_value in start_held),
+            *((market_value.currency.code, period_end) for _account_id, market_value in end_held),
+            *((txn.currency, txn.transaction_date) for txn in transactions),
+        ],
+    )
+    start_value = _held_value(fx_rates, start_held, period_start)
+    end_value = _held_value(fx_rates, end_held, period_end)
+
     net_cash_flow = Decimal("0")
     for txn in transactions:
-        amount_base = await convert_amount(
-            db,
-            txn.gross_amount,
-            txn.currency,
-            settings.base_currency,
-            txn.transaction_date,
-        )
+        amount_base = _to_base(fx_rates, txn.gross_amount, txn.currency, txn.transaction_date)
         sign = 1 if txn.transaction_type == InvestmentTransactionType.BUY else -1
         net_cash_flow += amount_base * sign
 
@@ -381,17 +574,20 @@ async def calculate_dividend_yield(
     )
     dividends = result.scalars().all()
 
+    held = await _held_positions(db, user_id, as_of_date)
+    fx_rates = await _prefetch_base_rates(
+        db,
+        [
+            *((dividend.currency, dividend.payment_date) for dividend in dividends),
+            *((market_value.currency.code, as_of_date) for _account_id, market_value in held),
+        ],
+    )
+
     annual_dividends = Decimal("0")
     for dividend in dividends:
-        annual_dividends += await convert_amount(
-            db,
-            dividend.amount,
-            dividend.currency,
-            settings.base_currency,
-            dividend.payment_date,
-        )
+        annual_dividends += _to_base(fx_rates, dividend.amount, dividend.currency, dividend.payment_date)
 
-    current_value = await _get_portfolio_value(db, user_id, as_of_date)
+    current_value = _held_value(fx_rates, held, as_of_date)
     if current_value == Decimal("0"):
         if annual_dividends == Decimal("0"):
             dividend_yield_ratio = Ratio.zero()
@@ -402,13 +598,14 @@ async def calculate_dividend_yield(
     return dividend_yield_ratio.to_percent()
 
 
-async def _get_portfolio_value(
+async def _held_positions(
     db: AsyncSession,
     user_id: UUID,
     as_of_date: date,
-) -> Decimal:
+    account_ids: Collection[UUID] | None = None,
+) -> list[tuple[UUID, Money]]:
     """
-    Get total portfolio value as of a specific date.
+    Get the market value of every position held on a specific date, with its account ID.
 
     Uses batched query to avoid N+1 pattern. Point-in-time (#1791 follow-up):
     considers every position this user has ever held, not just ones still
@@ -424,38 +621,73 @@ async def _get_portfolio_value(
     one broker's contribution (or double-count it, depending which side of the
     lookup collapses).
 
+    The held quantity is priced with the holdings resolver (``extension/prices.py``:
+    manual override, then synced price); a position with neither keeps its
+    snapshot's own market value. Prices for every position come from one query
+    per source.
+
     Args:
         db: Database session
         user_id: User ID
-        as_of_date: Date to get value for
+        as_of_date: Date to get positions for
+        account_ids: Restrict to these accounts (default: every account)
 
     Returns:
-        Decimal: Total portfolio value in base currency
+        list of (account_id, native-currency market value) for positions held on as_of_date
     """
     query = (
-        select(ManagedPosition.asset_identifier, Account.name)
+        select(ManagedPosition.account_id, ManagedPosition.asset_identifier, ManagedPosition.currency, Account.name)
         .join(Account, ManagedPosition.account_id == Account.id)
         .where(ManagedPosition.user_id == user_id)
     )
+    if account_ids is not None:
+        query = query.where(ManagedPosition.account_id.in_(account_ids))
     result = await db.execute(query)
     position_keys = result.all()
-    asset_ids = [identifier for identifier, _broker in position_keys]
+    asset_ids = [identifier for _account_id, identifier, _currency, _broker in position_keys]
 
     # Batch-fetch latest atomic positions (fixes N+1)
     atomic_map = await batch_latest_atomic_positions(db, user_id, asset_ids, as_of_date)
+    prices = await resolve_latest_prices(
+        db,
+        user_id,
+        {(identifier, as_of_date) for identifier in asset_ids},
+        include_snapshots=False,
+    )
 
-    total_value = Decimal("0")
-    for identifier, broker in position_keys:
+    held: list[tuple[UUID, Money]] = []
+    for account_id, identifier, currency, broker in position_keys:
         atomic = atomic_map.get((identifier, broker))
         if atomic is None or atomic.quantity == Decimal("0"):
             continue
-        value_base = await convert_amount(
-            db,
-            atomic.market_value or Decimal("0"),
-            atomic.currency,
-            settings.base_currency,
-            as_of_date,
-        )
-        total_value += value_base
+        quote = prices.get((identifier, as_of_date))
+        if quote is None:
+            held.append((account_id, Money(atomic.market_value or Decimal("0"), atomic.currency)))
+            continue
+        quantity = Quantity(atomic.quantity, PORTFOLIO_QUANTITY_UNIT).quantize()
+        unit_price = UnitPrice(quote.price, quote.currency or currency, PORTFOLIO_QUANTITY_UNIT)
+        held.append((account_id, unit_price * quantity))
+    return held
 
+
+def _held_value(fx_rates: PrefetchedFxRates, held: list[tuple[UUID, Money]], as_of_date: date) -> Decimal:
+    """Total base-currency market value of ``held`` on ``as_of_date``."""
+    total_value = Decimal("0")
+    for _account_id, market_value in held:
+        total_value += _to_base(fx_rates, market_value.amount, market_value.currency.code, as_of_date)
     return total_value
+
+
+async def _prefetch_base_rates(db: AsyncSession, needs: Iterable[tuple[str, date]]) -> PrefetchedFxRates:
+    """Prefetch every ``(currency, rate_date)`` -> base-currency spot rate in one batch."""
+    fx_rates = PrefetchedFxRates()
+    await fx_rates.prefetch(
+        db,
+        [(currency, settings.base_currency, rate_date, None, None) for currency, rate_date in needs],
+    )
+    return fx_rates
+
+
+def _to_base(fx_rates: PrefetchedFxRates, amount: Decimal, currency: str, rate_date: date) -> Decimal:
+    """``convert_amount`` into the base currency, answered from the prefetched batch."""
+    return fx_rates.convert_amount(amount, currency, settings.base_currency, rate_date)
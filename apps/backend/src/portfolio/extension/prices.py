@@ -0,0 +1,210 @@
+"""Bulk latest-price resolution for portfolio valuation.
+
+Holdings, P&L and performance used to resolve one position at a time — an
+override query, a synced-price query and a snapshot query per position. This
+module answers a whole set of ``(asset_identifier, as_of)`` pairs with ONE
+ranked (``ROW_NUMBER``) query per price source, so a portfolio renders in a
+constant number of round trips however many positions it holds.
+
+Precedence per pair, unchanged from the per-position lookup:
+
+1. the user's MANUAL ``MarketDataOverride`` dated exactly ``as_of``;
+2. the latest synced ``StockPrice`` on or before ``as_of`` (symbol matched as
+   ``strip().upper()``; ties broken by ``created_at`` desc, then ``source``,
+   ``currency`` and ``id``) — quoted in its own currency;
+3. the user's latest ``AtomicPosition`` snapshot on or before ``as_of``,
+   per unit (``market_value / quantity``; ``market_value`` when the snapshot
+   quantity is zero).
+
+Each source only sees the pairs the sources above it left unanswered.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import date
+from decimal import Decimal
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy import Date, String, and_, column, func, select, tuple_, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import Values
+
+from src.audit.quantity import Quantity
+from src.extraction.orm.layer2 import AtomicPosition
+from src.pricing import MarketDataOverride, PriceSource, StockPrice
+
+PORTFOLIO_QUANTITY_UNIT = "units"
+
+PricePair = tuple[str, date]
+
+
+class LatestPrice(NamedTuple):
+    """A resolved per-unit price.
+
+    ``currency`` is set only for synced ``StockPrice`` quotes, which are listed
+    in their own currency; override and snapshot prices are already in the
+    position's currency (``None``).
+    """
+
+    price: Decimal
+    currency: str | None
+
+
+async def resolve_latest_prices(
+    db: AsyncSession,
+    user_id: UUID,
+    pairs: Collection[PricePair],
+    *,
+    include_snapshots: bool = True,
+) -> dict[PricePair, LatestPrice]:
+    """Resolve the latest per-unit price for every ``(asset_identifier, as_of)`` pair.
+
+    Pairs with no price in any source are absent from the result. With
+    ``include_snapshots=False`` the snapshot fallback is skipped, for callers
+    that value their own snapshot when no market price exists.
+    """
+    pending = set(pairs)
+    resolved: dict[PricePair, LatestPrice] = {}
+    if not pending:
+        return resolved
+
+    for pair, price in (await _manual_override_prices(db, user_id, pending)).items():
+        resolved[pair] = LatestPrice(price, None)
+    pending -= resolved.keys()
+
+    if pending:
+        for pair, stock_price in (await latest_synced_stock_prices(db, pending)).items():
+            resolved[pair] = LatestPrice(stock_price.price, stock_price.currency)
+        pending -= resolved.keys()
+
+    if pending and include_snapshots:
+        for pair, snapshot in (await _latest_snapshots(db, user_id, pending)).items():
+            snapshot_quantity = Quantity(snapshot.quantity, PORTFOLIO_QUANTITY_UNIT).quantize()
+            if snapshot_quantity.is_zero():
+                resolved[pair] = LatestPrice(snapshot.market_value, None)
+            else:
+                resolved[pair] = LatestPrice(snapshot.market_value / snapshot_quantity.value, None)
+    return resolved
+
+
+async def latest_synced_stock_prices(
+    db: AsyncSession,
+    pairs: Collection[PricePair],
+) -> dict[PricePair, StockPrice]:
+    """Latest synced daily ``StockPrice`` on or before each pair's date, in one ranked query."""
+    by_symbol: dict[PricePair, list[PricePair]] = {}
+    for asset_identifier, as_of in pairs:
+        by_symbol.setdefault((asset_identifier.strip().upper(), as_of), []).append((asset_identifier, as_of))
+    if not by_symbol:
+        return {}
+
+    wanted = _pair_values(by_symbol, "wanted_stock_prices")
+    ranked = (
+        select(
+            wanted.c.asset_identifier,
+            wanted.c.as_of,
+            StockPrice.id.label("price_id"),
+            func.row_number()
+            .over(
+                partition_by=[wanted.c.asset_identifier, wanted.c.as_of],
+                order_by=[
+                    StockPrice.price_date.desc(),
+                    StockPrice.created_at.desc(),
+                    StockPrice.source.asc(),
+                    StockPrice.currency.asc(),
+                    StockPrice.id.asc(),
+                ],
+            )
+            .label("rn"),
+        )
+        .select_from(wanted)
+        .join(
+            StockPrice,
+            and_(StockPrice.symbol == wanted.c.asset_identifier, StockPrice.price_date <= wanted.c.as_of),
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(ranked.c.asset_identifier, ranked.c.as_of, StockPrice)
+        .join(ranked, StockPrice.id == ranked.c.price_id)
+        .where(ranked.c.rn == 1)
+    )
+    prices: dict[PricePair, StockPrice] = {}
+    for symbol, as_of, stock_price in result.all():
+        for pair in by_symbol[(symbol, as_of)]:
+            prices[pair] = stock_price
+    return prices
+
+
+async def _manual_override_prices(
+    db: AsyncSession,
+    user_id: UUID,
+    pairs: Collection[PricePair],
+) -> dict[PricePair, Decimal]:
+    """The user's MANUAL override dated exactly ``as_of``, newest first if re-entered that day."""
+    ranked = (
+        select(
+            MarketDataOverride.asset_identifier,
+            MarketDataOverride.price_date,
+            MarketDataOverride.price,
+            func.row_number()
+            .over(
+                partition_by=[MarketDataOverride.asset_identifier, MarketDataOverride.price_date],
+                order_by=[MarketDataOverride.created_at.desc(), MarketDataOverride.id.asc()],
+            )
+            .label("rn"),
+        )
+        .where(MarketDataOverride.user_id == user_id)
+        .where(MarketDataOverride.source == PriceSource.MANUAL)
+        .where(tuple_(MarketDataOverride.asset_identifier, MarketDataOverride.price_date).in_(sorted(pairs)))
+        .subquery()
+    )
+    result = await db.execute(
+        select(ranked.c.asset_identifier, ranked.c.price_date, ranked.c.price).where(ranked.c.rn == 1)
+    )
+    return {(asset_identifier, price_date): price for asset_identifier, price_date, price in result.all()}
+
+
+async def _latest_snapshots(
+    db: AsyncSession,
+    user_id: UUID,
+    pairs: Collection[PricePair],
+) -> dict[PricePair, AtomicPosition]:
+    """The user's latest ``AtomicPosition`` on or before each pair's date, across brokers."""
+    wanted = _pair_values(pairs, "wanted_snapshots")
+    ranked = (
+        select(
+            wanted.c.asset_identifier,
+            wanted.c.as_of,
+            AtomicPosition.id.label("snapshot_id"),
+            func.row_number()
+            .over(
+                partition_by=[wanted.c.asset_identifier, wanted.c.as_of],
+                order_by=[AtomicPosition.snapshot_date.desc(), AtomicPosition.created_at.desc()],
+            )
+            .label("rn"),
+        )
+        .select_from(wanted)
+        .join(
+            AtomicPosition,
+            and_(
+                AtomicPosition.user_id == user_id,
+                AtomicPosition.asset_identifier == wanted.c.asset_identifier,
+                AtomicPosition.snapshot_date <= wanted.c.as_of,
+            ),
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(ranked.c.asset_identifier, ranked.c.as_of, AtomicPosition)
+        .join(ranked, AtomicPosition.id == ranked.c.snapshot_id)
+        .where(ranked.c.rn == 1)
+    )
+    return {(asset_identifier, as_of): snapshot for asset_identifier, as_of, snapshot in result.all()}
+
+
+def _pair_values(pairs: Collection[PricePair], name: str) -> Values:
+    """The pairs as an inline ``VALUES (asset_identifier, as_of)`` table to join against."""
+    return values(column("asset_identifier", String), column("as_of", Date), name=name).data(sorted(pairs))
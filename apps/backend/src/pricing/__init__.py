@@ -23,9 +23,9 @@ the full FX lookup surface absorbed from the retired ``services/fx.py``
 (``build_manual_valuation_lines``, absorbed from
 ``services/reporting/manual_valuation.py``), the crawler sync
 (``sync_fx_rates``/``sync_stock_prices``/``ensure_market_data_fresh``/
-``get_market_data_status``/``resolve_missing_fx_rate`` — pure "given these
-scopes, sync/report on them"; discovering *which* scopes from the user's
-ledger is the caller's job, see ``extension/market_data/service.py``), the
+``get_market_data_status``/``resolve_missing_fx_rate``/``persist_fx_rates``
+— pure "given these scopes, sync/report on them"; discovering *which* scopes
+from the user's ledger is the caller's job, see ``extension/market_data/service.py``), the
 daily crawl orchestrator (``run_market_data_scheduler`` — scopes injected by
 the composition root's :data:`MarketDataScopeProvider`, absorbed from
 ``services/market_data_scheduler.py``), and the extraction-event ingest
@@ -67,6 +67,7 @@ from src.pricing.extension import (
     ResolvedMarketValuationPolicy,
     ResolvedValuationContribution,
     SqlObservationRepository,
+    close_market_data_client,
     convert_amount,
     convert_money,
     convert_to_base,
@@ -77,6 +78,7 @@ from src.pricing.extension import (
     ingest_statement_price,
     list_current_manual_valuation_facts,
     next_market_data_sync_at,
+    persist_fx_rates,
     pricing_trace_policy_registry,
     record_manual_valuation,
     record_override,
@@ -147,6 +149,7 @@ __all__ = [
     "ValuationService",
     "ValuationServiceError",
     "build_manual_valuation_lines",
+    "close_market_data_client",
     "convert_amount",
     "convert_money",
     "convert_to_base",
@@ -157,6 +160,7 @@ __all__ = [
     "ingest_statement_price",
     "list_current_manual_valuation_facts",
     "next_market_data_sync_at",
+    "persist_fx_rates",
     "record_manual_valuation",
     "record_override",
     "resolve",
@@ -0,0 +1,67 @@
+"""``FxSeries`` — one currency pair's crawled rate history as sorted arrays.
+
+The FX candidates ``SqlObservationRepository`` returns for a pair are the
+global ``FxRate`` rows only (``get_exchange_rate`` asks with ``user_id=None``),
+all at ``Authority.CRAWLER``. ``resolve()`` over them therefore reduces to
+"the latest ``as_of`` on or before the date, then latest ``observed_at``, then
+highest ``id``", and the average is a plain mean of the values in a date
+range. Held as parallel arrays sorted by exactly that key, both questions are
+a ``bisect`` — plus a prefix sum for the mean — instead of a scan over the
+whole history.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from src.pricing.base.observation import Authority
+from src.pricing.base.policy import ResolutionPolicy
+
+
+@dataclass(frozen=True, slots=True)
+class FxSeries:
+    """Rates of one pair, ordered by ``(as_of, observed_at, id)`` ascending.
+
+    ``prefix[i]`` is the exact ``Decimal`` sum of ``values[:i]``.
+    """
+
+    dates: Sequence[date]
+    values: Sequence[Decimal]
+    prefix: Sequence[Decimal]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple[date, Decimal]]) -> FxSeries:
+        """Build from ``(as_of, value)`` rows already in resolve()'s tie-break order."""
+        prefix = [Decimal("0")]
+        for _as_of, value in rows:
+            prefix.append(prefix[-1] + value)
+        return cls(dates=[row[0] for row in rows], values=[row[1] for row in rows], prefix=prefix)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def spot(self, as_of: date, policy: ResolutionPolicy | None = None) -> Decimal | None:
+        """What ``resolve(subject, as_of, policy, candidates)`` returns, or ``None`` when it would raise."""
+        if policy is not None and policy.min_authority > Authority.CRAWLER:
+            return None
+        # The last row on or before ``as_of`` is the latest as_of and, within
+        # that day, the latest observed_at / highest id.
+        index = bisect.bisect_right(self.dates, as_of) - 1
+        if index < 0:
+            return None
+        if policy is not None and policy.max_age_days is not None:
+            if (as_of - self.dates[index]).days > policy.max_age_days:
+                return None
+        return self.values[index]
+
+    def average(self, start: date, end: date) -> Decimal | None:
+        """Mean of every value with ``start <= as_of <= end``, or ``None`` when there is none."""
+        low = bisect.bisect_left(self.dates, start)
+        high = bisect.bisect_right(self.dates, end)
+        if high <= low:
+            return None
+        return (self.prefix[high] - self.prefix[low]) / (high - low)
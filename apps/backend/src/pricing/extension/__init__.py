@@ -17,9 +17,9 @@ the manual-valuation balance-sheet line builder
 ``services/reporting/manual_valuation.py``), the crawler sync
 (``extension/market_data/`` — ``sync_fx_rates``/``sync_stock_prices``/
 ``ensure_market_data_fresh``/``get_market_data_status``/
-``resolve_missing_fx_rate``; the many crawler-internal names in that
-subpackage's own ``__all__`` stay package-internal and are deliberately NOT
-flattened here, the same way ``reconciliation.extension.phases`` never
+``resolve_missing_fx_rate``/``persist_fx_rates``; the many crawler-internal
+names in that subpackage's own ``__all__`` stay package-internal and are
+deliberately NOT flattened here, the same way ``reconciliation.extension.phases`` never
 bubbles up to ``reconciliation``'s top level), and the daily crawl
 orchestrator (``extension/scheduler.py``, absorbed from
 ``services/market_data_scheduler.py`` — scope discovery stays inverted
@@ -43,8 +43,10 @@ from src.pricing.extension.market_data import (
     MARKET_DATA_QUANTITY_UNIT,
     MarketDataScopeStatus,
     MarketDataSyncResult,
+    close_market_data_client,
     ensure_market_data_fresh,
     get_market_data_status,
+    persist_fx_rates,
     resolve_missing_fx_rate,
     sync_fx_rates,
     sync_stock_prices,
@@ -81,6 +83,7 @@ __all__ = [
     "ManualValuationAttestationPolicy",
     "PrefetchedFxRates",
     "SqlObservationRepository",
+    "close_market_data_client",
     "convert_amount",
     "convert_money",
     "convert_to_base",
@@ -91,6 +94,7 @@ __all__ = [
     "ingest_statement_price",
     "list_current_manual_valuation_facts",
     "next_market_data_sync_at",
+    "persist_fx_rates",
     "record_manual_valuation",
     "record_override",
     "ResolvedValuationContribution",
@@ -4,9 +4,11 @@ The single FX lookup implementation (#1610 P2 absorbed ``services/fx.py`` —
 that module is retired; every consumer resolves rates through this package's
 published surface). Thin: the identity rate (a currency against itself is
 always exactly 1, a business rule that doesn't belong in the subject-agnostic
-``resolve()``) is handled here, then the general ``PriceableSubject`` +
-``resolve()`` path takes over — no FX-specific storage or resolution logic
-duplicated. ``convert_amount``/``convert_money``/``convert_to_base`` are thin
+``resolve()``) is handled here, then the pair's crawled observations are
+resolved through the session's ``FxSeriesStore`` — ``resolve()``'s
+latest-on-or-before rule and tie-break as a ``bisect`` over a per-pair sorted
+series, loaded once per session (see ``extension/fx_series.py``).
+``convert_amount``/``convert_money``/``convert_to_base`` are thin
 lookup+math bridges: the lookup is ``get_exchange_rate``/``get_average_rate``
 above, the math is ``audit.money.convert`` (rate passed in, per boundary
 ruling 5 — audit never looks up a rate).
@@ -26,10 +28,11 @@ Carried over from ``services/fx.py`` for its repointed consumers:
 - **``PrefetchedFxRates``** (AC-pricing.fx.2) — the explicit batch-prefetch
   cache the report builders use to avoid per-line lookups.
 
-Deliberately NOT carried over: the in-process TTL ``_FxRateCache`` — a
-performance optimization, not a correctness requirement; adding one here is
-deferred until this function is actually load-tested in its new home (move
-first, improve second). ``PrefetchedFxRates`` covers the hot batch paths.
+The in-process TTL ``_FxRateCache`` was first left behind (move first,
+improve second); once load tests showed dashboard traffic spending most of
+its DB time on identical lookups, it came back as the process-wide
+``fx_rate_cache`` (``extension/fx_cache.py``): LRU + TTL over resolved rates,
+with write-through invalidation so it never serves a superseded rate.
 """
 
 from __future__ import annotations
@@ -43,10 +46,10 @@ import src.config
 from src.audit import ExchangeRate, Money, MoneyError, convert as _money_convert, normalize_currency_code
 from src.observability import get_logger
 from src.pricing.base.errors import NoObservationError, PricingError
+from src.pricing.base.fx_series import FxSeries
 from src.pricing.base.policy import ResolutionPolicy
-from src.pricing.base.subject import PriceableSubject
-from src.pricing.extension.repository import SqlObservationRepository
-from src.pricing.extension.resolve import resolve
+from src.pricing.extension.fx_cache import FxCacheKey, cache_fx_rate, cached_fx_rate, fx_rate_cache
+from src.pricing.extension.fx_series import load_fx_series, load_fx_window
 
 # Bound from the bare published root (config publishes no named symbols).
 settings = src.config.settings
@@ -77,8 +80,8 @@ async def get_exchange_rate(
     (``resolve_missing_fx_rate``: stored inverse/bridge derivation, then an
     optional provider fetch — persisting what it finds), preserving the
     retired ``services/fx.py`` lazy path's behavior. Raises
-    :class:`~src.pricing.base.errors.NoObservationError` (propagated from
-    ``resolve()``) when no eligible observation exists even after the
+    :class:`~src.pricing.base.errors.NoObservationError` (as ``resolve()``
+    would) when no eligible observation exists even after the
     fallback — never returns a silently-wrong rate.
     """
     base = normalize_currency_code(base_currency)
@@ -86,24 +89,28 @@ async def get_exchange_rate(
     if base == quote:
         return Decimal("1")
 
-    subject = PriceableSubject.currency_pair(base, quote)
-    repo = SqlObservationRepository(db)
-    candidates = await repo.candidates(subject, rate_date)
-    if not candidates and lazy_load:
+    policy = ResolutionPolicy()
+    key = FxCacheKey(base, quote, rate_date, None, policy)
+    cached = cached_fx_rate(db, key)
+    if cached is not None:
+        return cached
+    generation = fx_rate_cache.generation
+    series = await load_fx_series(db, base, quote)
+    rate = series.spot(rate_date, policy)
+    if rate is None and lazy_load:
         # Deferred import: market_data composes this module's siblings, so a
         # module-level import would be a cycle waiting to happen.
         from src.pricing.extension.market_data.service import resolve_missing_fx_rate
 
-        rate = await resolve_missing_fx_rate(db, base, quote, rate_date)
-        if rate is not None:
-            return rate if isinstance(rate, Decimal) else Decimal(str(rate))
-    try:
-        observation = resolve(subject, rate_date, ResolutionPolicy(), candidates)
-    except NoObservationError as exc:
-        # Same type, FX-specific message: the ``services/fx.py`` wording the
-        # report error surfaces (and their tests) rely on.
-        raise NoObservationError(f"No FX rate available for {base}/{quote} on {rate_date}") from exc
-    return observation.value
+        fallback = await resolve_missing_fx_rate(db, base, quote, rate_date)
+        if fallback is not None:
+            return fallback if isinstance(fallback, Decimal) else Decimal(str(fallback))
+    if rate is None:
+        # FX-specific message: the ``services/fx.py`` wording the report
+        # error surfaces (and their tests) rely on.
+        raise NoObservationError(f"No FX rate available for {base}/{quote} on {rate_date}")
+    cache_fx_rate(db, key, rate, generation)
+    return rate
 
 
 async def get_average_rate(
@@ -119,10 +126,10 @@ async def get_average_rate(
     """The mean rate observed in ``[start_date, end_date]``, falling back to
     ``get_exchange_rate(end_date)`` when nothing was observed in the range.
 
-    Computed over the repository's own candidates (not a separate SQL AVG
-    query) — the repository's one job stays "what observations exist"; the
-    averaging is pricing's own business logic, same as ``resolve()``. The
-    period-end fallback is surfaced through ``fx_warnings``
+    Computed over the pair's crawled observations (not a separate SQL AVG
+    query) — the averaging is pricing's own business logic, answered from the
+    session's :class:`~src.pricing.extension.fx_series.FxSeriesStore` prefix
+    sums. The period-end fallback is surfaced through ``fx_warnings``
     (AC-pricing.fx.1) so a report can tell its consumer the average was
     unavailable.
     """
@@ -133,30 +140,41 @@ async def get_average_rate(
     if start_date > end_date:
         raise PricingError("start_date must be on or before end_date")
 
-    subject = PriceableSubject.currency_pair(base, quote)
-    repo = SqlObservationRepository(db)
-    candidates = await repo.candidates(subject, end_date)
-    in_range = [c.value for c in candidates if c.as_of >= start_date]
-    if not in_range:
-        logger.warning(
-            "No average FX rate data found for period, falling back to period-end spot rate",
-            base_currency=base,
-            quote_currency=quote,
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
-        )
-        _append_fx_warning(
-            fx_warnings,
-            {
-                "type": "average_rate_fallback",
-                "base_currency": base,
-                "quote_currency": quote,
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-            },
-        )
+    key = FxCacheKey(base, quote, end_date, start_date, ResolutionPolicy())
+    cached = cached_fx_rate(db, key)
+    if cached is not None:
+        return cached
+    generation = fx_rate_cache.generation
+    series = await load_fx_series(db, base, quote)
+    average = series.average(start_date, end_date)
+    if average is None:
+        # Never cached: the fallback warning must reach every caller.
+        _warn_average_fallback(fx_warnings, base, quote, start_date, end_date)
         return await get_exchange_rate(db, base, quote, end_date, lazy_load=lazy_load)
-    return sum(in_range) / len(in_range)
+    cache_fx_rate(db, key, average, generation)
+    return average
+
+
+def _warn_average_fallback(
+    fx_warnings: list[FxWarning] | None, base: str, quote: str, start_date: date, end_date: date
+) -> None:
+    logger.warning(
+        "No average FX rate data found for period, falling back to period-end spot rate",
+        base_currency=base,
+        quote_currency=quote,
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+    )
+    _append_fx_warning(
+        fx_warnings,
+        {
+            "type": "average_rate_fallback",
+            "base_currency": base,
+            "quote_currency": quote,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+        },
+    )
 
 
 def _convert_money_amount(amount: Decimal, source: str, target: str, rate: Decimal) -> Decimal:
@@ -293,6 +311,21 @@ class PrefetchedFxRates:
             return Decimal("1")
         return self._rates.get(self._key(base, quote, rate_date, average_start, average_end))
 
+    def convert_amount(self, amount: Decimal, currency: str, target_currency: str, rate_date: date) -> Decimal:
+        """:func:`convert_amount` at a prefetched spot rate — same rate, same ``Money`` rounding.
+
+        A same-currency conversion is a no-op; a key that was never prefetched
+        raises ``PricingError`` rather than silently resolving per call.
+        """
+        source = normalize_currency_code(currency)
+        target = normalize_currency_code(target_currency)
+        if source == target:
+            return amount
+        rate = self.get_rate(source, target, rate_date)
+        if rate is None:
+            raise PricingError(f"FX rate {source}/{target} on {rate_date.isoformat()} was not prefetched")
+        return _convert_money_amount(amount, source, target, rate)
+
     def set_rate(
         self,
         base: str,
@@ -313,6 +346,21 @@ class PrefetchedFxRates:
     ) -> None:
         """Fetch multiple rates into the local prefetch cache.
 
+        Set-based: keys are grouped by currency pair and each pair is loaded
+        with ONE range query spanning its earliest to latest date plus the
+        lookback row (:func:`~src.pricing.extension.fx_series.load_fx_window`);
+        every spot and average key is then answered in memory with
+        ``get_exchange_rate``/``get_average_rate`` semantics, ``fx_warnings``
+        included. Only the residual misses go through ``get_exchange_rate``
+        (and its ``lazy_load`` fallback), after which that pair's window is
+        reloaded so a persisted fallback rate is seen by its later keys.
+
+        Keys already in the process-wide
+        :data:`~src.pricing.extension.fx_cache.fx_rate_cache` are served from
+        it and never widen a pair's range; everything answered from a window
+        is cached on the way out (the average-fallback keys excepted, so their
+        ``fx_warnings`` keep firing).
+
         Sequential on purpose: all fetches share one ``AsyncSession``, which
         must not be used concurrently. A miss propagates the pricing error
         family — never a silent partial cache.
@@ -323,17 +371,55 @@ class PrefetchedFxRates:
         if not unique_pairs:
             return
 
+        policy = ResolutionPolicy()
+        misses: list[tuple[str, str, date, date | None, date | None]] = []
+        spans: dict[tuple[str, str], tuple[date, date]] = {}
         for base, quote, r_date, a_start, a_end in unique_pairs:
+            pair = (normalize_currency_code(base), normalize_currency_code(quote))
+            if pair[0] == pair[1]:
+                self.set_rate(base, quote, r_date, Decimal("1"), a_start, a_end)
+                continue
             if a_start and a_end:
-                rate = await get_average_rate(
-                    db,
-                    base,
-                    quote,
-                    a_start,
-                    a_end,
-                    fx_warnings=self._fx_warnings,
-                    lazy_load=self._lazy_load,
-                )
+                key = FxCacheKey(*pair, a_end, a_start, policy)
+                low, high = min(a_start, a_end), max(a_start, a_end)
             else:
-                rate = await get_exchange_rate(db, base, quote, r_date, lazy_load=self._lazy_load)
+                key = FxCacheKey(*pair, r_date, None, policy)
+                low = high = r_date
+            cached = cached_fx_rate(db, key)
+            if cached is not None:
+                self.set_rate(base, quote, r_date, cached, a_start, a_end)
+                continue
+            misses.append((base, quote, r_date, a_start, a_end))
+            if pair in spans:
+                low, high = min(low, spans[pair][0]), max(high, spans[pair][1])
+            spans[pair] = (low, high)
+
+        # pair -> (window, the cache generation read before loading it)
+        windows: dict[tuple[str, str], tuple[FxSeries, int]] = {}
+        for base, quote, r_date, a_start, a_end in misses:
+            pair = (normalize_currency_code(base), normalize_currency_code(quote))
+            if a_start and a_end and a_start > a_end:
+                raise PricingError("start_date must be on or before end_date")
+            loaded = windows.get(pair)
+            if loaded is None:
+                generation = fx_rate_cache.generation
+                loaded = windows[pair] = (await load_fx_window(db, *pair, *spans[pair]), generation)
+            series, generation = loaded
+
+            rate: Decimal | None = None
+            spot_date = r_date
+            if a_start and a_end:
+                rate = series.average(a_start, a_end)
+                if rate is None:
+                    _warn_average_fallback(self._fx_warnings, *pair, a_start, a_end)
+                    spot_date = a_end
+                else:
+                    cache_fx_rate(db, FxCacheKey(*pair, a_end, a_start, policy), rate, generation)
+            if rate is None:
+                rate = series.spot(spot_date, policy)
+                if rate is not None:
+                    cache_fx_rate(db, FxCacheKey(*pair, spot_date, None, policy), rate, generation)
+            if rate is None:
+                rate = await get_exchange_rate(db, *pair, spot_date, lazy_load=self._lazy_load)
+                windows.pop(pair, None)
             self.set_rate(base, quote, r_date, rate, a_start, a_end)
@@ -0,0 +1,192 @@
+"""``FxRateCache`` — the process-wide resolved-FX-rate cache (LRU + TTL).
+
+``extension/fx.py`` originally left the retired ``services/fx.py`` TTL cache
+behind until the lookup was load-tested; dashboard traffic since showed most
+of its DB time going to identical ``get_exchange_rate`` calls. This is the
+replacement: a bounded map of *resolved* rates keyed by
+:class:`FxCacheKey` — pair, date (or average window), ``ResolutionPolicy``
+and user scope — shared by every session in the process.
+
+It must never serve a rate a newer (or higher-authority) observation has
+superseded, so every fill and every read is guarded:
+
+* **Write-through invalidation.** ``_persist_fx_rate``, market-data override
+  writes and the daily sync call :func:`invalidate_fx_rates`; the
+  ``FxRate``/``MarketDataOverride`` mapper and bulk-DML listeners in
+  ``extension/fx_series.py`` catch any other write. Affected entries are
+  dropped immediately *and again* when the writing transaction ends, so a
+  reader that refilled from the still-committed old row in between is purged.
+* **Generations.** Every invalidation bumps :attr:`FxRateCache.generation`.
+  A fill carries the generation read before its rows were loaded and is
+  discarded if an invalidation landed meanwhile; session ``FxSeriesStore``\\ s
+  drop themselves when the generation moves, so a series loaded before a
+  commit never feeds the cache after it.
+* **Uncommitted writes stay private.** A session with unflushed FX/override
+  objects or uncommitted FX writes neither reads nor fills the cache.
+
+The TTL bounds what the hooks cannot see: rows written by another process.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+import src.config
+from src.observability import record_fx_rate_cache_eviction, record_fx_rate_cache_lookup
+from src.pricing.base.policy import ResolutionPolicy
+from src.pricing.orm.market_data import FxRate
+from src.pricing.orm.market_data_override import MarketDataOverride
+
+# Bound from the bare published root (config publishes no named symbols).
+settings = src.config.settings
+
+_PENDING_KEY = "pricing.fx_cache_pending"
+#: The ORM classes whose writes can change a resolved FX rate.
+WATCHED = (FxRate, MarketDataOverride)
+
+
+@dataclass(frozen=True, slots=True)
+class FxCacheKey:
+    """One resolved rate: a spot (``window_start is None``) or an average window."""
+
+    base: str
+    quote: str
+    rate_date: date
+    window_start: date | None
+    policy: ResolutionPolicy
+    user_id: UUID | None = None
+
+
+class FxRateCache:
+    """Bounded LRU of resolved rates with a per-entry TTL and a fill generation."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[FxCacheKey, tuple[float, Decimal]] = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: FxCacheKey) -> Decimal | None:
+        if self.max_entries <= 0:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[key]
+            self._evicted("expired")
+            entry = None
+        if entry is None:
+            self.misses += 1
+            record_fx_rate_cache_lookup(outcome="miss")
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        record_fx_rate_cache_lookup(outcome="hit")
+        return entry[1]
+
+    def put(self, key: FxCacheKey, rate: Decimal, generation: int) -> None:
+        """Store ``rate`` unless an invalidation happened since ``generation`` was read."""
+        if self.max_entries <= 0 or generation != self.generation:
+            return
+        self._entries[key] = (self._clock() + self.ttl_seconds, rate)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evicted("capacity")
+
+    def invalidate(self, base: str | None = None, quote: str | None = None) -> None:
+        """Drop the pair's entries (every entry when no pair is given) and bump the generation."""
+        self.generation += 1
+        if base is None or quote is None:
+            dropped = list(self._entries)
+        else:
+            dropped = [key for key in self._entries if key.base == base and key.quote == quote]
+        for key in dropped:
+            del self._entries[key]
+        self._evicted("invalidated", len(dropped))
+
+    def clear(self) -> None:
+        """Forget every entry and counter (tests and reconfiguration)."""
+        self._entries.clear()
+        self.generation += 1
+        self.hits = self.misses = self.evictions = 0
+
+    def _evicted(self, reason: str, count: int = 1) -> None:
+        if count:
+            self.evictions += count
+            record_fx_rate_cache_eviction(reason=reason, count=count)
+
+
+fx_rate_cache = FxRateCache(
+    max_entries=settings.fx_rate_cache_max_entries,
+    ttl_seconds=settings.fx_rate_cache_ttl_seconds,
+)
+
+
+def has_private_fx_writes(db: AsyncSession | Session) -> bool:
+    """Whether ``db`` holds FX/override writes other sessions cannot see yet."""
+    if db.info.get(_PENDING_KEY):
+        return True
+    return any(isinstance(obj, WATCHED) for obj in (*db.new, *db.dirty, *db.deleted))
+
+
+def cached_fx_rate(db: AsyncSession, key: FxCacheKey) -> Decimal | None:
+    """The cached rate for ``key``, or ``None`` (also when ``db`` has private FX writes)."""
+    if has_private_fx_writes(db):
+        return None
+    return fx_rate_cache.get(key)
+
+
+def cache_fx_rate(db: AsyncSession, key: FxCacheKey, rate: Decimal, generation: int) -> None:
+    """Fill ``key`` with a rate ``db`` read at ``generation``, if it is still safe to share."""
+    if not has_private_fx_writes(db):
+        fx_rate_cache.put(key, rate, generation)
+
+
+def invalidate_fx_rates(db: AsyncSession | Session, base: str | None = None, quote: str | None = None) -> None:
+    """Invalidate cached rates for ``base``/``quote`` (all pairs when omitted).
+
+    Drops them now and again when ``db``'s transaction commits or rolls back;
+    until then ``db`` bypasses the cache.
+    """
+    pair = (base, quote) if base is not None and quote is not None else None
+    db.info.setdefault(_PENDING_KEY, set()).add(pair)
+    if pair is None:
+        fx_rate_cache.invalidate()
+    else:
+        fx_rate_cache.invalidate(*pair)
+
+
+def _on_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is not None:
+        return
+    for pair in session.info.pop(_PENDING_KEY, ()):
+        if pair is None:
+            fx_rate_cache.invalidate()
+        else:
+            fx_rate_cache.invalidate(*pair)
+
+
+event.listen(Session, "after_transaction_end", _on_transaction_end)
@@ -0,0 +1,167 @@
+"""``FxSeriesStore`` — the session-scoped, lazily loaded FX series index.
+
+``get_exchange_rate``/``get_average_rate`` used to ask the repository for
+every ``FxRate`` row of the pair on or before the date — the full history as
+ORM objects — on every call, then filter/average in Python. The store loads a
+pair once per session with one two-column query, keeps it as an
+:class:`~src.pricing.base.fx_series.FxSeries` (sorted dates, values, prefix
+sums) and answers spot and average lookups by ``bisect``.
+
+Lifetime and invalidation: the store hangs off ``AsyncSession.info``, so it is
+dropped with the session (one request, one job run) and never crosses users
+or transactions. It follows the process-wide cache's generation
+(``extension/fx_cache.py``): any FX write — in this session or a committed one
+elsewhere in the process — bumps it, and the store empties itself on its next
+use. The listeners below turn every ``FxRate``/``MarketDataOverride`` insert,
+update or delete, bulk DML on either table included, into that invalidation;
+a savepoint rollback empties the store too. Rows added but not yet flushed
+are flushed before a cached series is served, exactly as the autoflush on the
+old per-call query would have.
+
+Batch callers (``PrefetchedFxRates.prefetch``) that know the date span they
+need ask for a :meth:`FxSeriesStore.window` instead: one range query per pair
+covering the span plus its lookback row, never stored in the store.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session, object_session
+
+from src.pricing.base.fx_series import FxSeries
+from src.pricing.extension.fx_cache import WATCHED, fx_rate_cache, invalidate_fx_rates
+from src.pricing.orm.market_data import FxRate
+from src.pricing.orm.market_data_override import MarketDataOverride
+
+_STORE_KEY = "pricing.fx_series_store"
+
+
+class FxSeriesStore:
+    """Per-pair :class:`FxSeries`, loaded on first use."""
+
+    def __init__(self) -> None:
+        self._series: dict[tuple[str, str], FxSeries] = {}
+        self._generation = fx_rate_cache.generation
+        self.loads = 0
+
+    async def series(self, db: AsyncSession, base: str, quote: str) -> FxSeries:
+        """The pair's series; ``base``/``quote`` must already be normalized codes."""
+        await _flush_pending(db)
+        self._follow_generation()
+        cached = self._series.get((base, quote))
+        if cached is not None:
+            return cached
+        generation = self._generation
+        rows = (
+            await db.execute(
+                select(FxRate.rate_date, FxRate.rate)
+                .where(FxRate.base_currency == base)
+                .where(FxRate.quote_currency == quote)
+                .order_by(FxRate.rate_date, FxRate.created_at, FxRate.id)
+            )
+        ).all()
+        series = FxSeries.from_rows([(row.rate_date, row.rate) for row in rows])
+        if fx_rate_cache.generation == generation:
+            self._series[(base, quote)] = series
+        self.loads += 1
+        return series
+
+    async def window(self, db: AsyncSession, base: str, quote: str, start: date, end: date) -> FxSeries:
+        """The pair's rows in ``[start, end]`` plus the latest one on or before ``start``.
+
+        Enough to answer every spot lookup dated in ``[start, end]`` and every
+        average inside it, in one query. Served from the full series when that
+        is already loaded; a window is never stored, so ``series()`` only ever
+        returns the whole history.
+        """
+        await _flush_pending(db)
+        self._follow_generation()
+        cached = self._series.get((base, quote))
+        if cached is not None:
+            return cached
+        same_pair = (FxRate.base_currency == base, FxRate.quote_currency == quote)
+        lookback = select(func.max(FxRate.rate_date)).where(*same_pair, FxRate.rate_date <= start).scalar_subquery()
+        rows = (
+            await db.execute(
+                select(FxRate.rate_date, FxRate.rate)
+                .where(*same_pair)
+                .where(FxRate.rate_date >= func.coalesce(lookback, start))
+                .where(FxRate.rate_date <= end)
+                .order_by(FxRate.rate_date, FxRate.created_at, FxRate.id)
+            )
+        ).all()
+        self.loads += 1
+        return FxSeries.from_rows([(row.rate_date, row.rate) for row in rows])
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def _follow_generation(self) -> None:
+        if self._generation != fx_rate_cache.generation:
+            self._series.clear()
+            self._generation = fx_rate_cache.generation
+
+
+def fx_series_store(db: AsyncSession) -> FxSeriesStore:
+    """The store bound to ``db``, created on first use."""
+    store = db.info.get(_STORE_KEY)
+    if store is None:
+        store = db.info[_STORE_KEY] = FxSeriesStore()
+    return store
+
+
+async def load_fx_series(db: AsyncSession, base: str, quote: str) -> FxSeries:
+    """The ``base``/``quote`` series from ``db``'s store (normalized codes)."""
+    return await fx_series_store(db).series(db, base, quote)
+
+
+async def load_fx_window(db: AsyncSession, base: str, quote: str, start: date, end: date) -> FxSeries:
+    """The ``base``/``quote`` series restricted to ``[start, end]`` plus its lookback row."""
+    return await fx_series_store(db).window(db, base, quote, start, end)
+
+
+async def _flush_pending(db: AsyncSession) -> None:
+    # What the autoflush before the old per-call query would have done.
+    if db.autoflush and any(isinstance(obj, WATCHED) for obj in (*db.new, *db.dirty, *db.deleted)):
+        await db.flush()
+
+
+def _on_fx_rate_insert_or_delete(_mapper: Mapper, _connection: object, target: FxRate) -> None:
+    session = object_session(target)
+    if session is not None:
+        invalidate_fx_rates(session, target.base_currency, target.quote_currency)
+
+
+def _on_watched_update(_mapper: Mapper, _connection: object, target: object) -> None:
+    # An update may move a row to another pair (or is an override): drop everything.
+    session = object_session(target)
+    if session is not None:
+        invalidate_fx_rates(session)
+
+
+def _on_bulk_statement(state: ORMExecuteState) -> None:
+    # insert()/update()/delete() statements bypass the mapper events above.
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is not None and mapper.class_ in WATCHED:
+        invalidate_fx_rates(state.session)
+
+
+def _on_rollback(session: Session, _previous_transaction: object) -> None:
+    # A rolled-back flush may have been loaded into a series.
+    store = session.info.get(_STORE_KEY)
+    if store is not None:
+        store.clear()
+
+
+event.listen(FxRate, "after_insert", _on_fx_rate_insert_or_delete)
+event.listen(FxRate, "after_delete", _on_fx_rate_insert_or_delete)
+event.listen(FxRate, "after_update", _on_watched_update)
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(MarketDataOverride, _event, _on_watched_update)
+event.listen(Session, "do_orm_execute", _on_bulk_statement)
+event.listen(Session, "after_soft_rollback", _on_rollback)
@@ -37,6 +37,7 @@ from src.pricing.base.manual_valuation import (
 )
 from src.pricing.base.observation import Authority, ObservationSource, PriceObservation, pricing_valuation_lineage_id
 from src.pricing.base.subject import PriceableSubject
+from src.pricing.extension.fx_cache import invalidate_fx_rates
 from src.pricing.extension.valuation_contribution import (
     emit_manual_valuation_decision,
 )
@@ -174,6 +175,8 @@ async def record_override(
     db.add(override)
     await db.flush()
     await db.refresh(override)
+    # An override outranks every crawled rate it could shadow.
+    invalidate_fx_rates(db)
 
     subject = PriceableSubject.security(asset_identifier)
     bus = OutboxEventBus(db, source_pkg=SOURCE_PKG)
@@ -3,6 +3,7 @@
 import httpx  # noqa: F401
 
 from src.pricing.extension.market_data._base import MARKET_DATA_QUANTITY_UNIT
+from src.pricing.extension.market_data._client import _PROVIDER_CLIENT, _ProviderHttpClient, close_market_data_client
 from src.pricing.extension.market_data._providers import (
     _FX_SYNC_SPEC,
     _STOCK_SYNC_SPEC,
@@ -37,9 +38,11 @@ from src.pricing.extension.market_data._store import (
     _is_sync_scope_fresh,
     _latest_fx_rate_date,
     _latest_fx_rate_date_for_scope,
+    _latest_fx_rate_dates,
     _latest_observation_date,
     _latest_observation_date_on_or_before,
     _latest_stock_price_date,
+    _latest_stock_price_dates,
     _load_stored_direct_or_inverse,
     _load_stored_rate,
     _load_stored_rate_on_date,
@@ -47,10 +50,14 @@ from src.pricing.extension.market_data._store import (
     _load_stored_stock_price_on_date,
     _load_sync_state,
     _persist_fx_rate,
+    _persist_fx_rates,
     _persist_stock_price,
+    _persist_stock_prices,
     _stored_fx_rate_dates,
+    _stored_fx_rate_dates_by_scope,
     _stored_fx_rate_dates_for_scope,
     _stored_stock_price_dates,
+    _stored_stock_price_dates_by_symbol,
     _sync_scope_status,
     _upsert_sync_state,
 )
@@ -97,6 +104,7 @@ from src.pricing.extension.market_data.service import (
     _sync_market_observation_series,
     ensure_market_data_fresh,
     get_market_data_status,
+    persist_fx_rates,
     resolve_missing_fx_rate,
     sync_fx_rates,
     sync_stock_prices,
@@ -115,6 +123,8 @@ __all__ = [
     "ValidatedMarketObservationSeries",
     "_FX_SYNC_SPEC",
     "_MarketSyncSpec",
+    "_PROVIDER_CLIENT",
+    "_ProviderHttpClient",
     "_STOCK_SYNC_SPEC",
     "_StoredFxRate",
     "_StoredStockPrice",
@@ -145,9 +155,11 @@ __all__ = [
     "_iter_dates",
     "_latest_fx_rate_date",
     "_latest_fx_rate_date_for_scope",
+    "_latest_fx_rate_dates",
     "_latest_observation_date",
     "_latest_observation_date_on_or_before",
     "_latest_stock_price_date",
+    "_latest_stock_price_dates",
     "_load_stored_direct_or_inverse",
     "_load_stored_rate",
     "_load_stored_rate_on_date",
@@ -169,7 +181,9 @@ __all__ = [
     "_parse_yahoo_fx_response_series",
     "_parse_yahoo_stock_response_series",
     "_persist_fx_rate",
+    "_persist_fx_rates",
     "_persist_stock_price",
+    "_persist_stock_prices",
     "_quantize_price",
     "_quantize_rate",
     "_relative_difference",
@@ -180,15 +194,19 @@ __all__ = [
     "_stooq_fx_symbol",
     "_stooq_stock_symbol",
     "_stored_fx_rate_dates",
+    "_stored_fx_rate_dates_by_scope",
     "_stored_fx_rate_dates_for_scope",
     "_stored_stock_price_dates",
+    "_stored_stock_price_dates_by_symbol",
     "_sync_market_observation_series",
     "_sync_scope_status",
     "_upsert_sync_state",
     "_yahoo_chart_params",
     "_yahoo_stock_symbol",
+    "close_market_data_client",
     "ensure_market_data_fresh",
     "get_market_data_status",
+    "persist_fx_rates",
     "resolve_missing_fx_rate",
     "sync_fx_rates",
     "sync_stock_prices",
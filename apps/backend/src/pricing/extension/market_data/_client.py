@@ -0,0 +1,104 @@
+"""Shared provider HTTP client: pooled, per-host bounded, single-flight."""
+
+from __future__ import annotations
+
+import asyncio
+from importlib.util import find_spec
+
+import httpx
+
+import src.config
+
+# Bound from the bare published root (config publishes no named symbols).
+settings = src.config.settings
+
+_USER_AGENT = "finance-report-audit/1.0"
+_KEEPALIVE_EXPIRY_SECONDS = 30.0
+# httpx negotiates HTTP/2 only with the optional ``h2`` package installed.
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+_RequestKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class _ProviderHttpClient:
+    """One keep-alive ``httpx.AsyncClient`` for every Yahoo/Stooq request.
+
+    Requests to one host hold one of ``settings.market_data_provider_connections_per_host``
+    slots. Identical in-flight requests — same URL and params, i.e. the same
+    provider, symbol and date range — share one round trip and its outcome.
+
+    The pool is opened lazily on the running event loop and replaced if the loop
+    changes; the app lifespan closes it through :func:`close_market_data_client`.
+    ``transport`` is the test seam (``httpx.MockTransport``).
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._in_flight: dict[_RequestKey, asyncio.Task[httpx.Response]] = {}
+
+    def _open(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            # Connections, slots and pending tasks belong to the loop that made them.
+            self._client = httpx.AsyncClient(
+                timeout=settings.market_data_yahoo_timeout_seconds,
+                headers={"User-Agent": _USER_AGENT},
+                limits=httpx.Limits(
+                    max_keepalive_connections=settings.market_data_provider_connections_per_host * 2,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+                http2=_HTTP2_AVAILABLE,
+                transport=self._transport,
+            )
+            self._loop = loop
+            self._host_slots = {}
+            self._in_flight = {}
+        return self._client
+
+    async def get(self, url: str, params: dict[str, str]) -> httpx.Response:
+        """GET ``url``; raises ``httpx.HTTPError`` for transport failures and non-2xx responses."""
+        client = self._open()
+        key: _RequestKey = (url, tuple(sorted(params.items())))
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(client, url, params))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Shielded: one cancelled caller must not cancel the round trip for the others.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: _RequestKey, task: asyncio.Task[httpx.Response]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller was cancelled
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str, params: dict[str, str]) -> httpx.Response:
+        host = httpx.URL(url).host
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(settings.market_data_provider_connections_per_host)
+        async with slots:
+            response = await client.get(url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def aclose(self) -> None:
+        client, loop = self._client, self._loop
+        self._client = None
+        self._loop = None
+        self._host_slots = {}
+        self._in_flight = {}
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+
+
+_PROVIDER_CLIENT = _ProviderHttpClient()
+
+
+async def close_market_data_client() -> None:
+    """Close the shared provider connection pool (app shutdown)."""
+    await _PROVIDER_CLIENT.aclose()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
@@ -12,6 +13,7 @@ from urllib.parse import quote
 import httpx
 
 import src.config
+from src.pricing.extension.market_data import _client
 from src.pricing.extension.market_data._base import (
     _STOOQ_DAILY_URL,
     _YAHOO_FX_CHART_URL,
@@ -19,12 +21,12 @@ from src.pricing.extension.market_data._base import (
     logger,
 )
 from src.pricing.extension.market_data._store import (
-    _latest_fx_rate_date_for_scope,
-    _latest_stock_price_date,
-    _persist_fx_rate,
-    _persist_stock_price,
-    _stored_fx_rate_dates_for_scope,
-    _stored_stock_price_dates,
+    _latest_fx_rate_dates,
+    _latest_stock_price_dates,
+    _persist_fx_rates,
+    _persist_stock_prices,
+    _stored_fx_rate_dates_by_scope,
+    _stored_stock_price_dates_by_symbol,
 )
 from src.pricing.extension.market_data._types import (
     FxRateObservation,
@@ -104,14 +106,14 @@ _FX_SYNC_SPEC = _MarketSyncSpec(
     kind="fx",
     parse_scope=_parse_sync_fx_scope,
     scope_name=lambda scope: _fx_scope(scope[0], scope[1]),
-    latest_date=_latest_fx_rate_date_for_scope,
-    stored_dates=_stored_fx_rate_dates_for_scope,
+    latest_dates=_latest_fx_rate_dates,
+    stored_dates=_stored_fx_rate_dates_by_scope,
     fetch_series=lambda scope, start_date, end_date: _fetch_validated_fx_rate_series_for_scope(
         scope,
         start_date,
         end_date,
     ),
-    persist_observation=_persist_fx_rate,
+    persist_observations=_persist_fx_rates,
     observation_date=_observation_date,
     observation_matches_scope=lambda observation, scope: (
         isinstance(observation, FxRateObservation)
@@ -125,14 +127,14 @@ _STOCK_SYNC_SPEC = _MarketSyncSpec(
     kind="stock",
     parse_scope=lambda symbol: _normalize_symbol(symbol) or None,
     scope_name=_stock_scope,
-    latest_date=_latest_stock_price_date,
-    stored_dates=_stored_stock_price_dates,
+    latest_dates=_latest_stock_price_dates,
+    stored_dates=_stored_stock_price_dates_by_symbol,
     fetch_series=lambda scope, start_date, end_date: _fetch_validated_stock_price_series(
         scope,
         start_date,
         end_date,
     ),
-    persist_observation=_persist_stock_price,
+    persist_observations=_persist_stock_prices,
     observation_date=_observation_date,
     observation_matches_scope=lambda observation, scope: (
         isinstance(observation, StockPriceObservation) and _normalize_symbol(observation.symbol) == scope
@@ -189,8 +191,10 @@ async def _fetch_yahoo_or_derived_fx_rate(
     bridge = _normalize_currency(settings.market_data_fx_bridge_currency)
     if bridge in {base_currency, quote_currency}:
         return None
-    base_to_bridge = await _fetch_yahoo_fx_rate(base_currency, bridge, requested_date)
-    bridge_to_quote = await _fetch_yahoo_fx_rate(bridge, quote_currency, requested_date)
+    base_to_bridge, bridge_to_quote = await asyncio.gather(
+        _fetch_yahoo_fx_rate(base_currency, bridge, requested_date),
+        _fetch_yahoo_fx_rate(bridge, quote_currency, requested_date),
+    )
     if base_to_bridge is None or bridge_to_quote is None:
         return None
 
@@ -235,8 +239,12 @@ async def _fetch_yahoo_or_derived_fx_rate_series(
     if bridge in {base_currency, quote_currency}:
         return None if direct_failed and inverse is None else []
 
-    base_to_bridge = await _fetch_yahoo_fx_rate_series(base_currency, bridge, start_date, end_date)
-    bridge_to_quote = await _fetch_yahoo_fx_rate_series(bridge, quote_currency, start_date, end_date)
+    # Both legs at once; a leg shared with another pair being synced (e.g.
+    # USD/SGD for every X/SGD) is coalesced by the provider client.
+    base_to_bridge, bridge_to_quote = await asyncio.gather(
+        _fetch_yahoo_fx_rate_series(base_currency, bridge, start_date, end_date),
+        _fetch_yahoo_fx_rate_series(bridge, quote_currency, start_date, end_date),
+    )
     if base_to_bridge is None and bridge_to_quote is None and direct_failed and inverse is None:
         return None
     if not base_to_bridge or not bridge_to_quote:
@@ -268,13 +276,7 @@ async def _fetch_provider_response(
     log_context: dict[str, str],
 ) -> httpx.Response | None:
     try:
-        async with httpx.AsyncClient(
-            timeout=settings.market_data_yahoo_timeout_seconds,
-            headers={"User-Agent": "finance-report-audit/1.0"},
-        ) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response
+        return await _client._PROVIDER_CLIENT.get(url, params)
     except httpx.HTTPError as exc:
         logger.warning(failure_message, **log_context, error=str(exc))
         return None
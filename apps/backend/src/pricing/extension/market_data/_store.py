@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Sequence
 from datetime import UTC, date, datetime
 from decimal import Decimal
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.pricing.extension.fx_cache import invalidate_fx_rates
 from src.pricing.extension.market_data._base import (
     _FRESHNESS_THRESHOLD,
     logger,
@@ -170,6 +173,7 @@ async def _persist_fx_rate(db: AsyncSession, observation: FxRateObservation) ->
         if concurrent is not None:
             return concurrent.rate
         raise
+    invalidate_fx_rates(db, base, quote)
     logger.info(
         "Persisted FX rate",
         base_currency=base,
@@ -439,3 +443,143 @@ async def _stored_fx_rate_dates_for_scope(
 ) -> set[date]:
     base, quote_currency = scope
     return await _stored_fx_rate_dates(db, base, quote_currency, start_date, end_date)
+
+
+# Bulk forms used by the sync engine: one query per phase for every scope in a
+# run, instead of one round trip per scope (dates) or per observation (rows).
+
+
+async def _latest_fx_rate_dates(
+    db: AsyncSession,
+    scopes: Collection[tuple[str, str]],
+) -> dict[tuple[str, str], date]:
+    if not scopes:
+        return {}
+    result = await db.execute(
+        select(FxRate.base_currency, FxRate.quote_currency, func.max(FxRate.rate_date))
+        .where(tuple_(FxRate.base_currency, FxRate.quote_currency).in_(list(scopes)))
+        .group_by(FxRate.base_currency, FxRate.quote_currency)
+    )
+    return {(base, quote_currency): latest for base, quote_currency, latest in result.all()}
+
+
+async def _stored_fx_rate_dates_by_scope(
+    db: AsyncSession,
+    scopes: Collection[tuple[str, str]],
+    start_date: date,
+    end_date: date,
+) -> dict[tuple[str, str], set[date]]:
+    stored: dict[tuple[str, str], set[date]] = {}
+    if not scopes:
+        return stored
+    result = await db.execute(
+        select(FxRate.base_currency, FxRate.quote_currency, FxRate.rate_date)
+        .where(tuple_(FxRate.base_currency, FxRate.quote_currency).in_(list(scopes)))
+        .where(FxRate.rate_date >= start_date)
+        .where(FxRate.rate_date <= end_date)
+    )
+    for base, quote_currency, rate_date in result.all():
+        stored.setdefault((base, quote_currency), set()).add(rate_date)
+    return stored
+
+
+async def _latest_stock_price_dates(db: AsyncSession, symbols: Collection[str]) -> dict[str, date]:
+    if not symbols:
+        return {}
+    result = await db.execute(
+        select(StockPrice.symbol, func.max(StockPrice.price_date))
+        .where(StockPrice.symbol.in_([_normalize_symbol(symbol) for symbol in symbols]))
+        .group_by(StockPrice.symbol)
+    )
+    return {symbol: latest for symbol, latest in result.all()}
+
+
+async def _stored_stock_price_dates_by_symbol(
+    db: AsyncSession,
+    symbols: Collection[str],
+    start_date: date,
+    end_date: date,
+) -> dict[str, set[date]]:
+    stored: dict[str, set[date]] = {}
+    if not symbols:
+        return stored
+    result = await db.execute(
+        select(StockPrice.symbol, StockPrice.price_date)
+        .where(StockPrice.symbol.in_([_normalize_symbol(symbol) for symbol in symbols]))
+        .where(StockPrice.price_date >= start_date)
+        .where(StockPrice.price_date <= end_date)
+    )
+    for symbol, price_date in result.all():
+        stored.setdefault(symbol, set()).add(price_date)
+    return stored
+
+
+async def _persist_fx_rates(db: AsyncSession, observations: Sequence[FxRateObservation]) -> int:
+    """Insert ``observations`` in one statement; rows already stored (or raced in) are left alone.
+
+    Returns the number of rows inserted. The first observation for a pair and
+    date wins, as it would with repeated ``_persist_fx_rate`` calls.
+    """
+    rows: dict[tuple[str, str, date], dict[str, object]] = {}
+    for observation in observations:
+        base = _normalize_currency(observation.base_currency)
+        quote_currency = _normalize_currency(observation.quote_currency)
+        rows.setdefault(
+            (base, quote_currency, observation.rate_date),
+            {
+                "base_currency": base,
+                "quote_currency": quote_currency,
+                "rate": _quantize_rate(observation.rate),
+                "rate_date": observation.rate_date,
+                "source": observation.source[:50],
+            },
+        )
+    if not rows:
+        return 0
+
+    result = await db.execute(
+        postgresql_insert(FxRate)
+        .values(list(rows.values()))
+        .on_conflict_do_nothing(constraint="uq_fx_rates_pair_date")
+        .returning(FxRate.base_currency, FxRate.quote_currency)
+    )
+    inserted = result.all()
+    for base, quote_currency in {(row.base_currency, row.quote_currency) for row in inserted}:
+        invalidate_fx_rates(db, base, quote_currency)
+    if inserted:
+        logger.info("Persisted FX rates", count=len(inserted), observations=len(rows))
+    return len(inserted)
+
+
+async def _persist_stock_prices(db: AsyncSession, observations: Sequence[StockPriceObservation]) -> int:
+    """Insert ``observations`` in one statement; rows already stored (or raced in) are left alone.
+
+    Returns the number of rows inserted. The first observation for a symbol
+    and date wins, as it would with repeated ``_persist_stock_price`` calls.
+    """
+    rows: dict[tuple[str, date], dict[str, object]] = {}
+    for observation in observations:
+        symbol = _normalize_symbol(observation.symbol)
+        rows.setdefault(
+            (symbol, observation.price_date),
+            {
+                "symbol": symbol,
+                "price": _quantize_price(observation.price),
+                "currency": _normalize_currency(observation.currency),
+                "price_date": observation.price_date,
+                "source": observation.source[:50],
+            },
+        )
+    if not rows:
+        return 0
+
+    result = await db.execute(
+        postgresql_insert(StockPrice)
+        .values(list(rows.values()))
+        .on_conflict_do_nothing(constraint="uq_stock_prices_symbol_currency_source_date")
+        .returning(StockPrice.id)
+    )
+    inserted = len(result.all())
+    if inserted:
+        logger.info("Persisted stock prices", count=inserted, observations=len(rows))
+    return inserted
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Collection, Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
@@ -156,9 +156,9 @@ class _MarketSyncSpec:
     kind: str
     parse_scope: Callable[[str], Any | None]
     scope_name: Callable[[Any], str]
-    latest_date: Callable[[AsyncSession, Any], Awaitable[date | None]]
-    stored_dates: Callable[[AsyncSession, Any, date, date], Awaitable[set[date]]]
+    latest_dates: Callable[[AsyncSession, Collection[Any]], Awaitable[dict[Any, date]]]
+    stored_dates: Callable[[AsyncSession, Collection[Any], date, date], Awaitable[dict[Any, set[date]]]]
     fetch_series: Callable[[Any, date, date], Awaitable[ValidatedMarketObservationSeries]]
-    persist_observation: Callable[[AsyncSession, MarketObservation], Awaitable[Decimal]]
+    persist_observations: Callable[[AsyncSession, Sequence[MarketObservation]], Awaitable[int]]
     observation_date: Callable[[MarketObservation], date]
     observation_matches_scope: Callable[[MarketObservation, Any], bool]
@@ -15,10 +15,11 @@ passes them in here.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import replace
+import asyncio
+from collections.abc import Iterable, Sequence
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -33,13 +34,18 @@ from src.pricing.extension.market_data._store import (
     _is_sync_scope_fresh,
     _load_stored_direct_or_inverse,
     _persist_fx_rate,
+    _persist_fx_rates,
     _sync_scope_status,
     _upsert_sync_state,
 )
 from src.pricing.extension.market_data._types import (
+    FxRateObservation,
     MarketDataFreshnessResult,
     MarketDataScopeStatus,
     MarketDataSyncResult,
+    MarketObservation,
+    ProviderDisagreement,
+    ValidatedMarketObservationSeries,
     _MarketSyncSpec,
 )
 from src.pricing.extension.market_data._util import (
@@ -53,6 +59,7 @@ from src.pricing.extension.market_data._util import (
     _parse_fx_pair,
     _stock_scope,
 )
+from src.pricing.orm.market_data import FxRate
 
 # Bound from the bare published root (config publishes no named symbols).
 settings = src.config.settings
@@ -66,51 +73,85 @@ async def _sync_market_observation_series(
     end_date: date,
     spec: _MarketSyncSpec,
 ) -> MarketDataSyncResult:
-    result = MarketDataSyncResult(kind=spec.kind)
-
-    for raw_scope in raw_scopes:
-        scope = spec.parse_scope(raw_scope)
-        if scope is None:
-            continue
-
-        last_date = await spec.latest_date(db, scope)
-        sync_start = _incremental_start(last_date, start_date, end_date)
-        if sync_start is None:
-            continue
-
+    """Fill the missing days of every scope in ``raw_scopes``.
+
+    Latest and stored dates for all scopes come from two set queries up front.
+    Provider fetches then run concurrently, at most
+    ``settings.market_data_sync_concurrency`` at a time, while this coroutine
+    persists each scope's series (in scope order, one multi-row insert per
+    scope) as soon as it arrives — the session is only ever used from here.
+    """
+    scopes = list(dict.fromkeys(scope for scope in map(spec.parse_scope, raw_scopes) if scope is not None))
+    if not scopes:
+        return MarketDataSyncResult(kind=spec.kind)
+
+    last_dates = await spec.latest_dates(db, scopes)
+    sync_starts: dict[Any, date] = {}
+    for scope in scopes:
+        sync_start = _incremental_start(last_dates.get(scope), start_date, end_date)
+        if sync_start is not None:
+            sync_starts[scope] = sync_start
+    if not sync_starts:
+        return MarketDataSyncResult(kind=spec.kind)
+
+    stored_by_scope = await spec.stored_dates(db, list(sync_starts), min(sync_starts.values()), end_date)
+    requested_by_scope: dict[Any, set[date]] = {}
+    skipped = 0
+    for scope, sync_start in sync_starts.items():
         all_dates = set(_iter_dates(sync_start, end_date))
-        stored_dates = await spec.stored_dates(db, scope, sync_start, end_date)
-        requested_dates = all_dates - stored_dates
-        result = replace(result, skipped=result.skipped + len(all_dates & stored_dates))
-        if not requested_dates:
-            continue
-
-        result = replace(result, requested=result.requested + len(requested_dates))
-        validated = await spec.fetch_series(scope, min(requested_dates), max(requested_dates))
-        result.disagreements.extend(validated.disagreements)
-
-        observed_dates: set[date] = {item.observed_date for item in validated.disagreements}
-        persisted_dates: list[date] = []
-        for observation in validated.observations:
-            observation_date = spec.observation_date(observation)
-            if not spec.observation_matches_scope(observation, scope) or observation_date not in requested_dates:
-                continue
-            await spec.persist_observation(db, observation)
-            persisted_dates.append(observation_date)
-            observed_dates.add(observation_date)
-            result = replace(result, inserted=result.inserted + 1)
-
-        result = replace(result, missing=result.missing + len(requested_dates - observed_dates))
-        if validated.provider_success:
-            await _upsert_sync_state(
-                db,
-                kind=spec.kind,
-                scope=spec.scope_name(scope),
-                last_success_date=end_date,
-                last_observation_date=max(persisted_dates) if persisted_dates else last_date,
-            )
-
-    return result
+        stored_dates = all_dates & stored_by_scope.get(scope, set())
+        skipped += len(stored_dates)
+        if requested_dates := all_dates - stored_dates:
+            requested_by_scope[scope] = requested_dates
+
+    semaphore = asyncio.Semaphore(settings.market_data_sync_concurrency)
+
+    async def fetch(scope: Any, requested_dates: set[date]) -> ValidatedMarketObservationSeries:
+        async with semaphore:
+            return await spec.fetch_series(scope, min(requested_dates), max(requested_dates))
+
+    fetches = {scope: asyncio.create_task(fetch(scope, dates)) for scope, dates in requested_by_scope.items()}
+    inserted = missing = 0
+    disagreements: list[ProviderDisagreement] = []
+    try:
+        for scope, requested_dates in requested_by_scope.items():
+            validated = await fetches[scope]
+            disagreements.extend(validated.disagreements)
+
+            observed_dates: set[date] = {item.observed_date for item in validated.disagreements}
+            observations: list[MarketObservation] = []
+            for observation in validated.observations:
+                observation_date = spec.observation_date(observation)
+                if spec.observation_matches_scope(observation, scope) and observation_date in requested_dates:
+                    observations.append(observation)
+                    observed_dates.add(observation_date)
+            inserted += await spec.persist_observations(db, observations)
+            missing += len(requested_dates - observed_dates)
+
+            if validated.provider_success:
+                await _upsert_sync_state(
+                    db,
+                    kind=spec.kind,
+                    scope=spec.scope_name(scope),
+                    last_success_date=end_date,
+                    last_observation_date=max(
+                        (spec.observation_date(observation) for observation in observations),
+                        default=last_dates.get(scope),
+                    ),
+                )
+    finally:
+        for task in fetches.values():
+            task.cancel()
+        await asyncio.gather(*fetches.values(), return_exceptions=True)
+
+    return MarketDataSyncResult(
+        kind=spec.kind,
+        requested=sum(len(dates) for dates in requested_by_scope.values()),
+        inserted=inserted,
+        skipped=skipped,
+        missing=missing,
+        disagreements=disagreements,
+    )
 
 
 async def resolve_missing_fx_rate(
@@ -151,6 +192,28 @@ async def resolve_missing_fx_rate(
     return None
 
 
+async def persist_fx_rates(db: AsyncSession, rates: Iterable[FxRate]) -> int:
+    """Store copies of ``rates`` on ``db``; pairs already stored for that date are left alone.
+
+    For rows resolved on a session that is about to be discarded (a read-only
+    snapshot worker, say) whose derivations should still outlive it. Returns
+    the number of rows inserted.
+    """
+    return await _persist_fx_rates(
+        db,
+        [
+            FxRateObservation(
+                base_currency=rate.base_currency,
+                quote_currency=rate.quote_currency,
+                rate=rate.rate,
+                rate_date=rate.rate_date,
+                source=rate.source,
+            )
+            for rate in rates
+        ],
+    )
+
+
 async def sync_fx_rates(
     db: AsyncSession,
     *,
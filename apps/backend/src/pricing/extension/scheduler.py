@@ -28,6 +28,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.database import async_session_maker
 from src.observability import get_logger
+from src.pricing.extension.fx_cache import fx_rate_cache
 from src.pricing.extension.market_data import sync_fx_rates, sync_stock_prices
 
 logger = get_logger(__name__)
@@ -75,6 +76,8 @@ async def run_daily_market_data_sync(
         fx_result = await sync_fx_rates(session, pairs=run_scopes.fx_pairs)
         stock_result = await sync_stock_prices(session, symbols=run_scopes.stock_symbols)
         await session.commit()
+    # The day's rates are in: nothing resolved before the sync may be served.
+    fx_rate_cache.invalidate()
     logger.info(
         "Daily market data sync completed",
         fx_requested=fx_result.requested,
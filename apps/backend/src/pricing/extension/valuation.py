@@ -475,6 +475,29 @@ class ValuationService:
             warnings=warnings,
         )
 
+    async def list_valuation_snapshot_dates(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        *,
+        through: date,
+    ) -> list[tuple[date, str]]:
+        """Distinct ``(as_of_date, currency)`` of current snapshots up to ``through``.
+
+        :meth:`get_latest_valuation_components` only changes on these dates
+        (plus the FX dates of these currencies), so a time series can treat
+        the manual-valuation totals as a step function between them.
+        """
+        result = await db.execute(
+            select(ManualValuationSnapshot.as_of_date, ManualValuationSnapshot.currency)
+            .distinct()
+            .where(ManualValuationSnapshot.user_id == user_id)
+            .where(ManualValuationSnapshot.as_of_date <= through)
+            .where(ManualValuationSnapshot.superseded_by_id.is_(None))
+            .order_by(ManualValuationSnapshot.as_of_date)
+        )
+        return [(row.as_of_date, row.currency) for row in result.all()]
+
 
 # ── Balance-sheet lines from manual valuations (absorbed from
 # services/reporting/manual_valuation.py, #1610 P2 / AC-pricing.manualvaluation.3).
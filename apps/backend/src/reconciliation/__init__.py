@@ -41,8 +41,15 @@ from src.reconciliation.extension.fx_transfer import (
     pair_fx_legs,
 )
 from src.reconciliation.extension.fx_transfer_discovery import discover_fx_conversions
+from src.reconciliation.extension.incremental import run_incremental_matching, subscribe_incremental_matching
+from src.reconciliation.extension.job_runner import (
+    ReconciliationJobRunner,
+    run_reconciliation_job,
+    shutdown_reconciliation_jobs,
+)
 from src.reconciliation.extension.matching import (
     MatchingContext,
+    MatchingScope,
     _find_many_to_one_candidates,
     _find_normal_candidates,
     _find_transfer_candidates,
@@ -59,6 +66,7 @@ from src.reconciliation.extension.matching import (
     score_group,
     score_single,
     sync_reconciliation_match_journal_entry_links,
+    sync_reconciliation_match_journal_entry_links_bulk,
 )
 from src.reconciliation.extension.review_queue import (
     accept_match,
@@ -111,9 +119,11 @@ __all__ = [
     "MatchCandidate",
     "MatchNotFoundError",
     "MatchingContext",
+    "MatchingScope",
     "RECONCILIATION_SEMANTIC_PROMPT",
     "ReconciliationConfig",
     "ReconciliationError",
+    "ReconciliationJobRunner",
     "ReconciliationMatch",
     "ReconciliationMatchJournalEntry",
     "ReconciliationStats",
@@ -160,6 +170,8 @@ __all__ = [
     "reject_match",
     "resolve_check",
     "run_all_consistency_checks",
+    "run_incremental_matching",
+    "run_reconciliation_job",
     "score_amount",
     "score_business_logic",
     "score_date",
@@ -167,7 +179,10 @@ __all__ = [
     "score_group",
     "score_single",
     "score_pattern",
+    "shutdown_reconciliation_jobs",
     "submit_reviewed_disposition",
+    "subscribe_incremental_matching",
     "sync_reconciliation_match_journal_entry_links",
+    "sync_reconciliation_match_journal_entry_links_bulk",
     "weighted_total",
 ]
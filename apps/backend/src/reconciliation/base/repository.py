@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Protocol
 from uuid import UUID
 
@@ -22,6 +23,22 @@ class ReconciliationRepository(Protocol):
 
     async def list_pending_transactions(self, user_id: UUID, limit: int | None = None) -> list[AtomicTransaction]: ...
 
+    async def list_incremental_pending_transactions(
+        self,
+        user_id: UUID,
+        *,
+        created_after: datetime | None,
+        date_ranges: Sequence[tuple[date, date]],
+        date_days: int,
+        limit: int | None = None,
+    ) -> list[AtomicTransaction]: ...
+
+    async def list_changed_entry_dates(self, *, user_id: UUID, updated_after: datetime | None) -> list[date]: ...
+
+    async def list_statement_pending_transactions(
+        self, *, user_id: UUID, statement_id: UUID
+    ) -> list[AtomicTransaction]: ...
+
     async def list_journal_candidates(
         self,
         *,
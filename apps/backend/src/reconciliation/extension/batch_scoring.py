@@ -0,0 +1,251 @@
+"""Fixed-point batch scoring kernel for reconciliation candidates.
+
+``score_amount`` / ``score_date`` / ``weighted_total`` are evaluated once per
+(transaction, candidate) pair on ``Decimal`` values, and ``weighted_total``
+builds five ``Decimal(str(float))`` objects per call. This kernel scores a whole
+block — transactions as rows, candidates as columns — on integer columns
+instead: amounts as fixed-point integers at the block's decimal scale, dates as
+day ordinals, component scores as integer hundredths, config weights as scaled
+integers. Rounding is done with exact integer half-even division, so every
+total equals the scalar ``weighted_total`` bit for bit; the scalar functions
+stay the reference oracle in tests.
+
+The repo carries no NumPy dependency, so the columns are plain ``list[int]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from src.reconciliation.base.config import ReconciliationConfig
+from src.reconciliation.extension.scoring import DescriptionScorer
+
+_FULL = 10000  # 100.00 in hundredths
+
+
+def _places(value: Decimal) -> int:
+    exponent = value.as_tuple().exponent
+    return -exponent if isinstance(exponent, int) and exponent < 0 else 0
+
+
+def _fixed(value: Decimal, places: int) -> int:
+    return int(value.scaleb(places))
+
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    """``round(Decimal(numerator) / denominator, 0)`` without leaving integers."""
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def _float_term(value: float) -> tuple[int, int]:
+    """Exact fixed-point form of ``Decimal(str(value))`` as ``(digits, places)``."""
+    decimal_value = Decimal(str(value))
+    places = _places(decimal_value)
+    return _fixed(decimal_value, places), places
+
+
+@dataclass(frozen=True)
+class TransactionBlock:
+    """Row inputs: one entry per transaction (or many-to-one group)."""
+
+    amounts: Sequence[Decimal]
+    dates: Sequence[date]
+    descriptions: Sequence[str | None]
+    history: Sequence[float]
+
+
+@dataclass(frozen=True)
+class CandidateBlock:
+    """Column inputs: one entry per single- or multi-entry candidate.
+
+    ``amounts`` are bank-side totals already resolved for the rows' direction,
+    ``dates`` every member entry's date (the best date score wins),
+    ``memos`` the ``" / "``-joined member memos, ``business`` the minimum
+    ``score_business_logic`` over members, ``is_multi`` whether the widened
+    combination tolerance applies.
+    """
+
+    amounts: Sequence[Decimal]
+    dates: Sequence[tuple[date, ...]]
+    memos: Sequence[str]
+    business: Sequence[float]
+    is_multi: Sequence[bool]
+
+
+@dataclass(frozen=True)
+class ScoreMatrix:
+    """Weighted totals plus the component columns needed to rebuild breakdowns."""
+
+    totals: list[list[int]]
+    amount: list[list[float]]
+    date: list[list[int]]
+    description: list[list[float]]
+    business: list[int]
+    history: Sequence[float]
+
+    def breakdown(self, row: int, col: int) -> dict[str, float]:
+        """The ``scores`` dict the scalar path would have built for this cell."""
+        return {
+            "amount": self.amount[row][col],
+            "date": self.date[row][col] / 100,
+            "description": self.description[row][col],
+            "business": self.business[col] / 100,
+            "history": self.history[row],
+        }
+
+
+def score_block(
+    transactions: TransactionBlock,
+    candidates: CandidateBlock,
+    config: ReconciliationConfig,
+    *,
+    amount_bonus: float = 0.0,
+    descriptions: DescriptionScorer | None = None,
+    min_total: int | None = None,
+    beat_row_best: bool = False,
+) -> ScoreMatrix:
+    """Score every (transaction, candidate) cell of a block in one pass.
+
+    ``amount_bonus`` reproduces the many-to-one ``min(100.0, amount + 5.0)``
+    float adjustment exactly, including its float rounding.
+
+    Description similarity is the expensive component, so it is scored last
+    and only when the cell can still matter: a cell whose total, with
+    ``DescriptionScorer.upper_bound`` in place of the real description score,
+    stays below ``min_total`` — or, with ``beat_row_best``, below the best total
+    already scored earlier in its row — is never compared exactly. Such a cell
+    reports that upper-bound total and description, both still below the
+    threshold, so callers that ignore sub-threshold cells see exact results.
+    """
+    if descriptions is None:
+        descriptions = DescriptionScorer()
+    weights = (
+        config.weight_amount,
+        config.weight_date,
+        config.weight_description,
+        config.weight_business,
+        config.weight_history,
+    )
+    weight_places = max(_places(weight) for weight in weights)
+    w_amount, w_date, w_description, w_business, w_history = (_fixed(weight, weight_places) for weight in weights)
+
+    scale = max(
+        [2, _places(config.amount_absolute)]
+        + [_places(amount) for amount in transactions.amounts]
+        + [_places(amount) for amount in candidates.amounts]
+    )
+    cent = 10 ** (scale - 2)
+    five = 5 * 10**scale
+    absolute = _fixed(config.amount_absolute, scale)
+    pct_num, pct_den = config.amount_percent.as_integer_ratio()
+    date_days = config.date_days
+
+    cand_amounts = [_fixed(amount, scale) for amount in candidates.amounts]
+    cand_ordinals = [tuple((d.toordinal(), d.month) for d in dates) for dates in candidates.dates]
+    business = [round(score * 100) for score in candidates.business]
+
+    totals: list[list[int]] = []
+    amount_rows: list[list[float]] = []
+    date_rows: list[list[int]] = []
+    description_rows: list[list[float]] = []
+
+    for row, txn_amount in enumerate(transactions.amounts):
+        t = _fixed(txn_amount, scale)
+        t_ordinal = transactions.dates[row].toordinal()
+        t_month = transactions.dates[row].month
+        t_description = transactions.descriptions[row]
+        history_digits, history_places = _float_term(transactions.history[row])
+
+        row_totals: list[int] = []
+        row_amounts: list[float] = []
+        row_dates: list[int] = []
+        row_descriptions: list[float] = []
+        row_best: int | None = None
+        for col, e in enumerate(cand_amounts):
+            # score_amount, in hundredths
+            diff = abs(t - e)
+            if diff <= cent:
+                amount_h = _FULL
+            elif diff <= absolute or diff * pct_den <= t * pct_num:
+                amount_h = 9000
+            elif diff <= five:
+                amount_h = 7000
+            elif candidates.is_multi[col] and (diff <= 2 * absolute or diff * pct_den <= 2 * t * pct_num):
+                amount_h = 7000
+            elif t == 0:
+                amount_h = 0
+            else:
+                amount_h = max(0, _round_half_even(_FULL * (t - diff), t))
+
+            # score_date over every member date, in hundredths
+            date_h = 0
+            for ordinal, month in cand_ordinals[col]:
+                days = abs(t_ordinal - ordinal)
+                if days == 0:
+                    score = _FULL
+                elif days <= 3:
+                    score = 9000
+                elif days <= date_days:
+                    score = 7500 if month != t_month else 7000
+                else:
+                    score = max(0, 100 - days * 10) * 100
+                date_h = max(date_h, score)
+
+            if amount_bonus:
+                amount = min(100.0, amount_h / 100 + amount_bonus)
+                amount_digits, amount_places = _float_term(amount)
+            else:
+                amount = amount_h / 100
+                amount_digits, amount_places = amount_h, 2
+
+            places = max(2, amount_places, history_places)
+            partial = (
+                amount_digits * 10 ** (places - amount_places) * w_amount
+                + date_h * 10 ** (places - 2) * w_date
+                + business[col] * 10 ** (places - 2) * w_business
+                + history_digits * 10 ** (places - history_places) * w_history
+            )
+            denominator = 10 ** (places + weight_places)
+            description_scale = 10 ** (places - 2) * w_description
+
+            floor = row_best if beat_row_best else None
+            if min_total is not None and (floor is None or min_total > floor):
+                floor = min_total
+            total = None
+            if floor is not None:
+                description = descriptions.upper_bound(t_description, candidates.memos[col])
+                total = _round_half_even(partial + round(description * 100) * description_scale, denominator)
+                if total >= floor:
+                    total = None
+            if total is None:
+                description = descriptions.score(t_description, candidates.memos[col])
+                total = _round_half_even(partial + round(description * 100) * description_scale, denominator)
+                row_best = total if row_best is None else max(row_best, total)
+
+            row_totals.append(total)
+            row_amounts.append(amount)
+            row_dates.append(date_h)
+            row_descriptions.append(description)
+
+        totals.append(row_totals)
+        amount_rows.append(row_amounts)
+        date_rows.append(row_dates)
+        description_rows.append(row_descriptions)
+
+    return ScoreMatrix(
+        totals=totals,
+        amount=amount_rows,
+        date=date_rows,
+        description=description_rows,
+        business=business,
+        history=transactions.history,
+    )
@@ -0,0 +1,112 @@
+"""Date-sorted candidate index shared by the reconciliation matching phases."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import date, timedelta
+from decimal import Decimal
+
+from src.ledger import JournalEntry
+from src.reconciliation.base.config import MAX_COMBINATION_CANDIDATES, entry_total_amount
+
+
+class CandidateIndex:
+    """Journal-entry candidates indexed by date, built once per matching run.
+
+    Replaces the per-transaction ``[c for c in all_candidates if d_start <=
+    c.entry_date <= d_end]`` scans: entries are sorted by ``entry_date`` once and
+    every ``±date_days`` window is a bisect slice. Windows, and the amount-sorted
+    view ``pruned`` walks, are memoized per transaction date because a
+    statement's rows cluster on few distinct dates.
+
+    Every list returned here keeps the input order of ``entries`` (ties broken by
+    input position), so the stable prune sort and the first-wins combination
+    scoring downstream stay identical to the linear filter they replace.
+    """
+
+    def __init__(self, entries: Sequence[JournalEntry], *, date_days: int) -> None:
+        self._entries = list(entries)
+        self._date_days = date_days
+        self._sorted_positions = sorted(range(len(self._entries)), key=lambda pos: (self._entries[pos].entry_date, pos))
+        self._sorted_dates = [self._entries[pos].entry_date for pos in self._sorted_positions]
+        self._windows: dict[date, list[int]] = {}
+        self._amount_views: dict[date, tuple[list[Decimal], list[int]]] = {}
+        self._totals: dict[int, Decimal] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _window_positions(self, txn_date: date) -> list[int]:
+        positions = self._windows.get(txn_date)
+        if positions is None:
+            lo = bisect_left(self._sorted_dates, txn_date - timedelta(days=self._date_days))
+            hi = bisect_right(self._sorted_dates, txn_date + timedelta(days=self._date_days))
+            positions = sorted(self._sorted_positions[lo:hi])
+            self._windows[txn_date] = positions
+        return positions
+
+    def _total(self, pos: int) -> Decimal:
+        total = self._totals.get(pos)
+        if total is None:
+            total = entry_total_amount(self._entries[pos])
+            self._totals[pos] = total
+        return total
+
+    def _amount_view(self, txn_date: date) -> tuple[list[Decimal], list[int]]:
+        """Return the window's (sorted totals, positions) pair — the amount-bucket index."""
+        view = self._amount_views.get(txn_date)
+        if view is None:
+            ordered = sorted(self._window_positions(txn_date), key=lambda pos: (self._total(pos), pos))
+            view = ([self._total(pos) for pos in ordered], ordered)
+            self._amount_views[txn_date] = view
+        return view
+
+    def window(self, txn_date: date) -> list[JournalEntry]:
+        """Entries dated within ``±date_days`` of ``txn_date``, in input order."""
+        return [self._entries[pos] for pos in self._window_positions(txn_date)]
+
+    def pruned(
+        self,
+        txn_date: date,
+        target_amount: Decimal,
+        *,
+        limit: int = MAX_COMBINATION_CANDIDATES,
+    ) -> list[JournalEntry]:
+        """Equivalent of ``prune_candidates(self.window(txn_date), ...)`` without re-sorting the window.
+
+        The ``(exact, amount_diff, date_diff)`` prune key is monotone in
+        ``amount_diff`` (``exact`` is just ``amount_diff <= 1%``), so the nearest
+        ``limit`` totals — plus every tie at the boundary — are taken by walking
+        outward from ``target_amount`` in the memoized amount-sorted view, and
+        only that short list is ordered.
+        """
+        positions = self._window_positions(txn_date)
+        if len(positions) <= limit:
+            return [self._entries[pos] for pos in positions]
+
+        amounts, by_amount = self._amount_view(txn_date)
+        pivot = bisect_left(amounts, target_amount)
+        lo, hi = pivot - 1, pivot
+        picked: list[tuple[Decimal, int]] = []
+        while lo >= 0 or hi < len(amounts):
+            if hi < len(amounts) and (lo < 0 or amounts[hi] - target_amount <= target_amount - amounts[lo]):
+                diff, pos = amounts[hi] - target_amount, by_amount[hi]
+                hi += 1
+            else:
+                diff, pos = target_amount - amounts[lo], by_amount[lo]
+                lo -= 1
+            if len(picked) >= limit and diff > picked[-1][0]:
+                break
+            picked.append((diff, pos))
+
+        tolerance = target_amount * Decimal("0.01")
+        picked.sort(
+            key=lambda item: (
+                0 if item[0] <= tolerance else 1,
+                item[0],
+                abs((txn_date - self._entries[item[1]].entry_date).days),
+                item[1],
+            )
+        )
+        return [self._entries[pos] for _, pos in picked[:limit]]
@@ -1,9 +1,20 @@
+"""Stage 2 consistency checks: duplicates, transfer pairs and anomalies.
+
+Duplicate groups and transfer-pair candidates are found in SQL (a ``GROUP BY``
+and an OUT/IN self-join), so no detector loads the user's whole transaction
+history into Python for grouping. Idempotency is decided against ONE read of
+the user's pending checks, keyed by ``(check_type, related_txn_fingerprint,
+anomaly_type)``; ``run_all_consistency_checks`` shares that set across all
+three detectors.
+"""
+
 from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import and_, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.extraction.orm.layer2 import AtomicTransaction, TransactionDirection
 from src.reconciliation.base.errors import (
@@ -12,70 +23,89 @@ from src.reconciliation.base.errors import (
     InvalidCheckActionError,
 )
 from src.reconciliation.extension.anomaly import detect_anomalies
-from src.reconciliation.orm.consistency_check import CheckStatus, CheckType, ConsistencyCheck
+from src.reconciliation.orm.consistency_check import (
+    CheckStatus,
+    CheckType,
+    ConsistencyCheck,
+    related_txn_fingerprint,
+)
 
 TRANSFER_TOLERANCE = Decimal("0.001")
 TRANSFER_DATE_TOLERANCE_DAYS = 3
+DUPLICATE_DESCRIPTION_PREFIX = 50
+
+# (check_type, related_txn_fingerprint, anomaly_type — ANOMALY checks only)
+_PendingCheckKey = tuple[CheckType, str, str | None]
+
+
+async def _load_pending_check_keys(db: AsyncSession, user_id: UUID) -> set[_PendingCheckKey]:
+    """Idempotency keys of every pending check the user already has, in one query."""
+    result = await db.execute(
+        select(
+            ConsistencyCheck.check_type,
+            ConsistencyCheck.related_txn_fingerprint,
+            ConsistencyCheck.details["anomaly_type"].astext,
+        )
+        .where(ConsistencyCheck.user_id == user_id)
+        .where(ConsistencyCheck.status == CheckStatus.PENDING)
+    )
+    return {
+        (check_type, fingerprint, anomaly_type if check_type == CheckType.ANOMALY else None)
+        for check_type, fingerprint, anomaly_type in result.all()
+    }
 
 
 async def detect_duplicates(
     db: AsyncSession,
     user_id: UUID,
     statement_id: UUID | None = None,
+    *,
+    pending: set[_PendingCheckKey] | None = None,
 ) -> list[ConsistencyCheck]:
-    base_query = select(AtomicTransaction).where(AtomicTransaction.user_id == user_id)
-
-    all_result = await db.execute(base_query)
-    all_txns = list(all_result.scalars().all())
-    anchor_txns = all_txns
-
-    groups: dict[str, list[AtomicTransaction]] = {}
-    for txn in all_txns:
-        key = f"{txn.amount}_{txn.direction.value}_{txn.description[:50] if txn.description else ''}"
-        if key not in groups:
-            groups[key] = []
-        groups[key].append(txn)
+    if pending is None:
+        pending = await _load_pending_check_keys(db, user_id)
+
+    description_key = func.left(AtomicTransaction.description, DUPLICATE_DESCRIPTION_PREFIX)
+    first_date = func.min(AtomicTransaction.txn_date)
+    last_date = func.max(AtomicTransaction.txn_date)
+    groups = await db.execute(
+        select(
+            AtomicTransaction.amount,
+            func.min(AtomicTransaction.description),
+            first_date,
+            last_date,
+            func.array_agg(AtomicTransaction.id),
+        )
+        .where(AtomicTransaction.user_id == user_id)
+        .group_by(AtomicTransaction.amount, AtomicTransaction.direction, description_key)
+        .having(func.count() > 1)
+        .having(last_date - first_date <= 1)
+        .order_by(first_date, AtomicTransaction.amount, func.min(AtomicTransaction.description))
+    )
 
     checks: list[ConsistencyCheck] = []
-    anchor_ids = {str(t.id) for t in anchor_txns}
-
-    for key, group in groups.items():
-        if len(group) > 1:
-            # Only process if at least one transaction in the group is an anchor
-            if not any(str(t.id) in anchor_ids for t in group):
-                continue
-
-            dates = sorted([t.txn_date for t in group])
-            if (dates[-1] - dates[0]).days <= 1:
-                txn_ids = sorted([str(t.id) for t in group])
-
-                # Idempotency: check if pending check already exists
-                existing = await db.execute(
-                    select(ConsistencyCheck).where(
-                        ConsistencyCheck.user_id == user_id,
-                        ConsistencyCheck.check_type == CheckType.DUPLICATE,
-                        ConsistencyCheck.status == CheckStatus.PENDING,
-                        ConsistencyCheck.related_txn_ids == txn_ids,
-                    )
-                )
-                if existing.scalar_one_or_none():
-                    continue
-
-                check = ConsistencyCheck(
-                    user_id=user_id,
-                    check_type=CheckType.DUPLICATE,
-                    status=CheckStatus.PENDING,
-                    related_txn_ids=txn_ids,
-                    details={
-                        "count": len(group),
-                        "amount": str(group[0].amount),
-                        "description": group[0].description,
-                        "date_range": f"{dates[0]} to {dates[-1]}",
-                    },
-                    severity="high",
-                )
-                checks.append(check)
-                db.add(check)
+    for amount, description, start, end, ids in groups.all():
+        txn_ids = sorted(str(txn_id) for txn_id in ids)
+        key = (CheckType.DUPLICATE, related_txn_fingerprint(txn_ids), None)
+        if key in pending:
+            continue
+        pending.add(key)
+
+        check = ConsistencyCheck(
+            user_id=user_id,
+            check_type=CheckType.DUPLICATE,
+            status=CheckStatus.PENDING,
+            related_txn_ids=txn_ids,
+            details={
+                "count": len(txn_ids),
+                "amount": str(amount),
+                "description": description,
+                "date_range": f"{start} to {end}",
+            },
+            severity="high",
+        )
+        checks.append(check)
+        db.add(check)
 
     if checks:
         await db.flush()
@@ -86,65 +116,64 @@ async def detect_transfer_pairs(
     db: AsyncSession,
     user_id: UUID,
     statement_id: UUID | None = None,
+    *,
+    pending: set[_PendingCheckKey] | None = None,
 ) -> list[ConsistencyCheck]:
-    base_query = select(AtomicTransaction).where(AtomicTransaction.user_id == user_id)
-
-    all_result = await db.execute(base_query)
-    all_txns = list(all_result.scalars().all())
-    anchor_txns = all_txns
-
-    out_txns = [t for t in anchor_txns if t.direction == TransactionDirection.OUT]
-    in_txns_by_amount: dict[Decimal, list[AtomicTransaction]] = {}
-    for t in all_txns:
-        if t.direction == TransactionDirection.IN:
-            if t.amount not in in_txns_by_amount:
-                in_txns_by_amount[t.amount] = []
-            in_txns_by_amount[t.amount].append(t)
+    if pending is None:
+        pending = await _load_pending_check_keys(db, user_id)
+
+    out_txn = aliased(AtomicTransaction)
+    in_txn = aliased(AtomicTransaction)
+    candidates = await db.execute(
+        select(out_txn.id, out_txn.txn_date, in_txn.id, in_txn.txn_date, out_txn.amount)
+        .join(
+            in_txn,
+            and_(
+                in_txn.user_id == out_txn.user_id,
+                in_txn.direction == TransactionDirection.IN,
+                in_txn.amount == out_txn.amount,
+                in_txn.txn_date >= out_txn.txn_date - TRANSFER_DATE_TOLERANCE_DAYS,
+                in_txn.txn_date <= out_txn.txn_date + TRANSFER_DATE_TOLERANCE_DAYS,
+            ),
+        )
+        .where(out_txn.user_id == user_id)
+        .where(out_txn.direction == TransactionDirection.OUT)
+        .order_by(out_txn.txn_date, out_txn.id, in_txn.txn_date, in_txn.id)
+    )
 
     checks: list[ConsistencyCheck] = []
-    matched_in: set[str] = set()
-
-    for out_txn in out_txns:
-        candidates = in_txns_by_amount.get(out_txn.amount, [])
-        for in_txn in candidates:
-            if str(in_txn.id) in matched_in:
-                continue
-
-            date_diff = abs((out_txn.txn_date - in_txn.txn_date).days)
-            if date_diff <= TRANSFER_DATE_TOLERANCE_DAYS:
-                txn_ids = sorted([str(out_txn.id), str(in_txn.id)])
-
-                # Idempotency
-                existing = await db.execute(
-                    select(ConsistencyCheck).where(
-                        ConsistencyCheck.user_id == user_id,
-                        ConsistencyCheck.check_type == CheckType.TRANSFER_PAIR,
-                        ConsistencyCheck.status == CheckStatus.PENDING,
-                        ConsistencyCheck.related_txn_ids == txn_ids,
-                    )
-                )
-                if existing.scalar_one_or_none():
-                    matched_in.add(str(in_txn.id))
-                    continue
-
-                check = ConsistencyCheck(
-                    user_id=user_id,
-                    check_type=CheckType.TRANSFER_PAIR,
-                    status=CheckStatus.PENDING,
-                    related_txn_ids=txn_ids,
-                    details={
-                        "amount": str(out_txn.amount),
-                        "out_date": str(out_txn.txn_date),
-                        "in_date": str(in_txn.txn_date),
-                        "amount_delta": "0.00",
-                        "date_diff_days": date_diff,
-                    },
-                    severity="medium",
-                )
-                checks.append(check)
-                db.add(check)
-                matched_in.add(str(in_txn.id))
-                break
+    paired_out: set[UUID] = set()
+    matched_in: set[UUID] = set()
+
+    # Greedy, in candidate order: each OUT pairs with its first IN not already used.
+    for out_id, out_date, in_id, in_date, amount in candidates.all():
+        if out_id in paired_out or in_id in matched_in:
+            continue
+        matched_in.add(in_id)
+
+        txn_ids = sorted([str(out_id), str(in_id)])
+        key = (CheckType.TRANSFER_PAIR, related_txn_fingerprint(txn_ids), None)
+        if key in pending:
+            continue
+        pending.add(key)
+
+        check = ConsistencyCheck(
+            user_id=user_id,
+            check_type=CheckType.TRANSFER_PAIR,
+            status=CheckStatus.PENDING,
+            related_txn_ids=txn_ids,
+            details={
+                "amount": str(amount),
+                "out_date": str(out_date),
+                "in_date": str(in_date),
+                "amount_delta": "0.00",
+                "date_diff_days": abs((out_date - in_date).days),
+            },
+            severity="medium",
+        )
+        checks.append(check)
+        db.add(check)
+        paired_out.add(out_id)
 
     if checks:
         await db.flush()
@@ -155,7 +184,12 @@ async def detect_anomalies_batch(
     db: AsyncSession,
     user_id: UUID,
     statement_id: UUID | None = None,
+    *,
+    pending: set[_PendingCheckKey] | None = None,
 ) -> list[ConsistencyCheck]:
+    if pending is None:
+        pending = await _load_pending_check_keys(db, user_id)
+
     query = select(AtomicTransaction).where(AtomicTransaction.user_id == user_id)
 
     result = await db.execute(query)
@@ -166,23 +200,10 @@ async def detect_anomalies_batch(
         anomalies = await detect_anomalies(db, txn, user_id=user_id)
         for anomaly in anomalies:
             txn_ids = [str(txn.id)]
-
-            # Idempotency
-            existing = await db.execute(
-                select(ConsistencyCheck).where(
-                    ConsistencyCheck.user_id == user_id,
-                    ConsistencyCheck.check_type == CheckType.ANOMALY,
-                    ConsistencyCheck.status == CheckStatus.PENDING,
-                    ConsistencyCheck.related_txn_ids == txn_ids,
-                )
-            )
-            found = False
-            for existing_check in existing.scalars().all():
-                if existing_check.details.get("anomaly_type") == anomaly.anomaly_type:
-                    found = True
-                    break
-            if found:
+            key = (CheckType.ANOMALY, related_txn_fingerprint(txn_ids), anomaly.anomaly_type)
+            if key in pending:
                 continue
+            pending.add(key)
 
             check = ConsistencyCheck(
                 user_id=user_id,
@@ -210,10 +231,11 @@ async def run_all_consistency_checks(
     user_id: UUID,
     statement_id: UUID,
 ) -> list[ConsistencyCheck]:
+    pending = await _load_pending_check_keys(db, user_id)
     checks: list[ConsistencyCheck] = []
-    checks.extend(await detect_duplicates(db, user_id, statement_id))
-    checks.extend(await detect_transfer_pairs(db, user_id, statement_id))
-    checks.extend(await detect_anomalies_batch(db, user_id, statement_id))
+    checks.extend(await detect_duplicates(db, user_id, statement_id, pending=pending))
+    checks.extend(await detect_transfer_pairs(db, user_id, statement_id, pending=pending))
+    checks.extend(await detect_anomalies_batch(db, user_id, statement_id, pending=pending))
     return checks
 
 
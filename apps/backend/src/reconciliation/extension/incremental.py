@@ -0,0 +1,97 @@
+"""Incremental matching reactor for extraction's ``StatementPosted`` event.
+
+Posting a statement commits new atomic transactions' journal entries and, in
+the same transaction, an ``extraction.StatementPosted`` outbox row. When the
+relay drains it, this handler runs an incremental matching job (see
+``extension/job_runner.py``) for the statement's owner in its own session, so
+only the posted statement's pending transactions and those whose inputs moved
+since the user's watermark are rescored, and never concurrently with another
+run for the same user. The statement's own transactions are selected by id, so
+the event-driven path never depends on the watermark to see them.
+
+- **Idempotent by construction.** A redelivered event finds the watermark
+  already advanced and the matched transactions no longer pending; the rerun
+  selects nothing new.
+- **Never wedges the relay.** A malformed payload is logged and skipped; a
+  failed run is rolled back and logged — its watermark does not move, so the
+  next incremental (or full) run picks the same work up.
+
+Wiring: the app composition root (``src/main.py``) calls
+:func:`subscribe_incremental_matching` on its ``SubscriberRegistry`` next to
+pricing's ingest subscriber.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config_app import get_effective_base_currency
+from src.extraction import STATEMENT_POSTED_EVENT_TYPE
+from src.observability import get_logger
+from src.platform.base import DomainEvent, SubscriberRegistry
+from src.reconciliation.extension.job_runner import run_reconciliation_job
+from src.reconciliation.extension.matching import MatchingScope
+from src.reconciliation.orm.reconciliation import ReconciliationMatch
+
+logger = get_logger(__name__)
+
+
+async def run_incremental_matching(
+    db: AsyncSession, event: DomainEvent, *, commit: bool = False
+) -> list[ReconciliationMatch] | None:
+    """Run incremental matching for one ``StatementPosted`` event's statement and owner.
+
+    Returns the created matches, or ``None`` when the payload was malformed.
+    With ``commit`` the job commits while holding the user's job lock;
+    otherwise it only flushes and the caller owns the transaction (and the lock).
+    """
+    payload = event.payload()
+    try:
+        user_id = UUID(str(payload["user_id"]))
+        statement_id = UUID(str(payload["statement_id"]))
+    except (KeyError, TypeError, ValueError):
+        logger.error(
+            "Malformed StatementPosted payload; skipping incremental matching",
+            statement_id=payload.get("statement_id"),
+        )
+        return None
+
+    currency = await get_effective_base_currency(db)
+    return await run_reconciliation_job(
+        db,
+        user_id=user_id,
+        currency=currency,
+        scope=MatchingScope(mode="incremental", statement_id=statement_id),
+        commit=commit,
+    )
+
+
+def make_incremental_matching_handler(
+    session_factory: async_sessionmaker[AsyncSession],
+):
+    """Build the production event handler: own session, own (reconciliation-only) commit."""
+
+    async def _handle(event: DomainEvent) -> None:
+        async with session_factory() as session:
+            try:
+                await run_incremental_matching(session, event, commit=True)
+            except Exception:
+                await session.rollback()
+                logger.error(
+                    "Incremental reconciliation run failed; left for the next run",
+                    statement_id=event.payload().get("statement_id"),
+                    exc_info=True,
+                )
+
+    return _handle
+
+
+def subscribe_incremental_matching(
+    registry: SubscriberRegistry,
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Register the incremental matching handler for ``extraction.StatementPosted`` on ``registry``."""
+    registry.subscribe(STATEMENT_POSTED_EVENT_TYPE, make_incremental_matching_handler(session_factory))
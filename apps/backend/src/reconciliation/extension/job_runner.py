@@ -0,0 +1,488 @@
+"""Process-pool runner for reconciliation matching jobs.
+
+``execute_matching`` scores on the event loop: a large run holds the loop (and
+every other request on it) for as long as the pure scoring takes. The runner
+splits a run in three:
+
+1. **Read, in the caller's session** — ``load_matching_inputs`` selects the
+   pending transactions, their candidate entries and merchant history, exactly
+   as ``execute_matching`` does.
+2. **Score, in a worker process** — the DB-free phases
+   (``_find_transfer_candidates``, ``_find_many_to_one_candidates``,
+   ``_find_normal_candidates``) run over a picklable :class:`MatchingSnapshot`:
+   plain frozen-dataclass copies (:class:`MatchingTransaction`,
+   :class:`MatchingEntry`) carrying only the columns scoring reads, so no ORM
+   instance is ever built outside a session.
+3. **Write, back in the caller's session** — the winners are applied with the
+   same helpers the in-session phases use (transfer materialization, superseding,
+   auto-accept status), then ``finish_matching`` pairs transfers, syncs links and
+   records merchant history.
+
+Runs for the same user are serialized by a per-user
+``pg_advisory_xact_lock`` held until the run's transaction ends — so the next
+run reads this one's matches, whichever app instance it lands on — while runs
+for different users score in parallel up to the worker count. A worker that
+dies breaks the pool; the run fails and the next one spawns a fresh pool. Two
+deliberate differences from ``execute_matching``:
+
+- With AI reconciliation enabled, hybrid-band cells need an LLM call from the
+  session, so the run falls back to ``execute_matching`` in-process.
+- Each merchant token's history score is taken against the first pending
+  transaction carrying it in list order, not the first one a phase happens to ask
+  about.
+
+Latency (queued / scoring / total) and throughput go to
+``record_reconciliation_job``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from time import perf_counter
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.audit import JournalEntrySourceType
+from src.audit.money import Currency, Money
+from src.config import settings
+from src.extraction.orm.layer2 import AtomicTransaction, TransactionDirection
+from src.ledger import AccountType, Direction, JournalEntry, JournalEntryStatus
+from src.observability import record_reconciliation_job
+from src.reconciliation.base.config import MatchCandidate, ReconciliationConfig, load_reconciliation_config
+from src.reconciliation.base.repository import ReconciliationRepository
+from src.reconciliation.extension.candidate_index import CandidateIndex
+from src.reconciliation.extension.matching import (
+    FULL_SCOPE,
+    MatchingInputs,
+    MatchingScope,
+    _find_many_to_one_candidates,
+    _find_normal_candidates,
+    _find_transfer_candidates,
+    build_many_to_one_groups,
+    execute_matching,
+    finish_matching,
+    load_matching_inputs,
+)
+from src.reconciliation.extension.repository import SqlReconciliationRepository
+from src.reconciliation.extension.scoring import DescriptionScorer, pattern_score_from_history
+from src.reconciliation.extension.subset_sum import SubsetSumEngine
+from src.reconciliation.orm.reconciliation import ReconciliationMatch
+
+
+@dataclass(frozen=True)
+class MatchingAccount:
+    """The account columns scoring reads off a candidate line."""
+
+    id: UUID
+    type: AccountType
+
+
+@dataclass(frozen=True)
+class MatchingLine:
+    """A candidate entry's line, reduced to what scoring and the balance check read."""
+
+    id: UUID
+    account_id: UUID
+    account: MatchingAccount | None
+    direction: Direction
+    amount: Decimal
+    currency: str | None
+    fx_rate: Decimal | None
+
+    @property
+    def money(self) -> Money:
+        """Mirror of ``JournalLine.money``, including its base-currency fallback."""
+        currency = self.currency if self.currency is not None else settings.base_currency
+        return Money(self.amount, Currency.of(currency))
+
+
+@dataclass(frozen=True)
+class MatchingEntry:
+    """A candidate journal entry as the DB-free phases see it."""
+
+    id: UUID
+    entry_date: date
+    memo: str
+    source_type: JournalEntrySourceType
+    status: JournalEntryStatus
+    lines: tuple[MatchingLine, ...]
+
+
+@dataclass(frozen=True)
+class MatchingTransaction:
+    """A pending statement transaction as the DB-free phases see it."""
+
+    id: UUID
+    txn_date: date
+    description: str
+    amount: Decimal
+    direction: TransactionDirection
+    reference: str | None
+    currency: str
+
+
+@dataclass(frozen=True)
+class MatchingSnapshot:
+    """Picklable scoring input: plain-dataclass copies of the rows plus the run's config and history scores."""
+
+    base_currency: str
+    config: ReconciliationConfig
+    transactions: tuple[MatchingTransaction, ...]
+    entries: tuple[MatchingEntry, ...]
+    pattern_scores: dict[str, float]
+
+
+@dataclass(frozen=True)
+class ScoredMatching:
+    """Worker output, keyed by ids so the parent applies it to its own session's rows.
+
+    ``many_to_one`` carries every member id of each winning group (its first
+    member is the group's representative).
+    """
+
+    transfer_txn_ids: tuple[UUID, ...]
+    many_to_one: tuple[tuple[tuple[UUID, ...], MatchCandidate], ...]
+    normal: tuple[tuple[UUID, MatchCandidate], ...]
+    scoring_ms: float
+
+
+def _transaction_dto(txn: AtomicTransaction) -> MatchingTransaction:
+    return MatchingTransaction(
+        id=txn.id,
+        txn_date=txn.txn_date,
+        description=txn.description,
+        amount=txn.amount,
+        direction=txn.direction,
+        reference=txn.reference,
+        currency=txn.currency,
+    )
+
+
+def _entry_dto(entry: JournalEntry, accounts: dict[UUID, MatchingAccount]) -> MatchingEntry:
+    lines = []
+    for line in entry.lines:
+        account = None
+        if line.account is not None:
+            account = accounts.get(line.account.id)
+            if account is None:
+                account = accounts[line.account.id] = MatchingAccount(id=line.account.id, type=line.account.type)
+        lines.append(
+            MatchingLine(
+                id=line.id,
+                account_id=line.account_id,
+                account=account,
+                direction=line.direction,
+                amount=line.amount,
+                currency=line.currency,
+                fx_rate=line.fx_rate,
+            )
+        )
+    return MatchingEntry(
+        id=entry.id,
+        entry_date=entry.entry_date,
+        memo=entry.memo,
+        source_type=entry.source_type,
+        status=entry.status,
+        lines=tuple(lines),
+    )
+
+
+def build_matching_snapshot(
+    inputs: MatchingInputs,
+    *,
+    base_currency: str,
+    config: ReconciliationConfig,
+    descriptions: DescriptionScorer,
+) -> MatchingSnapshot:
+    """Copy the run's inputs into a :class:`MatchingSnapshot` a worker process can unpickle."""
+    pattern_scores: dict[str, float] = {}
+    for txn in inputs.transactions:
+        tokens = descriptions.merchant_tokens(txn.description)
+        if tokens and tokens[0] not in pattern_scores:
+            pattern_scores[tokens[0]] = pattern_score_from_history(
+                inputs.pattern_history.get(tokens[0], []), txn, config
+            )
+    accounts: dict[UUID, MatchingAccount] = {}
+    return MatchingSnapshot(
+        base_currency=base_currency,
+        config=config,
+        transactions=tuple(_transaction_dto(txn) for txn in inputs.transactions),
+        entries=tuple(_entry_dto(entry, accounts) for entry in inputs.candidates),
+        pattern_scores=pattern_scores,
+    )
+
+
+def score_matching_snapshot(snapshot: MatchingSnapshot) -> ScoredMatching:
+    """Run the DB-free matching phases over ``snapshot``; the worker-process entry point."""
+    started = perf_counter()
+    transactions = list(snapshot.transactions)
+    entries = list(snapshot.entries)
+    config = snapshot.config
+    candidate_index = CandidateIndex(entries, date_days=config.date_days)
+    subset_sum = SubsetSumEngine(base_currency=snapshot.base_currency)
+    descriptions = DescriptionScorer()
+    entries_by_id = {str(entry.id): entry for entry in entries}
+
+    transfers = _find_transfer_candidates(transactions, entries, snapshot.pattern_scores, config)
+    groups = {group[0].id: tuple(txn.id for txn in group) for group in build_many_to_one_groups(transactions)}
+    many_to_one = _find_many_to_one_candidates(
+        transactions,
+        entries,
+        snapshot.pattern_scores,
+        config,
+        base_currency=snapshot.base_currency,
+        candidate_index=candidate_index,
+        subset_sum=subset_sum,
+        descriptions=descriptions,
+        entries_by_id=entries_by_id,
+    )
+    normal = _find_normal_candidates(
+        transactions,
+        entries,
+        snapshot.pattern_scores,
+        config,
+        base_currency=snapshot.base_currency,
+        candidate_index=candidate_index,
+        subset_sum=subset_sum,
+        descriptions=descriptions,
+        entries_by_id=entries_by_id,
+    )
+    return ScoredMatching(
+        transfer_txn_ids=tuple(txn.id for txn, _candidate, _paired in transfers),
+        many_to_one=tuple((groups[txn.id], candidate) for txn, candidate in many_to_one),
+        normal=tuple((txn.id, candidate) for txn, candidate in normal),
+        scoring_ms=(perf_counter() - started) * 1000,
+    )
+
+
+async def apply_scored_matching(
+    db: AsyncSession,
+    *,
+    scored: ScoredMatching,
+    transactions: Sequence[AtomicTransaction],
+    candidates: Sequence[JournalEntry],
+    config: ReconciliationConfig,
+    repository: ReconciliationRepository,
+    user_id: UUID,
+    currency: str,
+) -> list[ReconciliationMatch]:
+    """Write a worker's winners through the session, in ``execute_matching``'s phase order."""
+    from src.reconciliation.extension.phases import (
+        apply_many_to_one_match,
+        apply_normal_match,
+        run_transfer_detection_phase,
+    )
+
+    transactions_by_id = {txn.id: txn for txn in transactions}
+    entries_by_id = {str(entry.id): entry for entry in candidates}
+    matched_txn_ids: set[UUID] = set()
+
+    matches = await run_transfer_detection_phase(
+        db,
+        transactions=[transactions_by_id[txn_id] for txn_id in scored.transfer_txn_ids],
+        matched_txn_ids=matched_txn_ids,
+        repository=repository,
+        user_id=user_id,
+        currency=currency,
+    )
+    for member_ids, candidate in scored.many_to_one:
+        if all(txn_id in matched_txn_ids for txn_id in member_ids):
+            continue
+        matches.extend(
+            await apply_many_to_one_match(
+                db,
+                group=[transactions_by_id[txn_id] for txn_id in member_ids],
+                best_candidate=candidate,
+                best_entry=entries_by_id[candidate.journal_entry_ids[0]],
+                matched_txn_ids=matched_txn_ids,
+                config=config,
+                repository=repository,
+            )
+        )
+    for txn_id, candidate in scored.normal:
+        if txn_id in matched_txn_ids:
+            continue
+        match = await apply_normal_match(
+            db,
+            txn=transactions_by_id[txn_id],
+            best_match=candidate,
+            config=config,
+            repository=repository,
+            user_id=user_id,
+        )
+        if match is not None:
+            matches.append(match)
+    return matches
+
+
+class ReconciliationJobRunner:
+    """Scores matching runs in a process pool, one run per user at a time."""
+
+    def __init__(self, *, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned, not forked: a worker must not inherit the event loop,
+            # open DB connections or the parent's threads.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def _score(self, snapshot: MatchingSnapshot) -> ScoredMatching:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool(), score_matching_snapshot, snapshot)
+        except BrokenProcessPool:
+            # A worker died (OOM kill, segfault): the pool refuses all further
+            # work, so drop it and let the next run spawn a fresh one.
+            self.shutdown(wait=False)
+            raise
+
+    async def run(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: UUID,
+        currency: str,
+        limit: int | None = None,
+        repository: ReconciliationRepository | None = None,
+        scope: MatchingScope = FULL_SCOPE,
+        commit: bool = False,
+    ) -> list[ReconciliationMatch]:
+        """``execute_matching`` with scoring moved to the pool; same arguments, same result rows.
+
+        Takes the user's transaction-scoped advisory lock first, so the user's
+        next run (from any process) waits until this session's transaction
+        ends. Flushes only, unless ``commit`` — then the session is committed,
+        which also releases the lock.
+        """
+        started = perf_counter()
+        # Held until the session's transaction ends, across every worker process
+        # and app instance: the next run for this user reads this one's matches.
+        lock_key = f"reconciliation-job\x1f{user_id}"
+        await db.execute(select(func.pg_advisory_xact_lock(func.hashtextextended(lock_key, 0))))
+        queued_ms = (perf_counter() - started) * 1000
+        scoring_ms = 0.0
+        transactions = 0
+        outcome = "failure"
+        try:
+            config = load_reconciliation_config()
+            if config.enable_ai_reconciliation:
+                matches = await execute_matching(
+                    db,
+                    user_id=user_id,
+                    currency=currency,
+                    limit=limit,
+                    repository=repository,
+                    scope=scope,
+                )
+                if commit:
+                    await db.commit()
+                outcome = "in_session"
+                return matches
+
+            repo = repository if repository is not None else SqlReconciliationRepository(db)
+            descriptions = DescriptionScorer()
+            inputs = await load_matching_inputs(
+                db,
+                user_id=user_id,
+                config=config,
+                repository=repo,
+                descriptions=descriptions,
+                limit=limit,
+                scope=scope,
+            )
+            transactions = len(inputs.transactions)
+            if not inputs.transactions:
+                if commit:
+                    await db.commit()
+                outcome = "success"
+                return []
+
+            snapshot = build_matching_snapshot(inputs, base_currency=currency, config=config, descriptions=descriptions)
+            scored = await self._score(snapshot)
+            scoring_ms = scored.scoring_ms
+
+            matches = await apply_scored_matching(
+                db,
+                scored=scored,
+                transactions=inputs.transactions,
+                candidates=inputs.candidates,
+                config=config,
+                repository=repo,
+                user_id=user_id,
+                currency=currency,
+            )
+            await finish_matching(
+                db,
+                user_id=user_id,
+                currency=currency,
+                transactions=inputs.transactions,
+                matches=matches,
+                pair_transfers=inputs.pair_transfers,
+            )
+            if commit:
+                await db.commit()
+            outcome = "success"
+            return matches
+        finally:
+            record_reconciliation_job(
+                outcome=outcome,
+                queued_ms=queued_ms,
+                scoring_ms=scoring_ms,
+                total_ms=(perf_counter() - started) * 1000,
+                transactions=transactions,
+            )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the worker processes; a later run starts a fresh pool."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_runner: ReconciliationJobRunner | None = None
+
+
+def get_reconciliation_job_runner() -> ReconciliationJobRunner:
+    """The process-wide runner, sized by ``RECONCILIATION_JOB_WORKERS``."""
+    global _runner
+    if _runner is None:
+        _runner = ReconciliationJobRunner(max_workers=settings.reconciliation_job_workers)
+    return _runner
+
+
+async def run_reconciliation_job(
+    db: AsyncSession,
+    *,
+    user_id: UUID,
+    currency: str,
+    limit: int | None = None,
+    scope: MatchingScope = FULL_SCOPE,
+    commit: bool = False,
+) -> list[ReconciliationMatch]:
+    """Run one matching job on the process-wide runner."""
+    return await get_reconciliation_job_runner().run(
+        db, user_id=user_id, currency=currency, limit=limit, scope=scope, commit=commit
+    )
+
+
+def shutdown_reconciliation_jobs() -> None:
+    """Stop the process-wide runner's workers (application shutdown)."""
+    if _runner is not None:
+        _runner.shutdown()
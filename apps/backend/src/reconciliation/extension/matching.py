@@ -6,10 +6,11 @@ from collections.abc import Awaitable, Callable, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
-from itertools import combinations
+from typing import Literal
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.audit import JournalEntrySourceType, promote_entry_source_type
@@ -36,11 +37,16 @@ from src.reconciliation.base.config import (  # noqa: F401
 )
 from src.reconciliation.base.prompts import build_reconciliation_prompt
 from src.reconciliation.base.repository import ReconciliationRepository
+from src.reconciliation.extension.batch_scoring import CandidateBlock, ScoreMatrix, TransactionBlock, score_block
+from src.reconciliation.extension.candidate_index import CandidateIndex
+from src.reconciliation.extension.pattern_history import load_pattern_history, record_accepted_merchant_patterns
 from src.reconciliation.extension.repository import SqlReconciliationRepository
 from src.reconciliation.extension.scoring import (  # noqa: F401
+    DescriptionScorer,
     extract_merchant_tokens,
     is_cross_period,
     normalize_text,
+    pattern_score_from_history,
     score_amount,
     score_business_logic,
     score_date,
@@ -48,6 +54,13 @@ from src.reconciliation.extension.scoring import (  # noqa: F401
     score_pattern,
     weighted_total,
 )
+from src.reconciliation.extension.subset_sum import SubsetSumEngine
+from src.reconciliation.extension.watermark import (
+    capture_matching_watermark,
+    load_matching_watermark,
+    store_matching_watermark,
+    touched_date_ranges,
+)
 from src.reconciliation.orm.reconciliation import (
     ReconciliationMatch,
     ReconciliationMatchJournalEntry,
@@ -56,20 +69,42 @@ from src.reconciliation.orm.reconciliation import (
 
 logger = get_logger(__name__)
 
+MatchingMode = Literal["full", "incremental"]
+
+
+@dataclass(frozen=True)
+class MatchingScope:
+    """Which pending transactions a run rescores.
+
+    ``mode="full"`` rescores every pending transaction; ``mode="incremental"``
+    only those whose inputs moved since the user's watermark, plus the pending
+    transactions of ``statement_id`` when a posted statement triggered the run.
+    """
+
+    mode: MatchingMode = "full"
+    statement_id: UUID | None = None
+
+
+FULL_SCOPE = MatchingScope()
+
 
 @dataclass(frozen=True)
 class MatchingContext:
     """Stable dependencies shared by the matching phases.
 
-    Only the two run-scoped closures live here; package-level matching helpers
-    are imported by the phases directly instead of being passed as untyped
-    function parameters.
+    Only run-scoped state lives here (the shared candidate index, the memoized
+    subset-sum engine, the description fingerprint cache and the pattern score
+    closure); package-level matching
+    helpers are imported by the phases directly instead of being passed as
+    untyped function parameters.
     """
 
     config: ReconciliationConfig
     base_currency: str
     entries_by_id: dict[str, JournalEntry]
-    get_candidates_for_date: Callable[[date], list[JournalEntry]]
+    candidate_index: CandidateIndex
+    subset_sum: SubsetSumEngine
+    descriptions: DescriptionScorer
     get_cached_pattern_score: Callable[[AtomicTransaction], Awaitable[float]]
 
 
@@ -88,8 +123,13 @@ def _within_combination_tolerance(
     would add a null-currency failure mode the prior code never had. Adopting
     ``MoneyTolerance`` here waits on reconciliation amounts becoming Money-typed.
     """
+    return abs(combined - transaction.amount) <= _combination_band(transaction, config)
+
+
+def _combination_band(transaction: AtomicTransaction, config: ReconciliationConfig) -> Decimal:
+    """Half-width of the ``_within_combination_tolerance`` band, for ``SubsetSumEngine``."""
     tolerance = max(transaction.amount * config.amount_percent, config.amount_absolute)
-    return abs(combined - transaction.amount) <= tolerance * 2
+    return tolerance * 2
 
 
 def prune_candidates(
@@ -339,6 +379,70 @@ def _mark_auto_accepted_entry_reconciled(entry: JournalEntry) -> None:
         promote_entry_source_type(entry, JournalEntrySourceType.AUTO_MATCHED)
 
 
+def _scoring_members(
+    transaction: AtomicTransaction,
+    candidates: list[JournalEntry],
+    engine: SubsetSumEngine,
+    config: ReconciliationConfig,
+) -> tuple[list[tuple[JournalEntry, ...]], list[int]]:
+    """Balanced single entries, then in-band 2- and 3-entry combinations, in scoring order.
+
+    The second list is each member's ``multi_entry`` breakdown marker (0 for
+    single entries, 1 for pairs, 2 for triples).
+    """
+    members: list[tuple[JournalEntry, ...]] = [(entry,) for entry in candidates if engine.is_balanced(entry)]
+    multi_entry = [0] * len(members)
+    band = _combination_band(transaction, config)
+    for size in (2, 3):
+        combos = engine.combinations(candidates, transaction.direction, target=transaction.amount, band=band, size=size)
+        members.extend(combos)
+        multi_entry.extend([size - 1] * len(combos))
+    return members, multi_entry
+
+
+def _candidate_block(
+    transaction: AtomicTransaction,
+    members: Sequence[Sequence[JournalEntry]],
+    engine: SubsetSumEngine,
+    *,
+    is_group: bool = False,
+) -> CandidateBlock:
+    """Column inputs for ``score_block``, mirroring ``_calculate_candidate_score``'s aggregation."""
+    return CandidateBlock(
+        amounts=[
+            sum((engine.bank_side_amount(entry, transaction.direction) for entry in member), Decimal("0.00"))
+            for member in members
+        ],
+        dates=[tuple(entry.entry_date for entry in member) for member in members],
+        memos=[" / ".join([entry.memo for entry in member]).strip() for member in members],
+        business=[min(score_business_logic(transaction, entry) for entry in member) for member in members],
+        is_multi=[is_group or len(member) > 1 for member in members],
+    )
+
+
+def _description_prefilter(config: ReconciliationConfig) -> tuple[int, bool]:
+    """``score_block`` ``(min_total, beat_row_best)`` under which no selectable cell is ever approximated.
+
+    Without AI, a cell must reach ``pending_review`` and must not lose to an
+    earlier cell of its row. With AI, cells in the 60-84 hybrid band are
+    re-scored even below ``pending_review`` and the hybrid score can undercut
+    the row's best, so only the lower of the two floors is safe.
+    """
+    if config.enable_ai_reconciliation:
+        return min(config.pending_review, 60), False
+    return config.pending_review, True
+
+
+def _matrix_candidate(matrix: ScoreMatrix, col: int, entries: Sequence[JournalEntry]) -> MatchCandidate:
+    """Materialize one scored ``score_block`` cell (row 0) as a ``MatchCandidate``."""
+    breakdown: dict[str, float | str] = dict(matrix.breakdown(0, col))
+    return MatchCandidate(
+        journal_entry_ids=[str(entry.id) for entry in entries],
+        score=matrix.totals[0][col],
+        breakdown=breakdown,
+    )
+
+
 def _find_transfer_candidates(
     pending_txns: list[AtomicTransaction],
     atomic_txns: list[JournalEntry],
@@ -373,73 +477,65 @@ def _find_many_to_one_candidates(
     config: ReconciliationConfig,
     *,
     base_currency: str,
+    candidate_index: CandidateIndex | None = None,
+    subset_sum: SubsetSumEngine | None = None,
+    descriptions: DescriptionScorer | None = None,
+    entries_by_id: dict[str, JournalEntry] | None = None,
 ) -> list[tuple[AtomicTransaction, MatchCandidate]]:
     """Find many-to-one match candidates by grouping batch transactions.
 
     Pure scoring function: no DB access. Uses pre-computed pattern_scores
     for historical matching. Returns (representative_txn, best_candidate)
-    for each group that scores above pending_review threshold.
+    for each group that scores above pending_review threshold. Callers that
+    already hold the run's ``CandidateIndex`` / ``SubsetSumEngine`` /
+    ``DescriptionScorer`` pass them to skip rebuilding. With ``entries_by_id``,
+    equal scores are settled by ``_candidate_is_better`` exactly as the
+    in-session phase settles them; without it the first best wins.
     """
-    date_start = min(e.entry_date for e in atomic_txns) if atomic_txns else None
-    date_end = max(e.entry_date for e in atomic_txns) if atomic_txns else None
-
-    def get_candidates_for_date(txn_date: date) -> list[JournalEntry]:
-        if date_start is None or date_end is None:
-            return []
-        d_start = txn_date - timedelta(days=config.date_days)
-        d_end = txn_date + timedelta(days=config.date_days)
-        return [c for c in atomic_txns if d_start <= c.entry_date <= d_end]
+    index = candidate_index if candidate_index is not None else CandidateIndex(atomic_txns, date_days=config.date_days)
+    engine = subset_sum if subset_sum is not None else SubsetSumEngine(base_currency=base_currency)
+    descriptions = descriptions if descriptions is not None else DescriptionScorer()
+    min_total, beat_row_best = _description_prefilter(config)
 
     results: list[tuple[AtomicTransaction, MatchCandidate]] = []
     groups = build_many_to_one_groups(pending_txns)
     for group in groups:
         group_total = sum((txn.amount for txn in group), Decimal("0.00"))
         group_date = max(txn.txn_date for txn in group)
-        candidates = get_candidates_for_date(group_date)
+        candidates = index.pruned(group_date, group_total)
         if not candidates:
             continue
-        candidates = prune_candidates(
-            candidates,
-            txn_date=group_date,
-            target_amount=group_total,
-        )
 
-        tokens = extract_merchant_tokens(group[0].description)
+        tokens = descriptions.merchant_tokens(group[0].description)
         history_score = pattern_scores.get(tokens[0], 0.0) if tokens else 0.0
 
+        members = [(entry,) for entry in candidates if engine.is_balanced(entry)]
+        if not members:
+            continue
+        matrix = score_block(
+            TransactionBlock(
+                amounts=[group_total],
+                dates=[group[0].txn_date],
+                descriptions=[group[0].description],
+                history=[history_score],
+            ),
+            _candidate_block(group[0], members, engine, is_group=True),
+            config,
+            amount_bonus=5.0,
+            descriptions=descriptions,
+            min_total=min_total,
+            beat_row_best=beat_row_best,
+        )
         best_candidate: MatchCandidate | None = None
-        for entry in candidates:
-            if not is_entry_balanced(entry, base_currency=base_currency):
+        for col, total in enumerate(matrix.totals[0]):
+            if total < config.pending_review or (best_candidate is not None and total < best_candidate.score):
                 continue
-
-            # Inline scoring using pure functions (no DB)
-            txn_amount = group_total
-            entry_amount = entry_bank_side_amount(entry, group[0].direction)
-            amount_score = score_amount(txn_amount, entry_amount, config, is_multi=True)
-            date_score = score_date(group[0].txn_date, entry.entry_date, config)
-            description_score = score_description(group[0].description, entry.memo)
-            business_score = score_business_logic(group[0], entry)
-
-            scores: dict[str, float] = {
-                "amount": amount_score,
-                "date": date_score,
-                "description": description_score,
-                "business": business_score,
-                "history": history_score,
-                "many_to_one_bonus": 10.0,
-            }
-            # Apply many-to-one amount bonus
-            scores["amount"] = min(100.0, scores["amount"] + 5.0)
-            total = weighted_total(scores, config)
-
-            candidate = MatchCandidate(
-                journal_entry_ids=[str(entry.id)],
-                score=total,
-                breakdown={**scores, "group_total": str(group_total)},
-            )
-            if candidate.score >= config.pending_review and (
-                best_candidate is None or candidate.score > best_candidate.score
-            ):
+            if entries_by_id is None and best_candidate is not None and total == best_candidate.score:
+                continue
+            candidate = _matrix_candidate(matrix, col, members[col])
+            candidate.breakdown["many_to_one_bonus"] = 10.0
+            candidate.breakdown["group_total"] = str(group_total)
+            if entries_by_id is None or _candidate_is_better(candidate, best_candidate, entries_by_id):
                 best_candidate = candidate
 
         if best_candidate:
@@ -454,175 +550,305 @@ def _find_normal_candidates(
     config: ReconciliationConfig,
     *,
     base_currency: str,
+    candidate_index: CandidateIndex | None = None,
+    subset_sum: SubsetSumEngine | None = None,
+    descriptions: DescriptionScorer | None = None,
+    entries_by_id: dict[str, JournalEntry] | None = None,
 ) -> list[tuple[AtomicTransaction, MatchCandidate]]:
     """Find normal 1:1 and 1:N match candidates.
 
     Pure scoring function: no DB access. Uses pre-computed pattern_scores.
     Tries single entry, 2-entry, and 3-entry combinations.
     Returns (bank_txn, best_candidate) for each transaction that scores
-    above pending_review threshold.
+    above pending_review threshold. Callers that already hold the run's
+    ``CandidateIndex`` / ``SubsetSumEngine`` / ``DescriptionScorer`` pass them
+    to skip rebuilding. With ``entries_by_id``, equal scores are settled by
+    ``_candidate_is_better`` exactly as the in-session phase settles them;
+    without it the first best wins.
     """
-    date_start = min(e.entry_date for e in atomic_txns) if atomic_txns else None
-    date_end = max(e.entry_date for e in atomic_txns) if atomic_txns else None
-
-    def get_candidates_for_date(txn_date: date) -> list[JournalEntry]:
-        if date_start is None or date_end is None:
-            return []
-        d_start = txn_date - timedelta(days=config.date_days)
-        d_end = txn_date + timedelta(days=config.date_days)
-        return [c for c in atomic_txns if d_start <= c.entry_date <= d_end]
-
-    def _score_entries(
-        txn: AtomicTransaction,
-        entries: list[JournalEntry],
-        history_score: float,
-        is_multi: bool = False,
-    ) -> MatchCandidate:
-        entry_amounts = [entry_bank_side_amount(e, txn.direction) for e in entries]
-        total_amount = sum(entry_amounts, Decimal("0.00"))
-        entry_dates = [e.entry_date for e in entries]
-        entry_memo = " / ".join([e.memo for e in entries]).strip()
-
-        amount_s = score_amount(txn.amount, total_amount, config, is_multi=is_multi)
-        date_s = max(score_date(txn.txn_date, d, config) for d in entry_dates)
-        description_s = score_description(txn.description, entry_memo)
-        business_s = min(score_business_logic(txn, e) for e in entries) if entries else 0.0
-
-        scores: dict[str, float] = {
-            "amount": amount_s,
-            "date": date_s,
-            "description": description_s,
-            "business": business_s,
-            "history": history_score,
-        }
-        total = weighted_total(scores, config)
-        breakdown: dict[str, float | str] = dict(scores)
-        return MatchCandidate(
-            journal_entry_ids=[str(e.id) for e in entries],
-            score=total,
-            breakdown=breakdown,
-        )
+    index = candidate_index if candidate_index is not None else CandidateIndex(atomic_txns, date_days=config.date_days)
+    engine = subset_sum if subset_sum is not None else SubsetSumEngine(base_currency=base_currency)
+    descriptions = descriptions if descriptions is not None else DescriptionScorer()
+    min_total, beat_row_best = _description_prefilter(config)
 
     results: list[tuple[AtomicTransaction, MatchCandidate]] = []
     for txn in pending_txns:
-        candidates = get_candidates_for_date(txn.txn_date)
+        candidates = index.pruned(txn.txn_date, txn.amount)
         if not candidates:
             continue
-        candidates = prune_candidates(
-            candidates,
-            txn_date=txn.txn_date,
-            target_amount=txn.amount,
-        )
 
-        tokens = extract_merchant_tokens(txn.description)
+        tokens = descriptions.merchant_tokens(txn.description)
         history_score = pattern_scores.get(tokens[0], 0.0) if tokens else 0.0
 
-        best_match: MatchCandidate | None = None
+        members, multi_entry = _scoring_members(txn, candidates, engine, config)
+        if not members:
+            continue
+        matrix = score_block(
+            TransactionBlock(
+                amounts=[txn.amount],
+                dates=[txn.txn_date],
+                descriptions=[txn.description],
+                history=[history_score],
+            ),
+            _candidate_block(txn, members, engine),
+            config,
+            descriptions=descriptions,
+            min_total=min_total,
+            beat_row_best=beat_row_best,
+        )
+        if entries_by_id is not None:
+            best_match: MatchCandidate | None = None
+            for col, total in enumerate(matrix.totals[0]):
+                if best_match is not None and total < best_match.score:
+                    continue
+                candidate = _matrix_candidate(matrix, col, members[col])
+                if multi_entry[col]:
+                    candidate.breakdown["multi_entry"] = multi_entry[col]
+                if _candidate_is_better(candidate, best_match, entries_by_id):
+                    best_match = candidate
+            if best_match is not None and best_match.score >= config.pending_review:
+                results.append((txn, best_match))
+            continue
 
-        # Single entry matching
-        for entry in candidates:
-            if not is_entry_balanced(entry, base_currency=base_currency):
-                continue
-            candidate = _score_entries(txn, [entry], history_score)
-            if best_match is None or candidate.score > best_match.score:
-                best_match = candidate
-
-        # Two-entry combinations
-        for entry_a, entry_b in combinations(candidates, 2):
-            if not (
-                is_entry_balanced(entry_a, base_currency=base_currency)
-                and is_entry_balanced(entry_b, base_currency=base_currency)
-            ):
-                continue
-            combined = entry_bank_side_amount(entry_a, txn.direction) + entry_bank_side_amount(entry_b, txn.direction)
-            if not _within_combination_tolerance(combined, txn, config):
-                continue
-            candidate = _score_entries(txn, [entry_a, entry_b], history_score, is_multi=True)
-            candidate.breakdown["multi_entry"] = 1
-            if best_match is None or candidate.score > best_match.score:
-                best_match = candidate
-
-        # Three-entry combinations
-        for entry_a, entry_b, entry_c in combinations(candidates, 3):
-            if not (
-                is_entry_balanced(entry_a, base_currency=base_currency)
-                and is_entry_balanced(entry_b, base_currency=base_currency)
-                and is_entry_balanced(entry_c, base_currency=base_currency)
-            ):
-                continue
-            combined = (
-                entry_bank_side_amount(entry_a, txn.direction)
-                + entry_bank_side_amount(entry_b, txn.direction)
-                + entry_bank_side_amount(entry_c, txn.direction)
-            )
-            if not _within_combination_tolerance(combined, txn, config):
-                continue
-            candidate = _score_entries(txn, [entry_a, entry_b, entry_c], history_score, is_multi=True)
-            candidate.breakdown["multi_entry"] = 2
-            if best_match is None or candidate.score > best_match.score:
-                best_match = candidate
+        # Singles first, then 2- and 3-entry combinations; first-wins on ties.
+        best_col = 0
+        for col, total in enumerate(matrix.totals[0]):
+            if total > matrix.totals[0][best_col]:
+                best_col = col
 
-        if best_match and best_match.score >= config.pending_review:
+        if matrix.totals[0][best_col] >= config.pending_review:
+            best_match = _matrix_candidate(matrix, best_col, members[best_col])
+            if multi_entry[best_col]:
+                best_match.breakdown["multi_entry"] = multi_entry[best_col]
             results.append((txn, best_match))
     return results
 
 
-async def execute_matching(
+@dataclass(frozen=True)
+class MatchingInputs:
+    """Everything a matching run reads before scoring.
+
+    ``pair_transfers`` is false for an incremental run in which no journal
+    entry changed, since transfer pairs are formed between entry legs.
+    """
+
+    transactions: list[AtomicTransaction]
+    candidates: list[JournalEntry]
+    pattern_history: dict[str, list[Decimal]]
+    pair_transfers: bool
+
+
+async def load_matching_inputs(
     db: AsyncSession,
     *,
     user_id: UUID,
-    currency: str,
+    config: ReconciliationConfig,
+    repository: ReconciliationRepository,
+    descriptions: DescriptionScorer,
     limit: int | None = None,
-    repository: ReconciliationRepository | None = None,
-) -> list[ReconciliationMatch]:
-    """Execute reconciliation matching for pending transactions."""
-    config = load_reconciliation_config()
-    repo = repository if repository is not None else SqlReconciliationRepository(db)
+    scope: MatchingScope = FULL_SCOPE,
+) -> MatchingInputs:
+    """Select the run's pending transactions and read their candidates and merchant history.
+
+    An incremental run scoped to a posted ``statement_id`` always includes that
+    statement's pending transactions, whatever the watermark says. Advances
+    the user's watermark when the selection was not cut short by ``limit``
+    (see ``extension/watermark.py``).
+    """
+    # Captured before any read: rows committed mid-run stay above the mark.
+    watermark = await capture_matching_watermark(db, user_id=user_id)
+    previous = await load_matching_watermark(db, user_id=user_id) if scope.mode == "incremental" else None
 
     # Read pending transactions from Layer 2 (atomic_transactions).
-    transactions = await repo.list_pending_transactions(user_id, limit)
+    if previous is None:
+        transactions = await repository.list_pending_transactions(user_id, limit)
+        pair_transfers = True
+    else:
+        changed_entry_dates = await repository.list_changed_entry_dates(
+            user_id=user_id, updated_after=previous.entries_through
+        )
+        transactions = await repository.list_incremental_pending_transactions(
+            user_id,
+            created_after=previous.transactions_through,
+            date_ranges=touched_date_ranges(changed_entry_dates, config.date_days),
+            date_days=config.date_days,
+            limit=limit,
+        )
+        pair_transfers = bool(changed_entry_dates)
+        if scope.statement_id is not None:
+            posted = await repository.list_statement_pending_transactions(
+                user_id=user_id, statement_id=scope.statement_id
+            )
+            selected = {txn.id for txn in transactions}
+            transactions = sorted(
+                [*transactions, *(txn for txn in posted if txn.id not in selected)],
+                key=lambda txn: txn.txn_date,
+            )[:limit]
+            pair_transfers = pair_transfers or bool(posted)
+
+    # A run cut short by ``limit`` left pending rows unconsidered; it must not
+    # move the mark past them.
+    if (limit is None or len(transactions) < limit) and not watermark.is_empty:
+        await store_matching_watermark(db, user_id=user_id, watermark=watermark)
 
     if not transactions:
-        return []
+        return MatchingInputs(transactions=[], candidates=[], pattern_history={}, pair_transfers=pair_transfers)
 
     # Optimization: Pre-fetch all candidates for the entire period to avoid N+1 find_candidates
     min_date = min(txn.txn_date for txn in transactions) - timedelta(days=config.date_days)
     max_date = max(txn.txn_date for txn in transactions) + timedelta(days=config.date_days)
 
-    all_candidates = await repo.list_journal_candidates(
+    candidates = await repository.list_journal_candidates(
         user_id=user_id,
         start_date=min_date,
         end_date=max_date,
     )
-    entries_by_id = {str(entry.id): entry for entry in all_candidates}
 
-    def get_candidates_for_date(txn_date: date) -> list[JournalEntry]:
-        d_start = txn_date - timedelta(days=config.date_days)
-        d_end = txn_date + timedelta(days=config.date_days)
-        return [c for c in all_candidates if d_start <= c.entry_date <= d_end]
+    # History for every merchant token of the run comes from one batched
+    # projection read (seeding unknown tokens in one query).
+    pattern_history = await load_pattern_history(
+        db,
+        user_id=user_id,
+        tokens={tokens[0] for txn in transactions if (tokens := descriptions.merchant_tokens(txn.description))},
+    )
+    return MatchingInputs(
+        transactions=transactions,
+        candidates=candidates,
+        pattern_history=pattern_history,
+        pair_transfers=pair_transfers,
+    )
+
+
+async def finish_matching(
+    db: AsyncSession,
+    *,
+    user_id: UUID,
+    currency: str,
+    transactions: list[AtomicTransaction],
+    matches: list[ReconciliationMatch],
+    pair_transfers: bool,
+) -> None:
+    """Pair transfers, flush the run's matches with their links and merchant history, and emit metrics."""
+    # Phase 3: Auto-Pair Transfers (AFTER all matching complete)
+    # Find and pair transfers automatically per common/ledger/readme.md.
+    # Pairs are formed between journal-entry legs, so an incremental run with
+    # no changed entries cannot find a new one.
+    if pair_transfers:
+        try:
+            descriptions = DescriptionScorer()
+            transfer_pairs = await find_transfer_pairs(
+                db,
+                user_id,
+                currency=currency,
+                description_scorer=descriptions.score,
+                description_bound=descriptions.upper_bound,
+                threshold=85,
+            )
+            if transfer_pairs:
+                logger.info(
+                    "Auto-pairing complete",
+                    user_id=str(user_id),
+                    pairs_found=len(transfer_pairs),
+                )
+        except Exception as e:
+            logger.error(
+                "Failed to auto-pair transfers",
+                user_id=str(user_id),
+                error=str(e),
+            )
+            # Non-fatal error - continue with existing matches
+
+    try:
+        await db.flush()
+        await sync_reconciliation_match_journal_entry_links_bulk(db, matches)
+        auto_accepted_ids = {
+            match.atomic_txn_id for match in matches if match.status == ReconciliationStatus.AUTO_ACCEPTED
+        }
+        await record_accepted_merchant_patterns(
+            db,
+            user_id=user_id,
+            transactions=[txn for txn in transactions if txn.id in auto_accepted_ids],
+        )
+    except Exception as e:
+        logger.error(
+            "Reconciliation flush failed",
+            user_id=str(user_id),
+            matches_attempted=len(matches),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise
+
+    # AC-observability.10.4: emit one business metric per resolved match, labelled by its
+    # final disposition (auto_accepted / pending_review / rejected). Low
+    # cardinality — the label is the bounded ReconciliationStatus enum value.
+    for created_match in matches:
+        record_reconciliation_match_outcome(outcome=created_match.status.value)
+
+
+async def execute_matching(
+    db: AsyncSession,
+    *,
+    user_id: UUID,
+    currency: str,
+    limit: int | None = None,
+    repository: ReconciliationRepository | None = None,
+    scope: MatchingScope = FULL_SCOPE,
+) -> list[ReconciliationMatch]:
+    """Execute reconciliation matching for pending transactions.
+
+    A full :class:`MatchingScope` rescores every pending transaction. An
+    incremental one rescores only those whose inputs moved since the user's
+    watermark (see ``extension/watermark.py``) and skips transfer auto-pairing
+    when no journal entry changed; without a stored watermark it runs as full.
+    An incremental scope carrying the ``statement_id`` that triggered it always
+    rescores that statement's pending transactions. Either mode advances the
+    watermark when it was not cut short by ``limit``.
+    """
+    config = load_reconciliation_config()
+    repo = repository if repository is not None else SqlReconciliationRepository(db)
+    descriptions = DescriptionScorer()
+    inputs = await load_matching_inputs(
+        db,
+        user_id=user_id,
+        config=config,
+        repository=repo,
+        descriptions=descriptions,
+        limit=limit,
+        scope=scope,
+    )
+    transactions = inputs.transactions
+    if not transactions:
+        return []
+
+    entries_by_id = {str(entry.id): entry for entry in inputs.candidates}
+    # Built once and shared by every phase: bisect date windows + per-window
+    # amount views instead of a linear scan of all_candidates per transaction.
+    candidate_index = CandidateIndex(inputs.candidates, date_days=config.date_days)
 
     matches: list[ReconciliationMatch] = []
     matched_txn_ids: set[UUID] = set()
 
-    # Optimization: Cache pattern scores to avoid repeated DB hits for similar merchants
+    # Pattern scores are cached per token so each merchant is scored once,
+    # against the first transaction that carries it.
     pattern_score_cache: dict[str, float] = {}
 
     async def get_cached_pattern_score(txn: AtomicTransaction) -> float:
-        tokens = extract_merchant_tokens(txn.description)
+        tokens = descriptions.merchant_tokens(txn.description)
         if not tokens:
             return 0.0
         token = tokens[0]
-        if token in pattern_score_cache:
-            return pattern_score_cache[token]
-        score = await score_pattern(db, txn, config, user_id=user_id)
-        pattern_score_cache[token] = score
-        return score
+        if token not in pattern_score_cache:
+            pattern_score_cache[token] = pattern_score_from_history(inputs.pattern_history.get(token, []), txn, config)
+        return pattern_score_cache[token]
 
     context = MatchingContext(
         config=config,
         base_currency=currency,
         entries_by_id=entries_by_id,
-        get_candidates_for_date=get_candidates_for_date,
+        candidate_index=candidate_index,
+        subset_sum=SubsetSumEngine(base_currency=currency),
+        descriptions=descriptions,
         get_cached_pattern_score=get_cached_pattern_score,
     )
 
@@ -668,58 +894,24 @@ async def execute_matching(
         )
     )
 
-    # Phase 3: Auto-Pair Transfers (AFTER all matching complete)
-    # Find and pair transfers automatically per common/ledger/readme.md
-    try:
-        transfer_pairs = await find_transfer_pairs(
-            db,
-            user_id,
-            currency=currency,
-            description_scorer=score_description,
-            threshold=85,
-        )
-        if transfer_pairs:
-            logger.info(
-                "Auto-pairing complete",
-                user_id=str(user_id),
-                pairs_found=len(transfer_pairs),
-            )
-    except Exception as e:
-        logger.error(
-            "Failed to auto-pair transfers",
-            user_id=str(user_id),
-            error=str(e),
-        )
-        # Non-fatal error - continue with existing matches
-
-    try:
-        await db.flush()
-        for match in matches:
-            await sync_reconciliation_match_journal_entry_links(db, match)
-    except Exception as e:
-        logger.error(
-            "Reconciliation flush failed",
-            user_id=str(user_id),
-            matches_attempted=len(matches),
-            error=str(e),
-            error_type=type(e).__name__,
-        )
-        raise
-
-    # AC-observability.10.4: emit one business metric per resolved match, labelled by its
-    # final disposition (auto_accepted / pending_review / rejected). Low
-    # cardinality — the label is the bounded ReconciliationStatus enum value.
-    for created_match in matches:
-        record_reconciliation_match_outcome(outcome=created_match.status.value)
-
+    await finish_matching(
+        db,
+        user_id=user_id,
+        currency=currency,
+        transactions=transactions,
+        matches=matches,
+        pair_transfers=inputs.pair_transfers,
+    )
     return matches
 
 
 async def sync_reconciliation_match_journal_entry_links(db: AsyncSession, match: ReconciliationMatch) -> None:
     """Synchronize trusted reconciliation anchor links from the compatibility JSONB list."""
-    if match.id is None:
-        await db.flush()
+    await sync_reconciliation_match_journal_entry_links_bulk(db, [match])
+
 
+def _link_target_ids(match: ReconciliationMatch) -> list[UUID]:
+    """Distinct, parseable entry ids of ``match.journal_entry_ids`` in list order."""
     target_ids: list[UUID] = []
     seen: set[UUID] = set()
     for raw_entry_id in match.journal_entry_ids or []:
@@ -730,55 +922,91 @@ async def sync_reconciliation_match_journal_entry_links(db: AsyncSession, match:
         if entry_id not in seen:
             seen.add(entry_id)
             target_ids.append(entry_id)
+    return target_ids
 
-    if target_ids:
-        match_user_id = (
-            await db.execute(select(AtomicTransaction.user_id).where(AtomicTransaction.id == match.atomic_txn_id))
-        ).scalar_one_or_none()
-        if match_user_id is None:
-            target_ids = []
-        else:
-            valid_entry_ids = set(
-                (
-                    await db.execute(
-                        select(JournalEntry.id)
-                        .where(JournalEntry.id.in_(target_ids))
-                        .where(JournalEntry.user_id == match_user_id)
-                    )
-                ).scalars()
-            )
-            target_ids = [entry_id for entry_id in target_ids if entry_id in valid_entry_ids]
 
-    existing_ids = set(
-        (
-            await db.execute(
-                select(ReconciliationMatchJournalEntry.journal_entry_id).where(
-                    ReconciliationMatchJournalEntry.match_id == match.id
+# Matches per link-sync statement set: keeps every IN list and the multi-row
+# INSERT (4 bind parameters per link) well under the driver's 32767-parameter cap.
+_LINK_SYNC_CHUNK = 2000
+
+
+async def sync_reconciliation_match_journal_entry_links_bulk(
+    db: AsyncSession,
+    matches: Sequence[ReconciliationMatch],
+) -> None:
+    """Synchronize anchor links for many matches in a fixed number of statements.
+
+    Produces the same link rows as syncing each match on its own: an entry id
+    is linked only when it parses and its entry belongs to the user who owns
+    the match's atomic transaction; every other existing link of the match is
+    removed. Per chunk of ``_LINK_SYNC_CHUNK`` matches, ownership is one query,
+    existing links one query, and the in-memory diff is applied with one
+    ``INSERT ... ON CONFLICT DO NOTHING`` and one ``DELETE ... WHERE
+    (match_id, journal_entry_id) IN (...)``; the session is flushed once.
+    """
+    if not matches:
+        return
+    if any(match.id is None for match in matches):
+        await db.flush()
+    for offset in range(0, len(matches), _LINK_SYNC_CHUNK):
+        await _sync_link_chunk(db, matches[offset : offset + _LINK_SYNC_CHUNK])
+    await db.flush()
+
+
+async def _sync_link_chunk(db: AsyncSession, matches: Sequence[ReconciliationMatch]) -> None:
+    targets = {match.id: (match, _link_target_ids(match)) for match in matches}
+    requested_entry_ids = {entry_id for _, target_ids in targets.values() for entry_id in target_ids}
+
+    owned: set[tuple[UUID, UUID]] = set()
+    if requested_entry_ids:
+        owned = {
+            (txn_id, entry_id)
+            for txn_id, entry_id in (
+                await db.execute(
+                    select(AtomicTransaction.id, JournalEntry.id)
+                    .join(JournalEntry, JournalEntry.user_id == AtomicTransaction.user_id)
+                    .where(AtomicTransaction.id.in_({match.atomic_txn_id for match in matches}))
+                    .where(JournalEntry.id.in_(requested_entry_ids))
                 )
-            )
-        ).scalars()
-    )
-    target_set = set(target_ids)
+            ).all()
+        }
 
-    stale_ids = existing_ids - target_set
-    if stale_ids:
+    existing: set[tuple[UUID, UUID]] = {
+        (match_id, entry_id)
+        for match_id, entry_id in (
+            await db.execute(
+                select(
+                    ReconciliationMatchJournalEntry.match_id,
+                    ReconciliationMatchJournalEntry.journal_entry_id,
+                ).where(ReconciliationMatchJournalEntry.match_id.in_(list(targets)))
+            )
+        ).all()
+    }
+    wanted = [
+        (match_id, entry_id)
+        for match_id, (match, target_ids) in targets.items()
+        for entry_id in target_ids
+        if (match.atomic_txn_id, entry_id) in owned
+    ]
+
+    stale = existing.difference(wanted)
+    if stale:
         await db.execute(
             delete(ReconciliationMatchJournalEntry).where(
-                ReconciliationMatchJournalEntry.match_id == match.id,
-                ReconciliationMatchJournalEntry.journal_entry_id.in_(stale_ids),
+                tuple_(
+                    ReconciliationMatchJournalEntry.match_id,
+                    ReconciliationMatchJournalEntry.journal_entry_id,
+                ).in_(sorted(stale))
             )
         )
 
-    for ordinal_entry_id in target_ids:
-        if ordinal_entry_id in existing_ids:
-            continue
-        db.add(
-            ReconciliationMatchJournalEntry(
-                match_id=match.id,
-                journal_entry_id=ordinal_entry_id,
-            )
-        )
-    await db.flush()
+    missing = [
+        {"match_id": match_id, "journal_entry_id": entry_id}
+        for match_id, entry_id in wanted
+        if (match_id, entry_id) not in existing
+    ]
+    if missing:
+        await db.execute(postgresql_insert(ReconciliationMatchJournalEntry).values(missing).on_conflict_do_nothing())
 
 
 def auto_accept(match_score: int, config: ReconciliationConfig) -> bool:
@@ -0,0 +1,231 @@
+"""Batched historical-pattern loading over the merchant-token projection.
+
+``score_pattern`` answers one merchant token with one leading-wildcard
+``ILIKE`` scan joined to accepted matches. A cold run over a user with hundreds
+of merchants is hundreds of such scans. Here a run's whole token set is
+answered at once: known tokens come from ``reconciliation_merchant_patterns``
+in one keyed read, and unknown tokens are seeded by a single windowed query
+(one ``ILIKE`` per token inside one statement, newest
+``PATTERN_HISTORY_LIMIT`` rows per token) whose results are upserted into the
+projection. Accepting a match folds the transaction into every projected token
+its description contains, so later runs never go back to per-token SQL.
+
+Entries are keyed by transaction id, so folding a transaction in twice keeps
+one entry. History can also shrink: transactions are deleted (statement
+reparse) and accepted matches are superseded by a rematch. Rather than hook
+every such writer, each load checks in one keyed read that every projected
+transaction still has an accepted match, and reseeds the tokens that hold a
+stale one.
+
+Tokens are ``extract_merchant_tokens`` output — lowercase ``[a-z0-9]`` words —
+so the reverse ``description ILIKE '%' || token || '%'`` in
+``record_accepted_merchant_patterns`` needs no escaping.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from uuid import UUID
+
+from sqlalchemy import Integer, String, Text, column, func, literal, select, values
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.extraction.orm.layer2 import AtomicTransaction
+from src.reconciliation.extension.scoring import PATTERN_HISTORY_LIMIT, merchant_like_pattern
+from src.reconciliation.orm.reconciliation import (
+    ReconciliationMatch,
+    ReconciliationMerchantPattern,
+    ReconciliationStatus,
+)
+
+_ACCEPTED_STATUSES = (ReconciliationStatus.AUTO_ACCEPTED, ReconciliationStatus.ACCEPTED)
+
+HistoryEntry = tuple[UUID, date, Decimal]
+History = list[HistoryEntry]
+
+
+def _parse_history(raw: object) -> History | None:
+    """Decode a projection ``history`` value; ``None`` when it is not the expected shape.
+
+    Rows written before entries carried their transaction id decode as
+    ``None`` and are reseeded like any other undecodable row.
+    """
+    if not isinstance(raw, list):
+        return None
+    parsed: History = []
+    for item in raw:
+        if not isinstance(item, list) or len(item) != 3:
+            return None
+        try:
+            parsed.append((UUID(str(item[0])), date.fromisoformat(str(item[1])), Decimal(str(item[2]))))
+        except (ValueError, InvalidOperation):
+            return None
+    return parsed
+
+
+def _dump_history(history: History) -> list[list[str]]:
+    return [[str(txn_id), txn_date.isoformat(), str(amount)] for txn_id, txn_date, amount in history]
+
+
+def _merge_history(history: History, additions: Iterable[HistoryEntry]) -> History:
+    """Newest-first union keyed by transaction id, capped like the ``ORDER BY txn_date DESC LIMIT`` it mirrors."""
+    by_id = {txn_id: (txn_id, txn_date, amount) for txn_id, txn_date, amount in [*history, *additions]}
+    merged = sorted(by_id.values(), key=lambda item: item[1], reverse=True)
+    return merged[:PATTERN_HISTORY_LIMIT]
+
+
+async def _accepted_transaction_ids(db: AsyncSession, *, user_id: UUID, txn_ids: set[UUID]) -> set[UUID]:
+    """The subset of ``txn_ids`` that still exist with an accepted match."""
+    if not txn_ids:
+        return set()
+    result = await db.execute(
+        select(AtomicTransaction.id)
+        .join(ReconciliationMatch, ReconciliationMatch.atomic_txn_id == AtomicTransaction.id)
+        .where(AtomicTransaction.user_id == user_id)
+        .where(AtomicTransaction.id.in_(txn_ids))
+        .where(ReconciliationMatch.status.in_(_ACCEPTED_STATUSES))
+    )
+    return set(result.scalars().all())
+
+
+async def _query_accepted_history(db: AsyncSession, *, user_id: UUID, tokens: Sequence[str]) -> dict[str, History]:
+    """One statement answering ``score_pattern``'s history query for every token."""
+    wanted = values(column("token", String), column("pattern", Text), name="pattern_tokens").data(
+        [(token, merchant_like_pattern(token)) for token in tokens]
+    )
+    ranked = (
+        select(
+            wanted.c.token,
+            AtomicTransaction.id,
+            AtomicTransaction.txn_date,
+            AtomicTransaction.amount,
+            func.row_number()
+            .over(partition_by=wanted.c.token, order_by=AtomicTransaction.txn_date.desc())
+            .label("rank"),
+        )
+        .select_from(wanted)
+        .join(AtomicTransaction, AtomicTransaction.description.ilike(wanted.c.pattern, escape="\\"))
+        .join(ReconciliationMatch, ReconciliationMatch.atomic_txn_id == AtomicTransaction.id)
+        .where(AtomicTransaction.user_id == user_id)
+        .where(ReconciliationMatch.status.in_(_ACCEPTED_STATUSES))
+        .subquery()
+    )
+    result = await db.execute(
+        select(ranked.c.token, ranked.c.id, ranked.c.txn_date, ranked.c.amount)
+        .where(ranked.c.rank <= PATTERN_HISTORY_LIMIT)
+        .order_by(ranked.c.token, ranked.c.rank)
+    )
+    history: dict[str, History] = {token: [] for token in tokens}
+    for token, txn_id, txn_date, amount in result.all():
+        history[token].append((txn_id, txn_date, amount))
+    return history
+
+
+async def load_pattern_history(
+    db: AsyncSession,
+    *,
+    user_id: UUID,
+    tokens: Iterable[str],
+) -> dict[str, list[Decimal]]:
+    """Accepted-match history amounts (newest first) for every token, in at most four statements.
+
+    Tokens missing from the projection — whose row no longer decodes, e.g.
+    after snapshot anonymization, or lists a transaction that was deleted or
+    lost its accepted match — are seeded from the match history and upserted,
+    including tokens with no history, so the next run reads them from the
+    projection as well.
+    """
+    wanted = sorted(set(tokens))
+    if not wanted:
+        return {}
+
+    result = await db.execute(
+        select(ReconciliationMerchantPattern.token, ReconciliationMerchantPattern.history)
+        .where(ReconciliationMerchantPattern.user_id == user_id)
+        .where(ReconciliationMerchantPattern.token.in_(wanted))
+    )
+    history: dict[str, History] = {}
+    for token, raw in result.all():
+        parsed = _parse_history(raw)
+        if parsed is not None:
+            history[token] = parsed
+    live = await _accepted_transaction_ids(
+        db, user_id=user_id, txn_ids={txn_id for entries in history.values() for txn_id, _, _ in entries}
+    )
+    history = {token: entries for token, entries in history.items() if all(txn_id in live for txn_id, _, _ in entries)}
+
+    missing = [token for token in wanted if token not in history]
+    if missing:
+        seeded = await _query_accepted_history(db, user_id=user_id, tokens=missing)
+        stmt = postgresql_insert(ReconciliationMerchantPattern).values(
+            [
+                {
+                    "user_id": user_id,
+                    "token": token,
+                    "history": _dump_history(seeded[token]),
+                    "last_matched_on": seeded[token][0][1] if seeded[token] else None,
+                }
+                for token in missing
+            ]
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ReconciliationMerchantPattern.user_id, ReconciliationMerchantPattern.token],
+                set_={
+                    "history": stmt.excluded.history,
+                    "last_matched_on": stmt.excluded.last_matched_on,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        history.update(seeded)
+
+    return {token: [amount for _, _, amount in history[token]] for token in wanted}
+
+
+async def record_accepted_merchant_patterns(
+    db: AsyncSession,
+    *,
+    user_id: UUID,
+    transactions: Sequence[AtomicTransaction],
+) -> None:
+    """Fold newly accepted transactions into every projected token their descriptions contain.
+
+    Tokens not projected yet need nothing: their first ``load_pattern_history``
+    seeds them from the match history, which already includes these
+    transactions. Re-accepting a transaction already projected (e.g. after a
+    rematch) replaces its entry instead of adding a second one.
+    """
+    accepted = [txn for txn in transactions if txn.description]
+    if not accepted:
+        return
+
+    descriptions = values(column("position", Integer), column("description", Text), name="accepted_descriptions").data(
+        list(enumerate(txn.description for txn in accepted))
+    )
+    result = await db.execute(
+        select(ReconciliationMerchantPattern, descriptions.c.position)
+        .join(
+            descriptions,
+            descriptions.c.description.ilike(func.concat(literal("%"), ReconciliationMerchantPattern.token, "%")),
+        )
+        .where(ReconciliationMerchantPattern.user_id == user_id)
+    )
+    additions: dict[str, tuple[ReconciliationMerchantPattern, History]] = {}
+    for pattern, position in result.all():
+        txn = accepted[position]
+        additions.setdefault(pattern.token, (pattern, []))[1].append((txn.id, txn.txn_date, txn.amount))
+
+    for pattern, new_items in additions.values():
+        parsed = _parse_history(pattern.history)
+        if parsed is None:
+            # Undecodable rows are reseeded by the next load; leave them alone.
+            continue
+        merged = _merge_history(parsed, new_items)
+        pattern.history = _dump_history(merged)
+        pattern.last_matched_on = merged[0][1]
+    if additions:
+        await db.flush()
@@ -1,10 +1,12 @@
 """Matching phase helpers."""
 
-from src.reconciliation.extension.phases.many_to_one import run_many_to_one_phase
-from src.reconciliation.extension.phases.normal_matching import run_normal_matching_phase
+from src.reconciliation.extension.phases.many_to_one import apply_many_to_one_match, run_many_to_one_phase
+from src.reconciliation.extension.phases.normal_matching import apply_normal_match, run_normal_matching_phase
 from src.reconciliation.extension.phases.transfer_detection import run_transfer_detection_phase
 
 __all__ = [
+    "apply_many_to_one_match",
+    "apply_normal_match",
     "run_many_to_one_phase",
     "run_normal_matching_phase",
     "run_transfer_detection_phase",
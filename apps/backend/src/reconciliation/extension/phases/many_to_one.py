@@ -8,13 +8,16 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.extraction.orm.layer2 import AtomicTransaction
-from src.ledger import JournalEntryStatus
-from src.reconciliation.base import ReconciliationRepository, _candidate_is_better, is_entry_balanced
+from src.ledger import JournalEntry, JournalEntryStatus
+from src.reconciliation.base import MatchCandidate, ReconciliationConfig, ReconciliationRepository, _candidate_is_better
+from src.reconciliation.extension.batch_scoring import TransactionBlock, score_block
 from src.reconciliation.extension.matching import (
     MatchingContext,
+    _candidate_block,
+    _description_prefilter,
     _mark_auto_accepted_entry_reconciled,
+    _matrix_candidate,
     build_many_to_one_groups,
-    prune_candidates,
     score_group,
 )
 from src.reconciliation.orm.reconciliation import ReconciliationMatch, ReconciliationStatus
@@ -32,37 +35,55 @@ async def run_many_to_one_phase(
     """Run many-to-one grouping and candidate scoring."""
     created_matches: list[ReconciliationMatch] = []
     groups = build_many_to_one_groups(transactions)
+    min_total, beat_row_best = _description_prefilter(context.config)
     for group in groups:
         if all(txn.id in matched_txn_ids for txn in group):
             continue
         group_total = sum((txn.amount for txn in group), Decimal("0.00"))
         group_date = max(txn.txn_date for txn in group)
-        candidates = context.get_candidates_for_date(group_date)
+        candidates = context.candidate_index.pruned(group_date, group_total)
         if not candidates:
             continue
-        candidates = prune_candidates(
-            candidates,
-            txn_date=group_date,
-            target_amount=group_total,
-        )
 
         best_candidate = None
         best_entry = None
         history_score = await context.get_cached_pattern_score(group[0])
 
-        for entry in candidates:
-            if not is_entry_balanced(entry, base_currency=context.base_currency):
+        members = [(entry,) for entry in candidates if context.subset_sum.is_balanced(entry)]
+        if not members:
+            continue
+        matrix = score_block(
+            TransactionBlock(
+                amounts=[group_total],
+                dates=[group[0].txn_date],
+                descriptions=[group[0].description],
+                history=[history_score],
+            ),
+            _candidate_block(group[0], members, context.subset_sum, is_group=True),
+            context.config,
+            amount_bonus=5.0,
+            descriptions=context.descriptions,
+            min_total=min_total,
+            beat_row_best=beat_row_best,
+        )
+        for col, total in enumerate(matrix.totals[0]):
+            (entry,) = members[col]
+            if context.config.enable_ai_reconciliation and 60 <= total <= 84:
+                # Hybrid band: the scalar path owns the AI semantic re-score.
+                candidate = await score_group(
+                    db,
+                    group[0],
+                    [entry],
+                    context.config,
+                    user_id=user_id,
+                    group_amount=group_total,
+                    history_score=history_score,
+                )
+            elif total < context.config.pending_review or (best_candidate is not None and total < best_candidate.score):
                 continue
-
-            candidate = await score_group(
-                db,
-                group[0],
-                [entry],
-                context.config,
-                user_id=user_id,
-                group_amount=group_total,
-                history_score=history_score,
-            )
+            else:
+                candidate = _matrix_candidate(matrix, col, [entry])
+                candidate.breakdown["many_to_one_bonus"] = 10.0
             candidate.breakdown["group_total"] = str(group_total)
             if candidate.score >= context.config.pending_review and _candidate_is_better(
                 candidate, best_candidate, context.entries_by_id
@@ -71,40 +92,66 @@ async def run_many_to_one_phase(
                 best_entry = entry
 
         if best_candidate and best_entry:
-            status = (
-                ReconciliationStatus.AUTO_ACCEPTED
-                if best_candidate.score >= context.config.auto_accept
-                else ReconciliationStatus.PENDING_REVIEW
+            created_matches.extend(
+                await apply_many_to_one_match(
+                    db,
+                    group=group,
+                    best_candidate=best_candidate,
+                    best_entry=best_entry,
+                    matched_txn_ids=matched_txn_ids,
+                    config=context.config,
+                    repository=repository,
+                )
             )
-            for txn in group:
-                if txn.id in matched_txn_ids:
-                    continue
-                existing_match = await repository.get_active_match(txn.id)
-                if existing_match:
-                    existing_je_ids = set(existing_match.journal_entry_ids or [])
-                    new_je_ids = set(best_candidate.journal_entry_ids or [])
-                    if existing_je_ids == new_je_ids:
-                        matched_txn_ids.add(txn.id)
-                        continue
-                    existing_match.status = ReconciliationStatus.SUPERSEDED
+    return created_matches
+
+
+async def apply_many_to_one_match(
+    db: AsyncSession,
+    *,
+    group: list[AtomicTransaction],
+    best_candidate: MatchCandidate,
+    best_entry: JournalEntry,
+    matched_txn_ids: set[UUID],
+    config: ReconciliationConfig,
+    repository: ReconciliationRepository,
+) -> list[ReconciliationMatch]:
+    """Persist the group's winning entry for every member not matched yet."""
+    created_matches: list[ReconciliationMatch] = []
+    status = (
+        ReconciliationStatus.AUTO_ACCEPTED
+        if best_candidate.score >= config.auto_accept
+        else ReconciliationStatus.PENDING_REVIEW
+    )
+    for txn in group:
+        if txn.id in matched_txn_ids:
+            continue
+        existing_match = await repository.get_active_match(txn.id)
+        if existing_match:
+            existing_je_ids = set(existing_match.journal_entry_ids or [])
+            new_je_ids = set(best_candidate.journal_entry_ids or [])
+            if existing_je_ids == new_je_ids:
+                matched_txn_ids.add(txn.id)
+                continue
+            existing_match.status = ReconciliationStatus.SUPERSEDED
 
-                match_kwargs = {
-                    "journal_entry_ids": best_candidate.journal_entry_ids,
-                    "match_score": best_candidate.score,
-                    "score_breakdown": best_candidate.breakdown,
-                    "status": status,
-                }
-                match_kwargs["atomic_txn_id"] = txn.id
+        match_kwargs = {
+            "journal_entry_ids": best_candidate.journal_entry_ids,
+            "match_score": best_candidate.score,
+            "score_breakdown": best_candidate.breakdown,
+            "status": status,
+        }
+        match_kwargs["atomic_txn_id"] = txn.id
 
-                match = ReconciliationMatch(**match_kwargs)
-                await repository.add_match(match)
+        match = ReconciliationMatch(**match_kwargs)
+        await repository.add_match(match)
 
-                if existing_match:
-                    await db.flush()
-                    existing_match.superseded_by_id = match.id
+        if existing_match:
+            await db.flush()
+            existing_match.superseded_by_id = match.id
 
-                created_matches.append(match)
-                matched_txn_ids.add(txn.id)
-                if status == ReconciliationStatus.AUTO_ACCEPTED and best_entry.status != JournalEntryStatus.VOID:
-                    _mark_auto_accepted_entry_reconciled(best_entry)
+        created_matches.append(match)
+        matched_txn_ids.add(txn.id)
+        if status == ReconciliationStatus.AUTO_ACCEPTED and best_entry.status != JournalEntryStatus.VOID:
+            _mark_auto_accepted_entry_reconciled(best_entry)
     return created_matches
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
+from src.extraction import StatementSummary, resolve_statement_transactions
 from src.extraction.orm.layer2 import AtomicTransaction
 from src.ledger import JournalEntry, JournalEntryStatus, JournalLine
 from src.reconciliation.base.repository import ReconciliationRepository
@@ -38,6 +40,83 @@ class SqlReconciliationRepository(ReconciliationRepository):
         result = await self._db.execute(query)
         return list(result.scalars().all())
 
+    async def list_incremental_pending_transactions(
+        self,
+        user_id: UUID,
+        *,
+        created_after: datetime | None,
+        date_ranges: Sequence[tuple[date, date]],
+        date_days: int,
+        limit: int | None = None,
+    ) -> list[AtomicTransaction]:
+        """Pending transactions whose matching inputs moved since ``created_after``.
+
+        That is: created after it, dated within ``date_days`` of a pending one
+        that was, or dated inside ``date_ranges`` (windows around changed journal
+        entries). With no ``created_after`` every pending transaction qualifies.
+        """
+        matched = select(ReconciliationMatch.atomic_txn_id).where(ReconciliationMatch.atomic_txn_id.isnot(None))
+        query = (
+            select(AtomicTransaction)
+            .where(AtomicTransaction.user_id == user_id)
+            .where(AtomicTransaction.id.notin_(matched))
+            .order_by(AtomicTransaction.txn_date)
+        )
+        if created_after is not None:
+            fresh = aliased(AtomicTransaction)
+            near_fresh = exists().where(
+                fresh.user_id == user_id,
+                fresh.created_at > created_after,
+                fresh.id.notin_(matched),
+                func.abs(fresh.txn_date - AtomicTransaction.txn_date) <= date_days,
+            )
+            query = query.where(
+                or_(
+                    AtomicTransaction.created_at > created_after,
+                    near_fresh,
+                    *(AtomicTransaction.txn_date.between(start, end) for start, end in date_ranges),
+                )
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self._db.execute(query)
+        return list(result.scalars().all())
+
+    async def list_changed_entry_dates(self, *, user_id: UUID, updated_after: datetime | None) -> list[date]:
+        query = (
+            select(JournalEntry.entry_date)
+            .where(JournalEntry.user_id == user_id)
+            .where(JournalEntry.status != JournalEntryStatus.VOID)
+            .distinct()
+        )
+        if updated_after is not None:
+            query = query.where(JournalEntry.updated_at > updated_after)
+        result = await self._db.execute(query)
+        return list(result.scalars().all())
+
+    async def list_statement_pending_transactions(
+        self, *, user_id: UUID, statement_id: UUID
+    ) -> list[AtomicTransaction]:
+        """The user's statement's transactions that no match references yet."""
+        statement = await self._db.get(StatementSummary, statement_id)
+        if statement is None or statement.user_id != user_id:
+            return []
+        transactions = await resolve_statement_transactions(self._db, statement)
+        if not transactions:
+            return []
+        matched = set(
+            (
+                await self._db.execute(
+                    select(ReconciliationMatch.atomic_txn_id).where(
+                        ReconciliationMatch.atomic_txn_id.in_([txn.id for txn in transactions])
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        return [txn for txn in transactions if txn.id not in matched]
+
     async def list_journal_candidates(
         self,
         *,
@@ -14,6 +14,7 @@ from src.observability import get_logger
 from src.reconciliation.base.config import entry_total_amount
 from src.reconciliation.base.errors import AmountMismatchError, EntryCreationError, MatchNotFoundError
 from src.reconciliation.extension.matching import sync_reconciliation_match_journal_entry_links
+from src.reconciliation.extension.pattern_history import record_accepted_merchant_patterns
 from src.reconciliation.orm.reconciliation import ReconciliationMatch, ReconciliationStatus
 
 logger = get_logger(__name__)
@@ -158,6 +159,8 @@ async def accept_match(
 
     await db.flush()
     await sync_reconciliation_match_journal_entry_links(db, match)
+    if txn:
+        await record_accepted_merchant_patterns(db, user_id=user_id, transactions=[txn])
     return match
 
 
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Literal
 from uuid import UUID
 
@@ -19,6 +22,15 @@ from src.reconciliation.orm.reconciliation import ReconciliationMatch, Reconcili
 
 ReconciliationConfidenceTier = Literal["HIGH", "MEDIUM", "LOW"]
 
+# Statement descriptions and entry memos repeat heavily ("GIRO PAYMENT" x
+# thousands), so normalization and pairwise ratios are memoized process-wide in
+# bounded LRUs; the values are pure functions of their string arguments.
+_TEXT_CACHE_SIZE = 8192
+_RATIO_CACHE_SIZE = 16384
+
+# Most recent accepted matches per merchant token that history scoring looks at.
+PATTERN_HISTORY_LIMIT = 10
+
 
 def derive_reconciliation_score_tier(score: int | None) -> ReconciliationConfidenceTier:
     """Map one reconciliation match score to its review-queue presentation tier."""
@@ -29,6 +41,7 @@ def derive_reconciliation_score_tier(score: int | None) -> ReconciliationConfide
     return "HIGH"
 
 
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def normalize_text(value: str) -> str:
     """Normalize text for similarity comparison."""
     cleaned = re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
@@ -50,6 +63,83 @@ def score_description(a: str | None, b: str | None) -> float:
     return round(100 * (0.6 * ratio + 0.4 * token_score), 2)
 
 
+@lru_cache(maxsize=_RATIO_CACHE_SIZE)
+def _sequence_ratio(norm_a: str, norm_b: str) -> float:
+    return SequenceMatcher(None, norm_a, norm_b).ratio()
+
+
+@dataclass(frozen=True, slots=True)
+class DescriptionFingerprint:
+    """One description normalized once: text, token set and interned token ids."""
+
+    normalized: str
+    tokens: frozenset[str]
+    token_ids: frozenset[int]
+    merchant_tokens: tuple[str, ...]
+
+
+class DescriptionScorer:
+    """Run-scoped ``score_description`` over cached description fingerprints.
+
+    Every transaction description and entry memo is normalized once per
+    matching run; token overlap is a set operation on interned ints, and
+    ``SequenceMatcher`` ratios go through the shared bounded LRU. ``score``
+    returns exactly what ``score_description`` would.
+
+    ``upper_bound`` is a cheap ceiling on ``score`` — the exact token Jaccard
+    plus the length-ratio bound ``2 * min(len) / (len_a + len_b)`` on the
+    sequence ratio — so callers can skip pairs that cannot beat a threshold.
+    """
+
+    def __init__(self) -> None:
+        self._fingerprints: dict[str, DescriptionFingerprint | None] = {}
+        self._token_ids: dict[str, int] = {}
+
+    def fingerprint(self, text: str | None) -> DescriptionFingerprint | None:
+        """Fingerprint for ``text``, or ``None`` when it normalizes to nothing."""
+        if not text:
+            return None
+        if text in self._fingerprints:
+            return self._fingerprints[text]
+        normalized = normalize_text(text)
+        fingerprint = None
+        if normalized:
+            tokens = frozenset(normalized.split())
+            token_ids = frozenset(self._token_ids.setdefault(token, len(self._token_ids)) for token in tokens)
+            fingerprint = DescriptionFingerprint(normalized, tokens, token_ids, _merchant_tokens(normalized))
+        self._fingerprints[text] = fingerprint
+        return fingerprint
+
+    def merchant_tokens(self, text: str | None) -> list[str]:
+        """``extract_merchant_tokens`` from the cached fingerprint."""
+        fingerprint = self.fingerprint(text)
+        return list(fingerprint.merchant_tokens) if fingerprint else []
+
+    @staticmethod
+    def _token_score(a: DescriptionFingerprint, b: DescriptionFingerprint) -> float:
+        return len(a.token_ids & b.token_ids) / len(a.token_ids | b.token_ids)
+
+    def upper_bound(self, a: str | None, b: str | None) -> float:
+        """A value never below ``score(a, b)``, computed without ``SequenceMatcher``."""
+        fp_a = self.fingerprint(a)
+        fp_b = self.fingerprint(b)
+        if fp_a is None or fp_b is None:
+            return 0.0
+        len_a = len(fp_a.normalized)
+        len_b = len(fp_b.normalized)
+        ratio_bound = 2.0 * min(len_a, len_b) / (len_a + len_b)
+        return round(100 * (0.6 * ratio_bound + 0.4 * self._token_score(fp_a, fp_b)), 2)
+
+    def score(self, a: str | None, b: str | None) -> float:
+        """Same value as ``score_description(a, b)``."""
+        fp_a = self.fingerprint(a)
+        fp_b = self.fingerprint(b)
+        if fp_a is None or fp_b is None:
+            return 0.0
+        ratio = _sequence_ratio(fp_a.normalized, fp_b.normalized)
+        return round(100 * (0.6 * ratio + 0.4 * self._token_score(fp_a, fp_b)), 2)
+
+
 def score_amount(
     txn_amount: Decimal,
     entry_amount: Decimal,
@@ -140,13 +230,8 @@ def score_business_logic(transaction: AtomicTransaction, entry: JournalEntry) ->
     return 50.0
 
 
-def extract_merchant_tokens(description: str) -> list[str]:
-    """Extract meaningful merchant tokens from transaction description.
-
-    Improved extraction that takes up to 3 significant words, skipping
-    common prefixes like transaction codes, dates, and generic terms.
-    """
-    skip_patterns = {
+_MERCHANT_SKIP_TOKENS = frozenset(
+    {
         "ref",
         "txn",
         "trn",
@@ -163,20 +248,39 @@ def extract_merchant_tokens(description: str) -> list[str]:
         "visa",
         "mastercard",
     }
-    words = normalize_text(description).split()
-    tokens = []
-    for word in words:
+)
+
+
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def _merchant_tokens(normalized: str) -> tuple[str, ...]:
+    tokens: list[str] = []
+    for word in normalized.split():
         # Skip very short words, numbers, and common prefixes
         if len(word) < 3:
             continue
         if word.isdigit():
             continue
-        if word.lower() in skip_patterns:
+        if word.lower() in _MERCHANT_SKIP_TOKENS:
             continue
         tokens.append(word)
         if len(tokens) >= 3:
             break
-    return tokens
+    return tuple(tokens)
+
+
+def extract_merchant_tokens(description: str) -> list[str]:
+    """Extract meaningful merchant tokens from transaction description.
+
+    Improved extraction that takes up to 3 significant words, skipping
+    common prefixes like transaction codes, dates, and generic terms.
+    """
+    return list(_merchant_tokens(normalize_text(description)))
+
+
+def merchant_like_pattern(token: str) -> str:
+    """Escaped ``ILIKE`` substring pattern for one merchant token."""
+    safe_token = token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{safe_token}%"
 
 
 async def score_pattern(
@@ -194,9 +298,7 @@ async def score_pattern(
         return 0.0
 
     # Use first meaningful token for pattern matching
-    token = merchant_tokens[0]
-    safe_token = token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-    pattern = f"%{safe_token}%"
+    pattern = merchant_like_pattern(merchant_tokens[0])
 
     result = await db.execute(
         select(AtomicTransaction)
@@ -208,15 +310,28 @@ async def score_pattern(
         .where(ReconciliationMatch.status.in_([ReconciliationStatus.AUTO_ACCEPTED, ReconciliationStatus.ACCEPTED]))
         .where(AtomicTransaction.description.ilike(pattern, escape="\\"))
         .order_by(AtomicTransaction.txn_date.desc())
-        .limit(10)
+        .limit(PATTERN_HISTORY_LIMIT)
     )
     history = result.scalars().all()
-    if not history:
+    return pattern_score_from_history([past.amount for past in history], transaction, config)
+
+
+def pattern_score_from_history(
+    history_amounts: Sequence[Decimal],
+    transaction: AtomicTransaction,
+    config: ReconciliationConfig,
+) -> float:
+    """Score a transaction against the amounts of its merchant's accepted history.
+
+    80 when any past amount is within tolerance, 40 for history without an
+    amount fit, 0 without history.
+    """
+    if not history_amounts:
         return 0.0
 
     tolerance = max(transaction.amount * config.amount_percent, config.amount_absolute)
-    for past in history:
-        if abs(past.amount - transaction.amount) <= tolerance:
+    for amount in history_amounts:
+        if abs(amount - transaction.amount) <= tolerance:
             return 80.0
     return 40.0
 
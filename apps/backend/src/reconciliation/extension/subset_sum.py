@@ -0,0 +1,85 @@
+"""Subset-sum search for multi-entry (2-/3-entry) reconciliation candidates."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from decimal import Decimal
+
+from src.ledger import JournalEntry
+from src.reconciliation.base.config import entry_bank_side_amount, is_entry_balanced
+
+
+class SubsetSumEngine:
+    """Find candidate combinations whose bank-side total lands in a tolerance band.
+
+    Replaces ``itertools.combinations(candidates, n)`` followed by a per-tuple
+    ``is_entry_balanced`` / ``entry_bank_side_amount`` recompute and band check.
+    Each entry's balanced flag and bank-side amount are computed once per run
+    (memoized on the entry object, which the run keeps alive), the balanced
+    candidates are sorted by amount, and the last member of every combination is
+    located by bisect — so only in-band combinations are ever materialized.
+
+    Results come back in ``itertools.combinations`` order over the input list,
+    so first-wins scoring and ``_candidate_is_better`` tie-breaks are unchanged.
+    """
+
+    def __init__(self, *, base_currency: str) -> None:
+        self._base_currency = base_currency
+        self._balanced: dict[int, tuple[JournalEntry, bool]] = {}
+        self._amounts: dict[tuple[int, str | None], tuple[JournalEntry, Decimal]] = {}
+
+    def is_balanced(self, entry: JournalEntry) -> bool:
+        """Memoized ``is_entry_balanced`` for the run's base currency."""
+        cached = self._balanced.get(id(entry))
+        if cached is None:
+            cached = (entry, is_entry_balanced(entry, base_currency=self._base_currency))
+            self._balanced[id(entry)] = cached
+        return cached[1]
+
+    def bank_side_amount(self, entry: JournalEntry, direction: str | None) -> Decimal:
+        """Memoized ``entry_bank_side_amount`` keyed by the normalized transaction direction."""
+        key = (id(entry), direction.upper() if direction else None)
+        cached = self._amounts.get(key)
+        if cached is None:
+            cached = (entry, entry_bank_side_amount(entry, direction))
+            self._amounts[key] = cached
+        return cached[1]
+
+    def combinations(
+        self,
+        candidates: Sequence[JournalEntry],
+        direction: str | None,
+        *,
+        target: Decimal,
+        band: Decimal,
+        size: int,
+    ) -> list[tuple[JournalEntry, ...]]:
+        """Balanced ``size``-entry combinations with ``|total - target| <= band``."""
+        positions = [pos for pos, entry in enumerate(candidates) if self.is_balanced(entry)]
+        if len(positions) < size:
+            return []
+        positions.sort(key=lambda pos: self.bank_side_amount(candidates[pos], direction))
+        amounts = [self.bank_side_amount(candidates[pos], direction) for pos in positions]
+        low = target - band
+        high = target + band
+        found: list[tuple[int, ...]] = []
+
+        def search(start: int, remaining: int, partial: Decimal, chosen: tuple[int, ...]) -> None:
+            if remaining == 1:
+                first = bisect_left(amounts, low - partial, start)
+                last = bisect_right(amounts, high - partial, start)
+                found.extend(chosen + (positions[k],) for k in range(first, last))
+                return
+            largest = sum(amounts[len(amounts) - remaining + 1 :], Decimal("0"))
+            for k in range(start, len(amounts) - remaining + 1):
+                # Amounts are ascending, so the smallest completion only grows with k.
+                if partial + sum(amounts[k : k + remaining], Decimal("0")) > high:
+                    break
+                if partial + amounts[k] + largest < low:
+                    continue
+                search(k + 1, remaining - 1, partial + amounts[k], chosen + (positions[k],))
+
+        search(0, size, Decimal("0"), ())
+        ordered = sorted(tuple(sorted(combo)) for combo in found)
+        return [tuple(candidates[pos] for pos in combo) for combo in ordered]
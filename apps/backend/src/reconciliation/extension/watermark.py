@@ -0,0 +1,150 @@
+"""Per-user watermarks for incremental reconciliation runs.
+
+A full run rescores every pending transaction against every candidate in its
+window, even though a pending transaction that scored below threshold last time
+can only score differently if its inputs changed: a journal entry inside its
+``±date_days`` window was posted or edited, or a new transaction landed near it
+(many-to-one groups and transfer pairs are formed among transactions, not only
+against entries). ``reconciliation_watermarks`` records how far the last complete
+run looked; an incremental run reads it to select only the transactions whose
+inputs moved. The marks are captured *before* the run reads anything, so rows
+committed while it runs are seen again next time rather than skipped.
+
+``created_at``/``updated_at`` are stamped when a row is flushed, not when its
+transaction commits: a transaction still open at capture time can commit rows
+*older* than the captured maximum after the mark is stored. The mark is
+therefore capped at the start of the oldest other transaction in this database
+that has already written (holds a ``backend_xid``) and can still commit (is not
+aborted): every row it has yet to commit is stamped at or after that start. A
+transaction that has not written yet will stamp its rows after the capture, so
+read-only, idle and aborted sessions — including a pooled connection left idle
+in a read-only transaction — never hold the mark back. The cap is lowered by
+``settings.reconciliation_watermark_lag_seconds`` to absorb clock skew between
+app hosts. Rows between the cap and the true maximum are simply
+rescored again by the next run — still-pending transactions only, so the
+overlap is idempotent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import column, func, select, table
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.extraction.orm.layer2 import AtomicTransaction
+from src.ledger import JournalEntry
+from src.reconciliation.orm.reconciliation import ReconciliationWatermark
+
+_pg_stat_activity = table(
+    "pg_stat_activity",
+    column("datname"),
+    column("pid"),
+    column("state"),
+    column("backend_xid"),
+    column("xact_start"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class MatchingWatermark:
+    """Newest ``AtomicTransaction.created_at`` / ``JournalEntry.updated_at`` considered."""
+
+    transactions_through: datetime | None
+    entries_through: datetime | None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.transactions_through is None and self.entries_through is None
+
+
+async def load_matching_watermark(db: AsyncSession, *, user_id: UUID) -> MatchingWatermark | None:
+    """The user's stored watermark, or ``None`` before their first complete run."""
+    row = (
+        await db.execute(
+            select(ReconciliationWatermark.transactions_through, ReconciliationWatermark.entries_through).where(
+                ReconciliationWatermark.user_id == user_id
+            )
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    return MatchingWatermark(transactions_through=row[0], entries_through=row[1])
+
+
+async def capture_matching_watermark(db: AsyncSession, *, user_id: UUID) -> MatchingWatermark:
+    """High-water marks of the user's transactions and journal entries that are safe to store.
+
+    Each mark is the newest timestamp, capped below the oldest other open
+    transaction in this database that has written and can still commit (see
+    the module docstring).
+    """
+    oldest_open = (
+        select(func.min(_pg_stat_activity.c.xact_start))
+        .where(_pg_stat_activity.c.datname == func.current_database())
+        .where(_pg_stat_activity.c.pid != func.pg_backend_pid())
+        .where(_pg_stat_activity.c.xact_start.isnot(None))
+        .where(_pg_stat_activity.c.backend_xid.isnot(None))
+        .where(_pg_stat_activity.c.state.notin_(["idle", "idle in transaction (aborted)"]))
+        .scalar_subquery()
+    )
+    row = (
+        await db.execute(
+            select(
+                select(func.max(AtomicTransaction.created_at))
+                .where(AtomicTransaction.user_id == user_id)
+                .scalar_subquery(),
+                select(func.max(JournalEntry.updated_at)).where(JournalEntry.user_id == user_id).scalar_subquery(),
+                func.least(oldest_open, func.statement_timestamp()),
+            )
+        )
+    ).one()
+    safe_through = row[2] - timedelta(seconds=settings.reconciliation_watermark_lag_seconds)
+    return MatchingWatermark(
+        transactions_through=_capped(row[0], safe_through),
+        entries_through=_capped(row[1], safe_through),
+    )
+
+
+def _capped(mark: datetime | None, safe_through: datetime) -> datetime | None:
+    return mark if mark is None else min(mark, safe_through)
+
+
+async def store_matching_watermark(db: AsyncSession, *, user_id: UUID, watermark: MatchingWatermark) -> None:
+    """Upsert the user's watermark after a complete run."""
+    now = func.now()
+    stmt = postgresql_insert(ReconciliationWatermark).values(
+        user_id=user_id,
+        transactions_through=watermark.transactions_through,
+        entries_through=watermark.entries_through,
+        created_at=now,
+        updated_at=now,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ReconciliationWatermark.user_id],
+            set_={
+                "transactions_through": stmt.excluded.transactions_through,
+                "entries_through": stmt.excluded.entries_through,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+def touched_date_ranges(dates: Iterable[date], date_days: int) -> list[tuple[date, date]]:
+    """Merge each date's ``±date_days`` window into disjoint, ascending ranges."""
+    ranges: list[tuple[date, date]] = []
+    span = timedelta(days=date_days)
+    for day in sorted(set(dates)):
+        start, end = day - span, day + span
+        if ranges and start <= ranges[-1][1] + timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], end))
+        else:
+            ranges.append((start, end))
+    return ranges
@@ -1,8 +1,11 @@
+import hashlib
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 
 from sqlalchemy import DateTime, Enum as SQLEnum, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -22,6 +25,15 @@ class CheckStatus(str, Enum):
     FLAGGED = "flagged"
 
 
+def related_txn_fingerprint(txn_ids: Iterable[object]) -> str:
+    """Canonical fingerprint of a check's related transactions: order-insensitive SHA-256 of the ids."""
+    return hashlib.sha256(",".join(sorted(str(txn_id) for txn_id in txn_ids)).encode()).hexdigest()
+
+
+def _fingerprint_default(context: DefaultExecutionContext) -> str:
+    return related_txn_fingerprint(context.get_current_parameters()["related_txn_ids"])
+
+
 class ConsistencyCheck(Base, UUIDMixin, UserOwnedMixin, TimestampMixin):
     __tablename__ = "consistency_checks"
     __table_args__ = (Index("idx_consistency_checks_run_id", "run_id"),)
@@ -46,6 +58,8 @@ class ConsistencyCheck(Base, UUIDMixin, UserOwnedMixin, TimestampMixin):
     run_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
     related_txn_ids: Mapped[list] = mapped_column(JSONB, nullable=False)
+    # Idempotency key for the detectors (migration 0064 backfills existing rows).
+    related_txn_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False, default=_fingerprint_default)
 
     details: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
@@ -8,10 +8,11 @@ ruling). Consumers resolve ``atomic_txn_id`` via an explicit query (#1675 D4,
 now that ``AtomicTransaction`` has moved into ``extraction/orm/layer2.py``).
 """
 
+from datetime import date, datetime
 from enum import Enum
 from uuid import UUID
 
-from sqlalchemy import Enum as SQLEnum, ForeignKey, Index, Integer, String
+from sqlalchemy import Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -81,3 +82,50 @@ class ReconciliationMatchJournalEntry(Base, TimestampMixin):
 
     reconciliation_match: Mapped[ReconciliationMatch] = relationship("ReconciliationMatch")
     # No relationship() to ledger's JournalEntry: resolve by id (#1675 ruling).
+
+
+class ReconciliationMerchantPattern(Base, TimestampMixin):
+    """Per-user merchant-token projection of accepted-match history.
+
+    One row per (user, token) holds what ``score_pattern``'s accepted-match
+    ``ILIKE '%token%'`` history query returns: the newest ``[txn_id, txn_date,
+    amount]`` entries (newest first, capped at ``PATTERN_HISTORY_LIMIT``) plus the
+    newest matched transaction date. Rows are seeded by one batched query per matching run and
+    folded forward whenever a match is accepted, so scoring reads them instead
+    of scanning ``atomic_transactions`` per token. A row listing a transaction
+    that is gone or no longer accepted is reseeded on the next load.
+    """
+
+    __tablename__ = "reconciliation_merchant_patterns"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    token: Mapped[str] = mapped_column(String(255), primary_key=True)
+    history: Mapped[list[list[str]]] = mapped_column(JSONB, default=list, nullable=False)
+    last_matched_on: Mapped[date | None] = mapped_column(Date, nullable=True)
+
+
+class ReconciliationWatermark(Base, TimestampMixin):
+    """Per-user high-water marks of what matching has already considered.
+
+    ``transactions_through`` is the newest ``AtomicTransaction.created_at`` and
+    ``entries_through`` the newest ``JournalEntry.updated_at`` seen when the last
+    complete run started (``None`` when the user had none). An incremental run
+    rescores only pending transactions created after the first mark, plus
+    older pending ones whose date window holds a journal entry changed after the
+    second or a newly created transaction; every other pending transaction
+    already scored below threshold against an unchanged candidate set.
+    """
+
+    __tablename__ = "reconciliation_watermarks"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    transactions_through: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    entries_through: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
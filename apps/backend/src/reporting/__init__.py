@@ -37,6 +37,8 @@ _EXPORTS = {
     "current_package_document_summary": "src.reporting.extension.package_document",
     "PackageDocumentVersionError": "src.reporting.extension.report_package",
     "AnnualizedIncomeTotals": "src.reporting.extension.reporting_calc",
+    "ExportEncoding": "src.reporting.extension.report_export",
+    "ExportTable": "src.reporting.extension.report_export",
     "PersonalReportingFrameworkId": "src.reporting.base.types",
     "PolicyDimension": "src.reporting.base.types",
     "ReportError": "src.reporting.extension.reporting_calc",
@@ -58,7 +60,9 @@ _EXPORTS = {
     "_signed_amount": "src.reporting.extension.reporting_calc",
     "assemble_framework_balance_sheet": "src.reporting.extension.framework_report",
     "assemble_framework_income_statement": "src.reporting.extension.framework_report",
+    "balance_sheet_export_table": "src.reporting.extension.report_export",
     "build_personal_report_package_traceability_payload": "src.reporting.extension.report_traceability",
+    "cash_flow_export_table": "src.reporting.extension.report_export",
     "derive_user_framework_policy_result": "src.reporting.extension.framework_policy",
     "generate_balance_sheet": "src.reporting.extension.balance_sheet",
     "generate_annualized_income_schedule": "src.reporting.extension.annualized_income",
@@ -70,17 +74,20 @@ _EXPORTS = {
     "get_net_worth_allocation_schedule": "src.reporting.extension.net_worth",
     "get_net_worth_timeseries": "src.reporting.extension.net_worth",
     "income_bucket": "src.reporting.extension.reporting_calc",
+    "income_statement_export_table": "src.reporting.extension.report_export",
     "is_valid_line_for_framework": "src.reporting.base.l1_registry",
     "jsonable": "src.reporting.extension.report_package",
     "package_currency": "src.reporting.extension.report_package",
     "package_dates": "src.reporting.extension.report_package",
-    "package_snapshot_csv": "src.reporting.extension.report_package",
     "package_snapshot_document": "src.reporting.extension.report_package",
+    "package_snapshot_export_table": "src.reporting.extension.report_export",
     "package_snapshot_response": "src.reporting.extension.report_package",
     "package_snapshot_summary": "src.reporting.extension.report_package",
     "register_fx_gateway": "src.reporting.extension.fx_gateway",
     "register_manual_valuation_lines_provider": "src.reporting.extension.balance_sheet",
+    "register_report_cache_backend": "src.reporting.extension.report_cache",
     "resolve_line_currency": "src.reporting.extension.reporting_calc",
+    "stream_export": "src.reporting.extension.report_export",
 }
 
 __all__ = [
@@ -94,6 +101,8 @@ __all__ = [
     "current_package_document_summary",
     "PackageDocumentVersionError",
     "AnnualizedIncomeTotals",
+    "ExportEncoding",
+    "ExportTable",
     "PersonalReportingFrameworkId",
     "PolicyDimension",
     "ReportError",
@@ -115,7 +124,9 @@ __all__ = [
     "_signed_amount",
     "assemble_framework_balance_sheet",
     "assemble_framework_income_statement",
+    "balance_sheet_export_table",
     "build_personal_report_package_traceability_payload",
+    "cash_flow_export_table",
     "derive_user_framework_policy_result",
     "generate_balance_sheet",
     "generate_annualized_income_schedule",
@@ -127,17 +138,20 @@ __all__ = [
     "get_net_worth_allocation_schedule",
     "get_net_worth_timeseries",
     "income_bucket",
+    "income_statement_export_table",
     "is_valid_line_for_framework",
     "jsonable",
     "package_currency",
     "package_dates",
-    "package_snapshot_csv",
     "package_snapshot_document",
+    "package_snapshot_export_table",
     "package_snapshot_response",
     "package_snapshot_summary",
     "register_fx_gateway",
     "register_manual_valuation_lines_provider",
+    "register_report_cache_backend",
     "resolve_line_currency",
+    "stream_export",
 ]
 
 
@@ -185,12 +199,21 @@ if TYPE_CHECKING:
         current_package_document_summary,
         personal_report_package_decision_ref,
     )
+    from src.reporting.extension.report_cache import register_report_cache_backend
+    from src.reporting.extension.report_export import (
+        ExportEncoding,
+        ExportTable,
+        balance_sheet_export_table,
+        cash_flow_export_table,
+        income_statement_export_table,
+        package_snapshot_export_table,
+        stream_export,
+    )
     from src.reporting.extension.report_package import (
         PackageDocumentVersionError,
         jsonable,
         package_currency,
         package_dates,
-        package_snapshot_csv,
         package_snapshot_document,
         package_snapshot_response,
         package_snapshot_summary,
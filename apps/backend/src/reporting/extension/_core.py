@@ -8,7 +8,7 @@ from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, func, literal, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.ledger import (
@@ -18,6 +18,7 @@ from src.ledger import (
     JournalEntry,
     JournalEntryStatus,
     JournalLine,
+    load_account_currency_totals,
 )
 from src.observability import ErrorIds, get_logger
 from src.pricing import ManualValuationLiquidityClass
@@ -174,22 +175,19 @@ async def _aggregate_balances_sql(
     fx_warnings: list[FxWarning] | None = None,
     included_currencies: set[str] | None = None,
 ) -> dict[UUID, Decimal]:
-    """Aggregate account balances using SQL SUM/GROUP BY with FX conversion."""
-    currency_stmt = (
-        select(JournalLine.currency)
-        .distinct()
-        .join(Account, JournalLine.account_id == Account.id)
-        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
-        .where(Account.user_id == user_id)
-        .where(Account.type.in_(account_types))
-        .where(JournalEntry.status.in_(_REPORT_STATUSES))
-        .where(JournalEntry.entry_date <= as_of_date)
-    )
-    if start_date:
-        currency_stmt = currency_stmt.where(JournalEntry.entry_date >= start_date)
+    """Aggregate account balances with FX conversion.
 
-    currency_result = await db.execute(currency_stmt)
-    currencies = {row[0].upper() for row in currency_result.all()}
+    Reads ledger's maintained per-day cumulative totals (latest row ``<= as_of_date``,
+    minus the latest row before ``start_date``) instead of summing every line.
+    """
+    totals = await load_account_currency_totals(
+        db,
+        user_id,
+        account_types=account_types,
+        as_of=as_of_date,
+        since=start_date,
+    )
+    currencies = {row.currency.upper() for row in totals}
 
     if not currencies:
         return {}
@@ -200,54 +198,15 @@ async def _aggregate_balances_sql(
     if included_currencies is not None:
         included_currencies.update(fx_rates.keys())
 
-    fx_case_parts = []
-    for currency, rate in fx_rates.items():
-        fx_case_parts.append((JournalLine.currency == currency, literal(rate)))
-
-    fx_rate_expr = case(*fx_case_parts, else_=literal(Decimal("1")))
-
     # Accounting sign rules: ASSET/EXPENSE: DEBIT=+, CREDIT=-; LIABILITY/EQUITY/INCOME: CREDIT=+, DEBIT=-
-    sign_expr = case(
-        (
-            (Account.type.in_((AccountType.ASSET, AccountType.EXPENSE))) & (JournalLine.direction == Direction.DEBIT),
-            literal(1),
-        ),
-        (
-            (Account.type.in_((AccountType.ASSET, AccountType.EXPENSE))) & (JournalLine.direction == Direction.CREDIT),
-            literal(-1),
-        ),
-        (
-            (Account.type.in_((AccountType.LIABILITY, AccountType.EQUITY, AccountType.INCOME)))
-            & (JournalLine.direction == Direction.CREDIT),
-            literal(1),
-        ),
-        (
-            (Account.type.in_((AccountType.LIABILITY, AccountType.EQUITY, AccountType.INCOME)))
-            & (JournalLine.direction == Direction.DEBIT),
-            literal(-1),
-        ),
-        else_=literal(1),
-    )
-
-    agg_stmt = (
-        select(
-            Account.id.label("account_id"),
-            func.sum(JournalLine.amount * fx_rate_expr * sign_expr).label("balance"),
-        )
-        .join(Account, JournalLine.account_id == Account.id)
-        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
-        .where(Account.user_id == user_id)
-        .where(Account.type.in_(account_types))
-        .where(JournalLine.currency.in_(list(fx_rates.keys())))
-        .where(JournalEntry.status.in_(_REPORT_STATUSES))
-        .where(JournalEntry.entry_date <= as_of_date)
-        .group_by(Account.id)
-    )
-    if start_date:
-        agg_stmt = agg_stmt.where(JournalEntry.entry_date >= start_date)
-
-    result = await db.execute(agg_stmt)
-    return {row.account_id: Decimal(str(row.balance)) if row.balance else Decimal("0") for row in result.all()}
+    balances: dict[UUID, Decimal] = {}
+    for row in totals:
+        rate = fx_rates.get(row.currency)
+        if rate is None:
+            continue
+        sign = 1 if row.account_type in (AccountType.ASSET, AccountType.EXPENSE) else -1
+        balances[row.account_id] = balances.get(row.account_id, Decimal("0")) + row.net_debit * rate * sign
+    return balances
 
 
 async def _aggregate_account_provenance(
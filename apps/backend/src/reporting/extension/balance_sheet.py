@@ -24,12 +24,14 @@ from src.reporting.extension._core import (
 )
 from src.reporting.extension.fx_gateway import FxWarning
 from src.reporting.extension.portfolio_market import _build_portfolio_market_adjustment_lines
+from src.reporting.extension.report_cache import cached_report
 from src.reporting.extension.reporting_calc import (
     ReportError,
     _combine_provenance,
     _normalize_currency,
     _quantize_money,
 )
+from src.reporting.orm.snapshot import ReportType
 from src.schemas.provenance import DataProvenance
 
 if TYPE_CHECKING:
@@ -84,6 +86,7 @@ async def _build_manual_valuation_lines(
     )
 
 
+@cached_report(ReportType.BALANCE_SHEET)
 async def generate_balance_sheet(
     db: AsyncSession,
     user_id: UUID,
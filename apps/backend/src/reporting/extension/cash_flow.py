@@ -15,12 +15,14 @@ from src.ledger import Account, AccountType, JournalEntry, JournalLine
 from src.observability import ErrorIds, get_logger
 from src.reporting.extension import fx_gateway
 from src.reporting.extension._core import _REPORT_STATUSES, _line_total
+from src.reporting.extension.report_cache import cached_report
 from src.reporting.extension.reporting_calc import (
     ReportError,
     _normalize_currency,
     _quantize_money,
     _signed_amount,
 )
+from src.reporting.orm.snapshot import ReportType
 
 logger = get_logger(__name__)
 
@@ -73,6 +75,7 @@ def _accumulate_period_balances(
     return balances
 
 
+@cached_report(ReportType.CASH_FLOW)
 async def generate_cash_flow(
     db: AsyncSession,
     user_id: UUID,
@@ -7,9 +7,11 @@ from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Date, Select, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from src.audit import Currency, Money
 from src.ledger import Account, AccountType, JournalEntry, JournalLine
 from src.observability import ErrorIds, get_logger
 from src.reporting.extension import fx_gateway
@@ -25,6 +27,7 @@ from src.reporting.extension.fx_gateway import (
     convert_money,
 )
 from src.reporting.extension.internal_transfer import _internal_transfer_adjustment
+from src.reporting.extension.report_cache import cached_report
 from src.reporting.extension.reporting_calc import (
     ReportError,
     _add_months,
@@ -36,11 +39,34 @@ from src.reporting.extension.reporting_calc import (
     _quantize_money,
     _signed_amount,
 )
+from src.reporting.orm.snapshot import ReportType
 from src.schemas.provenance import DataProvenance
 
 logger = get_logger(__name__)
 
 
+def _period_lines(
+    user_id: UUID,
+    account_types: tuple[AccountType, ...],
+    start_date: date,
+    end_date: date,
+    *columns: Any,
+) -> Select[Any]:
+    """``SELECT columns`` over the user's reportable lines of ``account_types`` in the period."""
+    return (
+        select(*columns)
+        .select_from(JournalLine)
+        .join(Account, JournalLine.account_id == Account.id)
+        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
+        .where(Account.user_id == user_id)
+        .where(Account.type.in_(account_types))
+        .where(JournalEntry.status.in_(_REPORT_STATUSES))
+        .where(JournalEntry.entry_date >= start_date)
+        .where(JournalEntry.entry_date <= end_date)
+    )
+
+
+@cached_report(ReportType.INCOME_STATEMENT)
 async def generate_income_statement(
     db: AsyncSession,
     user_id: UUID,
@@ -69,34 +95,23 @@ async def generate_income_statement(
 
     period_totals: dict[date, dict[str, Decimal]] = {}
 
-    stmt = (
-        select(JournalLine, Account, JournalEntry)
-        .join(Account, JournalLine.account_id == Account.id)
-        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
-        .where(Account.user_id == user_id)
-        .where(Account.type.in_(account_types))
-        .where(JournalEntry.status.in_(_REPORT_STATUSES))
-        .where(JournalEntry.entry_date >= start_date)
-        .where(JournalEntry.entry_date <= end_date)
+    # FX needs come from the distinct (currency, entry_date) pairs of every
+    # in-scope foreign line — before tag/transfer filtering, as ever — so the
+    # prefetch keys (and their fx_warnings) match a line-by-line walk.
+    fx_need_result = await db.execute(
+        _period_lines(user_id, account_types, start_date, end_date, JournalLine.currency, JournalEntry.entry_date)
+        .where(JournalLine.currency != target_currency)
+        .distinct()
+        .order_by(JournalLine.currency, JournalEntry.entry_date)
     )
-    result = await db.execute(stmt)
-
-    entries_by_id: dict[UUID, list[tuple[JournalLine, Account, JournalEntry]]] = {}
     fx_needs: list[tuple[str, str, date, date | None, date | None]] = []
-
-    for line, account, entry in result.all():
-        if entry.id not in entries_by_id:
-            entries_by_id[entry.id] = []
-        entries_by_id[entry.id].append((line, account, entry))
-
-        # Collect FX needs for pre-fetching
-        if line.currency != target_currency:
-            # Period average need
-            fx_needs.append((line.currency, target_currency, end_date, start_date, end_date))
-            # Monthly average need
-            period_key = _month_start(entry.entry_date)
-            month_end = _add_months(period_key, 1) - timedelta(days=1)
-            fx_needs.append((line.currency, target_currency, entry.entry_date, period_key, month_end))
+    for line_currency, entry_date in fx_need_result.all():
+        # Period average need
+        fx_needs.append((line_currency, target_currency, end_date, start_date, end_date))
+        # Monthly average need
+        period_key = _month_start(entry_date)
+        month_end = _add_months(period_key, 1) - timedelta(days=1)
+        fx_needs.append((line_currency, target_currency, entry_date, period_key, month_end))
 
     # Batch pre-fetch all needed FX rates
     fx_rates = fx_gateway.PrefetchedFxRates(fx_warnings, lazy_load=True)
@@ -118,102 +133,117 @@ async def generate_income_statement(
     )
     excluded_entry_ids = transfer_adjustment.excluded_entry_ids
 
-    entries_to_include: set[UUID] = set()
+    # One row per (account, currency, direction, source type, month): the
+    # period-average and monthly-average rates are constant within a group,
+    # so converting the group sum equals converting each line.
+    entry_month = cast(func.date_trunc("month", JournalEntry.entry_date), Date)
+    group_columns = (
+        JournalLine.account_id,
+        Account.type,
+        JournalLine.currency,
+        JournalLine.direction,
+        JournalEntry.source_type,
+        entry_month,
+    )
+    aggregate_stmt = _period_lines(
+        user_id, account_types, start_date, end_date, *group_columns, func.sum(JournalLine.amount)
+    ).group_by(*group_columns)
     if tags:
-        for entry_id, lines_and_accounts in entries_by_id.items():
-            for line, account, entry in lines_and_accounts:
-                if line.tags:
-                    line_tags = set(k.lower() for k in line.tags.keys())
-                    if any(t.lower() in line_tags for t in tags):
-                        entries_to_include.add(entry_id)
-                        break
-    else:
-        entries_to_include = set(entries_by_id.keys())
-    entries_to_include -= excluded_entry_ids
+        # An entry is in scope when any of its in-scope lines carries one of
+        # the tags as a key (case-insensitive).
+        tagged_line = aliased(JournalLine)
+        tagged_account = aliased(Account)
+        tag_key = func.jsonb_object_keys(tagged_line.tags).column_valued("tag_key")
+        aggregate_stmt = aggregate_stmt.where(
+            select(tagged_line.id)
+            .join(tagged_account, tagged_line.account_id == tagged_account.id)
+            .where(tagged_line.journal_entry_id == JournalEntry.id)
+            .where(tagged_account.user_id == user_id)
+            .where(tagged_account.type.in_(account_types))
+            .where(select(tag_key).where(func.lower(tag_key).in_(sorted({tag.lower() for tag in tags}))).exists())
+            .exists()
+        )
+    if excluded_entry_ids:
+        aggregate_stmt = aggregate_stmt.where(JournalEntry.id.not_in(excluded_entry_ids))
+    aggregate_result = await db.execute(aggregate_stmt)
 
     provenance_inputs_by_account: dict[UUID, list[DataProvenance | None]] = {}
-    for entry_id, lines_and_accounts in entries_by_id.items():
-        if entry_id not in entries_to_include:
-            continue
-
-        for line, account, entry in lines_and_accounts:
-            provenance_inputs_by_account.setdefault(account.id, []).append(
-                _provenance_from_source_type(entry.source_type)
-            )
-            # Use pre-fetched rates
-            rate_total = fx_rates.get_rate(line.currency, target_currency, end_date, start_date, end_date)
-            if rate_total is None:
-                # Fallback to slow path if not pre-fetched (should be rare)
+    for account_id, account_kind, line_currency, direction, source_type, period_key, amount in aggregate_result.all():
+        provenance_inputs_by_account.setdefault(account_id, []).append(_provenance_from_source_type(source_type))
+        # Use pre-fetched rates
+        rate_total = fx_rates.get_rate(line_currency, target_currency, end_date, start_date, end_date)
+        if rate_total is None:
+            # Fallback to slow path if not pre-fetched (should be rare)
+            money = Money(amount, Currency.of(line_currency))
+            try:
+                converted_total = (
+                    await convert_money(
+                        db,
+                        money,
+                        target_currency,
+                        end_date,
+                        average_start=start_date,
+                        average_end=end_date,
+                        fx_warnings=fx_warnings,
+                        lazy_load=True,
+                    )
+                ).amount
+            except fx_gateway.FxRateError as exc:
+                logger.warning(
+                    "Average FX rate unavailable, falling back to spot",
+                    error_id=ErrorIds.REPORT_FX_FALLBACK,
+                    account_id=str(account_id),
+                    currency=line_currency,
+                    start_date=start_date,
+                    end_date=end_date,
+                    error=str(exc),
+                )
+                # Fallback to spot rate at end_date
                 try:
                     converted_total = (
                         await convert_money(
                             db,
-                            line.money,
+                            money,
                             target_currency,
                             end_date,
-                            average_start=start_date,
-                            average_end=end_date,
-                            fx_warnings=fx_warnings,
                             lazy_load=True,
                         )
                     ).amount
-                except fx_gateway.FxRateError as exc:
-                    logger.warning(
-                        "Average FX rate unavailable, falling back to spot",
-                        error_id=ErrorIds.REPORT_FX_FALLBACK,
-                        account_id=str(account.id),
-                        currency=line.currency,
-                        start_date=start_date,
-                        end_date=end_date,
-                        error=str(exc),
+                except fx_gateway.FxRateError as final_exc:
+                    logger.error(
+                        "All FX rate fallbacks failed for income statement",
+                        error_id=ErrorIds.REPORT_GENERATION_FAILED,
+                        account_id=str(account_id),
+                        error=str(final_exc),
                     )
-                    # Fallback to spot rate at end_date
-                    try:
-                        converted_total = (
-                            await convert_money(
-                                db,
-                                line.money,
-                                target_currency,
-                                end_date,
-                                lazy_load=True,
-                            )
-                        ).amount
-                    except fx_gateway.FxRateError as final_exc:
-                        logger.error(
-                            "All FX rate fallbacks failed for income statement",
-                            error_id=ErrorIds.REPORT_GENERATION_FAILED,
-                            account_id=str(account.id),
-                            error=str(final_exc),
-                        )
-                        raise ReportError(f"FX conversion failed: {final_exc}") from final_exc
-            else:
-                converted_total = line.amount * rate_total
-
-            signed_total = _signed_amount(account.type, line.direction, converted_total)
-            balances[account.id] += signed_total
-
-            # For monthly trend buckets, use pre-fetched monthly average rate
-            period_key = _month_start(entry.entry_date)
-            month_end = _add_months(period_key, 1) - timedelta(days=1)
-            rate_monthly = fx_rates.get_rate(line.currency, target_currency, entry.entry_date, period_key, month_end)
-            if rate_monthly is None:
-                # Fallback to period total rate if monthly rate unavailable
-                logger.warning(
-                    "Monthly average FX rate unavailable for trend, using period average",
-                    error_id=ErrorIds.REPORT_FX_FALLBACK,
-                    currency=line.currency,
-                    month_start=period_key,
-                )
-                converted_monthly = converted_total
-            else:
-                converted_monthly = line.amount * rate_monthly
-
-            signed_monthly = _signed_amount(account.type, line.direction, converted_monthly)
-            bucket = period_totals.setdefault(period_key, {"income": Decimal("0"), "expense": Decimal("0")})
-            if account.type == AccountType.INCOME:
-                bucket["income"] += signed_monthly
-            else:
-                bucket["expense"] += signed_monthly
+                    raise ReportError(f"FX conversion failed: {final_exc}") from final_exc
+        else:
+            converted_total = amount * rate_total
+
+        signed_total = _signed_amount(account_kind, direction, converted_total)
+        balances[account_id] += signed_total
+
+        # For monthly trend buckets, use pre-fetched monthly average rate
+        month_end = _add_months(period_key, 1) - timedelta(days=1)
+        rate_monthly = fx_rates.get_rate(line_currency, target_currency, period_key, period_key, month_end)
+        if rate_monthly is None:
+            # Fallback to period total rate if monthly rate unavailable
+            logger.warning(
+                "Monthly average FX rate unavailable for trend, using period average",
+                error_id=ErrorIds.REPORT_FX_FALLBACK,
+                currency=line_currency,
+                month_start=period_key,
+            )
+            converted_monthly = converted_total
+        else:
+            converted_monthly = amount * rate_monthly
+
+        signed_monthly = _signed_amount(account_kind, direction, converted_monthly)
+        bucket = period_totals.setdefault(period_key, {"income": Decimal("0"), "expense": Decimal("0")})
+        if account_kind == AccountType.INCOME:
+            bucket["income"] += signed_monthly
+        else:
+            bucket["expense"] += signed_monthly
 
     provenance_by_account = {
         account_id: _combine_provenance(provenance_values)
@@ -17,6 +17,7 @@ from src.pricing import ManualValuationLiquidityClass
 from src.reporting.extension import fx_gateway
 from src.reporting.extension._core import _REPORT_STATUSES, _load_accounts, _single_source_currency
 from src.reporting.extension.balance_sheet import generate_balance_sheet
+from src.reporting.extension.net_worth_series import build_net_worth_points
 from src.reporting.extension.portfolio_market import _portfolio_market_basis_by_account
 from src.reporting.extension.reporting_calc import (
     MAX_NET_WORTH_DAILY_POINTS,
@@ -397,7 +398,11 @@ async def get_net_worth_timeseries(
     granularity: str,
     currency: str | None = None,
 ) -> dict[str, object]:
-    """Get historical net worth points from balance sheet snapshots."""
+    """Get historical net worth points, each equal to that date's balance sheet.
+
+    Computed in one pass by :func:`build_net_worth_points` rather than one
+    balance sheet per point, which is what lets daily series span years.
+    """
     if start_date > end_date:
         raise ReportError("from date must be before to date")
     if granularity not in {"daily", "monthly"}:
@@ -408,24 +413,11 @@ async def get_net_worth_timeseries(
         raise ReportError(f"Daily net worth time-series is capped at {MAX_NET_WORTH_DAILY_POINTS} points")
 
     target_currency = _normalize_currency(currency)
-    spans = _iter_periods(start_date, end_date, granularity)
-    points: list[dict[str, object]] = []
-    for span in spans:
-        point_date = span.start if granularity == "daily" else span.end
-        balance_sheet = await generate_balance_sheet(
-            db, user_id, as_of_date=point_date, currency=target_currency, include_trust_signals=False
-        )
-        total_assets = _quantize_money(Decimal(str(balance_sheet["total_assets"])))
-        total_liabilities = _quantize_money(Decimal(str(balance_sheet["total_liabilities"])))
-        points.append(
-            {
-                "date": point_date,
-                "total_assets": total_assets,
-                "total_liabilities": total_liabilities,
-                "net_worth": _quantize_money(total_assets - total_liabilities),
-                "currency": target_currency,
-            }
-        )
+    if granularity == "daily":
+        point_dates = [start_date + timedelta(days=offset) for offset in range(day_count)]
+    else:
+        point_dates = [span.end for span in _iter_periods(start_date, end_date, granularity)]
+    points = await build_net_worth_points(db, user_id, point_dates=point_dates, target_currency=target_currency)
 
     return {"currency": target_currency, "granularity": granularity, "points": points}
 
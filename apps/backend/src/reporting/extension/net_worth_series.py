@@ -0,0 +1,257 @@
+"""Incremental net-worth time-series engine.
+
+``get_net_worth_timeseries`` used to build one full balance sheet per point:
+reload accounts, re-aggregate every journal line up to the point, rebuild the
+portfolio adjustments and manual valuations, recompute net income and
+unrealized FX — hundreds of full-ledger scans for a one-year daily series.
+Only ``total_assets`` and ``total_liabilities`` reach the series, so this
+engine computes just those, exactly as ``generate_balance_sheet`` does:
+
+* **Ledger lines** — one grouped query for the opening balances before the
+  first point and one for the per-(entry_date, account, currency, direction)
+  deltas inside the window, folded into running native balances. Each point
+  converts them at its own spot rates (``_get_fx_rates_map``, served by
+  pricing's FX series store and cache), skips unconvertible currencies the
+  same way, and quantizes per account before totalling.
+* **Portfolio and manual-valuation overlays** — step functions. Their inputs
+  (position validity, overrides, synced prices, snapshots, valuation
+  snapshots, FX rates of the currencies involved) only change on known
+  dates, so the overlays are rebuilt with the balance sheet's own builders
+  at the first point and at every point whose interval since the previous
+  point contains one of those dates (or that touches ``date.today()``,
+  where holdings evaluate at the latest imported snapshot instead).
+  The portfolio adjustment itself is re-derived per point, because it also
+  depends on that point's ledger balance.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.extraction.orm.layer2 import AtomicPosition
+from src.extraction.orm.layer3 import ManagedPosition
+from src.ledger import Account, AccountType, JournalEntry, JournalLine
+from src.pricing import FxRate, MarketDataOverride, PriceSource, StockPrice, ValuationService
+from src.reporting.extension import fx_gateway
+from src.reporting.extension._core import _REPORT_STATUSES, _get_fx_rates_map, _line_total, _load_accounts
+from src.reporting.extension.balance_sheet import _build_manual_valuation_lines
+from src.reporting.extension.portfolio_market import (
+    _portfolio_market_adjustment_lines,
+    _portfolio_market_basis_by_account,
+)
+from src.reporting.extension.reporting_calc import ReportError, _quantize_money, _signed_amount
+
+_LEDGER_TYPES = (AccountType.ASSET, AccountType.LIABILITY)
+
+
+async def _overlay_change_dates(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    through: date,
+    target_currency: str,
+) -> list[date]:
+    """Sorted dates on which the portfolio or manual-valuation overlay may change."""
+    changes: set[date] = set()
+    currencies: set[str] = set()
+
+    positions = (
+        await db.execute(
+            select(
+                ManagedPosition.asset_identifier,
+                ManagedPosition.currency,
+                ManagedPosition.acquisition_date,
+                ManagedPosition.disposal_date,
+            )
+            .where(ManagedPosition.user_id == user_id)
+            .where(ManagedPosition.acquisition_date <= through)
+        )
+    ).all()
+    if positions:
+        identifiers = {row.asset_identifier for row in positions}
+        symbols = {identifier.strip().upper() for identifier in identifiers}
+        for row in positions:
+            currencies.add(row.currency.upper())
+            changes.add(row.acquisition_date)
+            if row.disposal_date is not None:
+                changes.add(row.disposal_date)
+
+        snapshot_dates = await db.execute(
+            select(AtomicPosition.snapshot_date)
+            .distinct()
+            .where(AtomicPosition.user_id == user_id)
+            .where(AtomicPosition.asset_identifier.in_(identifiers))
+            .where(AtomicPosition.snapshot_date <= through)
+        )
+        changes.update(row.snapshot_date for row in snapshot_dates.all())
+
+        synced = await db.execute(
+            select(StockPrice.price_date, StockPrice.currency)
+            .distinct()
+            .where(StockPrice.symbol.in_(symbols))
+            .where(StockPrice.price_date <= through)
+        )
+        for row in synced.all():
+            changes.add(row.price_date)
+            currencies.add(row.currency.upper())
+
+        # An override only prices its own date: the day after falls back again.
+        overrides = await db.execute(
+            select(MarketDataOverride.price_date)
+            .distinct()
+            .where(MarketDataOverride.user_id == user_id)
+            .where(MarketDataOverride.asset_identifier.in_(identifiers))
+            .where(MarketDataOverride.source == PriceSource.MANUAL)
+            .where(MarketDataOverride.price_date <= through)
+        )
+        for row in overrides.all():
+            changes.update((row.price_date, row.price_date + timedelta(days=1)))
+
+    for as_of_date, currency in await ValuationService().list_valuation_snapshot_dates(db, user_id, through=through):
+        changes.add(as_of_date)
+        currencies.add(currency.upper())
+
+    if currencies - {target_currency}:
+        # Direct, inverse and bridged lookups only ever read pairs within this set.
+        fx_currencies = currencies | {target_currency, settings.market_data_fx_bridge_currency.upper()}
+        fx_dates = await db.execute(
+            select(FxRate.rate_date)
+            .distinct()
+            .where(FxRate.base_currency.in_(fx_currencies))
+            .where(FxRate.quote_currency.in_(fx_currencies))
+            .where(FxRate.rate_date <= through)
+        )
+        changes.update(row.rate_date for row in fx_dates.all())
+
+    return sorted(changes)
+
+
+async def build_net_worth_points(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    point_dates: list[date],
+    target_currency: str,
+) -> list[dict[str, object]]:
+    """Net-worth points for ascending ``point_dates``, equal to per-point balance sheets."""
+    if not point_dates:
+        return []
+    first, last = point_dates[0], point_dates[-1]
+    accounts = await _load_accounts(db, user_id, _LEDGER_TYPES)
+    account_types = {account.id: account.type for account in accounts}
+
+    base_stmt = (
+        select(
+            JournalLine.account_id,
+            JournalLine.currency,
+            JournalLine.direction,
+        )
+        .join(Account, JournalLine.account_id == Account.id)
+        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
+        .where(Account.user_id == user_id)
+        .where(Account.type.in_(_LEDGER_TYPES))
+        .where(JournalEntry.status.in_(_REPORT_STATUSES))
+    )
+    opening_rows = (
+        await db.execute(
+            base_stmt.add_columns(func.sum(JournalLine.amount).label("total"))
+            .where(JournalEntry.entry_date < first)
+            .group_by(JournalLine.account_id, JournalLine.currency, JournalLine.direction)
+        )
+    ).all()
+    delta_rows = (
+        await db.execute(
+            base_stmt.add_columns(JournalEntry.entry_date, func.sum(JournalLine.amount).label("total"))
+            .where(JournalEntry.entry_date >= first)
+            .where(JournalEntry.entry_date <= last)
+            .group_by(JournalEntry.entry_date, JournalLine.account_id, JournalLine.currency, JournalLine.direction)
+            .order_by(JournalEntry.entry_date)
+        )
+    ).all()
+
+    # (account_id, stored currency) -> signed native balance
+    native: dict[tuple[UUID, str], Decimal] = {}
+    currencies: set[str] = set()
+
+    def fold(row: Any) -> None:
+        currencies.add(row.currency.upper())
+        account_type = account_types.get(row.account_id)
+        if account_type is None:  # inactive: never a balance-sheet line
+            return
+        key = (row.account_id, row.currency)
+        native[key] = native.get(key, Decimal("0")) + _signed_amount(
+            account_type, row.direction, Decimal(str(row.total))
+        )
+
+    for row in opening_rows:
+        fold(row)
+
+    change_dates = await _overlay_change_dates(db, user_id, through=last, target_currency=target_currency)
+    today = date.today()
+    basis_by_account: dict[UUID, dict[str, Any]] = {}
+    valuation_assets: list[dict[str, Any]] = []
+    valuation_liabilities: list[dict[str, Any]] = []
+    previous: date | None = None
+
+    points: list[dict[str, object]] = []
+    cursor = 0
+    for point in point_dates:
+        while cursor < len(delta_rows) and delta_rows[cursor].entry_date <= point:
+            fold(delta_rows[cursor])
+            cursor += 1
+
+        rates = await _get_fx_rates_map(db, currencies, target_currency, point) if currencies else {}
+        balances: dict[UUID, Decimal] = {account.id: Decimal("0") for account in accounts}
+        for (account_id, currency), amount in native.items():
+            rate = rates.get(currency)
+            if rate is not None:
+                balances[account_id] += amount * rate
+        asset_lines = [
+            {"account_id": account.id, "amount": _quantize_money(balances[account.id])}
+            for account in accounts
+            if account.type == AccountType.ASSET
+        ]
+        liability_lines = [
+            {"account_id": account.id, "amount": _quantize_money(balances[account.id])}
+            for account in accounts
+            if account.type == AccountType.LIABILITY
+        ]
+
+        if (
+            previous is None
+            or today in (point, previous)
+            or bisect_right(change_dates, point) > bisect_right(change_dates, previous)
+        ):
+            basis_by_account = await _portfolio_market_basis_by_account(
+                db, user_id, as_of_date=point, target_currency=target_currency
+            )
+            try:
+                valuation_assets, valuation_liabilities = await _build_manual_valuation_lines(
+                    db, user_id, as_of_date=point, target_currency=target_currency
+                )
+            except fx_gateway.FxRateError as exc:
+                raise ReportError(str(exc)) from exc
+        previous = point
+
+        adjustments = _portfolio_market_adjustment_lines(basis_by_account, asset_lines, target_currency=target_currency)
+        total_assets = _line_total([*asset_lines, *adjustments, *valuation_assets])
+        total_liabilities = _line_total([*liability_lines, *valuation_liabilities])
+        points.append(
+            {
+                "date": point,
+                "total_assets": total_assets,
+                "total_liabilities": total_liabilities,
+                "net_worth": _quantize_money(total_assets - total_liabilities),
+                "currency": target_currency,
+            }
+        )
+
+    return points
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from typing import Any, cast
@@ -22,6 +24,7 @@ from src.audit import (
     TraceTargetClass,
     VersionedTraceRef,
     current_authoritative_trace_decision_projection,
+    normalize_currency_code,
 )
 from src.config import settings
 from src.extraction import (
@@ -58,7 +61,10 @@ from src.reporting.extension.framework_report import (
     assemble_framework_balance_sheet,
     assemble_framework_income_statement,
 )
+from src.reporting.extension.package_sections import PackageSectionExecutor, SectionBuilder
+from src.reporting.extension.report_cache import cached_report
 from src.reporting.extension.report_traceability import build_personal_report_package_traceability_payload
+from src.reporting.orm.snapshot import ReportType
 from src.schemas.portfolio import InvestmentPerformanceReportScheduleResponse
 from src.schemas.reporting import (
     BalanceSheetResponse,
@@ -82,23 +88,6 @@ from src.schemas.reporting import (
 )
 
 
-def _package_document_summary(document: PersonalReportPackageDocument) -> PersonalReportPackageDocumentSummary:
-    """Project one typed document without recomputing authority in the consumer."""
-    if document.lifecycle is PersonalReportPackageDocumentLifecycle.FROZEN:
-        if document.snapshot_id is None or document.frozen_at is None:
-            raise ValueError("Frozen package document is missing durable identity metadata")
-    return PersonalReportPackageDocumentSummary(
-        snapshot_id=document.snapshot_id,
-        package_id=document.package_id,
-        lifecycle=document.lifecycle,
-        status=document.status,
-        context=document.context,
-        readiness=document.readiness,
-        generated_at=document.generated_at,
-        frozen_at=document.frozen_at,
-    )
-
-
 def personal_report_package_decision_ref(document: PersonalReportPackageDocument) -> TraceDecisionRef:
     """Reconstruct exact audit coordinates from one selected frozen document."""
     if document.schema_version != "2":
@@ -335,31 +324,106 @@ def _section_blocker(code: str, reason: str) -> PersonalReportPackageReadinessBl
     )
 
 
-def _section_invariant_blockers(
-    sections: PersonalReportPackageSections,
+@dataclass(frozen=True)
+class _SectionFacts:
+    """What the package invariants read from one section; the section itself is not kept."""
+
+    period_matches: bool
+    currencies: frozenset[str]
+    failed_checks: frozenset[str] = frozenset()
+    net_income: Decimal | None = None
+    has_holdings: bool = False
+    market_valuation_selections: tuple[Any, ...] = ()
+
+
+@dataclass(frozen=True)
+class _PackageSectionFacts:
+    balance_sheet: _SectionFacts
+    income_statement: _SectionFacts
+    cash_flow: _SectionFacts
+    investment_performance: _SectionFacts
+    annualized_income_long_term: _SectionFacts
+
+    @property
+    def all(self) -> tuple[_SectionFacts, ...]:
+        return (
+            self.balance_sheet,
+            self.income_statement,
+            self.cash_flow,
+            self.investment_performance,
+            self.annualized_income_long_term,
+        )
+
+
+def _balance_sheet_facts(section: Any, *, as_of_date: date) -> _SectionFacts:
+    failed: set[str] = set()
+    if not section.is_balanced or abs(section.equation_delta) >= Decimal("0.01"):
+        failed.add("balance_sheet_equation_failed")
+    if section.opening_balance_warnings:
+        failed.add("opening_balance_missing")
+    if section.portfolio_warnings:
+        failed.add("portfolio_value_incomplete")
+    return _SectionFacts(
+        period_matches=section.as_of_date == as_of_date,
+        currencies=frozenset({section.currency}),
+        failed_checks=frozenset(failed),
+        net_income=section.net_income,
+    )
+
+
+def _income_statement_facts(section: Any, *, start_date: date, end_date: date) -> _SectionFacts:
+    return _SectionFacts(
+        period_matches=(section.start_date, section.end_date) == (start_date, end_date),
+        currencies=frozenset({section.currency}),
+        net_income=section.net_income,
+    )
+
+
+def _cash_flow_facts(section: Any, *, start_date: date, end_date: date) -> _SectionFacts:
+    summary = section.summary
+    rolls_forward = summary.ending_cash - summary.beginning_cash == summary.net_cash_flow
+    return _SectionFacts(
+        period_matches=(section.start_date, section.end_date) == (start_date, end_date),
+        currencies=frozenset({section.currency}),
+        failed_checks=frozenset() if rolls_forward else frozenset({"cash_flow_rollforward_failed"}),
+    )
+
+
+def _investment_facts(section: Any, *, start_date: date, end_date: date, as_of_date: date) -> _SectionFacts:
+    return _SectionFacts(
+        period_matches=(section.period_start, section.period_end, section.as_of_date)
+        == (start_date, end_date, as_of_date),
+        currencies=frozenset({section.currency}),
+        failed_checks=frozenset({"investment_market_data_stale"}) if section.data_freshness.stale else frozenset(),
+        has_holdings=bool(getattr(section, "holdings", ())),
+        market_valuation_selections=tuple(getattr(section, "market_valuation_selections", ())),
+    )
+
+
+def _annualized_income_facts(section: Any, *, as_of_date: date) -> _SectionFacts:
+    return _SectionFacts(
+        period_matches=section.as_of_date == as_of_date,
+        currencies=frozenset({section.income.currency, section.restricted_fair_value_total_currency}),
+    )
+
+
+def _section_facts_blockers(
+    facts: _PackageSectionFacts,
     *,
-    start_date: date,
-    end_date: date,
-    as_of_date: date,
     currency: str,
     contributions: tuple[PackageSectionContribution[Any], ...],
     cash_inputs: PackageCashInputs,
 ) -> list[PersonalReportPackageReadinessBlocker]:
-    """Prove cross-section accounting and context before authority emission."""
+    """Fold per-section facts into the cross-section accounting and context blockers."""
+    failed = {code for section in facts.all for code in section.failed_checks}
     blockers: list[PersonalReportPackageReadinessBlocker] = []
-    balance_sheet = sections.balance_sheet
-    income_statement = sections.income_statement
-    cash_flow = sections.cash_flow
-    investment = sections.investment_performance
-    annualized = sections.annualized_income_long_term
-    if not balance_sheet.is_balanced or abs(balance_sheet.equation_delta) >= Decimal("0.01"):
+    if "balance_sheet_equation_failed" in failed:
         blockers.append(_section_blocker("balance_sheet_equation_failed", "The balance sheet does not balance."))
-    if balance_sheet.net_income != income_statement.net_income:
+    if facts.balance_sheet.net_income != facts.income_statement.net_income:
         blockers.append(
             _section_blocker("statement_net_income_mismatch", "Balance-sheet and income-statement net income differ.")
         )
-    cash_rollforward = cash_flow.summary.ending_cash - cash_flow.summary.beginning_cash
-    if cash_rollforward != cash_flow.summary.net_cash_flow:
+    if "cash_flow_rollforward_failed" in failed:
         blockers.append(
             _section_blocker(
                 "cash_flow_rollforward_failed", "Beginning cash plus net cash flow does not equal ending cash."
@@ -374,28 +438,28 @@ def _section_invariant_blockers(
                 "Cash balances require an authoritative bank-statement custody account input.",
             )
         )
-    if balance_sheet.opening_balance_warnings:
+    if "opening_balance_missing" in failed:
         blockers.append(
             _section_blocker(
                 "opening_balance_missing",
                 "Recorded activity is missing an opening balance required for a complete statement.",
             )
         )
-    if balance_sheet.portfolio_warnings:
+    if "portfolio_value_incomplete" in failed:
         blockers.append(
             _section_blocker(
                 "portfolio_value_incomplete",
                 "One or more selected positions lack a point-in-time value.",
             )
         )
-    if investment.data_freshness.stale:
+    if "investment_market_data_stale" in failed:
         blockers.append(
             _section_blocker(
                 "investment_market_data_stale",
                 "The selected investment schedule uses stale market data.",
             )
         )
-    if getattr(investment, "holdings", ()) and not any(
+    if facts.investment_performance.has_holdings and not any(
         contribution.is_authoritative and "investment_performance" in contribution.section_ids
         for contribution in contributions
     ):
@@ -405,34 +469,69 @@ def _section_invariant_blockers(
                 "Investment holdings have no current authoritative source contribution.",
             )
         )
-    period_matches = (
-        balance_sheet.as_of_date == as_of_date
-        and income_statement.start_date == start_date
-        and income_statement.end_date == end_date
-        and cash_flow.start_date == start_date
-        and cash_flow.end_date == end_date
-        and investment.period_start == start_date
-        and investment.period_end == end_date
-        and investment.as_of_date == as_of_date
-        and annualized.as_of_date == as_of_date
-    )
-    if not period_matches:
+    if not all(section.period_matches for section in facts.all):
         blockers.append(_section_blocker("section_period_mismatch", "A section does not match the document period."))
-    section_currencies = {
-        balance_sheet.currency,
-        income_statement.currency,
-        cash_flow.currency,
-        investment.currency,
-        annualized.income.currency,
-        annualized.restricted_fair_value_total_currency,
-    }
-    if section_currencies != {currency}:
+    if frozenset().union(*(section.currencies for section in facts.all)) != {currency}:
         blockers.append(
             _section_blocker("section_currency_mismatch", "Every package section must use the document currency.")
         )
     return blockers
 
 
+def _section_invariant_blockers(
+    sections: PersonalReportPackageSections,
+    *,
+    start_date: date,
+    end_date: date,
+    as_of_date: date,
+    currency: str,
+    contributions: tuple[PackageSectionContribution[Any], ...],
+    cash_inputs: PackageCashInputs,
+) -> list[PersonalReportPackageReadinessBlocker]:
+    """Prove cross-section accounting and context before authority emission."""
+    facts = _PackageSectionFacts(
+        balance_sheet=_balance_sheet_facts(sections.balance_sheet, as_of_date=as_of_date),
+        income_statement=_income_statement_facts(sections.income_statement, start_date=start_date, end_date=end_date),
+        cash_flow=_cash_flow_facts(sections.cash_flow, start_date=start_date, end_date=end_date),
+        investment_performance=_investment_facts(
+            sections.investment_performance, start_date=start_date, end_date=end_date, as_of_date=as_of_date
+        ),
+        annualized_income_long_term=_annualized_income_facts(
+            sections.annualized_income_long_term, as_of_date=as_of_date
+        ),
+    )
+    return _section_facts_blockers(facts, currency=currency, contributions=contributions, cash_inputs=cash_inputs)
+
+
+def _reduced(builder: SectionBuilder, reduce: Callable[[Any], _SectionFacts]) -> SectionBuilder:
+    """``builder`` whose section is reduced to its facts inside the worker, before it is returned."""
+
+    async def build(session: AsyncSession) -> _SectionFacts:
+        return reduce(await builder(session))
+
+    return build
+
+
+@dataclass(frozen=True)
+class _PackageInputs:
+    """Policy and contributions every package evaluation starts from."""
+
+    policy: Any
+    decisions_by_source_id: dict[str, Any]
+    contributions: tuple[PackageSectionContribution[Any], ...]
+    cash_inputs: PackageCashInputs
+    executor: PackageSectionExecutor
+
+
+@dataclass(frozen=True)
+class _PackageEvaluation:
+    """The manifest fold, shared by the document and readiness-only paths."""
+
+    contributions: tuple[PackageSectionContribution[Any], ...]
+    input_manifest: list[PersonalReportPackageTraceManifestEntry]
+    coverage: PersonalReportPackageInputCoverage
+
+
 class PackageAssembler:
     """Build one preview/frozen document without router-local section aggregation."""
 
@@ -454,23 +553,14 @@ class PackageAssembler:
         """Assemble the document and fail closed on unanchored contributing inputs."""
         contract = _contract(framework_id)
         statement_disposition_policy = _package_statement_disposition_policy()
-        policy = await derive_user_framework_policy_result(
-            db,
-            user_id,
-            framework_id=framework_id,
-            report_period_start=start_date,
-            report_period_end=end_date,
-            as_of_date=as_of_date,
-        )
-        decisions_by_source_id = _policy_decisions_by_source_id(policy)
-        base_contributions = await self._contributions(
+        inputs = await self._inputs(
             db,
             user_id=user_id,
+            framework_id=framework_id,
             start_date=start_date,
             end_date=end_date,
             as_of_date=as_of_date,
         )
-        cash_inputs = _cash_inputs_from_contributions(base_contributions)
         sections = await self._sections(
             db,
             user_id=user_id,
@@ -480,43 +570,36 @@ class PackageAssembler:
             as_of_date=as_of_date,
             currency=currency,
             include_restricted=include_restricted,
-            decisions_by_source_id=decisions_by_source_id,
-            contributions=base_contributions,
-            cash_inputs=cash_inputs,
-        )
-        market_contributions = await self._selected_market_contributions(
-            db,
-            user_id=user_id,
-            selections=sections.investment_performance.market_valuation_selections,
-        )
-        contributions = (*base_contributions, *market_contributions)
-        sections.traceability_appendix = PersonalReportPackageTraceabilityResponse.model_validate(
-            await build_personal_report_package_traceability_payload(contributions=contributions)
+            decisions_by_source_id=inputs.decisions_by_source_id,
+            contributions=inputs.contributions,
+            cash_inputs=inputs.cash_inputs,
+            executor=inputs.executor,
         )
-        sections.notes = _package_notes(statement_disposition_policy)
-        input_manifest, unproven_input_refs = await self._input_manifest(
+        evaluation = await self._evaluate(
             db,
             user_id=user_id,
-            contributions=contributions,
-        )
-        coverage = PersonalReportPackageInputCoverage(
-            manifest_decision_count=len(input_manifest),
-            authoritative_input_count=sum(len(item.input_refs) for item in input_manifest),
-            unproven_input_count=len(unproven_input_refs),
+            contributions=inputs.contributions,
+            market_valuation_selections=sections.investment_performance.market_valuation_selections,
         )
+        policy = inputs.policy
+        input_manifest = evaluation.input_manifest
         readiness = self._readiness(
             policy=policy,
-            coverage=coverage,
+            coverage=evaluation.coverage,
             section_blockers=_section_invariant_blockers(
                 sections,
                 start_date=start_date,
                 end_date=end_date,
                 as_of_date=as_of_date,
                 currency=currency,
-                contributions=contributions,
-                cash_inputs=cash_inputs,
+                contributions=evaluation.contributions,
+                cash_inputs=inputs.cash_inputs,
             ),
         )
+        sections.traceability_appendix = PersonalReportPackageTraceabilityResponse.model_validate(
+            await build_personal_report_package_traceability_payload(contributions=evaluation.contributions)
+        )
+        sections.notes = _package_notes(statement_disposition_policy)
         now = datetime.now(UTC)
         package_decision_id = None
         if (
@@ -569,6 +652,161 @@ class PackageAssembler:
             sections=sections,
         )
 
+    async def readiness(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: UUID,
+        framework_id: PersonalReportingFrameworkId,
+        start_date: date,
+        end_date: date,
+        as_of_date: date,
+        currency: str,
+        include_restricted: bool = False,
+    ) -> PersonalReportPackageReadinessResponse:
+        """The readiness the preview document would carry, evaluated section by section.
+
+        Each section worker reduces its section to the facts the invariants read
+        (:class:`_SectionFacts`) before returning, so only those facts outlive
+        the worker and the sections, traceability appendix, notes and document
+        are never assembled. The annualized income schedule is not built at
+        all: its only invariants are its period and currency, and the schedule
+        is produced for exactly the requested as-of date and normalized currency.
+        """
+        inputs = await self._inputs(
+            db,
+            user_id=user_id,
+            framework_id=framework_id,
+            start_date=start_date,
+            end_date=end_date,
+            as_of_date=as_of_date,
+        )
+        balance_sheet, income_statement, cash_flow, investment, _annualized = self._section_builders(
+            user_id=user_id,
+            framework_id=framework_id,
+            start_date=start_date,
+            end_date=end_date,
+            as_of_date=as_of_date,
+            currency=currency,
+            include_restricted=include_restricted,
+            decisions_by_source_id=inputs.decisions_by_source_id,
+            cash_inputs=inputs.cash_inputs,
+        )
+        balance_sheet_facts, income_statement_facts, cash_flow_facts, investment_facts = await inputs.executor.gather(
+            _reduced(
+                balance_sheet,
+                lambda section: _balance_sheet_facts(
+                    BalanceSheetResponse.model_validate(section), as_of_date=as_of_date
+                ),
+            ),
+            _reduced(
+                income_statement,
+                lambda section: _income_statement_facts(
+                    IncomeStatementResponse.model_validate(section), start_date=start_date, end_date=end_date
+                ),
+            ),
+            _reduced(
+                cash_flow,
+                lambda section: _cash_flow_facts(
+                    CashFlowResponse.model_validate(section), start_date=start_date, end_date=end_date
+                ),
+            ),
+            _reduced(
+                investment,
+                lambda section: _investment_facts(
+                    section, start_date=start_date, end_date=end_date, as_of_date=as_of_date
+                ),
+            ),
+        )
+        facts = _PackageSectionFacts(
+            balance_sheet=balance_sheet_facts,
+            income_statement=income_statement_facts,
+            cash_flow=cash_flow_facts,
+            investment_performance=investment_facts,
+            annualized_income_long_term=_SectionFacts(
+                period_matches=True, currencies=frozenset({normalize_currency_code(currency)})
+            ),
+        )
+        evaluation = await self._evaluate(
+            db,
+            user_id=user_id,
+            contributions=inputs.contributions,
+            market_valuation_selections=investment_facts.market_valuation_selections,
+        )
+        return self._readiness(
+            policy=inputs.policy,
+            coverage=evaluation.coverage,
+            section_blockers=_section_facts_blockers(
+                facts, currency=currency, contributions=evaluation.contributions, cash_inputs=inputs.cash_inputs
+            ),
+        )
+
+    async def _inputs(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: UUID,
+        framework_id: PersonalReportingFrameworkId,
+        start_date: date,
+        end_date: date,
+        as_of_date: date,
+    ) -> _PackageInputs:
+        policy = await derive_user_framework_policy_result(
+            db,
+            user_id,
+            framework_id=framework_id,
+            report_period_start=start_date,
+            report_period_end=end_date,
+            as_of_date=as_of_date,
+        )
+        executor = await PackageSectionExecutor.open(db)
+        contributions = await self._contributions(
+            db,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            as_of_date=as_of_date,
+            executor=executor,
+        )
+        return _PackageInputs(
+            policy=policy,
+            decisions_by_source_id=_policy_decisions_by_source_id(policy),
+            contributions=contributions,
+            cash_inputs=_cash_inputs_from_contributions(contributions),
+            executor=executor,
+        )
+
+    async def _evaluate(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: UUID,
+        contributions: tuple[PackageSectionContribution[Any], ...],
+        market_valuation_selections: Sequence[Any],
+    ) -> _PackageEvaluation:
+        """Add the rendered market prices to ``contributions`` and fold them into the input manifest."""
+        market_contributions = await self._selected_market_contributions(
+            db,
+            user_id=user_id,
+            selections=list(market_valuation_selections),
+        )
+        contributions = (*contributions, *market_contributions)
+        input_manifest, unproven_input_refs = await self._input_manifest(
+            db,
+            user_id=user_id,
+            contributions=contributions,
+        )
+        coverage = PersonalReportPackageInputCoverage(
+            manifest_decision_count=len(input_manifest),
+            authoritative_input_count=sum(len(item.input_refs) for item in input_manifest),
+            unproven_input_count=len(unproven_input_refs),
+        )
+        return _PackageEvaluation(
+            contributions=contributions,
+            input_manifest=input_manifest,
+            coverage=coverage,
+        )
+
     async def _emit_package_decision(
         self,
         db: AsyncSession,
@@ -690,10 +928,51 @@ class PackageAssembler:
         decisions_by_source_id: dict[str, Any],
         contributions: tuple[PackageSectionContribution[Any], ...],
         cash_inputs: PackageCashInputs,
+        executor: PackageSectionExecutor | None = None,
     ) -> PersonalReportPackageSections:
-        balance_sheet, income_statement, cash_flow, investment_performance, annualized_income, traceability = (
-            await assemble_framework_balance_sheet(
-                db,
+        """Build the independent sections concurrently on one read snapshot."""
+        executor = executor or await PackageSectionExecutor.open(db)
+        balance_sheet, income_statement, cash_flow, investment_performance, annualized_income = await executor.gather(
+            *self._section_builders(
+                user_id=user_id,
+                framework_id=framework_id,
+                start_date=start_date,
+                end_date=end_date,
+                as_of_date=as_of_date,
+                currency=currency,
+                include_restricted=include_restricted,
+                decisions_by_source_id=decisions_by_source_id,
+                cash_inputs=cash_inputs,
+            )
+        )
+        traceability = await build_personal_report_package_traceability_payload(contributions=contributions)
+        return PersonalReportPackageSections(
+            balance_sheet=BalanceSheetResponse.model_validate(balance_sheet),
+            income_statement=IncomeStatementResponse.model_validate(income_statement),
+            cash_flow=CashFlowResponse.model_validate(cash_flow),
+            investment_performance=InvestmentPerformanceReportScheduleResponse.model_validate(investment_performance),
+            annualized_income_long_term=annualized_income,
+            notes=PersonalReportPackageNotesResponse.model_validate(PERSONAL_REPORT_PACKAGE_NOTES),
+            traceability_appendix=PersonalReportPackageTraceabilityResponse.model_validate(traceability),
+        )
+
+    @staticmethod
+    def _section_builders(
+        *,
+        user_id: UUID,
+        framework_id: PersonalReportingFrameworkId,
+        start_date: date,
+        end_date: date,
+        as_of_date: date,
+        currency: str,
+        include_restricted: bool,
+        decisions_by_source_id: dict[str, Any],
+        cash_inputs: PackageCashInputs,
+    ) -> tuple[SectionBuilder, SectionBuilder, SectionBuilder, SectionBuilder, SectionBuilder]:
+        """Balance sheet, income statement, cash flow, investment and annualized income builders, in that order."""
+        return (
+            lambda session: assemble_framework_balance_sheet(
+                session,
                 user_id,
                 framework_id=framework_id,
                 as_of_date=as_of_date,
@@ -701,8 +980,8 @@ class PackageAssembler:
                 include_restricted=include_restricted,
                 decisions_by_source_id=decisions_by_source_id,
             ),
-            await assemble_framework_income_statement(
-                db,
+            lambda session: assemble_framework_income_statement(
+                session,
                 user_id,
                 framework_id=framework_id,
                 start_date=start_date,
@@ -710,36 +989,26 @@ class PackageAssembler:
                 currency=currency,
                 decisions_by_source_id=decisions_by_source_id,
             ),
-            await generate_cash_flow(
-                db,
+            lambda session: generate_cash_flow(
+                session,
                 user_id,
                 start_date=start_date,
                 end_date=end_date,
                 currency=currency,
                 cash_account_ids=cash_inputs.account_ids,
             ),
-            await build_investment_performance_report_schedule(
-                db,
+            lambda session: build_investment_performance_report_schedule(
+                session,
                 user_id,
                 period_start=start_date,
                 period_end=end_date,
                 as_of_date=as_of_date,
                 currency=currency,
             ),
-            await generate_annualized_income_schedule(db, user_id, as_of_date=as_of_date, currency=currency),
-            await build_personal_report_package_traceability_payload(
-                contributions=contributions,
+            lambda session: generate_annualized_income_schedule(
+                session, user_id, as_of_date=as_of_date, currency=currency
             ),
         )
-        return PersonalReportPackageSections(
-            balance_sheet=BalanceSheetResponse.model_validate(balance_sheet),
-            income_statement=IncomeStatementResponse.model_validate(income_statement),
-            cash_flow=CashFlowResponse.model_validate(cash_flow),
-            investment_performance=InvestmentPerformanceReportScheduleResponse.model_validate(investment_performance),
-            annualized_income_long_term=annualized_income,
-            notes=PersonalReportPackageNotesResponse.model_validate(PERSONAL_REPORT_PACKAGE_NOTES),
-            traceability_appendix=PersonalReportPackageTraceabilityResponse.model_validate(traceability),
-        )
 
     async def _contributions(
         self,
@@ -749,20 +1018,24 @@ class PackageAssembler:
         start_date: date,
         end_date: date,
         as_of_date: date,
+        executor: PackageSectionExecutor | None = None,
     ) -> tuple[PackageSectionContribution[Any], ...]:
         """Adapt package-owned DTOs; never reconstruct their authority locally."""
-        statement_results = await list_statement_contributions(db, user_id=user_id, as_of=as_of_date)
-        journal_results = await list_journal_contributions(
-            db,
-            user_id=user_id,
-            start_date=date.min,
-            end_date=as_of_date,
-        )
-        valuation_results = await resolve_manual_valuation_contributions(
-            db,
-            user_id=user_id,
-            as_of=as_of_date,
-            policy=ResolutionPolicy(),
+        executor = executor or await PackageSectionExecutor.open(db)
+        statement_results, journal_results, valuation_results = await executor.gather(
+            lambda session: list_statement_contributions(session, user_id=user_id, as_of=as_of_date),
+            lambda session: list_journal_contributions(
+                session,
+                user_id=user_id,
+                start_date=date.min,
+                end_date=as_of_date,
+            ),
+            lambda session: resolve_manual_valuation_contributions(
+                session,
+                user_id=user_id,
+                as_of=as_of_date,
+                policy=ResolutionPolicy(),
+            ),
         )
         return (
             *(
@@ -885,15 +1158,60 @@ async def current_package_document_summary(
     user_id: UUID,
     as_of_date: date | None = None,
 ) -> PersonalReportPackageDocumentSummary:
-    """Build the current default-framework candidate through the sole assembler."""
+    """Summarize the current default-framework candidate without rendering it.
+
+    Workflow status polling and the advisor need only readiness and status: a
+    preview is never trusted, so the summary is the readiness from
+    :meth:`PackageAssembler.readiness`, memoized against the user's ledger and
+    pricing versions (statement, trace-decision, journal and valuation writes
+    all bump them). Only the readiness is cached; ``generated_at`` is stamped
+    on every call.
+    """
     report_end = as_of_date or date.today()
-    document = await PackageAssembler().assemble(
+    start_date = report_end - timedelta(days=365)
+    framework_id = PersonalReportingFrameworkId.US_GAAP_LIKE
+    currency = settings.base_currency
+    payload = await _current_package_readiness_payload(
         db,
-        user_id=user_id,
-        framework_id=PersonalReportingFrameworkId.US_GAAP_LIKE,
-        start_date=report_end - timedelta(days=365),
+        user_id,
+        framework_id=framework_id,
+        start_date=start_date,
         end_date=report_end,
-        as_of_date=report_end,
-        currency=settings.base_currency,
+        currency=currency,
+    )
+    return PersonalReportPackageDocumentSummary(
+        package_id=PERSONAL_REPORT_PACKAGE_CONTRACT["package_id"],
+        lifecycle=PersonalReportPackageDocumentLifecycle.PREVIEW,
+        status=PersonalReportPackageSnapshotStatus.DRAFT,
+        context=PersonalReportPackageContext(
+            framework_id=framework_id,
+            start_date=start_date,
+            end_date=report_end,
+            as_of_date=report_end,
+            currency=currency,
+        ),
+        readiness=PersonalReportPackageReadinessResponse.model_validate(payload),
+        generated_at=datetime.now(UTC),
+    )
+
+
+@cached_report(ReportType.PACKAGE)
+async def _current_package_readiness_payload(
+    db: AsyncSession,
+    user_id: UUID,
+    *,
+    framework_id: PersonalReportingFrameworkId,
+    start_date: date,
+    end_date: date,
+    currency: str,
+) -> dict[str, object]:
+    readiness = await PackageAssembler().readiness(
+        db,
+        user_id=user_id,
+        framework_id=framework_id,
+        start_date=start_date,
+        end_date=end_date,
+        as_of_date=end_date,
+        currency=currency,
     )
-    return _package_document_summary(document)
+    return readiness.model_dump()
@@ -0,0 +1,128 @@
+"""Concurrent execution of independent package sections on one read snapshot.
+
+:class:`~src.reporting.extension.package_document.PackageAssembler` builds the
+framework balance sheet, income statement, cash flow, investment schedule,
+annualized income schedule and the statement/journal/valuation contribution
+lists — independent reads that used to be awaited one after another on the
+request session. :class:`PackageSectionExecutor` runs them concurrently, each
+on its own session, with at most ``settings.package_section_concurrency`` in
+flight.
+
+Every worker session imports the request transaction's snapshot
+(``pg_export_snapshot`` / ``SET TRANSACTION SNAPSHOT`` under REPEATABLE READ),
+so all sections read exactly the same database state — the same state a
+sequential run would have seen, minus the drift a long sequential run on a
+READ COMMITTED session could pick up between sections. Results come back in
+submission order and the first failure in submission order is raised, so the
+document (and its digest) does not depend on scheduling.
+
+An imported snapshot cannot see the request transaction's own uncommitted
+writes, so when that transaction has already written (it holds an xid) the
+executor falls back to the sequential run on the request session.
+
+Worker sessions are rolled back, so the one write a section builder makes —
+an FX rate that ``lazy_load`` derives (inverse, bridge) or fetches and
+persists — would be lost with them, unlike on the sequential path. The
+executor keeps the ``FxRate`` rows each worker flushes and, once every section
+has succeeded, stores them on the request session with
+:func:`~src.pricing.persist_fx_rates` (pairs already stored for the date are
+left alone), so they commit or roll back with the request as before. Nothing
+is carried over when a section fails. Carrying rates over gives the request
+transaction an xid, so a later :meth:`PackageSectionExecutor.open` on the same
+transaction runs sequentially.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.database import create_session_maker_from_db
+from src.pricing import FxRate, persist_fx_rates
+
+SectionBuilder = Callable[[AsyncSession], Awaitable[Any]]
+
+# NULL while the transaction has not written anything; a snapshot exported
+# after a write would hide that write from the workers.
+_EXPORT_READ_SNAPSHOT_SQL = text(
+    "SELECT CASE WHEN pg_current_xact_id_if_assigned() IS NULL THEN pg_export_snapshot() END"
+)
+
+
+class PackageSectionExecutor:
+    """Run section builders concurrently on one shared snapshot, keeping the FX rates they derive."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        snapshot_id: str | None,
+        session_factory: async_sessionmaker[AsyncSession] | None,
+        max_concurrency: int,
+    ) -> None:
+        self._db = db
+        self._snapshot_id = snapshot_id
+        self._session_factory = session_factory
+        self._max_concurrency = max_concurrency
+
+    @classmethod
+    async def open(
+        cls,
+        db: AsyncSession,
+        *,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        max_concurrency: int | None = None,
+    ) -> PackageSectionExecutor:
+        """Export ``db``'s snapshot for the workers; sequential on ``db`` if it cannot be shared."""
+        limit = max_concurrency or settings.package_section_concurrency
+        snapshot_id = await db.scalar(_EXPORT_READ_SNAPSHOT_SQL) if limit > 1 else None
+        return cls(
+            db,
+            snapshot_id=snapshot_id,
+            session_factory=session_factory,
+            max_concurrency=limit,
+        )
+
+    @property
+    def concurrent(self) -> bool:
+        return self._snapshot_id is not None and self._max_concurrency > 1
+
+    async def gather(self, *builders: SectionBuilder) -> tuple[Any, ...]:
+        """Results of ``builders`` in submission order."""
+        if not self.concurrent:
+            return tuple([await builder(self._db) for builder in builders])
+
+        session_factory = self._session_factory or create_session_maker_from_db(self._db)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        derived_fx_rates: list[FxRate] = []
+
+        def keep_derived_fx_rates(session: Session, _flush_context: Any) -> None:
+            derived_fx_rates.extend(row for row in session.new if isinstance(row, FxRate))
+
+        async def run(builder: SectionBuilder) -> Any:
+            async with semaphore, session_factory() as session:
+                event.listen(session.sync_session, "after_flush", keep_derived_fx_rates)
+                try:
+                    await session.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"))
+                    # Snapshot ids are server-generated hex/dash tokens; no bind
+                    # parameters are accepted by SET TRANSACTION SNAPSHOT.
+                    await session.execute(text(f"SET TRANSACTION SNAPSHOT '{self._snapshot_id}'"))
+                    return await builder(session)
+                finally:
+                    # Rows inserted in the rolled-back transaction are expunged
+                    # with their attributes intact, so the kept rates stay readable.
+                    await session.rollback()
+
+        outcomes = await asyncio.gather(*(run(builder) for builder in builders), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        if derived_fx_rates:
+            await persist_fx_rates(self._db, derived_fx_rates)
+        return tuple(outcomes)
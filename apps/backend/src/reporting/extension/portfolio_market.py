@@ -154,7 +154,6 @@ async def _build_portfolio_market_adjustment_lines(
     cost basis only when that cost basis is already represented in the ledger,
     so cash balances are not accidentally netted out.
     """
-    ledger_by_account = {line["account_id"]: Decimal(str(line["amount"])) for line in asset_lines}
     basis_by_account = await _portfolio_market_basis_by_account(
         db,
         user_id,
@@ -162,7 +161,21 @@ async def _build_portfolio_market_adjustment_lines(
         target_currency=target_currency,
         warnings=warnings,
     )
+    return _portfolio_market_adjustment_lines(basis_by_account, asset_lines, target_currency=target_currency)
+
 
+def _portfolio_market_adjustment_lines(
+    basis_by_account: dict[UUID, dict[str, Any]],
+    asset_lines: Sequence[dict[str, Any]],
+    *,
+    target_currency: str,
+) -> list[dict[str, Any]]:
+    """Adjustment lines for an already-converted basis against ledger asset lines.
+
+    Pure, so the net-worth time series can reuse one basis across the points
+    it does not change between.
+    """
+    ledger_by_account = {line["account_id"]: Decimal(str(line["amount"])) for line in asset_lines}
     adjustment_lines: list[dict[str, Any]] = []
     for account_id, basis in basis_by_account.items():
         market_value = Decimal(str(basis["market_value"]))
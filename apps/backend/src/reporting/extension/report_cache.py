@@ -0,0 +1,268 @@
+"""Report result cache — memoized balance sheets, income statements, cash flows.
+
+One dashboard load, the advisor's summary context, ``/reports/export`` and
+the package summary each regenerate the same statement for the same user and
+dates. :func:`cached_report` wraps the three ``generate_*`` functions so a
+repeat call with the same arguments is served from a cache keyed by
+:class:`ReportCacheKey`: user, report kind, normalized arguments, the user's
+ledger version, the global pricing version and ``date.today()`` (statements
+dated today read the latest holdings snapshot).
+
+The versions come from ``report_cache_versions`` (``orm/report_cache_version.py``),
+stamped by database triggers on every journal, account, position, valuation,
+classification, reconciliation and FX/price write — in any process — so an
+entry is never served after the data it was computed from changed:
+
+* **Hit** only when both versions still equal the entry's.
+* **Fill** only when the versions read *after* computing equal the ones read
+  before; a write committed mid-computation leaves nothing behind.
+* **Uncommitted writes stay private.** A session's own uncommitted stamps are
+  visible to it alone, so what it computes is keyed under versions no other
+  session can observe until that data commits.
+
+Results are returned deep-frozen (:func:`freeze`) on hits and misses alike,
+so no caller can corrupt a shared entry; ``dict(report)``/``list(lines)``
+give a mutable copy. The default backend is a per-process LRU + TTL
+(:class:`InMemoryReportCache`); a shared store can be plugged in with
+:func:`register_report_cache_backend`.
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import date
+from functools import wraps
+from typing import Any, Never, ParamSpec, Protocol
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.observability import record_report_cache_eviction, record_report_cache_lookup
+from src.reporting.orm.report_cache_version import PRICING_SCOPE, ReportCacheVersion, user_scope
+from src.reporting.orm.snapshot import ReportType
+
+P = ParamSpec("P")
+Report = dict[str, object]
+ScopeVersion = tuple[int, ...]
+
+
+def _immutable(self: object, *args: object, **kwargs: object) -> Never:
+    raise TypeError(f"{type(self).__name__} is a cached report value and cannot be modified; copy it first")
+
+
+class FrozenDict(dict[Any, Any]):
+    """A ``dict`` whose mutators raise ``TypeError`` (``dict(value)`` copies)."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self) -> tuple[type[FrozenDict], tuple[dict[Any, Any]]]:
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list[Any]):
+    """A ``list`` whose mutators raise ``TypeError`` (``list(value)`` copies)."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+
+    def __reduce__(self) -> tuple[type[FrozenList], tuple[list[Any]]]:
+        return FrozenList, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Deep-frozen copy of a report value: dicts, lists, tuples and sets all the way down.
+
+    Lists stay list-typed (``FrozenList``) so ``report["assets"] == []`` and
+    JSON/pydantic handling are unchanged.
+    """
+    if isinstance(value, FrozenDict | FrozenList):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class ReportCacheKey:
+    """One generated report: who, which statement, which arguments, over which data."""
+
+    user_id: UUID
+    kind: ReportType
+    params: tuple[tuple[str, Hashable], ...]
+    ledger_version: ScopeVersion
+    pricing_version: ScopeVersion
+    today: date
+
+
+class ReportCacheBackend(Protocol):
+    """Storage behind :func:`cached_report` — per-process by default, pluggable for a shared store.
+
+    Values are deep-frozen reports; a shared backend must (de)serialize them
+    (``FrozenDict``/``FrozenList`` pickle as themselves).
+    """
+
+    enabled: bool
+
+    def get(self, key: ReportCacheKey) -> Report | None: ...
+
+    def put(self, key: ReportCacheKey, report: Report) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryReportCache:
+    """Bounded LRU of frozen reports with a per-entry TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[ReportCacheKey, tuple[float, Report]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: ReportCacheKey) -> Report | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[key]
+            self._evicted("expired")
+            entry = None
+        if entry is None:
+            self.misses += 1
+            record_report_cache_lookup(kind=key.kind.value, outcome="miss")
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        record_report_cache_lookup(kind=key.kind.value, outcome="hit")
+        return entry[1]
+
+    def put(self, key: ReportCacheKey, report: Report) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (self._clock() + self.ttl_seconds, report)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evicted("capacity")
+
+    def clear(self) -> None:
+        """Forget every entry and counter (tests and reconfiguration)."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def _evicted(self, reason: str, count: int = 1) -> None:
+        self.evictions += count
+        record_report_cache_eviction(reason=reason, count=count)
+
+
+_backend: ReportCacheBackend = InMemoryReportCache(
+    max_entries=settings.report_cache_max_entries,
+    ttl_seconds=settings.report_cache_ttl_seconds,
+)
+
+
+def register_report_cache_backend(backend: ReportCacheBackend) -> ReportCacheBackend:
+    """Install the report cache's storage; returns the previous backend."""
+    global _backend
+    previous = _backend
+    _backend = backend
+    return previous
+
+
+def report_cache_backend() -> ReportCacheBackend:
+    """The storage currently behind :func:`cached_report`."""
+    return _backend
+
+
+async def load_report_versions(db: AsyncSession, user_id: UUID) -> tuple[ScopeVersion, ScopeVersion]:
+    """``(ledger_version, pricing_version)`` as ``db`` sees them now."""
+    ledger_scope = user_scope(user_id)
+    stamps: dict[str, list[int]] = {ledger_scope: [], PRICING_SCOPE: []}
+    result = await db.execute(
+        select(ReportCacheVersion.scope_key, ReportCacheVersion.id)
+        .where(ReportCacheVersion.scope_key.in_(stamps))
+        .order_by(ReportCacheVersion.id)
+    )
+    for scope_key, stamp_id in result.all():
+        stamps[scope_key].append(stamp_id)
+    return tuple(stamps[ledger_scope]), tuple(stamps[PRICING_SCOPE])
+
+
+def _param_key(value: Any) -> Hashable:
+    if isinstance(value, list | tuple):
+        return tuple(_param_key(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_param_key(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _param_key(item)) for key, item in value.items()))
+    hash(value)
+    return value
+
+
+def cached_report(
+    kind: ReportType,
+) -> Callable[[Callable[P, Awaitable[Report]]], Callable[P, Awaitable[Report]]]:
+    """Memoize a ``generate_*(db, user_id, *, ...)`` report function (see module docstring)."""
+
+    def decorate(generate: Callable[P, Awaitable[Report]]) -> Callable[P, Awaitable[Report]]:
+        signature = inspect.signature(generate)
+
+        @wraps(generate)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Report:
+            backend = _backend
+            if not backend.enabled:
+                return freeze(await generate(*args, **kwargs))
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            db: AsyncSession = arguments.pop("db")
+            user_id: UUID = arguments.pop("user_id")
+            try:
+                params = tuple((name, _param_key(value)) for name, value in arguments.items())
+            except TypeError:  # an unhashable argument: compute uncached
+                return freeze(await generate(*args, **kwargs))
+
+            versions = await load_report_versions(db, user_id)
+            key = ReportCacheKey(user_id, kind, params, *versions, today=date.today())
+            cached = backend.get(key)
+            if cached is not None:
+                return cached
+
+            report: Report = freeze(await generate(*args, **kwargs))
+            if await load_report_versions(db, user_id) == versions:
+                backend.put(key, report)
+            return report
+
+        return wrapper
+
+    return decorate
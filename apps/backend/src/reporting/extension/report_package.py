@@ -8,11 +8,10 @@ routers. Behavior unchanged.
 
 from __future__ import annotations
 
-import csv
+from collections.abc import Iterator
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from io import StringIO
 from typing import Any
 from uuid import UUID
 
@@ -158,15 +157,13 @@ def package_snapshot_input_decision_references(document: PersonalReportPackageDo
     )
 
 
-def package_snapshot_csv(snapshot: PersonalReportPackageSnapshotResponse) -> str:
-    output = StringIO()
-    writer = csv.writer(output)
+def package_snapshot_rows(snapshot: PersonalReportPackageSnapshotResponse) -> Iterator[list[Any]]:
+    """Traceability lines of a frozen snapshot, in export-contract CSV column order."""
     document = snapshot.document
     section_payloads = document.sections.model_dump(mode="json")
     traceability = document.sections.traceability_appendix
     evidence_bundle_references = package_snapshot_evidence_references(document.framework_policy)
     input_decision_references = package_snapshot_input_decision_references(document)
-    writer.writerow(document.contract.export_contract.csv_columns)
     for line in traceability.lines:
         section_payload = section_payloads.get(line.section_id, {})
         amount = resolve_payload_field(section_payload, line.amount_field)
@@ -177,22 +174,17 @@ def package_snapshot_csv(snapshot: PersonalReportPackageSnapshotResponse) -> str
             if line.currency_field
             else ""
         )
-        writer.writerow(
-            [
-                snapshot.package_id,
-                line.section_id,
-                line.line_id,
-                line.label,
-                amount,
-                currency,
-                line.source_state,
-                snapshot.framework_id.value,
-                document.framework_policy.result_id,
-                document.framework_policy.matrix_version,
-                evidence_bundle_references,
-                input_decision_references,
-            ]
-        )
-    content = output.getvalue()
-    output.close()
-    return content
+        yield [
+            snapshot.package_id,
+            line.section_id,
+            line.line_id,
+            line.label,
+            amount,
+            currency,
+            line.source_state,
+            snapshot.framework_id.value,
+            document.framework_policy.result_id,
+            document.framework_policy.matrix_version,
+            evidence_bundle_references,
+            input_decision_references,
+        ]
@@ -35,7 +35,9 @@ _DERIVED_SOURCE_TYPES = {JournalEntrySourceType.SYSTEM, JournalEntrySourceType.F
 
 # Limit to ~1 year of daily data to ensure report performance and prevent memory issues.
 MAX_TREND_POINTS = 366
-MAX_NET_WORTH_DAILY_POINTS = 366
+# The net-worth series folds ledger deltas in one pass (net_worth_series.py),
+# so its daily cap is ten years rather than one.
+MAX_NET_WORTH_DAILY_POINTS = 3660
 
 
 class ReportError(Exception):
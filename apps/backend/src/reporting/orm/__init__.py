@@ -1,5 +1,6 @@
 """ORM entities owned by reporting."""
 
+from src.reporting.orm.report_cache_version import ReportCacheVersion
 from src.reporting.orm.snapshot import ReportSnapshot, ReportType
 
-__all__ = ["ReportSnapshot", "ReportType"]
+__all__ = ["ReportCacheVersion", "ReportSnapshot", "ReportType"]
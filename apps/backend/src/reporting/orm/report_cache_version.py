@@ -0,0 +1,167 @@
+"""Report-cache version stamps, written by database triggers.
+
+The report cache (``extension/report_cache.py``) keys a generated statement
+by the *versions* of the data it read: one scope per user (``user:<uuid>`` —
+journal, account, position, valuation, classification, reconciliation,
+statement, tenant trace-decision and per-user FX/price writes) and one global ``pricing`` scope (``fx_rates`` and
+``stock_prices``, shared by every user).
+
+Every write statement on a watched table inserts one stamp row per touched
+scope, from a statement-level trigger, so the API process, the Prefect worker
+and ad-hoc scripts all bump the same versions. A scope's version is the set of
+its surviving stamp ids, not a counter row: writers never update a shared row
+(so concurrent syncs and postings never wait on one another), a stamp becomes
+visible exactly when its transaction commits, and each stamp prunes the older
+ones it can lock without waiting — the set stays a handful of ids and changes
+on every commit that touched the scope.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import BigInteger, Index, String, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+from src.ledger.orm.journal import _split_postgresql_ddl
+
+PRICING_SCOPE = "pricing"
+
+
+def user_scope(user_id: object) -> str:
+    """The version scope of one user's own data."""
+    return f"user:{user_id}"
+
+
+class ReportCacheVersion(Base):
+    """One version stamp of a report-cache scope (see module docstring)."""
+
+    __tablename__ = "report_cache_versions"
+    __table_args__ = (Index("ix_report_cache_versions_scope_id", "scope_key", "id"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    scope_key: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ReportCacheVersion {self.scope_key} {self.id}>"
+
+
+# table -> the scope keys of a batch of changed rows; ``{rows}`` is the
+# transition table (old_rows/new_rows). Tables without ``user_id`` resolve it
+# through their parent row.
+_USER_ID_SCOPE = "SELECT 'user:' || user_id::text FROM {rows}"
+WATCHED_TABLE_SCOPES: dict[str, str] = {
+    "accounts": _USER_ID_SCOPE,
+    "journal_entries": _USER_ID_SCOPE,
+    "journal_lines": (
+        "SELECT 'user:' || e.user_id::text FROM {rows} AS r JOIN journal_entries AS e ON e.id = r.journal_entry_id"
+    ),
+    "atomic_transactions": _USER_ID_SCOPE,
+    "atomic_positions": _USER_ID_SCOPE,
+    "transaction_classification": (
+        "SELECT 'user:' || t.user_id::text FROM {rows} AS r JOIN atomic_transactions AS t ON t.id = r.atomic_txn_id"
+    ),
+    "reconciliation_matches": (
+        "SELECT 'user:' || t.user_id::text FROM {rows} AS r JOIN atomic_transactions AS t ON t.id = r.atomic_txn_id"
+    ),
+    "reconciliation_match_journal_entries": (
+        "SELECT 'user:' || e.user_id::text FROM {rows} AS r JOIN journal_entries AS e ON e.id = r.journal_entry_id"
+    ),
+    "managed_positions": _USER_ID_SCOPE,
+    "investment_transactions": _USER_ID_SCOPE,
+    "investment_lots": _USER_ID_SCOPE,
+    "dividend_income": _USER_ID_SCOPE,
+    "manual_valuation_snapshots": _USER_ID_SCOPE,
+    "market_data_override": _USER_ID_SCOPE,
+    "statement_price_observations": _USER_ID_SCOPE,
+    "fx_conversions": _USER_ID_SCOPE,
+    # Package readiness inputs: statement results and the trace decisions
+    # that make a contribution authoritative.
+    "statement_summaries": _USER_ID_SCOPE,
+    "statement_extraction_results": _USER_ID_SCOPE,
+    "reviewed_statement_envelopes": _USER_ID_SCOPE,
+    "trace_records": "SELECT 'user:' || scope_id FROM {rows} WHERE scope_kind = 'TENANT'",
+    "fx_rates": f"SELECT '{PRICING_SCOPE}' FROM {{rows}}",
+    "stock_prices": f"SELECT '{PRICING_SCOPE}' FROM {{rows}}",
+}
+
+_BUMP_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION fr_bump_report_cache_versions()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_changed text;
+BEGIN
+    -- TG_ARGV[0] selects the scope keys of the changed rows from {rows}.
+    IF TG_OP = 'INSERT' THEN
+        v_changed := replace(TG_ARGV[0], '{rows}', 'new_rows');
+    ELSIF TG_OP = 'DELETE' THEN
+        v_changed := replace(TG_ARGV[0], '{rows}', 'old_rows');
+    ELSE
+        v_changed := replace(TG_ARGV[0], '{rows}', 'old_rows')
+            || ' UNION ' || replace(TG_ARGV[0], '{rows}', 'new_rows');
+    END IF;
+
+    -- One stamp per touched scope; then drop the older stamps nobody else is
+    -- pruning right now (SKIP LOCKED: writers never wait on each other).
+    EXECUTE $sql$
+        WITH stamped AS (
+            INSERT INTO report_cache_versions (scope_key)
+            SELECT DISTINCT changed.scope_key
+            FROM ($sql$ || v_changed || $sql$) AS changed (scope_key)
+            WHERE changed.scope_key IS NOT NULL
+            RETURNING scope_key, id
+        ),
+        superseded AS (
+            SELECT v.id
+            FROM report_cache_versions AS v
+            JOIN stamped AS s ON s.scope_key = v.scope_key AND v.id < s.id
+            FOR UPDATE OF v SKIP LOCKED
+        )
+        DELETE FROM report_cache_versions
+        WHERE id IN (SELECT id FROM superseded)
+    $sql$;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def _trigger_ddl(table: str, scope_sql: str) -> str:
+    # PostgreSQL allows transition tables on single-event triggers only.
+    argument = scope_sql.replace("'", "''")
+    statements = []
+    for event_name, referencing in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        trigger = f"trg_{table}_report_cache_{event_name.lower()}"
+        statements.append(
+            f"DROP TRIGGER IF EXISTS {trigger} ON {table};\n"
+            f"CREATE TRIGGER {trigger}\n"
+            f"AFTER {event_name} ON {table}\n"
+            f"REFERENCING {referencing}\n"
+            f"FOR EACH STATEMENT EXECUTE FUNCTION fr_bump_report_cache_versions('{argument}');\n"
+        )
+    return "".join(statements)
+
+
+def _install_report_cache_version_ddl(target: Any, connection: Any, **_: Any) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+
+    # The triggers live on other packages' tables: install once the whole
+    # metadata exists, skipping watched tables this metadata does not map.
+    existing = set(target.tables)
+    for statement in _split_postgresql_ddl(_BUMP_FUNCTION_SQL):
+        connection.exec_driver_sql(statement)
+    for table, scope_sql in WATCHED_TABLE_SCOPES.items():
+        if table in existing:
+            for statement in _split_postgresql_ddl(_trigger_ddl(table, scope_sql)):
+                connection.exec_driver_sql(statement)
+
+
+event.listen(Base.metadata, "after_create", _install_report_cache_version_ddl)
@@ -2,29 +2,35 @@ from datetime import date as date_type
 from uuid import UUID
 
 from fastapi import APIRouter, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from src.config_app import get_effective_base_currency
 from src.deps import CurrentUserId, DbSession
 from src.ledger import (
+    JOURNAL_EXPORT_COLUMNS,
     DecisionAnchorError,
     JournalEntry,
     JournalEntryStatus,
+    JournalExportCursor,
     ValidationError,
     post_journal_entry,
+    stream_journal_lines,
     submit_manual_journal_entry,
     validate_manual_journal_entry_for_post,
     void_journal_entry,
 )
 from src.observability import get_logger, log_financial_mutation
 from src.platform import get_owned_or_404, paginate, raise_bad_request
+from src.reporting import ExportEncoding, ExportTable, stream_export
 from src.schemas import (
     JournalEntryCreate,
     JournalEntryListResponse,
     JournalEntryResponse,
     VoidJournalEntryRequest,
 )
+from src.schemas.streaming import ExportStreamEnvelope
 
 router = APIRouter(prefix="/journal-entries", tags=["journal-entries"])
 logger = get_logger(__name__)
@@ -89,6 +95,41 @@ async def list_journal_entries(
     return JournalEntryListResponse(items=items, total=total)
 
 
+@router.get("/export")
+async def export_journal_lines(
+    format: ExportEncoding = Query(default=ExportEncoding.CSV),
+    start_date: date_type | None = None,
+    end_date: date_type | None = None,
+    account_id: list[UUID] | None = Query(default=None, description="Only lines posted to these accounts"),
+    status_filter: JournalEntryStatus | None = None,
+    after: str | None = Query(default=None, description="Resume after the row carrying this cursor"),
+    *,
+    db: DbSession,
+    user_id: CurrentUserId,
+) -> StreamingResponse:
+    """Stream every journal line with its entry, account, FX and provenance columns."""
+    try:
+        cursor = JournalExportCursor.decode(after) if after else None
+    except ValidationError as e:
+        raise_bad_request(str(e), cause=e)
+
+    rows = stream_journal_lines(
+        db,
+        user_id,
+        start_date=start_date,
+        end_date=end_date,
+        account_ids=account_id or (),
+        status=status_filter,
+        after=cursor,
+    )
+    envelope = ExportStreamEnvelope(media_type=format.media_type, filename=f"journal-lines.{format.suffix}")
+    return StreamingResponse(
+        stream_export(ExportTable(columns=JOURNAL_EXPORT_COLUMNS, rows=rows), format),
+        media_type=envelope.media_type.value,
+        headers=envelope.to_headers(),
+    )
+
+
 @router.get("/{entry_id}", response_model=JournalEntryResponse)
 async def get_journal_entry(
     entry_id: UUID,
@@ -25,6 +25,7 @@ from src.ledger import (
 from src.observability import ensure_request_id, get_logger, log_financial_mutation, safe_error_message
 from src.platform import get_owned_or_404, raise_bad_request, raise_not_found
 from src.reconciliation import (
+    MatchingScope,
     MatchNotFoundError,
     ReconciliationError,
     ReconciliationMatch,
@@ -34,10 +35,10 @@ from src.reconciliation import (
     accept_match as accept_match_service,
     batch_accept as batch_accept_service,
     detect_anomalies,
-    execute_matching,
     get_pending_items,
     get_reconciliation_stats,
     reject_match as reject_match_service,
+    run_reconciliation_job,
     submit_reviewed_disposition,
 )
 from src.schemas.reconciliation import (
@@ -220,17 +221,19 @@ async def run_reconciliation(
         progress=None,
         model_to_use=None,
         limit=payload.limit,
+        mode=payload.mode,
     )
 
     try:
         currency = await get_effective_base_currency(db)
-        matches = await execute_matching(
+        matches = await run_reconciliation_job(
             db,
             limit=payload.limit,
             user_id=user_id,
             currency=currency,
+            scope=MatchingScope(mode=payload.mode, statement_id=payload.statement_id),
+            commit=True,
         )
-        await db.commit()
     except ValidationError as exc:
         await db.rollback()
         raise_bad_request(str(exc), cause=exc)
@@ -3,12 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import csv
 import json
 from datetime import UTC, date, datetime
 from enum import Enum
-from io import StringIO
-from typing import Any, cast
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Query
@@ -25,12 +22,16 @@ from src.portfolio import active_stock_symbols
 from src.pricing import ensure_market_data_fresh
 from src.pricing.orm.market_data import FxRate
 from src.reporting import (
+    ExportEncoding,
+    ExportTable,
     PackageAssembler,
     PackageDocumentVersionError,
     ReportError,
     ReportingSnapshotService,
     ReportSnapshot,
     ReportType as SnapshotReportType,
+    balance_sheet_export_table,
+    cash_flow_export_table,
     generate_balance_sheet,
     generate_cash_flow,
     generate_income_statement,
@@ -39,11 +40,13 @@ from src.reporting import (
     get_category_breakdown,
     get_net_worth_allocation_schedule,
     get_net_worth_timeseries,
+    income_statement_export_table,
     package_currency as _package_currency,
     package_dates as _package_dates,
-    package_snapshot_csv as _package_snapshot_csv,
+    package_snapshot_export_table,
     package_snapshot_response as _package_snapshot_response,
     package_snapshot_summary as _package_snapshot_summary,
+    stream_export,
 )
 from src.schemas import (
     AccountLineageResponse,
@@ -142,6 +145,8 @@ class ExportFormat(str, Enum):
     """Supported export formats."""
 
     CSV = "csv"
+    NDJSON = "ndjson"
+    COLUMNAR = "columnar"
 
 
 class PackageSnapshotExportFormat(str, Enum):
@@ -300,13 +305,15 @@ async def export_personal_report_package_snapshot(
     snapshot = await get_personal_report_package_snapshot(snapshot_id=snapshot_id, db=db, user_id=user_id)
     stem = f"personal-report-package-{snapshot.framework_id.value}-{snapshot.as_of_date}-{snapshot.id}"
     if format == PackageSnapshotExportFormat.JSON:
-        content = json.dumps(snapshot.model_dump(mode="json"), sort_keys=True)
         envelope = ExportStreamEnvelope(media_type=ExportStreamMediaType.JSON, filename=f"{stem}.json")
-    else:
-        content = _package_snapshot_csv(snapshot)
-        envelope = ExportStreamEnvelope(media_type=ExportStreamMediaType.CSV, filename=f"{stem}.csv")
+        return StreamingResponse(
+            iter((json.dumps(snapshot.model_dump(mode="json"), sort_keys=True).encode(),)),
+            media_type=envelope.media_type.value,
+            headers=envelope.to_headers(),
+        )
+    envelope = ExportStreamEnvelope(media_type=ExportStreamMediaType.CSV, filename=f"{stem}.csv")
     return StreamingResponse(
-        StringIO(content),
+        stream_export(package_snapshot_export_table(snapshot), ExportEncoding.CSV),
         media_type=envelope.media_type.value,
         headers=envelope.to_headers(),
     )
@@ -591,131 +598,47 @@ async def export_report(
     db: DbSession,
     user_id: CurrentUserId,
 ) -> StreamingResponse:
-    """Export reports in CSV format."""
-    output = StringIO()
-    writer = csv.writer(output)
-
+    """Export a report as CSV, NDJSON rows or columnar NDJSON row groups, streamed as it is encoded."""
+    table: ExportTable
     try:
         if report_type == ExportReportType.BALANCE_SHEET:
             report_date = as_of_date or date.today()
             await _ensure_report_market_data_fresh(db, user_id, currency=currency, end_date=report_date)
-            balance_sheet_report = cast(
-                dict[str, Any],
-                await generate_balance_sheet(
-                    db,
-                    user_id,
-                    as_of_date=report_date,
-                    currency=currency,
-                    include_restricted=include_restricted,
-                ),
-            )
-            writer.writerow(["section", "account", "amount", "currency"])
-            for section, balance_lines in (
-                ("Assets", balance_sheet_report["assets"]),
-                ("Liabilities", balance_sheet_report["liabilities"]),
-                ("Equity", balance_sheet_report["equity"]),
-            ):
-                for balance_line in balance_lines:
-                    writer.writerow(
-                        [section, balance_line["name"], balance_line["amount"], balance_sheet_report["currency"]]
-                    )
-            writer.writerow(
-                ["Total Assets", "", balance_sheet_report["total_assets"], balance_sheet_report["currency"]]
+            balance_sheet_report = await generate_balance_sheet(
+                db,
+                user_id,
+                as_of_date=report_date,
+                currency=currency,
+                include_restricted=include_restricted,
             )
-            writer.writerow(
-                [
-                    "Total Liabilities",
-                    "",
-                    balance_sheet_report["total_liabilities"],
-                    balance_sheet_report["currency"],
-                ]
-            )
-            writer.writerow(
-                ["Total Equity", "", balance_sheet_report["total_equity"], balance_sheet_report["currency"]]
-            )
-            filename = f"balance-sheet-{balance_sheet_report['as_of_date']}.csv"
+            table = balance_sheet_export_table(balance_sheet_report)
+            stem = f"balance-sheet-{balance_sheet_report['as_of_date']}"
         elif report_type == ExportReportType.INCOME_STATEMENT:
             if not start_date or not end_date:
                 raise_bad_request("start_date and end_date are required for income statement export")
             await _ensure_report_market_data_fresh(db, user_id, currency=currency, end_date=end_date)
-            income_statement_report = cast(
-                dict[str, Any],
-                await generate_income_statement(
-                    db,
-                    user_id,
-                    start_date=start_date,
-                    end_date=end_date,
-                    currency=currency,
-                ),
-            )
-            writer.writerow(["section", "account", "amount", "currency"])
-            for section, income_lines in (
-                ("Income", income_statement_report["income"]),
-                ("Expenses", income_statement_report["expenses"]),
-            ):
-                for income_line in income_lines:
-                    writer.writerow(
-                        [section, income_line["name"], income_line["amount"], income_statement_report["currency"]]
-                    )
-            writer.writerow(
-                ["Total Income", "", income_statement_report["total_income"], income_statement_report["currency"]]
+            income_statement_report = await generate_income_statement(
+                db,
+                user_id,
+                start_date=start_date,
+                end_date=end_date,
+                currency=currency,
             )
-            writer.writerow(
-                [
-                    "Total Expenses",
-                    "",
-                    income_statement_report["total_expenses"],
-                    income_statement_report["currency"],
-                ]
-            )
-            writer.writerow(
-                ["Net Income", "", income_statement_report["net_income"], income_statement_report["currency"]]
-            )
-            filename = f"income-statement-{start_date}-to-{end_date}.csv"
+            table = income_statement_export_table(income_statement_report)
+            stem = f"income-statement-{start_date}-to-{end_date}"
         elif report_type == ExportReportType.CASH_FLOW:
             if not start_date or not end_date:
                 raise_bad_request("start_date and end_date are required for cash flow export")
             await _ensure_report_market_data_fresh(db, user_id, currency=currency, end_date=end_date)
-            cash_flow_report = cast(
-                dict[str, Any],
-                await generate_cash_flow(
-                    db,
-                    user_id,
-                    start_date=start_date,
-                    end_date=end_date,
-                    currency=currency,
-                ),
-            )
-            writer.writerow(["section", "account", "amount", "currency", "description"])
-            for section, cash_flow_lines in (
-                ("Operating", cash_flow_report["operating"]),
-                ("Investing", cash_flow_report["investing"]),
-                ("Financing", cash_flow_report["financing"]),
-            ):
-                for cash_flow_line in cash_flow_lines:
-                    writer.writerow(
-                        [
-                            section,
-                            cash_flow_line["subcategory"],
-                            cash_flow_line["amount"],
-                            cash_flow_report["currency"],
-                            cash_flow_line.get("description") or "",
-                        ]
-                    )
-            summary = cash_flow_report["summary"]
-            writer.writerow(
-                ["Operating Activities", "", summary["operating_activities"], cash_flow_report["currency"], ""]
-            )
-            writer.writerow(
-                ["Investing Activities", "", summary["investing_activities"], cash_flow_report["currency"], ""]
-            )
-            writer.writerow(
-                ["Financing Activities", "", summary["financing_activities"], cash_flow_report["currency"], ""]
+            cash_flow_report = await generate_cash_flow(
+                db,
+                user_id,
+                start_date=start_date,
+                end_date=end_date,
+                currency=currency,
             )
-            writer.writerow(["Net Cash Flow", "", summary["net_cash_flow"], cash_flow_report["currency"], ""])
-            writer.writerow(["Beginning Cash", "", summary["beginning_cash"], cash_flow_report["currency"], ""])
-            writer.writerow(["Ending Cash", "", summary["ending_cash"], cash_flow_report["currency"], ""])
-            filename = f"cash-flow-{start_date}-to-{end_date}.csv"
+            table = cash_flow_export_table(cash_flow_report)
+            stem = f"cash-flow-{start_date}-to-{end_date}"
         else:  # pragma: no cover - FastAPI enum validation rejects unsupported values first.
             raise_bad_request("Unsupported report type")
     except ReportError as exc:
@@ -727,11 +650,10 @@ async def export_report(
         raise_bad_request(str(exc), cause=exc)
 
     await db.commit()
-    content = output.getvalue()
-    output.close()
-    envelope = ExportStreamEnvelope(media_type=ExportStreamMediaType.CSV, filename=filename)
+    encoding = ExportEncoding(format.value)
+    envelope = ExportStreamEnvelope(media_type=encoding.media_type, filename=f"{stem}.{encoding.suffix}")
     return StreamingResponse(
-        StringIO(content),
+        stream_export(table, encoding),
         media_type=envelope.media_type.value,
         headers=envelope.to_headers(),
     )
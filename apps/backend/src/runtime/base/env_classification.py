@@ -79,6 +79,16 @@ NON_DEPENDENCY_ENV_FIELDS: dict[str, str] = {
     "otel_service_name": "tuning",
     "otel_resource_attributes": "tuning",
     "openpanel_environment": "tuning",
+    "reconciliation_watermark_lag_seconds": "tuning",
+    "reconciliation_job_workers": "tuning",
+    "fx_rate_cache_max_entries": "tuning",
+    "fx_rate_cache_ttl_seconds": "tuning",
+    "report_cache_max_entries": "tuning",
+    "report_cache_ttl_seconds": "tuning",
+    "package_section_concurrency": "tuning",
+    "journal_export_batch_size": "tuning",
+    "market_data_sync_concurrency": "tuning",
+    "market_data_provider_connections_per_host": "tuning",
 }
 
 
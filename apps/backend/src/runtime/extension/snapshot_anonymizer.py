@@ -75,6 +75,13 @@ class Action(str, Enum):
 # them by one integer keeps every cross-column derivation exact.
 MONEY_COLUMNS: frozenset[str] = frozenset(
     {
+        # The daily-balance read model sums journal_lines.amount (and
+        # amount * fx_rate); scaling it by the same factor keeps it equal to the
+        # scaled lines without a rebuild (triggers are off during the rewrite).
+        "account_daily_balances.credit_total",
+        "account_daily_balances.debit_total",
+        "account_daily_balances.fx_credit_total",
+        "account_daily_balances.fx_debit_total",
         "atomic_positions.market_value",
         "atomic_transactions.amount",
         "atomic_transactions.balance_after",
@@ -136,6 +143,7 @@ JSON_KEEP_COLUMNS: frozenset[str] = frozenset(
 # machine identifiers — no personal or document-derived content.
 STRING_KEEP_COLUMNS: frozenset[str] = frozenset(
     {
+        "account_daily_balances.currency",
         "accounts.currency",
         "accounts.type",
         "ai_feedback.action",
@@ -152,6 +160,7 @@ STRING_KEEP_COLUMNS: frozenset[str] = frozenset(
         "chat_messages.role",
         "chat_sessions.status",
         "consistency_checks.check_type",
+        "consistency_checks.related_txn_fingerprint",
         "consistency_checks.run_id",
         "consistency_checks.severity",
         "consistency_checks.status",
@@ -200,6 +209,7 @@ STRING_KEEP_COLUMNS: frozenset[str] = frozenset(
         "ping_state.state",
         "reconciliation_matches.run_id",
         "reconciliation_matches.status",
+        "report_cache_versions.scope_key",
         "report_snapshots.report_type",
         "reviewed_statement_envelopes.currency",
         "statement_extraction_results.producer_version",
@@ -282,6 +292,7 @@ STRING_PSEUDONYM_COLUMNS: dict[str, str] = {
     "manual_valuation_snapshots.notes": "generic",
     "manual_valuation_snapshots.source": "generic",
     "market_data_override.asset_identifier": "asset",
+    "reconciliation_merchant_patterns.token": "generic",
     "statement_price_observations.subject_key": "asset",
     "statement_summaries.account_last4": "digits4",
     "statement_summaries.file_hash": "hash",
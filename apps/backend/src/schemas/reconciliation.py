@@ -3,6 +3,7 @@
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -87,6 +88,13 @@ class ReconciliationRunRequest(BaseModel):
         le=10000,
         description="Maximum number of source transactions to consider.",
     )
+    mode: Literal["full", "incremental"] = Field(
+        default="full",
+        description=(
+            "full rescores every pending transaction; incremental rescores only those whose "
+            "inputs changed since the last complete run."
+        ),
+    )
 
 
 class ReconciliationRunResponse(BaseModel):
@@ -59,6 +59,7 @@ class ExportStreamMediaType(str, Enum):
 
     CSV = "text/csv"
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
 
 
 class ChatStreamEnvelope(BaseModel):
@@ -122,8 +123,8 @@ class ChatStreamEnvelope(BaseModel):
 class ExportStreamEnvelope(BaseModel):
     """Typed envelope for the report-export streaming responses.
 
-    Export streams carry a fully-rendered document (CSV rows or a JSON blob) as
-    an attachment. This envelope declares the media type and filename so the
+    Export streams carry a document (CSV rows, NDJSON rows or row groups, or a
+    JSON blob) as an attachment. This envelope declares the media type and filename so the
     ``Content-Disposition`` attachment header is built from a validated source
     instead of an inline f-string.
     """
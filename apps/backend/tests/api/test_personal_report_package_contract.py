@@ -246,7 +246,7 @@ def test_AC5_12_2_package_contract_marks_notes_ready():
 
 
 async def _read_streaming_body(response) -> str:
-    return "".join([chunk async for chunk in response.body_iterator])
+    return "".join([chunk.decode() if isinstance(chunk, bytes) else chunk async for chunk in response.body_iterator])
 
 
 def _package_snapshot_sections(label: str = "Total Assets") -> dict:
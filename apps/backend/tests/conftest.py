@@ -191,6 +191,34 @@ def reset_rate_limiters():
         limiter.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_fx_rate_cache():
+    """Drop the process-wide FX rate cache before/after each test.
+
+    Each test gets a fresh database, but the cache outlives it; a rate cached
+    by one test must not answer the same key in the next.
+    """
+    from src.pricing.extension.fx_cache import fx_rate_cache
+
+    fx_rate_cache.clear()
+    yield
+    fx_rate_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_report_cache():
+    """Drop the process-wide report cache before/after each test.
+
+    Truncation restarts the version-stamp ids, so a report cached by one test
+    could otherwise match the same user, arguments and versions in the next.
+    """
+    from src.reporting.extension.report_cache import report_cache_backend
+
+    report_cache_backend().clear()
+    yield
+    report_cache_backend().clear()
+
+
 @pytest.fixture(autouse=True)
 def disable_external_market_data_fetch(monkeypatch):
     """Keep tests deterministic unless a test explicitly enables provider fetches."""
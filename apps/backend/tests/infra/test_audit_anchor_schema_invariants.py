@@ -34,7 +34,9 @@ from src.reconciliation import (
     ReconciliationMatchJournalEntry,
     ReconciliationStatus,
     sync_reconciliation_match_journal_entry_links,
+    sync_reconciliation_match_journal_entry_links_bulk,
 )
+from src.reconciliation.extension import matching as reconciliation_matching
 
 BACKEND_DIR = Path(__file__).parent.parent.parent
 MIGRATION_PATH = BACKEND_DIR / "migrations" / "versions" / "0034_audit_anchor_referential_integrity.py"
@@ -205,6 +207,65 @@ async def test_AC18_11_1_reconciliation_links_reject_missing_and_cross_user_entr
     )
 
 
+async def test_bulk_link_sync_leaves_exactly_the_owned_parseable_links(
+    db: AsyncSession, test_user: User, monkeypatch
+) -> None:
+    """The batch synchronizer, across chunks, leaves the explicitly expected link rows and nothing else."""
+    # Chunks of two: the four matches span two ownership / existing-link / diff rounds.
+    monkeypatch.setattr(reconciliation_matching, "_LINK_SYNC_CHUNK", 2)
+    other_user = await _make_user(db, email_prefix="anchor-bulk-other")
+    own_entries = [await _make_journal_entry(db, test_user.id) for _ in range(3)]
+    other_entry = await _make_journal_entry(db, other_user.id)
+    foreign_atomic = await _make_atomic_transaction(db, other_user.id)
+    atomics = [await _make_atomic_transaction(db, test_user.id) for _ in range(3)]
+
+    def _match(atomic_txn_id, entry_ids: list[str]) -> ReconciliationMatch:
+        return ReconciliationMatch(
+            atomic_txn_id=atomic_txn_id,
+            journal_entry_ids=entry_ids,
+            match_score=100,
+            score_breakdown={"anchor": 100.0},
+            status=ReconciliationStatus.ACCEPTED,
+        )
+
+    matches = [
+        # Duplicate, unparseable and other-user ids are dropped.
+        _match(atomics[0].id, [str(own_entries[0].id), str(own_entries[0].id), "nope", str(other_entry.id)]),
+        _match(atomics[1].id, [str(own_entries[1].id)]),
+        # A missing entry is dropped.
+        _match(atomics[2].id, [str(own_entries[2].id), str(uuid4())]),
+        # The atomic transaction belongs to another user, so none of the ids are owned.
+        _match(foreign_atomic.id, [str(own_entries[0].id)]),
+    ]
+    db.add_all(matches)
+    await db.flush()
+    # Pre-existing links: one to keep, one that is stale after the edit below.
+    db.add_all(
+        [
+            ReconciliationMatchJournalEntry(match_id=matches[1].id, journal_entry_id=own_entries[1].id),
+            ReconciliationMatchJournalEntry(match_id=matches[2].id, journal_entry_id=own_entries[0].id),
+        ]
+    )
+    await db.flush()
+
+    await sync_reconciliation_match_journal_entry_links_bulk(db, matches)
+
+    rows = (
+        await db.execute(
+            select(ReconciliationMatchJournalEntry.match_id, ReconciliationMatchJournalEntry.journal_entry_id).where(
+                ReconciliationMatchJournalEntry.match_id.in_([match.id for match in matches])
+            )
+        )
+    ).all()
+    assert sorted((row.match_id, row.journal_entry_id) for row in rows) == sorted(
+        [
+            (matches[0].id, own_entries[0].id),
+            (matches[1].id, own_entries[1].id),
+            (matches[2].id, own_entries[2].id),
+        ]
+    )
+
+
 async def test_AC18_11_2_atomic_source_links_reject_missing_and_cross_user_documents(
     db: AsyncSession,
     test_user: User,
@@ -413,6 +413,13 @@ def test_AC10_10_4_business_metric_helpers_record_outcomes(monkeypatch) -> None:
         duration_ms=321.0,
     )
     telemetry_metrics.record_reconciliation_match_outcome(outcome="accepted")
+    telemetry_metrics.record_reconciliation_job(
+        outcome="success", queued_ms=1.0, scoring_ms=20.0, total_ms=30.0, transactions=12
+    )
+    telemetry_metrics.record_fx_rate_cache_lookup(outcome="hit")
+    telemetry_metrics.record_fx_rate_cache_eviction(reason="capacity", count=3)
+    telemetry_metrics.record_report_cache_lookup(kind="balance_sheet", outcome="miss")
+    telemetry_metrics.record_report_cache_eviction(reason="expired")
     telemetry_metrics.record_confidence_north_star(score=0.98, source="scheduled")
 
     assert meter.counters["finance.statement_parse.outcome"].add_calls == [(1, {"outcome": "success", "parser": "csv"})]
@@ -423,6 +430,18 @@ def test_AC10_10_4_business_metric_helpers_record_outcomes(monkeypatch) -> None:
         )
     ]
     assert meter.counters["finance.reconciliation.match.outcome"].add_calls == [(1, {"outcome": "accepted"})]
+    assert meter.histograms["finance.reconciliation.job.duration"].record_calls == [
+        (1.0, {"stage": "queued", "outcome": "success"}),
+        (20.0, {"stage": "scoring", "outcome": "success"}),
+        (30.0, {"stage": "total", "outcome": "success"}),
+    ]
+    assert meter.counters["finance.reconciliation.job.transactions"].add_calls == [(12, {"outcome": "success"})]
+    assert meter.counters["finance.fx_rate_cache.lookup"].add_calls == [(1, {"outcome": "hit"})]
+    assert meter.counters["finance.fx_rate_cache.eviction"].add_calls == [(3, {"reason": "capacity"})]
+    assert meter.counters["finance.report_cache.lookup"].add_calls == [
+        (1, {"kind": "balance_sheet", "outcome": "miss"})
+    ]
+    assert meter.counters["finance.report_cache.eviction"].add_calls == [(1, {"reason": "expired"})]
     assert meter.histograms["finance.confidence_north_star"].record_calls == [(0.98, {"source": "scheduled"})]
 
 
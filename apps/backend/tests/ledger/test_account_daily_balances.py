@@ -0,0 +1,128 @@
+"""AC-ledger.81: the maintained daily-balance read model."""
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ledger import (
+    Account,
+    AccountType,
+    Direction,
+    JournalEntry,
+    JournalEntryStatus,
+    JournalLine,
+    calculate_account_balances,
+    calculate_account_balances_in_base_currency,
+    find_account_daily_balance_drift,
+    load_account_currency_totals,
+    post_journal_entry,
+    rebuild_account_daily_balances,
+    verify_accounting_equation,
+    void_journal_entry,
+)
+from src.ledger.orm.daily_balance import AccountDailyBalance
+from tests.ledger._ledger_helpers import create_anchored_test_journal_entry as create_journal_entry
+
+
+async def _raw_net_debits(db: AsyncSession, user_id, *, as_of: date | None = None) -> dict:
+    """(account_id, currency) -> debit minus credit, summed straight from journal lines."""
+    stmt = (
+        select(
+            JournalLine.account_id,
+            JournalLine.currency,
+            func.sum(
+                case((JournalLine.direction == Direction.DEBIT, JournalLine.amount), else_=-JournalLine.amount)
+            ).label("net"),
+        )
+        .join(JournalEntry, JournalLine.journal_entry_id == JournalEntry.id)
+        .where(JournalEntry.user_id == user_id)
+        .where(JournalEntry.status.in_([JournalEntryStatus.POSTED, JournalEntryStatus.RECONCILED]))
+        .group_by(JournalLine.account_id, JournalLine.currency)
+    )
+    if as_of is not None:
+        stmt = stmt.where(JournalEntry.entry_date <= as_of)
+    return {(row.account_id, row.currency): row.net for row in (await db.execute(stmt)).all()}
+
+
+async def _assert_matches_raw(db: AsyncSession, user_id, *, as_of: date | None = None) -> None:
+    assert await find_account_daily_balance_drift(db, user_id=user_id) == []
+    totals = await load_account_currency_totals(db, user_id, as_of=as_of)
+    raw = await _raw_net_debits(db, user_id, as_of=as_of)
+    assert {(row.account_id, row.currency): row.net_debit for row in totals} == raw
+
+
+async def _post(db: AsyncSession, user_id, entry_date: date, debit: Account, credit: Account, amount: str, **fx):
+    lines = [
+        {"account_id": debit.id, "direction": Direction.DEBIT, "amount": Decimal(amount), **fx},
+        {"account_id": credit.id, "direction": Direction.CREDIT, "amount": Decimal(amount), **fx},
+    ]
+    entry = await create_journal_entry(
+        db, user_id, entry_date=entry_date, memo=f"{amount} on {entry_date}", lines_data=lines
+    )
+    await post_journal_entry(db, entry.id, user_id)
+    await db.commit()
+    return entry.id
+
+
+async def test_AC_ledger_81_1_daily_balances_track_raw_line_sums(db: AsyncSession, test_user) -> None:
+    """AC-ledger.81.1: post, backdated post, reconcile and void keep the read model exact."""
+    user_id = test_user.id
+    cash = Account(user_id=user_id, name="Cash", type=AccountType.ASSET, currency="SGD")
+    broker = Account(user_id=user_id, name="Broker USD", type=AccountType.ASSET, currency="USD")
+    equity = Account(user_id=user_id, name="Equity", type=AccountType.EQUITY, currency="SGD")
+    salary = Account(user_id=user_id, name="Salary", type=AccountType.INCOME, currency="SGD")
+    db.add_all([cash, broker, equity, salary])
+    await db.commit()
+
+    await _post(db, user_id, date(2026, 1, 10), cash, equity, "1000.00")
+    march = await _post(db, user_id, date(2026, 3, 1), cash, salary, "250.00")
+    await _assert_matches_raw(db, user_id)
+
+    # Backdated: lands before existing rows and must flow into every later cumulative row.
+    await _post(db, user_id, date(2025, 12, 31), cash, salary, "40.00")
+    await _post(db, user_id, date(2026, 2, 1), broker, equity, "100.00", currency="USD", fx_rate=Decimal("1.350000"))
+    await _assert_matches_raw(db, user_id)
+    await _assert_matches_raw(db, user_id, as_of=date(2026, 1, 31))
+
+    # Reconcile keeps the entry counted: no delta.
+    await db.execute(update(JournalEntry).where(JournalEntry.id == march).values(status=JournalEntryStatus.RECONCILED))
+    await db.commit()
+    await _assert_matches_raw(db, user_id)
+
+    february = await _post(db, user_id, date(2026, 2, 15), cash, salary, "75.00")
+    await void_journal_entry(db, february, "Duplicate", user_id)
+    await db.commit()
+    await _assert_matches_raw(db, user_id)
+    await _assert_matches_raw(db, user_id, as_of=date(2026, 2, 20))
+
+    window = await load_account_currency_totals(
+        db, user_id, account_ids=[cash.id], as_of=date(2026, 3, 31), since=date(2026, 1, 1)
+    )
+    assert [row.net_debit for row in window] == [Decimal("1250.00")]
+
+    nominal = await calculate_account_balances(db, [cash, broker, equity, salary], user_id)
+    assert nominal[cash.id] == (await _raw_net_debits(db, user_id))[(cash.id, "SGD")]
+    assert nominal[broker.id] == Decimal("100.00")
+    converted = await calculate_account_balances_in_base_currency(
+        db, [cash, broker, equity, salary], user_id, base_currency="SGD"
+    )
+    assert converted[broker.id] == Decimal("135.00")
+    assert converted[equity.id] == Decimal("1135.00")
+    assert await verify_accounting_equation(db, user_id, base_currency="SGD") is True
+
+    # A drifted row is reported, and the rebuild restores the raw sums.
+    await db.execute(
+        update(AccountDailyBalance)
+        .where(AccountDailyBalance.account_id == cash.id)
+        .where(AccountDailyBalance.balance_date == date(2026, 1, 10))
+        .values(debit_total=AccountDailyBalance.debit_total + 1)
+    )
+    await db.commit()
+    drift = await find_account_daily_balance_drift(db, user_id=user_id)
+    assert [(row.account_id, row.balance_date) for row in drift] == [(cash.id, date(2026, 1, 10))]
+
+    assert await rebuild_account_daily_balances(db, user_id=user_id) > 0
+    await db.commit()
+    await _assert_matches_raw(db, user_id)
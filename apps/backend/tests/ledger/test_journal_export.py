@@ -0,0 +1,87 @@
+"""AC-ledger.82: the streamed, resumable line-level journal export."""
+
+import csv
+import json
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from src.audit import JournalEntrySourceType
+from src.config import settings
+from src.ledger import (
+    JOURNAL_EXPORT_COLUMNS,
+    Account,
+    AccountType,
+    Direction,
+    JournalEntry,
+    JournalEntryStatus,
+    JournalLine,
+)
+
+
+async def _post(db, user_id, entry_date: date, debit: Account, credit: Account, amount: str) -> JournalEntry:
+    entry = JournalEntry(
+        user_id=user_id,
+        entry_date=entry_date,
+        memo=f"export {amount}",
+        source_type=JournalEntrySourceType.MANUAL,
+        status=JournalEntryStatus.POSTED,
+    )
+    db.add(entry)
+    await db.flush()
+    for account, direction in ((debit, Direction.DEBIT), (credit, Direction.CREDIT)):
+        db.add(
+            JournalLine(
+                journal_entry_id=entry.id,
+                account_id=account.id,
+                direction=direction,
+                amount=Decimal(amount),
+                currency="SGD",
+            )
+        )
+    await db.commit()
+    return entry
+
+
+async def test_AC_ledger_82_1_journal_export_streams_resumable_keyset_rows(client, db, test_user, monkeypatch) -> None:
+    """AC-ledger.82.1: keyset-ordered line rows in batches; filters; a cursor resumes after its row."""
+    user_id = test_user.id
+    cash = Account(user_id=user_id, name="Cash", type=AccountType.ASSET, currency="SGD")
+    equity = Account(user_id=user_id, name="Owner Equity", type=AccountType.EQUITY, currency="SGD")
+    food = Account(user_id=user_id, name="Food", type=AccountType.EXPENSE, currency="SGD")
+    db.add_all([cash, equity, food])
+    await db.commit()
+    await _post(db, user_id, date(2026, 3, 1), food, cash, "12.50")
+    await _post(db, user_id, date(2026, 1, 1), cash, equity, "1000.00")
+    await _post(db, user_id, date(2026, 2, 1), food, cash, "40.00")
+    monkeypatch.setattr(settings, "journal_export_batch_size", 2)
+
+    response = await client.get("/journal-entries/export", params={"format": "ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-disposition"] == "attachment; filename=journal-lines.ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 6
+    assert list(rows[0]) == list(JOURNAL_EXPORT_COLUMNS)
+    keys = [(row["entry_date"], row["entry_id"], row["line_id"]) for row in rows]
+    assert keys == sorted(keys)
+    assert rows[0]["entry_date"] == "2026-01-01"
+    assert rows[0]["amount"] == "1000.00"
+    assert rows[0]["entry_status"] == "posted"
+    assert rows[0]["source_type"] == "manual"
+    assert {row["direction"] for row in rows} == {"DEBIT", "CREDIT"}
+
+    resumed = await client.get("/journal-entries/export", params={"format": "ndjson", "after": rows[2]["cursor"]})
+    assert [json.loads(line) for line in resumed.text.splitlines()] == rows[3:]
+
+    filtered = await client.get(
+        "/journal-entries/export",
+        params={"account_id": str(food.id), "start_date": "2026-02-15"},
+    )
+    assert filtered.headers["content-type"].startswith("text/csv")
+    table = list(csv.reader(StringIO(filtered.text)))
+    assert table[0] == list(JOURNAL_EXPORT_COLUMNS)
+    assert [(line[0], line[9], line[12]) for line in table[1:]] == [("2026-03-01", "Food", "12.50")]
+
+    bad = await client.get("/journal-entries/export", params={"after": "not-a-cursor"})
+    assert bad.status_code == 400
@@ -1053,3 +1053,78 @@ class TestPairConfidenceEdgeCases:
         )
 
         assert breakdown["amount"] == 0.0
+
+
+class TestTransferPairAssignment:
+    """The pairing engine maximizes total confidence instead of pairing greedily."""
+
+    @staticmethod
+    def _leg(processing_id, direction, entry_date, amount="100.00", memo="Transfer to Bank B"):
+        from types import SimpleNamespace
+
+        from src.ledger.base.transfer_pairing import TransferLeg
+
+        line = SimpleNamespace(account_id=processing_id, direction=direction, amount=Decimal(amount), currency="SGD")
+        entry = SimpleNamespace(memo=memo, entry_date=entry_date, lines=[line])
+        return TransferLeg(entry=entry, currency="SGD", amount=line.amount)
+
+    def test_assignment_beats_greedy_and_has_no_entry_cap(self):
+        """AC-ledger.74.4 · Pairing maximizes total confidence and considers every leg (no 500-entry cap)."""
+        from datetime import timedelta
+
+        from src.ledger.base.transfer_pairing import pair_transfer_legs
+
+        processing_id = uuid4()
+        day = date(2024, 3, 4)
+        # out_a scores 90 with in_x and 89 with in_y; out_b only clears the threshold with in_x (87).
+        # Greedy in OUT order pairs out_a↔in_x and strands out_b; the assignment pairs both.
+        out_a = self._leg(processing_id, Direction.DEBIT, day)
+        out_b = self._leg(processing_id, Direction.DEBIT, day - timedelta(days=3))
+        in_x = self._leg(processing_id, Direction.CREDIT, day)
+        in_y = self._leg(processing_id, Direction.CREDIT, day + timedelta(days=1))
+
+        pairs = pair_transfer_legs(
+            [out_a, out_b], [in_x, in_y], processing_id, description_scorer=score_description, threshold=85
+        )
+
+        assert [(p.out_entry, p.in_entry, p.confidence) for p in pairs] == [
+            (out_a.entry, in_y.entry, 89),
+            (out_b.entry, in_x.entry, 87),
+        ]
+
+        outs = [
+            self._leg(processing_id, Direction.DEBIT, day + timedelta(days=i), amount=f"{100 + i}.00")
+            for i in range(600)
+        ]
+        ins = [
+            self._leg(processing_id, Direction.CREDIT, day + timedelta(days=i), amount=f"{100 + i}.00")
+            for i in reversed(range(600))
+        ]
+        pairs = pair_transfer_legs(outs, ins, processing_id, description_scorer=score_description, threshold=85)
+
+        assert len(pairs) == 600
+        assert all(p.in_entry.entry_date == p.out_entry.entry_date and p.confidence == 90 for p in pairs)
+
+    def test_oversized_component_pairs_greedily_without_the_assignment(self, monkeypatch):
+        """AC-reconciliation.performance.13 · A component above the cap skips the O(k³) assignment."""
+        from src.ledger.base import transfer_pairing
+
+        def no_assignment(*_args):
+            raise AssertionError("a component above the cap must not reach the assignment")
+
+        monkeypatch.setattr(transfer_pairing, "_max_weight_matching", no_assignment)
+        processing_id = uuid4()
+        day = date(2024, 1, 31)
+        # Identical standing orders: every OUT leg scores the same with every IN leg.
+        size = transfer_pairing._MAX_ASSIGNMENT_LEGS // 2 + 1
+        outs = [self._leg(processing_id, Direction.DEBIT, day) for _ in range(size)]
+        ins = [self._leg(processing_id, Direction.CREDIT, day) for _ in range(size)]
+
+        pairs = transfer_pairing.pair_transfer_legs(
+            outs, ins, processing_id, description_scorer=score_description, threshold=85
+        )
+
+        assert len(pairs) == size
+        assert len({id(p.out_entry) for p in pairs}) == len({id(p.in_entry) for p in pairs}) == size
+        # Ties go to the earlier OUT leg, then the earlier IN leg.
+        assert [(p.out_entry, p.in_entry) for p in pairs] == [(o.entry, i.entry) for o, i in zip(outs, ins)]
@@ -24,6 +24,7 @@ from src.portfolio import (
     calculate_money_weighted_return,
     calculate_time_weighted_return,
     calculate_xirr,
+    calculate_xirr_by_account,
 )
 
 
@@ -751,3 +752,81 @@ async def test_xirr_calculation_error_raised(db: AsyncSession, test_user, invest
 
     with pytest.raises(XIRRCalculationError):
         await calculate_xirr(db, test_user.id)
+
+
+async def test_AC_portfolio_performance_9_batched_fx_float_solver_and_per_account_xirr(
+    db: AsyncSession,
+    test_user,
+):
+    """AC-portfolio.performance.9: float64 root + Decimal acceptance; per-account XIRR in one call."""
+    from src.extraction.orm.layer2 import AtomicPosition
+    from src.portfolio.extension.performance import _xirr_float_root, _xirr_newton
+
+    # Ten years of monthly contributions: the seeded Decimal solve agrees with the unseeded one.
+    amounts = [Decimal("-500.00")] * 120 + [Decimal("95000.00")]
+    days = [month * 30 for month in range(120)] + [3650]
+    seed = _xirr_float_root(amounts, days)
+    assert seed is not None
+    seeded = _xirr_newton(amounts, days, guess=seed, max_iter=1, tolerance=Decimal("1e-6"))
+    unseeded = _xirr_newton(amounts, days, guess=Decimal("0.1"), max_iter=100, tolerance=Decimal("1e-6"))
+    assert abs(seeded - unseeded) < Decimal("1e-6")
+    assert _xirr_float_root([Decimal("100"), Decimal("200")], [0, 365]) is None
+
+    accounts = {}
+    for name, years, closing_value in (("Broker A", 1, "11000.00"), ("Broker B", 2, "12100.00")):
+        account = Account(user_id=test_user.id, name=name, type=AccountType.ASSET, currency="SGD")
+        db.add(account)
+        await db.flush()
+        start = date.today() - timedelta(days=365 * years)
+        symbol = f"XIRR{years}"
+        position = ManagedPosition(
+            user_id=test_user.id,
+            account_id=account.id,
+            asset_identifier=symbol,
+            quantity=Decimal("100"),
+            cost_basis=Decimal("10000.00"),
+            currency="SGD",
+            acquisition_date=start,
+            status=PositionStatus.ACTIVE,
+            cost_basis_method=CostBasisMethod.FIFO,
+        )
+        db.add(position)
+        await db.flush()
+        buy = _buy_transaction(
+            user_id=test_user.id,
+            transaction_date=start,
+            asset_identifier=symbol,
+            gross_amount=Decimal("10000.00"),
+            quantity=Decimal("100"),
+        )
+        buy.position_id = position.id
+        db.add(buy)
+        db.add(
+            AtomicPosition(
+                user_id=test_user.id,
+                snapshot_date=date.today(),
+                asset_identifier=symbol,
+                broker=name,
+                quantity=Decimal("100"),
+                market_value=Decimal(closing_value),
+                currency="SGD",
+                dedup_hash=f"ac_performance_9_{symbol}",
+                source_documents={},
+            )
+        )
+        accounts[name] = account
+    empty = Account(user_id=test_user.id, name="Broker C", type=AccountType.ASSET, currency="SGD")
+    db.add(empty)
+    await db.flush()
+
+    xirrs = await calculate_xirr_by_account(
+        db,
+        test_user.id,
+        [accounts["Broker A"].id, accounts["Broker B"].id, empty.id],
+    )
+
+    assert list(xirrs) == [accounts["Broker A"].id, accounts["Broker B"].id, empty.id]
+    assert abs(xirrs[accounts["Broker A"].id] - Decimal("10.00")) <= Decimal("0.01")
+    assert abs(xirrs[accounts["Broker B"].id] - Decimal("10.00")) <= Decimal("0.01")
+    assert xirrs[empty.id] is None
+    assert await calculate_xirr_by_account(db, test_user.id, []) == {}
@@ -4,6 +4,7 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.extraction.orm.layer2 import AtomicPosition
@@ -16,7 +17,7 @@ from src.portfolio import (
     PortfolioService,
 )
 from src.pricing import MarketDataOverride, PriceSource
-from src.pricing.orm.market_data import FxRate
+from src.pricing.orm.market_data import FxRate, StockPrice
 from src.schemas.portfolio import PriceUpdateRequest
 from tests.factories import UserFactory
 
@@ -1127,3 +1128,83 @@ async def test_get_latest_atomic_none(db, test_user, svc):
     """
     result = await svc._get_latest_atomic(db, "NOPE", test_user.id)
     assert result is None
+
+
+async def test_AC_portfolio_valuation_6_bulk_price_resolution_keeps_precedence(db, db_engine, test_user, svc, account):
+    """AC-portfolio.valuation.6: override > synced > snapshot, resolved in a constant number of queries."""
+    today = date.today()
+    yesterday, tomorrow = today - timedelta(days=1), today + timedelta(days=1)
+
+    def _position(identifier: str) -> ManagedPosition:
+        return ManagedPosition(
+            user_id=test_user.id,
+            account_id=account.id,
+            asset_identifier=identifier,
+            quantity=Decimal("10"),
+            cost_basis=Decimal("500.00"),
+            currency="SGD",
+            acquisition_date=today - timedelta(days=30),
+            status=PositionStatus.ACTIVE,
+            cost_basis_method=CostBasisMethod.FIFO,
+        )
+
+    def _snapshot(identifier: str) -> AtomicPosition:
+        return AtomicPosition(
+            user_id=test_user.id,
+            snapshot_date=today,
+            asset_identifier=identifier,
+            broker="Bulk Broker",
+            quantity=Decimal("10"),
+            market_value=Decimal("600.00"),
+            currency="SGD",
+            dedup_hash=f"bulk_{identifier}",
+            source_documents={},
+        )
+
+    db.add_all([_position(identifier) for identifier in ("OVR", "SYNC", "SNAP")])
+    db.add_all([_snapshot(identifier) for identifier in ("OVR", "SYNC", "SNAP")])
+    db.add_all(
+        [
+            MarketDataOverride(
+                user_id=test_user.id,
+                asset_identifier="OVR",
+                price_date=today,
+                price=Decimal("80.00"),
+                currency="SGD",
+                source=PriceSource.MANUAL,
+            ),
+            StockPrice(symbol="OVR", price=Decimal("70"), currency="SGD", price_date=today, source="test"),
+            StockPrice(symbol="SYNC", price=Decimal("65"), currency="SGD", price_date=yesterday, source="test"),
+            StockPrice(symbol="SYNC", price=Decimal("1"), currency="SGD", price_date=tomorrow, source="test"),
+        ]
+    )
+    await db.flush()
+
+    statements: list[str] = []
+
+    def capture_sql(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        if statement.lstrip().lower().startswith("select"):
+            statements.append(statement)
+
+    async def _count_reads() -> tuple[int, dict[str, Decimal]]:
+        statements.clear()
+        sqlalchemy_event.listen(db_engine.sync_engine, "before_cursor_execute", capture_sql)
+        try:
+            holdings = await svc.get_holdings(db, test_user.id)
+            await svc.calculate_unrealized_pnl(db, test_user.id)
+        finally:
+            sqlalchemy_event.remove(db_engine.sync_engine, "before_cursor_execute", capture_sql)
+        return len(statements), {holding.asset_identifier: holding.market_value for holding in holdings}
+
+    reads, values = await _count_reads()
+    # Override 80, synced 65 (the future quote is ignored), snapshot 600 / 10 = 60.
+    assert values == {"OVR": Decimal("800.00"), "SYNC": Decimal("650.00"), "SNAP": Decimal("600.00")}
+
+    more = [f"SNAP{index}" for index in range(5)]
+    db.add_all([_position(identifier) for identifier in more])
+    db.add_all([_snapshot(identifier) for identifier in more])
+    await db.flush()
+
+    more_reads, values = await _count_reads()
+    assert len(values) == 8
+    assert more_reads == reads
@@ -343,22 +343,12 @@ async def test_fetch_yahoo_fx_rate_success(monkeypatch):
         }
     }
 
-    class FakeClient:
-        def __init__(self, *, timeout, headers):
-            self.timeout = timeout
-            self.headers = headers
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json=payload)
 
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, _exc_type, _exc, _traceback):
-            return False
-
-        async def get(self, url, params):
-            calls.append((self.timeout, self.headers, url, params))
-            return httpx.Response(200, json=payload, request=httpx.Request("GET", url))
-
-    monkeypatch.setattr(market_data.httpx, "AsyncClient", FakeClient)
+    client = market_data._ProviderHttpClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(market_data._client, "_PROVIDER_CLIENT", client)
 
     result = await market_data._fetch_yahoo_fx_rate("HKD", "SGD", date(2025, 6, 30))
 
@@ -369,31 +359,26 @@ async def test_fetch_yahoo_fx_rate_success(monkeypatch):
         rate_date=date(2025, 6, 29),
         source="yahoo_finance",
     )
-    timeout, headers, url, params = calls[0]
-    assert timeout == settings.market_data_yahoo_timeout_seconds
-    assert headers["User-Agent"] == "finance-report-audit/1.0"
-    assert url == "https://query1.finance.yahoo.com/v8/finance/chart/HKDSGD=X"
-    assert params["interval"] == "1d"
+    request = calls[0]
+    assert request.extensions["timeout"]["read"] == settings.market_data_yahoo_timeout_seconds
+    assert request.headers["User-Agent"] == "finance-report-audit/1.0"
+    assert request.url.host == "query1.finance.yahoo.com"
+    assert request.url.path == "/v8/finance/chart/HKDSGD=X"
+    assert request.url.params["interval"] == "1d"
+    await client.aclose()
 
 
 async def test_fetch_yahoo_fx_rate_returns_none_on_http_error(monkeypatch):
     """[AC5.4.3] Yahoo FX fetch should convert HTTP errors into cache misses."""
 
-    class FailingClient:
-        def __init__(self, *, timeout, headers):
-            self.timeout = timeout
-            self.headers = headers
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("offline", request=request)
 
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, _exc_type, _exc, _traceback):
-            return False
-
-        async def get(self, url, params):
-            raise httpx.ConnectError("offline", request=httpx.Request("GET", url))
-
-    monkeypatch.setattr(market_data.httpx, "AsyncClient", FailingClient)
+    monkeypatch.setattr(
+        market_data._client,
+        "_PROVIDER_CLIENT",
+        market_data._ProviderHttpClient(transport=httpx.MockTransport(handler)),
+    )
 
     result = await market_data._fetch_yahoo_fx_rate("HKD", "SGD", date(2025, 6, 30))
 
@@ -0,0 +1,82 @@
+"""AC-pricing.marketdata.15: the shared, pooled, single-flight provider HTTP client."""
+
+import asyncio
+from collections import Counter
+from datetime import date
+
+import httpx
+import pytest
+
+from src.config import settings
+from src.pricing import close_market_data_client
+from src.pricing.extension import market_data
+
+
+class _CountingTransport(httpx.MockTransport):
+    closed = 0
+
+    async def aclose(self) -> None:
+        self.closed += 1
+
+
+def _chart(close: float | None, observed_date: date) -> dict[str, object]:
+    if close is None:
+        return {"chart": {"result": []}}
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"currency": "USD"},
+                    "timestamp": [market_data._date_to_epoch(observed_date)],
+                    "indicators": {"quote": [{"close": [close]}]},
+                }
+            ]
+        }
+    }
+
+
+async def test_AC_pricing_marketdata_15_provider_client_pools_bounds_and_coalesces(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """AC-pricing.marketdata.15: one pool for every call, per-host slots, one round trip per identical request."""
+    observed_date = date(2026, 1, 5)
+    closes = {"EURUSD=X": 1.1, "GBPUSD=X": 1.25, "JPYUSD=X": 0.0065, "USDSGD=X": 1.35}
+    requests: Counter[str] = Counter()
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        symbol = request.url.path.rsplit("/", 1)[-1]
+        requests[symbol] += 1
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=_chart(closes.get(symbol), observed_date))
+
+    transport = _CountingTransport(handler)
+    monkeypatch.setattr(market_data._client, "_PROVIDER_CLIENT", market_data._ProviderHttpClient(transport=transport))
+    monkeypatch.setattr(settings, "market_data_provider_connections_per_host", 2)
+    monkeypatch.setattr(settings, "market_data_fx_bridge_currency", "USD")
+
+    results = await asyncio.gather(
+        *(
+            market_data._fetch_yahoo_or_derived_fx_rate_series(base, "SGD", observed_date, observed_date)
+            for base in ("EUR", "GBP", "JPY")
+        )
+    )
+
+    assert [[observation.source for observation in series] for series in results] == [["yahoo_finance:bridge:USD"]] * 3
+    # Every pair bridges through USD/SGD: the three concurrent legs share one request.
+    assert requests["USDSGD=X"] == 1
+    assert requests["EURSGD=X"] == requests["SGDEUR=X"] == requests["EURUSD=X"] == 1
+    assert peak == 2
+
+    # Sequential repeats are new round trips on the same, still-open pool.
+    await market_data._fetch_yahoo_fx_rate_series("USD", "SGD", observed_date, observed_date)
+    assert requests["USDSGD=X"] == 2
+    assert transport.closed == 0
+
+    await close_market_data_client()
+    assert transport.closed == 1
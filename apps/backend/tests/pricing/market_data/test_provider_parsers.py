@@ -577,38 +577,18 @@ async def test_fetch_yahoo_or_derived_fx_rate_series_uses_inverse_bridge_and_fai
 async def test_provider_http_wrappers_parse_success_and_http_errors(monkeypatch: pytest.MonkeyPatch) -> None:
     """AC11.10.4: HTTP wrappers hand responses to parsers and convert provider errors to misses."""
 
-    class FakeResponse:
-        def __init__(self, *, payload: dict[str, object] | None = None, text: str = "", error: bool = False) -> None:
-            self._payload = payload or {}
-            self.text = text
-            self._error = error
-
-        def json(self) -> dict[str, object]:
-            return self._payload
-
-        def raise_for_status(self) -> None:
-            if self._error:
-                raise httpx.HTTPStatusError(
-                    "boom", request=httpx.Request("GET", "https://example.test"), response=httpx.Response(500)
-                )
-
-    class FakeAsyncClient:
-        response: FakeResponse
-
-        def __init__(self, **_kwargs: object) -> None:
-            pass
-
-        async def __aenter__(self) -> "FakeAsyncClient":
-            return self
-
-        async def __aexit__(self, *_args: object) -> None:
-            return None
+    reply: dict[str, object] = {}
 
-        async def get(self, _url: str, *, params: dict[str, str]) -> FakeResponse:
-            assert params["interval"] == "1d" if "interval" in params else params["i"] == "d"
-            return self.response
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        assert params["interval"] == "1d" if "interval" in params else params["i"] == "d"
+        return httpx.Response(**reply)
 
-    monkeypatch.setattr(market_data.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(
+        market_data._client,
+        "_PROVIDER_CLIENT",
+        market_data._ProviderHttpClient(transport=httpx.MockTransport(handler)),
+    )
     chart_payload = {
         "chart": {
             "result": [
@@ -622,15 +602,15 @@ async def test_provider_http_wrappers_parse_success_and_http_errors(monkeypatch:
     }
     csv_payload = "Date,Close\n2026-01-05,150.25\n"
 
-    FakeAsyncClient.response = FakeResponse(payload=chart_payload)
+    reply = {"status_code": 200, "json": chart_payload}
     assert await market_data._fetch_yahoo_fx_rate("USD", "SGD", date(2026, 1, 5)) is not None
     assert await market_data._fetch_yahoo_stock_price("AAPL", date(2026, 1, 5)) is not None
 
-    FakeAsyncClient.response = FakeResponse(text=csv_payload)
+    reply = {"status_code": 200, "text": csv_payload}
     assert await market_data._fetch_stooq_fx_rate("USD", "SGD", date(2026, 1, 5)) is not None
     assert await market_data._fetch_stooq_stock_price("AAPL", date(2026, 1, 5)) is not None
 
-    FakeAsyncClient.response = FakeResponse(error=True)
+    reply = {"status_code": 500}
     assert await market_data._fetch_yahoo_fx_rate("USD", "SGD", date(2026, 1, 5)) is None
     assert await market_data._fetch_yahoo_stock_price("AAPL", date(2026, 1, 5)) is None
     assert await market_data._fetch_stooq_fx_rate("USD", "SGD", date(2026, 1, 5)) is None
@@ -640,40 +620,18 @@ async def test_provider_http_wrappers_parse_success_and_http_errors(monkeypatch:
 async def test_provider_http_range_wrappers_parse_success_and_http_errors(monkeypatch: pytest.MonkeyPatch) -> None:
     """AC11.10.8: HTTP range wrappers parse bulk provider responses and report request failures."""
 
-    class FakeResponse:
-        def __init__(self, *, payload: dict[str, object] | None = None, text: str = "", error: bool = False) -> None:
-            self._payload = payload or {}
-            self.text = text
-            self._error = error
-
-        def json(self) -> dict[str, object]:
-            return self._payload
-
-        def raise_for_status(self) -> None:
-            if self._error:
-                raise httpx.HTTPStatusError(
-                    "boom",
-                    request=httpx.Request("GET", "https://example.test"),
-                    response=httpx.Response(500),
-                )
-
-    class FakeAsyncClient:
-        response: FakeResponse
-
-        def __init__(self, **_kwargs: object) -> None:
-            pass
-
-        async def __aenter__(self) -> "FakeAsyncClient":
-            return self
-
-        async def __aexit__(self, *_args: object) -> None:
-            return None
+    reply: dict[str, object] = {}
 
-        async def get(self, _url: str, *, params: dict[str, str]) -> FakeResponse:
-            assert params["interval"] == "1d" if "interval" in params else params["i"] == "d"
-            return self.response
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        assert params["interval"] == "1d" if "interval" in params else params["i"] == "d"
+        return httpx.Response(**reply)
 
-    monkeypatch.setattr(market_data.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(
+        market_data._client,
+        "_PROVIDER_CLIENT",
+        market_data._ProviderHttpClient(transport=httpx.MockTransport(handler)),
+    )
     chart_payload = {
         "chart": {
             "result": [
@@ -687,15 +645,15 @@ async def test_provider_http_range_wrappers_parse_success_and_http_errors(monkey
     }
     csv_payload = "Date,Close\n2026-01-05,150.25\n"
 
-    FakeAsyncClient.response = FakeResponse(payload=chart_payload)
+    reply = {"status_code": 200, "json": chart_payload}
     assert await market_data._fetch_yahoo_fx_rate_series("USD", "SGD", date(2026, 1, 5), date(2026, 1, 5))
     assert await market_data._fetch_yahoo_stock_price_series("AAPL", date(2026, 1, 5), date(2026, 1, 5))
 
-    FakeAsyncClient.response = FakeResponse(text=csv_payload)
+    reply = {"status_code": 200, "text": csv_payload}
     assert await market_data._fetch_stooq_fx_rate_series("USD", "SGD", date(2026, 1, 5), date(2026, 1, 5))
     assert await market_data._fetch_stooq_stock_price_series("AAPL", date(2026, 1, 5), date(2026, 1, 5))
 
-    FakeAsyncClient.response = FakeResponse(error=True)
+    reply = {"status_code": 500}
     assert await market_data._fetch_yahoo_fx_rate_series("USD", "SGD", date(2026, 1, 5), date(2026, 1, 5)) is None
     assert await market_data._fetch_yahoo_stock_price_series("AAPL", date(2026, 1, 5), date(2026, 1, 5)) is None
     assert await market_data._fetch_stooq_fx_rate_series("USD", "SGD", date(2026, 1, 5), date(2026, 1, 5)) is None
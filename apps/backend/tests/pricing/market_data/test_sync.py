@@ -1,14 +1,16 @@
 """AC11.10: Daily market data sync tests."""
 
+import asyncio
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import func, select
+from sqlalchemy import event as sqlalchemy_event, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.composition import observed_fx_pairs
+from src.config import settings
 from src.extraction.orm.layer2 import AtomicPosition
 from src.extraction.orm.layer3 import CostBasisMethod, ManagedPosition, PositionStatus
 from src.ledger import Account, AccountType, Direction, JournalEntry, JournalLine
@@ -1114,3 +1116,82 @@ async def test_market_data_status_falls_back_to_persisted_observation_date(
     assert len(status) == 1
     assert status[0].fresh is True
     assert status[0].last_observation_date == date(2026, 1, 10)
+
+
+async def test_AC_pricing_marketdata_14_sync_fetches_concurrently_and_bulk_inserts(
+    db: AsyncSession,
+    db_engine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """AC-pricing.marketdata.14: bounded concurrent fetches, two date queries, one insert per scope."""
+    db.add(
+        StockPrice(
+            symbol="SYM0",
+            price=Decimal("10.000000"),
+            currency="USD",
+            price_date=date(2026, 1, 5),
+            source="seed",
+        )
+    )
+    await db.commit()
+
+    in_flight = 0
+    peak = 0
+    fetched: list[tuple[str, date, date]] = []
+
+    async def fake_fetch(symbol: str, start_date: date, end_date: date) -> market_data.ValidatedMarketObservationSeries:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        fetched.append((symbol, start_date, end_date))
+        observations = [
+            market_data.StockPriceObservation(
+                symbol=symbol,
+                price=Decimal("10.000000"),
+                currency="USD",
+                price_date=requested_date,
+                source="test_primary",
+            )
+            for requested_date in market_data._iter_dates(start_date, end_date)
+            # SYM4's provider has no row for the last day.
+            if not (symbol == "SYM4" and requested_date == end_date)
+        ]
+        return market_data.ValidatedMarketObservationSeries(observations=observations)
+
+    monkeypatch.setattr(market_data._providers, "_fetch_validated_stock_price_series", fake_fetch)
+    monkeypatch.setattr(settings, "market_data_sync_concurrency", 2)
+
+    statements: list[str] = []
+
+    def capture_sql(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        statements.append(" ".join(statement.lower().split()))
+
+    sqlalchemy_event.listen(db_engine.sync_engine, "before_cursor_execute", capture_sql)
+    try:
+        result = await market_data.sync_stock_prices(
+            db,
+            symbols=[f"sym{index}" for index in range(6)],
+            start_date=date(2026, 1, 5),
+            end_date=date(2026, 1, 7),
+        )
+    finally:
+        sqlalchemy_event.remove(db_engine.sync_engine, "before_cursor_execute", capture_sql)
+
+    assert peak == 2
+    assert sorted(fetched)[0] == ("SYM0", date(2026, 1, 6), date(2026, 1, 7))
+    assert len(fetched) == 6
+    # SYM0 resumes after its stored day; the others fetch the whole range.
+    assert result.skipped == 0
+    assert result.requested == 17
+    assert result.inserted == 16
+    assert result.missing == 1
+    price_inserts = [statement for statement in statements if statement.startswith("insert into stock_prices")]
+    assert len(price_inserts) == 6
+    date_reads = [
+        statement for statement in statements if statement.startswith("select") and "from stock_prices" in statement
+    ]
+    assert len(date_reads) == 2
+    count = await db.scalar(select(func.count()).select_from(StockPrice).where(StockPrice.source == "test_primary"))
+    assert count == 16
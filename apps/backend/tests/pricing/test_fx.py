@@ -14,11 +14,14 @@ from decimal import Decimal
 
 import pytest
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.pricing import FxWarning, PrefetchedFxRates
 from src.pricing.base.errors import NoObservationError, PricingError
 from src.pricing.extension.fx import get_average_rate, get_exchange_rate
+from src.pricing.extension.fx_cache import fx_rate_cache
+from src.pricing.extension.fx_series import fx_series_store
+from src.pricing.extension.market_data import FxRateObservation, _persist_fx_rate
 from src.pricing.orm.market_data import FxRate
 
 pytestmark = pytest.mark.asyncio
@@ -288,3 +291,93 @@ async def test_AC_pricing_fx_2_prefetch_empty_pairs_is_a_noop(db: AsyncSession):
     await prefetched.prefetch(db, [])
 
     assert prefetched.get_rate("USD", "SGD", date(2026, 6, 15)) is None
+
+
+async def test_series_store_sees_writes_made_after_the_first_lookup(db: AsyncSession):
+    """The session's ``FxSeriesStore`` loads a pair once and is write-through:
+    a row added (even unflushed) or deleted later is visible to the next lookup."""
+    db.add(
+        FxRate(
+            base_currency="USD", quote_currency="SGD", rate=Decimal("1.30"), rate_date=date(2026, 1, 1), source="test"
+        )
+    )
+    await db.commit()
+    assert await get_exchange_rate(db, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.30")
+
+    newer = FxRate(
+        base_currency="USD", quote_currency="SGD", rate=Decimal("1.35"), rate_date=date(2026, 6, 1), source="test"
+    )
+    db.add(newer)
+    assert await get_exchange_rate(db, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.35")
+    assert await get_average_rate(db, "USD", "SGD", date(2026, 1, 1), date(2026, 6, 30)) == Decimal("1.325")
+
+    await db.delete(newer)
+    await db.flush()
+    assert await get_exchange_rate(db, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.30")
+
+
+async def test_AC_pricing_fx_2_prefetch_loads_each_pair_once(db: AsyncSession):
+    """AC-pricing.fx.2: prefetch groups its keys by pair — one range query per
+    pair — and answers every spot/average key (fallback warning included)
+    exactly as the per-key lookups would."""
+    for day, rate in ((1, "1.30"), (10, "1.40"), (20, "1.50")):
+        db.add(
+            FxRate(
+                base_currency="USD",
+                quote_currency="SGD",
+                rate=Decimal(rate),
+                rate_date=date(2026, 5, day),
+                source="test",
+            )
+        )
+    db.add(
+        FxRate(
+            base_currency="EUR", quote_currency="SGD", rate=Decimal("1.45"), rate_date=date(2026, 4, 1), source="test"
+        )
+    )
+    await db.commit()
+    keys = [
+        ("USD", "SGD", date(2026, 5, 15), None, None),
+        ("usd", "SGD", date(2026, 5, 31), date(2026, 5, 1), date(2026, 5, 31)),
+        ("USD", "SGD", date(2026, 6, 30), date(2026, 6, 1), date(2026, 6, 30)),
+        ("EUR", "SGD", date(2026, 5, 31), date(2026, 5, 1), date(2026, 5, 31)),
+    ]
+
+    warnings: list[FxWarning] = []
+    prefetched = PrefetchedFxRates(warnings)
+    await prefetched.prefetch(db, keys)
+
+    assert fx_series_store(db).loads == 2
+    assert [prefetched.get_rate(*key) for key in keys] == [
+        Decimal("1.40"),
+        Decimal("1.40"),
+        Decimal("1.50"),
+        Decimal("1.45"),
+    ]
+    assert [(w["base_currency"], w["start_date"]) for w in warnings] == [("USD", "2026-06-01"), ("EUR", "2026-05-01")]
+
+
+async def test_cached_rate_is_dropped_when_another_session_persists_a_newer_one(db: AsyncSession, db_engine):
+    """The process-wide cache never outlives a committed write: a rate cached
+    through one session is replaced once another session persists and commits
+    a newer observation, and an uncommitted one stays private to its writer."""
+    db.add(
+        FxRate(
+            base_currency="USD", quote_currency="SGD", rate=Decimal("1.30"), rate_date=date(2026, 1, 1), source="test"
+        )
+    )
+    await db.commit()
+    assert await get_exchange_rate(db, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.30")
+    assert await get_exchange_rate(db, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.30")
+    assert fx_rate_cache.hits == 1
+
+    writer_session = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with writer_session() as writer:
+        await _persist_fx_rate(writer, FxRateObservation("USD", "SGD", Decimal("1.35"), date(2026, 6, 1), "test"))
+        assert await get_exchange_rate(writer, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.35")
+        await db.commit()
+        assert await get_exchange_rate(db, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.30")
+        await writer.commit()
+
+    await db.commit()
+    assert await get_exchange_rate(db, "USD", "SGD", date(2026, 6, 15)) == Decimal("1.35")
@@ -0,0 +1,70 @@
+"""``FxRateCache`` — the process-wide resolved-FX-rate cache, tested in isolation.
+
+AC-pricing.fx.5: bounded LRU + TTL, invalidation by pair or wholesale, and a
+fill generation that discards a rate read before an invalidation landed —
+with a fake clock, no database.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.pricing.base.policy import ResolutionPolicy
+from src.pricing.extension.fx_cache import FxCacheKey, FxRateCache
+
+pytestmark = pytest.mark.no_db
+
+POLICY = ResolutionPolicy()
+
+
+def _key(base: str = "USD", day: int = 1) -> FxCacheKey:
+    return FxCacheKey(base, "SGD", date(2026, 6, day), None, POLICY)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_AC_pricing_fx_5_cache_is_bounded_expiring_and_generation_guarded():
+    """AC-pricing.fx.5: LRU eviction, TTL expiry, invalidation and stale fills."""
+    clock = _Clock()
+    cache = FxRateCache(max_entries=2, ttl_seconds=60, clock=clock)
+
+    cache.put(_key(day=1), Decimal("1.30"), cache.generation)
+    cache.put(_key(day=2), Decimal("1.31"), cache.generation)
+    assert cache.get(_key(day=1)) == Decimal("1.30")  # day 1 is now most recent
+    cache.put(_key(day=3), Decimal("1.32"), cache.generation)
+    assert cache.get(_key(day=2)) is None  # least recently used, evicted
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+    clock.now = 61
+    assert cache.get(_key(day=1)) is None
+    assert cache.evictions == 2
+
+    # A fill that read its rows before an invalidation is dropped.
+    generation = cache.generation
+    cache.invalidate("USD", "SGD")
+    cache.put(_key(day=4), Decimal("1.33"), generation)
+    assert cache.get(_key(day=4)) is None
+
+    cache.put(_key("USD", 5), Decimal("1.34"), cache.generation)
+    cache.put(_key("EUR", 5), Decimal("1.45"), cache.generation)
+    cache.invalidate("USD", "SGD")
+    assert cache.get(_key("USD", 5)) is None
+    assert cache.get(_key("EUR", 5)) == Decimal("1.45")
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_disabled_cache_stores_nothing():
+    cache = FxRateCache(max_entries=0, ttl_seconds=60)
+    cache.put(_key(), Decimal("1.30"), cache.generation)
+    assert cache.get(_key()) is None
+    assert (len(cache), cache.misses) == (0, 0)
@@ -0,0 +1,72 @@
+"""``FxSeries`` — the sorted-array FX index behind ``get_exchange_rate``.
+
+AC-pricing.fx.4: ``spot``/``average`` answer exactly what ``resolve()`` and a
+plain mean over the same crawled candidates would — plain in-memory
+``PriceObservation`` fixtures, no database.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.pricing.base.errors import NoObservationError
+from src.pricing.base.fx_series import FxSeries
+from src.pricing.base.observation import Authority, ObservationSource, PriceObservation
+from src.pricing.base.policy import ResolutionPolicy
+from src.pricing.base.subject import PriceableSubject
+
+pytestmark = pytest.mark.no_db
+
+SUBJECT = PriceableSubject.currency_pair("USD", "SGD")
+START = date(2026, 1, 1)
+
+
+def _candidates(rng: random.Random) -> list[PriceObservation]:
+    candidates = []
+    for offset in sorted(rng.sample(range(120), 40)):
+        candidates.append(
+            PriceObservation(
+                subject=SUBJECT,
+                value=Decimal(str(round(rng.uniform(1.2, 1.5), 6))),
+                as_of=START + timedelta(days=offset),
+                observed_at=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(days=offset),
+                source=ObservationSource.CRAWLER,
+                authority=Authority.CRAWLER,
+                currency="SGD",
+            )
+        )
+    return candidates
+
+
+def test_AC_pricing_fx_4_series_matches_resolve_and_mean():
+    """AC-pricing.fx.4: bisect lookups agree with ``resolve()`` and the mean."""
+    from src.pricing.extension.resolve import resolve
+
+    rng = random.Random(7)
+    candidates = _candidates(rng)
+    series = FxSeries.from_rows([(c.as_of, c.value) for c in candidates])
+    policies = [ResolutionPolicy(), ResolutionPolicy(max_age_days=3), ResolutionPolicy(min_authority=Authority.MANUAL)]
+
+    for offset in range(-5, 130):
+        as_of = START + timedelta(days=offset)
+        for policy in policies:
+            try:
+                expected = resolve(SUBJECT, as_of, policy, candidates).value
+            except NoObservationError:
+                expected = None
+            assert series.spot(as_of, policy) == expected
+        for width in (0, 6, 30):
+            start = as_of - timedelta(days=width)
+            in_range = [c.value for c in candidates if start <= c.as_of <= as_of]
+            assert series.average(start, as_of) == (sum(in_range) / len(in_range) if in_range else None)
+
+
+def test_empty_series_has_no_spot_or_average():
+    series = FxSeries.from_rows([])
+    assert len(series) == 0
+    assert series.spot(START) is None
+    assert series.average(START, START) is None
@@ -0,0 +1,170 @@
+"""Parity guard for the fixed-point batch scoring kernel.
+
+``score_amount`` / ``score_date`` / ``score_description`` / ``weighted_total``
+remain the reference oracle: every cell of ``score_block`` must reproduce the
+scalar total and breakdown exactly.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.reconciliation import score_amount, score_date, score_description, weighted_total
+from src.reconciliation.base.config import DEFAULT_CONFIG
+from src.reconciliation.extension.batch_scoring import CandidateBlock, TransactionBlock, score_block
+
+pytestmark = pytest.mark.no_db
+
+_WORDS = ["giro", "payment", "acme", "salary", "batch", "vendor", "fee", "rent"]
+
+
+def _amount(rng: random.Random) -> Decimal:
+    places = rng.choice([0, 1, 2, 2, 2, 4])
+    return Decimal(rng.randint(0, 500_000)).scaleb(-places) if places else Decimal(rng.randint(0, 5000))
+
+
+def _scalar(
+    txn_amount, txn_date, description, history, cand_amount, cand_dates, memo, business, is_multi, config, bonus
+):
+    scores = {
+        "amount": score_amount(txn_amount, cand_amount, config, is_multi=is_multi),
+        "date": max(score_date(txn_date, d, config) for d in cand_dates),
+        "description": score_description(description, memo),
+        "business": business,
+        "history": history,
+    }
+    if bonus:
+        scores["amount"] = min(100.0, scores["amount"] + bonus)
+    return weighted_total(scores, config), scores
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        DEFAULT_CONFIG,
+        replace(
+            DEFAULT_CONFIG,
+            weight_amount=Decimal("0.333"),
+            weight_date=Decimal("0.2"),
+            weight_description=Decimal("0.1675"),
+            amount_percent=Decimal("0.0125"),
+            amount_absolute=Decimal("0.005"),
+            date_days=10,
+        ),
+    ],
+)
+@pytest.mark.parametrize("bonus", [0.0, 5.0])
+def test_score_block_matches_scalar_oracle(config, bonus: float) -> None:
+    """AC-reconciliation.performance.5: the fixed-point kernel equals the scalar weighted_total bit for bit."""
+    rng = random.Random(42)
+    base = date(2024, 1, 20)
+    txns = TransactionBlock(
+        amounts=[_amount(rng) for _ in range(12)] + [Decimal("0"), Decimal("-25.00")],
+        dates=[base + timedelta(days=rng.randint(-20, 20)) for _ in range(14)],
+        descriptions=[" ".join(rng.sample(_WORDS, 2)) for _ in range(13)] + [None],
+        history=[rng.choice([0.0, 40.0, 80.0, 33.333, 12.5]) for _ in range(14)],
+    )
+    cands = CandidateBlock(
+        amounts=[_amount(rng) for _ in range(40)],
+        dates=[tuple(base + timedelta(days=rng.randint(-15, 15)) for _ in range(rng.randint(1, 3))) for _ in range(40)],
+        memos=[" ".join(rng.sample(_WORDS, 3)) for _ in range(40)],
+        business=[rng.choice([100.0, 90.0, 85.0, 75.0, 70.0, 50.0, 40.0]) for _ in range(40)],
+        is_multi=[rng.random() < 0.5 for _ in range(40)],
+    )
+    # Near-exact and band-edge amounts so every score_amount tier is exercised.
+    cands.amounts[:4] = [
+        txns.amounts[0],
+        txns.amounts[0] + Decimal("0.01"),
+        txns.amounts[1] + Decimal("4.99"),
+        Decimal("0"),
+    ]
+
+    matrix = score_block(txns, cands, config, amount_bonus=bonus)
+
+    for row in range(len(txns.amounts)):
+        for col in range(len(cands.amounts)):
+            total, scores = _scalar(
+                txns.amounts[row],
+                txns.dates[row],
+                txns.descriptions[row],
+                txns.history[row],
+                cands.amounts[col],
+                cands.dates[col],
+                cands.memos[col],
+                cands.business[col],
+                cands.is_multi[col],
+                config,
+                bonus,
+            )
+            assert matrix.totals[row][col] == total, (row, col)
+            assert matrix.breakdown(row, col) == scores
+
+
+def test_exact_half_totals_round_half_even() -> None:
+    # 0.40 * 91.25 + 0.25 * 100 + 0.10 * 30 == 64.5 exactly; half-up would give 65.
+    txns = TransactionBlock(amounts=[Decimal("100.00")], dates=[date(2024, 1, 1)], descriptions=["x"], history=[0.0])
+    cands = CandidateBlock(
+        amounts=[Decimal("108.75")],
+        dates=[(date(2024, 1, 1),)],
+        memos=["y"],
+        business=[30.0],
+        is_multi=[False],
+    )
+
+    matrix = score_block(txns, cands, DEFAULT_CONFIG)
+    total, _ = _scalar(
+        Decimal("100.00"),
+        date(2024, 1, 1),
+        "x",
+        0.0,
+        Decimal("108.75"),
+        (date(2024, 1, 1),),
+        "y",
+        30.0,
+        False,
+        DEFAULT_CONFIG,
+        0.0,
+    )
+
+    assert matrix.totals[0][0] == total == 64
+
+
+@pytest.mark.parametrize("min_total", [None, 60, 85])
+@pytest.mark.parametrize("beat_row_best", [False, True])
+def test_description_prefilter_only_approximates_unselectable_cells(min_total, beat_row_best: bool) -> None:
+    rng = random.Random(11)
+    base = date(2024, 3, 10)
+    txns = TransactionBlock(
+        amounts=[_amount(rng) for _ in range(8)],
+        dates=[base + timedelta(days=rng.randint(-5, 5)) for _ in range(8)],
+        descriptions=[" ".join(rng.sample(_WORDS, 2)) for _ in range(8)],
+        history=[rng.choice([0.0, 40.0, 80.0]) for _ in range(8)],
+    )
+    cands = CandidateBlock(
+        amounts=[rng.choice(txns.amounts) + Decimal(rng.randint(-300, 300)).scaleb(-2) for _ in range(30)],
+        dates=[(base + timedelta(days=rng.randint(-5, 5)),) for _ in range(30)],
+        memos=[" ".join(rng.sample(_WORDS, rng.randint(1, 4))) for _ in range(30)],
+        business=[rng.choice([100.0, 70.0, 40.0]) for _ in range(30)],
+        is_multi=[False] * 30,
+    )
+
+    exact = score_block(txns, cands, DEFAULT_CONFIG)
+    pruned = score_block(txns, cands, DEFAULT_CONFIG, min_total=min_total, beat_row_best=beat_row_best)
+
+    for row in range(len(txns.amounts)):
+        row_best = None
+        for col in range(len(cands.amounts)):
+            real = exact.totals[row][col]
+            floor = max(f for f in (min_total, row_best if beat_row_best else None, -1) if f is not None)
+            if real >= floor:
+                assert pruned.totals[row][col] == real
+                assert pruned.breakdown(row, col) == exact.breakdown(row, col)
+            else:
+                # Approximated cells still report a total below the threshold.
+                assert real <= pruned.totals[row][col] < floor
+            row_best = real if row_best is None else max(row_best, real)
@@ -0,0 +1,78 @@
+"""Parity guard for the shared reconciliation candidate index.
+
+``CandidateIndex`` replaces the per-transaction linear date filter plus
+``prune_candidates`` re-sort; both remain the oracle here.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.ledger import AccountType
+from src.reconciliation import prune_candidates
+from src.reconciliation.extension import reconciliation_audit as audit
+from src.reconciliation.extension.candidate_index import CandidateIndex
+
+pytestmark = pytest.mark.no_db
+
+
+def _entries(count: int, *, seed: int) -> list:
+    rng = random.Random(seed)
+    user_id = audit._stable_uuid("user:candidate-index")
+    bank = audit._account(user_id, "Index Bank", AccountType.ASSET)
+    expense = audit._account(user_id, "Index Expense", AccountType.EXPENSE)
+    return [
+        audit._entry(
+            user_id,
+            f"index-{seed}-{i}",
+            date(2024, 1, 1) + timedelta(days=rng.randint(0, 60)),
+            f"Index entry {i}",
+            str(Decimal(rng.randint(100, 400)) / Decimal(4)),
+            bank_account=bank,
+            other_account=expense,
+            direction="OUT",
+        )
+        for i in range(count)
+    ]
+
+
+def _linear_window(entries: list, txn_date: date, date_days: int) -> list:
+    d_start = txn_date - timedelta(days=date_days)
+    d_end = txn_date + timedelta(days=date_days)
+    return [entry for entry in entries if d_start <= entry.entry_date <= d_end]
+
+
+def test_window_matches_linear_filter_in_input_order() -> None:
+    entries = _entries(200, seed=1)
+    index = CandidateIndex(entries, date_days=7)
+
+    for offset in range(-10, 75):
+        txn_date = date(2024, 1, 1) + timedelta(days=offset)
+        assert index.window(txn_date) == _linear_window(entries, txn_date, 7)
+
+
+def test_pruned_matches_prune_candidates_including_ties() -> None:
+    """AC-reconciliation.performance.3: the shared index reproduces the linear window and prune order."""
+    # Quarter-unit amounts over a narrow range force many amount_diff ties at
+    # the prune boundary, which is where the outward walk could diverge.
+    entries = _entries(600, seed=2)
+    index = CandidateIndex(entries, date_days=7)
+    rng = random.Random(3)
+
+    for _ in range(200):
+        txn_date = date(2024, 1, 1) + timedelta(days=rng.randint(-5, 65))
+        target = Decimal(rng.randint(100, 400)) / Decimal(4)
+        expected = prune_candidates(_linear_window(entries, txn_date, 7), txn_date=txn_date, target_amount=target)
+        assert index.pruned(txn_date, target) == expected
+
+
+def test_empty_index_yields_no_candidates() -> None:
+    index = CandidateIndex([], date_days=7)
+
+    assert len(index) == 0
+    assert index.window(date(2024, 1, 1)) == []
+    assert index.pruned(date(2024, 1, 1), Decimal("10.00")) == []
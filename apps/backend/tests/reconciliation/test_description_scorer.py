@@ -0,0 +1,58 @@
+"""Parity guard for cached description fingerprints.
+
+``score_description`` / ``extract_merchant_tokens`` stay the oracle for
+``DescriptionScorer``; ``upper_bound`` must never undercut the real score.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src.reconciliation import extract_merchant_tokens, score_description
+from src.reconciliation.extension.scoring import DescriptionScorer
+
+pytestmark = pytest.mark.no_db
+
+_WORDS = ["GIRO", "PAYMENT", "acme", "Salary", "POS", "visa", "12", "ab", "rent-Q3", "Café", "fee", "***", "ref 991"]
+
+
+def _corpus(seed: int) -> list[str | None]:
+    rng = random.Random(seed)
+    texts: list[str | None] = [None, "", "   ", "!!!", "GIRO PAYMENT", "giro payment"]
+    texts += [" ".join(rng.choices(_WORDS, k=rng.randint(1, 5))) for _ in range(60)]
+    return texts
+
+
+def test_score_matches_score_description_and_bound_holds() -> None:
+    """AC-reconciliation.performance.6: cached scoring equals score_description and the bound holds."""
+    scorer = DescriptionScorer()
+    corpus = _corpus(7)
+
+    for a in corpus:
+        for b in corpus:
+            expected = score_description(a, b)
+            assert scorer.score(a, b) == expected, (a, b)
+            assert scorer.upper_bound(a, b) >= expected, (a, b)
+
+
+def test_merchant_tokens_match_extract_merchant_tokens() -> None:
+    scorer = DescriptionScorer()
+
+    for text in _corpus(8):
+        if text is None:
+            assert scorer.merchant_tokens(text) == []
+            continue
+        assert scorer.merchant_tokens(text) == extract_merchant_tokens(text)
+
+
+def test_fingerprint_is_built_once_per_text() -> None:
+    scorer = DescriptionScorer()
+
+    first = scorer.fingerprint("GIRO PAYMENT 123")
+    assert first is not None
+    assert scorer.fingerprint("GIRO PAYMENT 123") is first
+    assert first.normalized == "giro payment 123"
+    assert first.tokens == {"giro", "payment", "123"}
+    assert scorer.fingerprint("!!!") is None
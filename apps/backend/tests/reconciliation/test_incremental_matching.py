@@ -0,0 +1,325 @@
+"""Incremental reconciliation: watermark selection and the ``StatementPosted`` reactor."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import settings
+from src.extraction import (
+    STATEMENT_POSTED_EVENT_TYPE,
+    DocumentType,
+    StatementPosted,
+    StatementSummary,
+    UploadedDocument,
+)
+from src.extraction.orm.layer2 import AtomicTransaction, TransactionDirection
+from src.extraction.orm.statement_enums import BankStatementStatus
+from src.ledger import Account, AccountType
+from src.platform import SubscriberRegistry
+from src.reconciliation import MatchingScope, ReconciliationMatch, execute_matching, subscribe_incremental_matching
+from src.reconciliation.base.config import DEFAULT_CONFIG
+from src.reconciliation.extension import incremental
+from src.reconciliation.extension.repository import SqlReconciliationRepository
+from src.reconciliation.extension.watermark import (
+    MatchingWatermark,
+    load_matching_watermark,
+    store_matching_watermark,
+    touched_date_ranges,
+)
+from tests.ledger._ledger_helpers import create_valid_posted_entry
+
+INCREMENTAL = MatchingScope(mode="incremental")
+
+
+def _atomic(*, owner_id, txn_date: date, description: str, amount: str, doc_id: str | None = None) -> AtomicTransaction:
+    return AtomicTransaction(
+        user_id=owner_id,
+        txn_date=txn_date,
+        description=description,
+        amount=Decimal(amount),
+        direction=TransactionDirection.IN,
+        currency="SGD",
+        dedup_hash=uuid4().hex + uuid4().hex,
+        source_documents=[{"doc_id": doc_id or str(uuid4()), "doc_type": "bank_statement"}],
+    )
+
+
+def _event(user_id: object) -> StatementPosted:
+    return StatementPosted.create(
+        statement_id=uuid4(),
+        user_id=user_id,  # type: ignore[arg-type]
+        created_count=1,
+        occurred_at=datetime.now(UTC),
+    )
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.committed = False
+        self.rolled_back = False
+
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+
+@pytest.mark.no_db
+def test_touched_date_ranges_merge_overlapping_windows() -> None:
+    days = [date(2024, 1, 10), date(2024, 1, 1), date(2024, 1, 10), date(2024, 3, 1)]
+
+    assert touched_date_ranges(days, 3) == [
+        (date(2023, 12, 29), date(2024, 1, 4)),
+        (date(2024, 1, 7), date(2024, 1, 13)),
+        (date(2024, 2, 27), date(2024, 3, 4)),
+    ]
+    assert touched_date_ranges([date(2024, 1, 1), date(2024, 1, 7)], 3) == [(date(2023, 12, 29), date(2024, 1, 10))]
+    assert touched_date_ranges([], 3) == []
+
+
+@pytest.mark.no_db
+def test_statement_posted_payload_carries_dedup_key_and_owner() -> None:
+    user_id = uuid4()
+    event = _event(user_id)
+
+    assert event.event_type == STATEMENT_POSTED_EVENT_TYPE == "extraction.StatementPosted"
+    assert event.payload() == {
+        "aggregate_id": str(event.statement_id),
+        "statement_id": str(event.statement_id),
+        "user_id": str(user_id),
+        "created_count": 1,
+    }
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_malformed_payload_is_skipped_without_touching_the_session() -> None:
+    assert await incremental.run_incremental_matching(object(), _event("not-a-uuid")) is None  # type: ignore[arg-type]
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_handler_runs_committing_jobs_and_swallows_failures(monkeypatch) -> None:
+    calls: list[dict] = []
+
+    async def fake_currency(_db):
+        return "SGD"
+
+    async def fake_run_reconciliation_job(_db, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            raise RuntimeError("matching failed")
+        return []
+
+    monkeypatch.setattr(incremental, "get_effective_base_currency", fake_currency)
+    monkeypatch.setattr(incremental, "run_reconciliation_job", fake_run_reconciliation_job)
+    sessions: list[_FakeSession] = []
+
+    def session_factory() -> _FakeSession:
+        sessions.append(_FakeSession())
+        return sessions[-1]
+
+    registry = SubscriberRegistry()
+    subscribe_incremental_matching(registry, session_factory=session_factory)  # type: ignore[arg-type]
+    (handler,) = registry.handlers_for(STATEMENT_POSTED_EVENT_TYPE)
+    user_id = uuid4()
+
+    first = _event(user_id)
+    await handler(first)
+    await handler(_event(user_id))
+
+    # The job commits while holding the user's lock; the handler only rolls back a failed run.
+    assert [(call["scope"].mode, call["commit"]) for call in calls] == [("incremental", True), ("incremental", True)]
+    assert (calls[0]["user_id"], calls[0]["scope"].statement_id) == (user_id, first.statement_id)
+    assert (sessions[0].committed, sessions[0].rolled_back) == (False, False)
+    assert (sessions[1].committed, sessions[1].rolled_back) == (False, True)
+
+
+async def test_incremental_run_selects_only_transactions_whose_inputs_moved(
+    db: AsyncSession, test_user, monkeypatch
+) -> None:
+    """AC-reconciliation.performance.8: only transactions whose inputs moved are rescored."""
+    # No safety lag: every row here is committed before the mark is captured.
+    monkeypatch.setattr(settings, "reconciliation_watermark_lag_seconds", 0)
+    user_id = test_user.id
+    stale = _atomic(owner_id=user_id, txn_date=date(2024, 1, 5), description="Unknown wire", amount="321.00")
+    db.add(stale)
+    await db.commit()
+
+    # Full run: nothing to match, but the watermark is recorded.
+    assert await execute_matching(db, user_id=user_id, currency="SGD") == []
+    await db.commit()
+    assert await load_matching_watermark(db, user_id=user_id) is not None
+
+    await create_valid_posted_entry(
+        db, user_id, entry_date=date(2024, 3, 15), memo="Salary Payment", amount=Decimal("1000.00")
+    )
+    fresh = _atomic(owner_id=user_id, txn_date=date(2024, 3, 15), description="Salary Payment", amount="1000.00")
+    db.add(fresh)
+    await db.commit()
+
+    watermark = await load_matching_watermark(db, user_id=user_id)
+    assert watermark is not None
+    repo = SqlReconciliationRepository(db)
+    changed = await repo.list_changed_entry_dates(user_id=user_id, updated_after=watermark.entries_through)
+    selected = await repo.list_incremental_pending_transactions(
+        user_id,
+        created_after=watermark.transactions_through,
+        date_ranges=touched_date_ranges(changed, DEFAULT_CONFIG.date_days),
+        date_days=DEFAULT_CONFIG.date_days,
+    )
+    assert changed == [date(2024, 3, 15)]
+    assert [txn.id for txn in selected] == [fresh.id]
+
+    matches = await execute_matching(db, user_id=user_id, currency="SGD", scope=INCREMENTAL)
+    await db.commit()
+    assert [match.atomic_txn_id for match in matches] == [fresh.id]
+
+    # Redelivery: nothing moved since, so the rerun selects nothing.
+    assert await execute_matching(db, user_id=user_id, currency="SGD", scope=INCREMENTAL) == []
+
+    # A journal entry landing in the stale transaction's window brings it back.
+    await create_valid_posted_entry(
+        db, user_id, entry_date=date(2024, 1, 6), memo="Unknown wire", amount=Decimal("321.00")
+    )
+    await db.commit()
+    matches = await execute_matching(db, user_id=user_id, currency="SGD", scope=INCREMENTAL)
+    await db.commit()
+    assert [match.atomic_txn_id for match in matches] == [stale.id]
+
+    stored = (await db.execute(select(ReconciliationMatch.atomic_txn_id))).scalars().all()
+    assert set(stored) >= {fresh.id, stale.id}
+
+
+async def test_watermark_does_not_pass_rows_of_a_transaction_still_open(
+    db: AsyncSession, db_engine, test_user, monkeypatch
+) -> None:
+    """AC-reconciliation.performance.8: a row stamped before the mark but committed after it is still selected."""
+    monkeypatch.setattr(settings, "reconciliation_watermark_lag_seconds", 0)
+    user_id = test_user.id
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as slow:
+        # The slow import's transaction is open (and its row stamped) first ...
+        await slow.execute(select(1))
+        late = _atomic(owner_id=user_id, txn_date=date(2024, 2, 1), description="Slow import", amount="12.00")
+        slow.add(late)
+        await slow.flush()
+
+        # ... while another import commits a newer row and a run stores its mark.
+        db.add(_atomic(owner_id=user_id, txn_date=date(2024, 2, 2), description="Fast import", amount="34.00"))
+        await db.commit()
+        assert await execute_matching(db, user_id=user_id, currency="SGD") == []
+        await db.commit()
+
+        await slow.commit()
+
+    watermark = await load_matching_watermark(db, user_id=user_id)
+    assert watermark is not None
+    assert watermark.transactions_through is not None
+    assert watermark.transactions_through < late.created_at
+    selected = await SqlReconciliationRepository(db).list_incremental_pending_transactions(
+        user_id,
+        created_after=watermark.transactions_through,
+        date_ranges=[],
+        date_days=DEFAULT_CONFIG.date_days,
+    )
+    assert late.id in {txn.id for txn in selected}
+
+
+async def test_watermark_ignores_open_transactions_that_have_not_written(
+    db: AsyncSession, db_engine, test_user, monkeypatch
+) -> None:
+    """A pooled session idling in a read-only transaction does not hold the mark back."""
+    monkeypatch.setattr(settings, "reconciliation_watermark_lag_seconds", 0)
+    user_id = test_user.id
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as reader:
+        await reader.execute(select(1))
+
+        fresh = _atomic(owner_id=user_id, txn_date=date(2024, 2, 2), description="Fresh import", amount="34.00")
+        db.add(fresh)
+        await db.commit()
+        assert await execute_matching(db, user_id=user_id, currency="SGD") == []
+        await db.commit()
+
+        await reader.rollback()
+
+    watermark = await load_matching_watermark(db, user_id=user_id)
+    assert watermark is not None
+    assert watermark.transactions_through == fresh.created_at
+
+
+async def test_statement_posted_run_rescores_the_statement_whatever_the_watermark(db: AsyncSession, test_user) -> None:
+    """AC-reconciliation.performance.11: the posted statement's pending transactions are always rescored."""
+    user_id = test_user.id
+    account = Account(user_id=user_id, name=f"Posted {uuid4()}", type=AccountType.ASSET, currency="SGD")
+    doc = UploadedDocument(
+        id=uuid4(),
+        user_id=user_id,
+        file_path="statements/posted.pdf",
+        file_hash=uuid4().hex,
+        original_filename="posted.pdf",
+        document_type=DocumentType.BANK_STATEMENT,
+    )
+    db.add_all([account, doc])
+    await db.flush()
+    statement = StatementSummary(
+        id=uuid4(),
+        user_id=user_id,
+        uploaded_document_id=doc.id,
+        file_hash=doc.file_hash,
+        account_id=account.id,
+        institution="Test Bank",
+        currency="SGD",
+        period_start=date(2024, 4, 1),
+        period_end=date(2024, 4, 30),
+        opening_balance=Decimal("0.00"),
+        closing_balance=Decimal("0.00"),
+        status=BankStatementStatus.APPROVED,
+    )
+    db.add(statement)
+    await create_valid_posted_entry(
+        db, user_id, entry_date=date(2024, 4, 10), memo="Rent April", amount=Decimal("1500.00")
+    )
+    posted = _atomic(
+        owner_id=user_id, txn_date=date(2024, 4, 10), description="Rent April", amount="1500.00", doc_id=str(doc.id)
+    )
+    db.add(posted)
+    # A mark already past every row: the watermark alone selects nothing.
+    beyond = datetime(2999, 1, 1, tzinfo=UTC)
+    await store_matching_watermark(
+        db, user_id=user_id, watermark=MatchingWatermark(transactions_through=beyond, entries_through=beyond)
+    )
+    await db.commit()
+
+    repo = SqlReconciliationRepository(db)
+    assert (
+        await repo.list_incremental_pending_transactions(
+            user_id, created_after=beyond, date_ranges=[], date_days=DEFAULT_CONFIG.date_days
+        )
+        == []
+    )
+    matches = await execute_matching(
+        db, user_id=user_id, currency="SGD", scope=MatchingScope(mode="incremental", statement_id=statement.id)
+    )
+    await db.commit()
+    assert [match.atomic_txn_id for match in matches] == [posted.id]
+
+    # Another user's statement scopes nothing in; a matched transaction is no longer pending.
+    assert await repo.list_statement_pending_transactions(user_id=uuid4(), statement_id=statement.id) == []
+    assert await repo.list_statement_pending_transactions(user_id=user_id, statement_id=statement.id) == []
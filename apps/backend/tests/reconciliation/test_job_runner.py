@@ -0,0 +1,226 @@
+"""Reconciliation job runner: dataclass snapshots, pool scoring, per-user advisory locking."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.audit import JournalEntrySourceType
+from src.extraction.orm.layer2 import AtomicTransaction, TransactionDirection
+from src.ledger import AccountType
+from src.reconciliation import ReconciliationJobRunner, ReconciliationStatus, execute_matching
+from src.reconciliation.base.config import DEFAULT_CONFIG
+from src.reconciliation.extension import job_runner, reconciliation_audit as audit
+from src.reconciliation.extension.job_runner import (
+    MatchingEntry,
+    MatchingTransaction,
+    build_matching_snapshot,
+    score_matching_snapshot,
+)
+from src.reconciliation.extension.matching import MatchingInputs, _find_normal_candidates
+from src.reconciliation.extension.scoring import DescriptionScorer
+from tests.ledger._ledger_helpers import create_valid_posted_entry
+
+
+def _inputs() -> MatchingInputs:
+    user_id = audit._stable_uuid("user:job-runner")
+    bank = audit._account(user_id, "bank", AccountType.ASSET)
+    income = audit._account(user_id, "income", AccountType.INCOME)
+    expense = audit._account(user_id, "expense", AccountType.EXPENSE)
+    words = ["acme", "grab", "salary", "batch", "settlement", "coffee", "rent", "transfer", "giro"]
+    entries = []
+    for i in range(60):
+        direction = "IN" if i % 3 else "OUT"
+        entries.append(
+            audit._entry(
+                user_id,
+                f"e{i}",
+                date(2024, 1, 1) + timedelta(days=i % 20),
+                f"{words[i % len(words)]} {words[(i * 7) % len(words)]}",
+                f"{10 + (i % 13) * 5}.00",
+                bank_account=bank,
+                other_account=income if direction == "IN" else expense,
+                direction=direction,
+            )
+        )
+    transactions = [
+        audit._txn(
+            f"t{i}",
+            date(2024, 1, 1) + timedelta(days=(i * 3) % 20),
+            f"{words[(i * 5) % len(words)]} {words[i % len(words)]}",
+            f"{10 + (i % 11) * 5}.00",
+            "IN" if i % 2 else "OUT",
+        )
+        for i in range(30)
+    ]
+    return MatchingInputs(
+        transactions=transactions,
+        candidates=entries,
+        pattern_history={"acme": [Decimal("15.00")]},
+        pair_transfers=True,
+    )
+
+
+def _comparable(scored: job_runner.ScoredMatching) -> tuple:
+    return (
+        scored.transfer_txn_ids,
+        [(ids, c.journal_entry_ids, c.score, c.breakdown) for ids, c in scored.many_to_one],
+        [(txn_id, c.journal_entry_ids, c.score, c.breakdown) for txn_id, c in scored.normal],
+    )
+
+
+@pytest.mark.no_db
+def test_pool_scoring_matches_in_process_scoring() -> None:
+    """AC-reconciliation.performance.9: a spawned worker scores a pickled snapshot exactly as in-process scoring."""
+    inputs = _inputs()
+    snapshot = build_matching_snapshot(
+        inputs, base_currency="SGD", config=DEFAULT_CONFIG, descriptions=DescriptionScorer()
+    )
+    local = score_matching_snapshot(snapshot)
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        remote = pool.submit(score_matching_snapshot, snapshot).result()
+
+    assert _comparable(remote) == _comparable(local)
+    assert local.normal
+    # Ids line up with the caller's rows, not with the session-free copies.
+    assert {txn_id for txn_id, _candidate in local.normal} <= {txn.id for txn in inputs.transactions}
+    assert isinstance(snapshot.transactions[0], MatchingTransaction)
+    assert isinstance(snapshot.entries[0], MatchingEntry)
+    assert pickle.loads(pickle.dumps(snapshot)).entries[0].lines[0].account.type == AccountType.ASSET
+
+
+@pytest.mark.no_db
+def test_entries_by_id_breaks_ties_by_source_trust_like_the_phase() -> None:
+    user_id = audit._stable_uuid("user:job-runner-ties")
+    bank = audit._account(user_id, "bank", AccountType.ASSET)
+    income = audit._account(user_id, "income", AccountType.INCOME)
+    parsed, manual = (
+        audit._entry(
+            user_id,
+            ref,
+            date(2024, 1, 15),
+            "Salary Payment",
+            "1000.00",
+            bank_account=bank,
+            other_account=income,
+            direction="IN",
+        )
+        for ref in ("parsed", "manual")
+    )
+    parsed.source_type = JournalEntrySourceType.AUTO_PARSED
+    txn = audit._txn("salary", date(2024, 1, 15), "Salary Payment", "1000.00", "IN")
+    entries = [parsed, manual]
+
+    ((_, first_wins),) = _find_normal_candidates([txn], entries, {}, DEFAULT_CONFIG, base_currency="SGD")
+    ((_, trusted),) = _find_normal_candidates(
+        [txn], entries, {}, DEFAULT_CONFIG, base_currency="SGD", entries_by_id={str(e.id): e for e in entries}
+    )
+
+    assert first_wins.journal_entry_ids == [str(parsed.id)]
+    assert trusted.journal_entry_ids == [str(manual.id)]
+    assert trusted.score == first_wins.score
+    assert trusted.breakdown["source_type_winner_rank"] == 4.0
+
+
+async def test_runs_serialize_per_user_and_overlap_across_users(monkeypatch, db_engine) -> None:
+    active: dict[object, int] = {}
+    peak = {"same_user": 0, "overall": 0}
+    recorded: list[dict] = []
+
+    async def fake_load_matching_inputs(_db, *, user_id, **_kwargs):
+        active[user_id] = active.get(user_id, 0) + 1
+        peak["same_user"] = max(peak["same_user"], active[user_id])
+        peak["overall"] = max(peak["overall"], sum(active.values()))
+        await asyncio.sleep(0.05)
+        active[user_id] -= 1
+        return MatchingInputs(transactions=[], candidates=[], pattern_history={}, pair_transfers=True)
+
+    monkeypatch.setattr(job_runner, "load_matching_inputs", fake_load_matching_inputs)
+    monkeypatch.setattr(job_runner, "load_reconciliation_config", lambda: DEFAULT_CONFIG)
+    monkeypatch.setattr(job_runner, "record_reconciliation_job", lambda **kwargs: recorded.append(kwargs))
+
+    # Two runners stand in for two app instances: only the database lock is shared.
+    runners = [ReconciliationJobRunner(max_workers=1), ReconciliationJobRunner(max_workers=1)]
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    alice, bob = uuid4(), uuid4()
+
+    async def run(runner: ReconciliationJobRunner, user_id) -> list:
+        async with session_factory() as session:
+            return await runner.run(session, user_id=user_id, currency="SGD", repository=object(), commit=True)  # type: ignore[arg-type]
+
+    results = await asyncio.gather(run(runners[0], alice), run(runners[1], alice), run(runners[0], bob))
+
+    assert results == [[], [], []]
+    assert peak == {"same_user": 1, "overall": 2}
+    assert [entry["outcome"] for entry in recorded] == ["success"] * 3
+    assert max(entry["queued_ms"] for entry in recorded) > 0
+    with pytest.raises(ValueError):
+        ReconciliationJobRunner(max_workers=0)
+
+
+async def test_broken_pool_fails_the_run_and_is_replaced(monkeypatch, db: AsyncSession) -> None:
+    class DeadPool:
+        shut_down = False
+
+        def submit(self, *_args, **_kwargs):
+            raise BrokenProcessPool("a worker died")
+
+        def shutdown(self, *, wait: bool, cancel_futures: bool) -> None:
+            self.shut_down = True
+
+    inputs = _inputs()
+    monkeypatch.setattr(job_runner, "load_matching_inputs", AsyncMock(return_value=inputs))
+    monkeypatch.setattr(job_runner, "load_reconciliation_config", lambda: DEFAULT_CONFIG)
+    runner = ReconciliationJobRunner(max_workers=1)
+    dead = runner._executor = DeadPool()  # type: ignore[assignment]
+
+    with pytest.raises(BrokenProcessPool):
+        await runner.run(db, user_id=uuid4(), currency="SGD", repository=object())  # type: ignore[arg-type]
+
+    assert dead.shut_down
+    assert runner._executor is None
+    try:
+        assert isinstance(runner._pool(), ProcessPoolExecutor)
+    finally:
+        runner.shutdown()
+
+
+async def test_runner_scores_in_the_pool_and_commits_its_matches(db: AsyncSession, test_user) -> None:
+    user_id = test_user.id
+    await create_valid_posted_entry(
+        db, user_id, entry_date=date(2024, 3, 15), memo="Salary Payment", amount=Decimal("1000.00")
+    )
+    txn = AtomicTransaction(
+        user_id=user_id,
+        txn_date=date(2024, 3, 15),
+        description="Salary Payment",
+        amount=Decimal("1000.00"),
+        direction=TransactionDirection.IN,
+        currency="SGD",
+        dedup_hash=uuid4().hex + uuid4().hex,
+        source_documents=[{"doc_id": str(uuid4()), "doc_type": "bank_statement"}],
+    )
+    db.add(txn)
+    await db.commit()
+
+    runner = ReconciliationJobRunner(max_workers=1)
+    try:
+        matches = await runner.run(db, user_id=user_id, currency="SGD", commit=True)
+    finally:
+        runner.shutdown()
+
+    assert [match.atomic_txn_id for match in matches] == [txn.id]
+    assert matches[0].status in (ReconciliationStatus.AUTO_ACCEPTED, ReconciliationStatus.PENDING_REVIEW)
+    # The committed match leaves nothing pending for an in-session rerun.
+    assert await execute_matching(db, user_id=user_id, currency="SGD") == []
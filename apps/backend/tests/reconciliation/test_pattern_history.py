@@ -0,0 +1,190 @@
+"""Batched pattern-history loading and the merchant-token projection."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.extraction.orm.layer2 import AtomicTransaction, TransactionDirection
+from src.reconciliation import DEFAULT_CONFIG, ReconciliationMatch, ReconciliationStatus, score_pattern
+from src.reconciliation.extension.pattern_history import (
+    _merge_history,
+    _parse_history,
+    _query_accepted_history,
+    load_pattern_history,
+    record_accepted_merchant_patterns,
+)
+from src.reconciliation.extension.scoring import PATTERN_HISTORY_LIMIT, pattern_score_from_history
+from src.reconciliation.orm.reconciliation import ReconciliationMerchantPattern
+
+
+def _txn(user_id, description: str, amount: str, txn_date: date) -> AtomicTransaction:
+    return AtomicTransaction(
+        user_id=user_id,
+        txn_date=txn_date,
+        description=description,
+        amount=Decimal(amount),
+        direction=TransactionDirection.OUT,
+        currency="SGD",
+        dedup_hash=uuid4().hex,
+        source_documents=[],
+    )
+
+
+async def _accepted(db: AsyncSession, user_id, description: str, amount: str, txn_date: date) -> AtomicTransaction:
+    txn = _txn(user_id, description, amount, txn_date)
+    db.add(txn)
+    await db.flush()
+    db.add(
+        ReconciliationMatch(
+            atomic_txn_id=txn.id,
+            journal_entry_ids=[],
+            match_score=90,
+            score_breakdown={"amount": 100.0},
+            status=ReconciliationStatus.ACCEPTED,
+        )
+    )
+    await db.flush()
+    return txn
+
+
+async def test_load_pattern_history_matches_score_pattern_and_seeds_projection(db: AsyncSession, test_user) -> None:
+    """AC-reconciliation.performance.7: batched history equals score_pattern and seeds the projection."""
+    user_id = test_user.id
+    today = date(2024, 5, 1)
+    await _accepted(db, user_id, "Coffee Shop", "10.00", today)
+    await _accepted(db, user_id, "GIRO Grocer Mart", "55.20", today - timedelta(days=3))
+    # Pending (not accepted) history never counts.
+    db.add(_txn(user_id, "Grocer Mart", "99.00", today))
+    await db.commit()
+
+    probes = [
+        _txn(user_id, "COFFEE SHOP 1123", "10.05", today),
+        _txn(user_id, "grocer mart", "70.00", today),
+        _txn(user_id, "Unknown Vendor", "5.00", today),
+    ]
+    history = await load_pattern_history(db, user_id=user_id, tokens={"coffee", "grocer", "unknown"})
+
+    assert history == {"coffee": [Decimal("10.00")], "grocer": [Decimal("55.20")], "unknown": []}
+    for txn, token in zip(probes, ["coffee", "grocer", "unknown"], strict=True):
+        expected = await score_pattern(db, txn, DEFAULT_CONFIG, user_id=user_id)
+        assert pattern_score_from_history(history[token], txn, DEFAULT_CONFIG) == expected
+
+    rows = {
+        row.token: row
+        for row in (
+            await db.execute(
+                select(ReconciliationMerchantPattern).where(ReconciliationMerchantPattern.user_id == user_id)
+            )
+        ).scalars()
+    }
+    assert set(rows) == {"coffee", "grocer", "unknown"}
+    assert rows["grocer"].last_matched_on == today - timedelta(days=3)
+    assert rows["unknown"].history == []
+
+
+async def test_accept_folds_into_projected_tokens_and_next_load_reads_projection(db: AsyncSession, test_user) -> None:
+    user_id = test_user.id
+    today = date(2024, 6, 1)
+    await _accepted(db, user_id, "Coffee Shop", "10.00", today - timedelta(days=10))
+    await db.commit()
+    await load_pattern_history(db, user_id=user_id, tokens={"coffee", "bakery"})
+
+    accepted = await _accepted(db, user_id, "POS COFFEE BEAN", "12.00", today)
+    await record_accepted_merchant_patterns(db, user_id=user_id, transactions=[accepted])
+    await db.commit()
+
+    history = await load_pattern_history(db, user_id=user_id, tokens={"coffee", "bakery"})
+    assert history == {"coffee": [Decimal("12.00"), Decimal("10.00")], "bakery": []}
+    row = await db.get(ReconciliationMerchantPattern, (user_id, "coffee"))
+    assert row is not None
+    assert row.last_matched_on == today
+
+
+async def test_undecodable_projection_row_is_reseeded(db: AsyncSession, test_user) -> None:
+    user_id = test_user.id
+    await _accepted(db, user_id, "Coffee Shop", "10.00", date(2024, 7, 1))
+    db.add(ReconciliationMerchantPattern(user_id=user_id, token="coffee", history={"anonymized": True}))
+    await db.commit()
+
+    history = await load_pattern_history(db, user_id=user_id, tokens=["coffee"])
+
+    assert history == {"coffee": [Decimal("10.00")]}
+
+
+def test_merge_history_keeps_newest_first_up_to_limit() -> None:
+    start = date(2024, 1, 1)
+    existing = [(uuid4(), start + timedelta(days=day), Decimal(day)) for day in range(PATTERN_HISTORY_LIMIT, 0, -1)]
+    oldest = (uuid4(), start, Decimal("0"))
+    newest = (uuid4(), start + timedelta(days=30), Decimal("30"))
+
+    merged = _merge_history(existing, [oldest, newest])
+
+    assert len(merged) == PATTERN_HISTORY_LIMIT
+    assert merged[0] == newest
+    assert oldest not in merged
+
+
+def test_merge_history_folds_a_transaction_in_once() -> None:
+    txn_id = uuid4()
+    existing = [(txn_id, date(2024, 1, 2), Decimal("5.00"))]
+
+    merged = _merge_history(existing, [(txn_id, date(2024, 1, 2), Decimal("5.00"))])
+
+    assert merged == existing
+
+
+async def test_projection_matches_match_history_after_delete_supersede_and_reject(db: AsyncSession, test_user) -> None:
+    """AC-reconciliation.performance.12: the projection stays equal to the accepted-match history."""
+    user_id = test_user.id
+    today = date(2024, 8, 1)
+    deleted = await _accepted(db, user_id, "Coffee Shop", "10.00", today - timedelta(days=9))
+    superseded = await _accepted(db, user_id, "Coffee Shop", "11.00", today - timedelta(days=6))
+    kept = await _accepted(db, user_id, "Coffee Shop", "12.00", today - timedelta(days=3))
+    pending = _txn(user_id, "Coffee Shop", "13.00", today)
+    db.add(pending)
+    await db.flush()
+    pending_match = ReconciliationMatch(
+        atomic_txn_id=pending.id,
+        journal_entry_ids=[],
+        match_score=70,
+        score_breakdown={"amount": 100.0},
+        status=ReconciliationStatus.PENDING_REVIEW,
+    )
+    db.add(pending_match)
+    await db.commit()
+    await load_pattern_history(db, user_id=user_id, tokens=["coffee"])
+
+    # Folding an already projected transaction again keeps one entry.
+    await record_accepted_merchant_patterns(db, user_id=user_id, transactions=[kept, kept])
+    # A statement reparse deletes a transaction (its matches cascade) ...
+    await db.delete(deleted)
+    # ... a rematch supersedes an accepted match with one pending review ...
+    old_match = (
+        await db.execute(select(ReconciliationMatch).where(ReconciliationMatch.atomic_txn_id == superseded.id))
+    ).scalar_one()
+    old_match.status = ReconciliationStatus.SUPERSEDED
+    db.add(
+        ReconciliationMatch(
+            atomic_txn_id=superseded.id,
+            journal_entry_ids=[],
+            match_score=60,
+            score_breakdown={"amount": 100.0},
+            status=ReconciliationStatus.PENDING_REVIEW,
+        )
+    )
+    # ... and the pending match is rejected.
+    pending_match.status = ReconciliationStatus.REJECTED
+    await db.commit()
+
+    history = await load_pattern_history(db, user_id=user_id, tokens=["coffee"])
+    expected = await _query_accepted_history(db, user_id=user_id, tokens=["coffee"])
+    row = await db.get(ReconciliationMerchantPattern, (user_id, "coffee"))
+    assert row is not None
+    await db.refresh(row)
+
+    assert expected == {"coffee": [(kept.id, kept.txn_date, Decimal("12.00"))]}
+    assert _parse_history(row.history) == expected["coffee"]
+    assert history == {"coffee": [Decimal("12.00")]}
@@ -6,8 +6,13 @@ These tests cover the Critical and High priority gaps identified in the test aud
 - #13 Batch 10,000 transactions performance (< 10s)
 - #14 Concurrent matching without race condition
 - #15 Cross-month matching enhanced
+- #16 Transfer pairing over 20,000 Processing legs (< 1s)
+- #17 Transfer pairing over one dense component of identical transfers (< 1s)
 """
 
+import gc
+import math
+import random
 import time
 from datetime import date, timedelta
 from decimal import Decimal
@@ -19,11 +24,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.audit import JournalEntrySourceType
 from src.extraction.orm.layer2 import AtomicTransaction, TransactionDirection
 from src.ledger import Account, AccountType, Direction, JournalEntry, JournalEntryStatus, JournalLine
+from src.ledger.base.transfer_pairing import TransferLeg, pair_transfer_legs
 from src.reconciliation import (
     DEFAULT_CONFIG,
     calculate_match_score,
     execute_matching,
 )
+from src.reconciliation.extension.scoring import DescriptionScorer
 
 
 def _make_atomic(
@@ -340,10 +347,11 @@ class TestBatchPerformance:
         matches = await execute_matching(db, user_id=user_id, currency="SGD")
         elapsed = time.perf_counter() - start_time
 
-        # Performance threshold: 5s for 100 transactions
+        # Performance threshold: 2s for 100 transactions (was 5s before the shared
+        # CandidateIndex replaced the per-transaction linear candidate scans).
         # This test is marked @slow and skipped by default in CI/local.
         # Run explicitly with: pytest -m slow
-        assert elapsed < 5.0, f"Matching {txn_count} transactions took {elapsed:.2f}s (> 5s limit)"
+        assert elapsed < 2.0, f"Matching {txn_count} transactions took {elapsed:.2f}s (> 2s limit)"
 
         # Should have processed all transactions
         assert len(matches) >= 0  # May or may not have matches
@@ -525,3 +533,133 @@ class TestCrossMonthMatching:
 
         # 3-day gap has some penalty, but amount match + similar description should compensate
         assert score_result.score >= 65, f"Weekend gap (3 days) match should score >= 65, got {score_result.score}"
+
+
+# =============================================================================
+# High #16: Transfer Pairing Over 20,000 Processing Legs
+# =============================================================================
+
+
+def _processing_leg(
+    processing_id: UUID, *, entry_date: date, memo: str, amount: Decimal, direction: Direction
+) -> TransferLeg:
+    """A transient Transfer OUT (Processing debited) or IN (Processing credited) entry."""
+    entry = JournalEntry(
+        id=uuid4(),
+        entry_date=entry_date,
+        memo=memo,
+        source_type=JournalEntrySourceType.SYSTEM,
+        status=JournalEntryStatus.POSTED,
+    )
+    entry.lines = [JournalLine(account_id=processing_id, direction=direction, amount=amount, currency="SGD")]
+    return TransferLeg(entry=entry, currency="SGD", amount=amount)
+
+
+@pytest.mark.perf
+class TestTransferPairingPerformance:
+    """The transfer-pairing engine stays sub-second without an entry cap (wall-clock, so ``perf`` only)."""
+
+    @pytest.mark.no_db
+    def test_pairing_20000_legs_is_sub_second(self):
+        """AC-reconciliation.performance.10: 20,000 Processing legs pair in under a second, none dropped."""
+        rng = random.Random(20_000)
+        processing_id = uuid4()
+        banks = ["DBS", "OCBC", "UOB", "HSBC", "Citi", "Maybank"]
+
+        def amount() -> Decimal:
+            # Log-uniform 5 .. 50,000, so amount bands hold realistic neighbours.
+            return Decimal(str(round(math.exp(rng.uniform(math.log(5), math.log(50_000))), 2)))
+
+        out_legs: list[TransferLeg] = []
+        in_legs: list[TransferLeg] = []
+        for i in range(10_000):
+            day = date(2023, 1, 1) + timedelta(days=rng.randrange(730))
+            memo = f"Transfer to {rng.choice(banks)} ref {i}"
+            sent = amount()
+            out_legs.append(
+                _processing_leg(processing_id, entry_date=day, memo=memo, amount=sent, direction=Direction.DEBIT)
+            )
+            if i % 5:
+                # The other side of a real transfer: same amount, 0-3 days later.
+                in_legs.append(
+                    _processing_leg(
+                        processing_id,
+                        entry_date=day + timedelta(days=rng.randint(0, 3)),
+                        memo=memo,
+                        amount=sent,
+                        direction=Direction.CREDIT,
+                    )
+                )
+            else:
+                in_legs.append(
+                    _processing_leg(
+                        processing_id,
+                        entry_date=date(2023, 1, 1) + timedelta(days=rng.randrange(730)),
+                        memo=f"Fund transfer ref {i}",
+                        amount=amount(),
+                        direction=Direction.CREDIT,
+                    )
+                )
+
+        descriptions = DescriptionScorer()
+        gc.collect()  # time the pairing, not a collection of the fixture's garbage
+        start = time.perf_counter()
+        pairs = pair_transfer_legs(
+            out_legs,
+            in_legs,
+            processing_id,
+            description_scorer=descriptions.score,
+            description_bound=descriptions.upper_bound,
+            threshold=85,
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0, f"Pairing 20,000 legs took {elapsed:.2f}s"
+        # Every genuine transfer past the old 500-entry cap is paired with its own leg.
+        assert len(pairs) == 8_000
+        assert all(pair.out_entry.memo == pair.in_entry.memo for pair in pairs)
+        assert len({id(pair.in_entry) for pair in pairs}) == len(pairs)
+
+    @pytest.mark.no_db
+    def test_dense_component_of_identical_transfers_is_sub_second(self):
+        """One component of 400 identical legs pairs in under a second."""
+        processing_id = uuid4()
+        day = date(2024, 1, 31)
+        out_legs = [
+            _processing_leg(
+                processing_id,
+                entry_date=day,
+                memo="Standing order",
+                amount=Decimal("250.00"),
+                direction=Direction.DEBIT,
+            )
+            for _ in range(200)
+        ]
+        in_legs = [
+            _processing_leg(
+                processing_id,
+                entry_date=day,
+                memo="Standing order",
+                amount=Decimal("250.00"),
+                direction=Direction.CREDIT,
+            )
+            for _ in range(200)
+        ]
+
+        descriptions = DescriptionScorer()
+        gc.collect()
+        start = time.perf_counter()
+        pairs = pair_transfer_legs(
+            out_legs,
+            in_legs,
+            processing_id,
+            description_scorer=descriptions.score,
+            description_bound=descriptions.upper_bound,
+            threshold=85,
+        )
+        elapsed = time.perf_counter() - start
+
+        # Past the assignment cap the component is paired greedily: still every leg, once.
+        assert elapsed < 1.0, f"Pairing one 400-leg component took {elapsed:.2f}s"
+        assert len(pairs) == 200
+        assert len({id(pair.out_entry) for pair in pairs}) == len({id(pair.in_entry) for pair in pairs}) == 200
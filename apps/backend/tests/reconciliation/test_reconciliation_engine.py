@@ -2,6 +2,7 @@
 
 from datetime import date
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 from uuid import UUID, uuid4
 
@@ -43,6 +44,7 @@ from src.reconciliation import (
     submit_reviewed_disposition,
 )
 from src.reconciliation.extension.anomaly import detect_anomalies
+from src.reconciliation.extension.candidate_index import CandidateIndex
 from src.reconciliation.extension.review_queue import accept_match, batch_accept, reject_match
 from tests.ledger._ledger_helpers import create_valid_posted_entry
 
@@ -922,12 +924,17 @@ async def test_execute_matching_reuses_pattern_score_cache(db: AsyncSession, tes
         patch("src.reconciliation.extension.phases.transfer_detection.detect_transfer_pattern", return_value=False),
         patch("src.reconciliation.extension.matching.find_transfer_pairs", new_callable=AsyncMock, return_value=[]),
         patch(
-            "src.reconciliation.extension.matching.score_pattern", new_callable=AsyncMock, return_value=0.0
-        ) as mock_score,
+            "src.reconciliation.extension.matching.load_pattern_history",
+            new_callable=AsyncMock,
+            return_value={"acme": []},
+        ) as mock_load,
+        patch("src.reconciliation.extension.matching.pattern_score_from_history", return_value=0.0) as mock_score,
     ):
         await execute_matching(db, user_id=user_id, currency="SGD")
 
-    assert mock_score.await_count == 1
+    assert mock_load.await_count == 1
+    assert mock_load.await_args.kwargs["tokens"] == {"acme"}
+    assert mock_score.call_count == 1
 
 
 async def test_execute_matching_many_to_one_skips_unbalanced_entry(db: AsyncSession, test_user) -> None:
@@ -965,8 +972,7 @@ async def test_execute_matching_many_to_one_skips_unbalanced_entry(db: AsyncSess
 
     with (
         patch("src.reconciliation.extension.matching.find_transfer_pairs", new_callable=AsyncMock, return_value=[]),
-        patch("src.reconciliation.extension.phases.many_to_one.is_entry_balanced", return_value=False),
-        patch("src.reconciliation.extension.phases.normal_matching.is_entry_balanced", return_value=False),
+        patch("src.reconciliation.extension.subset_sum.is_entry_balanced", return_value=False),
     ):
         matches = await execute_matching(db, user_id=user_id, currency="SGD")
 
@@ -1005,13 +1011,14 @@ async def test_execute_matching_many_to_one_keeps_same_existing_match(db: AsyncS
 
     with (
         patch("src.reconciliation.extension.phases.many_to_one.build_many_to_one_groups", return_value=[[txn, txn]]),
-        patch("src.reconciliation.extension.phases.many_to_one.prune_candidates", return_value=[object()]),
-        patch("src.reconciliation.extension.phases.many_to_one.is_entry_balanced", return_value=True),
+        patch.object(CandidateIndex, "pruned", return_value=[object()]),
+        patch("src.reconciliation.extension.subset_sum.is_entry_balanced", return_value=True),
+        patch("src.reconciliation.extension.phases.many_to_one._candidate_block"),
         patch(
-            "src.reconciliation.extension.phases.many_to_one.score_group",
-            new_callable=AsyncMock,
-            return_value=candidate,
+            "src.reconciliation.extension.phases.many_to_one.score_block",
+            return_value=SimpleNamespace(totals=[[candidate.score]]),
         ),
+        patch("src.reconciliation.extension.phases.many_to_one._matrix_candidate", return_value=candidate),
         patch("src.reconciliation.extension.phases.transfer_detection.detect_transfer_pattern", return_value=False),
         patch("src.reconciliation.extension.matching.find_transfer_pairs", new_callable=AsyncMock, return_value=[]),
         patch("src.reconciliation.extension.matching.entry_total_amount", return_value=Decimal("100.00")),
@@ -1052,14 +1059,14 @@ async def test_execute_matching_many_to_one_layer2_sets_atomic_txn_id(db: AsyncS
         patch("src.reconciliation.extension.phases.transfer_detection.detect_transfer_pattern", return_value=False),
         patch("src.reconciliation.extension.matching.find_transfer_pairs", new_callable=AsyncMock, return_value=[]),
         patch("src.reconciliation.extension.phases.many_to_one.build_many_to_one_groups", return_value=[[txn]]),
-        patch("src.reconciliation.extension.phases.many_to_one.prune_candidates", return_value=[entry]),
-        patch("src.reconciliation.extension.phases.many_to_one.is_entry_balanced", return_value=True),
+        patch.object(CandidateIndex, "pruned", return_value=[entry]),
+        patch("src.reconciliation.extension.subset_sum.is_entry_balanced", return_value=True),
         patch(
-            "src.reconciliation.extension.phases.many_to_one.score_group",
-            new_callable=AsyncMock,
-            return_value=candidate,
+            "src.reconciliation.extension.phases.many_to_one.score_block",
+            return_value=SimpleNamespace(totals=[[candidate.score]]),
         ),
-        patch("src.reconciliation.extension.matching.score_pattern", new_callable=AsyncMock, return_value=0.0),
+        patch("src.reconciliation.extension.phases.many_to_one._matrix_candidate", return_value=candidate),
+        patch("src.reconciliation.extension.matching.load_pattern_history", new_callable=AsyncMock, return_value={}),
     ):
         matches = await execute_matching(db, user_id=user_id, currency="SGD")
 
@@ -1111,21 +1118,17 @@ async def test_execute_matching_three_entry_combination_skips_unbalanced_member(
         patch("src.reconciliation.extension.phases.transfer_detection.detect_transfer_pattern", return_value=False),
         patch("src.reconciliation.extension.matching.find_transfer_pairs", new_callable=AsyncMock, return_value=[]),
         patch("src.reconciliation.extension.phases.many_to_one.build_many_to_one_groups", return_value=[]),
+        patch.object(CandidateIndex, "pruned", return_value=[entry_a, entry_b, entry_c]),
         patch(
-            "src.reconciliation.extension.phases.normal_matching.prune_candidates",
-            return_value=[entry_a, entry_b, entry_c],
-        ),
-        patch(
-            "src.reconciliation.extension.phases.normal_matching.is_entry_balanced",
+            "src.reconciliation.extension.subset_sum.is_entry_balanced",
             side_effect=lambda e, *, base_currency: e.id != entry_c.id,
         ),
         patch(
-            "src.reconciliation.extension.phases.normal_matching.score_single",
-            new_callable=AsyncMock,
+            "src.reconciliation.extension.phases.normal_matching._matrix_candidate",
             return_value=low_score,
         ),
         patch("src.reconciliation.extension.matching.entry_total_amount", return_value=Decimal("1.00")),
-        patch("src.reconciliation.extension.matching.score_pattern", new_callable=AsyncMock, return_value=0.0),
+        patch("src.reconciliation.extension.matching.load_pattern_history", new_callable=AsyncMock, return_value={}),
     ):
         matches = await execute_matching(db, user_id=user_id, currency="SGD")
 
@@ -1184,8 +1187,7 @@ async def test_execute_matching_layer2_atomic_match_and_transfer_pair_logging(
         patch("src.reconciliation.extension.phases.transfer_detection.detect_transfer_pattern", return_value=False),
         patch("src.reconciliation.extension.phases.many_to_one.build_many_to_one_groups", return_value=[]),
         patch(
-            "src.reconciliation.extension.phases.normal_matching.score_single",
-            new_callable=AsyncMock,
+            "src.reconciliation.extension.phases.normal_matching._matrix_candidate",
             return_value=candidate,
         ),
         patch(
@@ -1193,7 +1195,7 @@ async def test_execute_matching_layer2_atomic_match_and_transfer_pair_logging(
             new_callable=AsyncMock,
             return_value=[("a", "b")],
         ),
-        patch("src.reconciliation.extension.matching.score_pattern", new_callable=AsyncMock, return_value=0.0),
+        patch("src.reconciliation.extension.matching.load_pattern_history", new_callable=AsyncMock, return_value={}),
     ):
         matches = await execute_matching(db, user_id=user_id, currency="SGD")
 
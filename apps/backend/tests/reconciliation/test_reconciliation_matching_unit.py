@@ -756,8 +756,9 @@ async def test_execute_matching_skip_unbalanced(db: AsyncSession, test_user):
         amount=Decimal("100.00"),
     )
 
+    # Single and multi-entry candidates both pass the subset-sum engine's balance check.
     with patch(
-        "src.reconciliation.extension.phases.normal_matching.is_entry_balanced",
+        "src.reconciliation.extension.subset_sum.is_entry_balanced",
         return_value=False,
     ):
         matches = await execute_matching(db, user_id=user_id, currency="SGD")
@@ -226,7 +226,7 @@ async def test_run_reconciliation_maps_processing_currency_conflict_to_400(
     async def fail_matching(*_args, **_kwargs):
         raise ValidationError("Processing account currency is SGD; got transfer currency USD")
 
-    monkeypatch.setattr(reconciliation_router, "execute_matching", fail_matching)
+    monkeypatch.setattr(reconciliation_router, "run_reconciliation_job", fail_matching)
 
     with pytest.raises(HTTPException) as exc_info:
         await reconciliation_router.run_reconciliation(ReconciliationRunRequest(), db=db, user_id=test_user.id)
@@ -242,7 +242,7 @@ async def test_run_reconciliation_filters_unmatched(
     await _create_transaction(db, statement, amount=Decimal("5.00"), status=None)
     await db.commit()
 
-    async def fake_execute_matching(*_args, **_kwargs):
+    async def fake_run_reconciliation_job(*_args, **_kwargs):
         return [
             ReconciliationMatch(
                 atomic_txn_id=uuid4(),
@@ -260,7 +260,7 @@ async def test_run_reconciliation_filters_unmatched(
             ),
         ]
 
-    monkeypatch.setattr(reconciliation_router, "execute_matching", fake_execute_matching)
+    monkeypatch.setattr(reconciliation_router, "run_reconciliation_job", fake_run_reconciliation_job)
 
     response = await reconciliation_router.run_reconciliation(
         ReconciliationRunRequest(statement_id=statement.id), db=db, user_id=test_user.id
@@ -281,7 +281,7 @@ async def test_AC10_8_3_reconciliation_run_audit_checkpoints(
     await _create_transaction(db, statement, amount=Decimal("5.00"), status=None)
     await db.commit()
 
-    async def fake_execute_matching(*_args, **_kwargs):
+    async def fake_run_reconciliation_job(*_args, **_kwargs):
         return [
             ReconciliationMatch(
                 atomic_txn_id=uuid4(),
@@ -294,7 +294,7 @@ async def test_AC10_8_3_reconciliation_run_audit_checkpoints(
 
     mock_info = MagicMock()
     mock_exception = MagicMock()
-    monkeypatch.setattr(reconciliation_router, "execute_matching", fake_execute_matching)
+    monkeypatch.setattr(reconciliation_router, "run_reconciliation_job", fake_run_reconciliation_job)
     monkeypatch.setattr(reconciliation_router.logger, "info", mock_info)
     monkeypatch.setattr(reconciliation_router.logger, "exception", mock_exception)
 
@@ -325,10 +325,10 @@ async def test_AC10_8_3_reconciliation_run_audit_checkpoints(
     assert completed["pending_review"] == 0
     assert completed["unmatched"] == 1
 
-    async def fail_execute_matching(*_args, **_kwargs):
+    async def fail_run_reconciliation_job(*_args, **_kwargs):
         raise RuntimeError("matching score service unavailable with raw details omitted")
 
-    monkeypatch.setattr(reconciliation_router, "execute_matching", fail_execute_matching)
+    monkeypatch.setattr(reconciliation_router, "run_reconciliation_job", fail_run_reconciliation_job)
 
     with pytest.raises(RuntimeError, match="matching score service unavailable"):
         await reconciliation_router.run_reconciliation(
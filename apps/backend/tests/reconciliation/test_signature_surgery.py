@@ -98,6 +98,7 @@ def test_matching_phases_return_created_matches() -> None:
         inspect.getsource(function)
         for function in (
             matching.execute_matching,
+            matching.load_matching_inputs,
             run_many_to_one_phase,
             run_normal_matching_phase,
         )
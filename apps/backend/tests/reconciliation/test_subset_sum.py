@@ -0,0 +1,94 @@
+"""Parity guard for the multi-entry subset-sum engine.
+
+The ``itertools.combinations`` + ``_within_combination_tolerance`` loop the
+engine replaced stays here as the oracle: same tuples, same order.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date
+from decimal import Decimal
+from itertools import combinations
+
+import pytest
+
+from src.ledger import AccountType
+from src.reconciliation import _within_combination_tolerance, entry_bank_side_amount, is_entry_balanced
+from src.reconciliation.base.config import DEFAULT_CONFIG
+from src.reconciliation.extension import reconciliation_audit as audit
+from src.reconciliation.extension.subset_sum import SubsetSumEngine
+
+pytestmark = pytest.mark.no_db
+
+
+def _candidates(count: int, *, seed: int) -> list:
+    rng = random.Random(seed)
+    user_id = audit._stable_uuid("user:subset-sum")
+    bank = audit._account(user_id, "Subset Bank", AccountType.ASSET)
+    expense = audit._account(user_id, "Subset Expense", AccountType.EXPENSE)
+    entries = []
+    for i in range(count):
+        entry = audit._entry(
+            user_id,
+            f"subset-{seed}-{i}",
+            date(2024, 5, 6),
+            f"Subset entry {i}",
+            str(Decimal(rng.randint(4, 120)) / Decimal(4)),
+            bank_account=bank,
+            other_account=expense,
+            direction="OUT",
+        )
+        if i % 7 == 0:
+            # Unbalanced: the engine must skip it exactly like the old guard did.
+            entry.lines[1].amount += Decimal("1.00")
+        entries.append(entry)
+    return entries
+
+
+def _oracle(candidates: list, txn, size: int) -> list[tuple]:
+    found = []
+    for combo in combinations(candidates, size):
+        if not all(is_entry_balanced(entry, base_currency="SGD") for entry in combo):
+            continue
+        combined = sum((entry_bank_side_amount(entry, txn.direction) for entry in combo), Decimal("0"))
+        if _within_combination_tolerance(combined, txn, DEFAULT_CONFIG):
+            found.append(combo)
+    return found
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("size", [2, 3])
+def test_combinations_match_itertools_oracle_in_order(seed: int, size: int) -> None:
+    """AC-reconciliation.performance.4: bisect-driven combinations equal the itertools scan, in order."""
+    candidates = _candidates(30, seed=seed)
+    engine = SubsetSumEngine(base_currency="SGD")
+    rng = random.Random(seed * 10 + size)
+
+    for _ in range(10):
+        txn = audit._txn("subset-target", date(2024, 5, 6), "Subset target", str(rng.randint(5, 60)), "OUT")
+        band = max(txn.amount * DEFAULT_CONFIG.amount_percent, DEFAULT_CONFIG.amount_absolute) * 2
+
+        actual = engine.combinations(candidates, txn.direction, target=txn.amount, band=band, size=size)
+
+        assert actual == _oracle(candidates, txn, size)
+
+
+def test_band_edges_are_inclusive() -> None:
+    candidates = _candidates(4, seed=9)[1:]
+    engine = SubsetSumEngine(base_currency="SGD")
+    amounts = [engine.bank_side_amount(entry, "OUT") for entry in candidates]
+    target = amounts[0] + amounts[1]
+
+    on_edge = engine.combinations(candidates, "OUT", target=target + Decimal("0.20"), band=Decimal("0.20"), size=2)
+    past_edge = engine.combinations(candidates, "OUT", target=target + Decimal("0.21"), band=Decimal("0.20"), size=2)
+
+    assert (candidates[0], candidates[1]) in on_edge
+    assert (candidates[0], candidates[1]) not in past_edge
+
+
+def test_fewer_balanced_candidates_than_size_yields_nothing() -> None:
+    engine = SubsetSumEngine(base_currency="SGD")
+    candidates = _candidates(1, seed=4)
+
+    assert engine.combinations(candidates, "OUT", target=Decimal("10"), band=Decimal("100"), size=2) == []
@@ -7,9 +7,13 @@ from uuid import uuid4
 import pytest
 
 from src.audit import JournalEntrySourceType
+from src.extraction.orm.layer2 import AssetType, AtomicPosition
+from src.extraction.orm.layer3 import CostBasisMethod, ManagedPosition, PositionStatus
 from src.ledger import Account, AccountType, Direction, JournalEntry, JournalEntryStatus, JournalLine
+from src.pricing import ManualValuationComponentType, ManualValuationLiquidityClass
+from src.pricing.orm.manual_valuation import ManualValuationSnapshot
 from src.pricing.orm.market_data import FxRate
-from src.reporting import ReportError, get_net_worth_timeseries
+from src.reporting import ReportError, generate_balance_sheet, get_net_worth_timeseries
 
 
 async def _account(db, user_id, name: str, account_type: AccountType, currency: str = "SGD") -> Account:
@@ -133,7 +137,7 @@ async def test_net_worth_timeseries_daily_cap(db):
         await get_net_worth_timeseries(
             db,
             uuid4(),
-            start_date=date(2025, 1, 1),
+            start_date=date(2016, 1, 1),
             end_date=date(2026, 2, 1),
             granularity="daily",
             currency="SGD",
@@ -166,22 +170,25 @@ async def test_net_worth_timeseries_rejects_unknown_granularity(db):
         )
 
 
-async def test_net_worth_timeseries_monthly_uses_period_end_and_normalizes_currency(db, monkeypatch):
+async def test_net_worth_timeseries_monthly_uses_period_end_and_normalizes_currency(db, test_user):
     """AC5.7.1: Monthly net worth points use month-end dates and normalized currency."""
-    user_id = uuid4()
-    captured_dates: list[date] = []
-    captured_currencies: list[str] = []
-
-    async def fake_balance_sheet(db, requested_user_id, *, as_of_date, currency, include_trust_signals=True):
-        assert requested_user_id == user_id
-        captured_dates.append(as_of_date)
-        captured_currencies.append(currency)
-        return {
-            "total_assets": Decimal("1000.00"),
-            "total_liabilities": Decimal("250.00"),
-        }
-
-    monkeypatch.setattr("src.reporting.extension.net_worth.generate_balance_sheet", fake_balance_sheet)
+    user_id = test_user.id
+    cash = await _account(db, user_id, "Cash", AccountType.ASSET, currency="USD")
+    card = await _account(db, user_id, "Card", AccountType.LIABILITY, currency="USD")
+    equity = await _account(db, user_id, "Owner Equity", AccountType.EQUITY, currency="USD")
+    await _entry(
+        db,
+        user_id,
+        date(2026, 1, 10),
+        [(cash, Direction.DEBIT, Decimal("1000.00"), "USD"), (equity, Direction.CREDIT, Decimal("1000.00"), "USD")],
+    )
+    await _entry(
+        db,
+        user_id,
+        date(2026, 2, 1),
+        [(equity, Direction.DEBIT, Decimal("250.00"), "USD"), (card, Direction.CREDIT, Decimal("250.00"), "USD")],
+    )
+    await db.commit()
 
     report = await get_net_worth_timeseries(
         db,
@@ -192,11 +199,137 @@ async def test_net_worth_timeseries_monthly_uses_period_end_and_normalizes_curre
         currency="usd",
     )
 
-    assert captured_dates == [date(2026, 1, 31), date(2026, 2, 2)]
-    assert captured_currencies == ["USD", "USD"]
     assert report["currency"] == "USD"
-    assert [point["date"] for point in report["points"]] == captured_dates
-    assert [point["net_worth"] for point in report["points"]] == [Decimal("750.00"), Decimal("750.00")]
+    assert [point["date"] for point in report["points"]] == [date(2026, 1, 31), date(2026, 2, 2)]
+    assert [point["currency"] for point in report["points"]] == ["USD", "USD"]
+    assert [point["net_worth"] for point in report["points"]] == [Decimal("1000.00"), Decimal("750.00")]
+
+
+async def test_AC_reporting_net_worth_timeseries_3_matches_per_point_balance_sheet(db, test_user):
+    """AC-reporting.net-worth-timeseries.3: the one-pass engine equals a balance sheet per point.
+
+    Covers opening balances before the window, FX moving mid-window, an
+    unconvertible currency, a liability, an inactive account, a portfolio
+    position stepping in with its market-value adjustment and a manual
+    valuation snapshot.
+    """
+    user_id = test_user.id
+    cash = await _account(db, user_id, "Cash", AccountType.ASSET)
+    usd_cash = await _account(db, user_id, "USD Cash", AccountType.ASSET, currency="USD")
+    brokerage = await _account(db, user_id, "Brokerage", AccountType.ASSET)
+    card = await _account(db, user_id, "Card", AccountType.LIABILITY)
+    closed = await _account(db, user_id, "Closed", AccountType.ASSET)
+    equity = await _account(db, user_id, "Owner Equity", AccountType.EQUITY)
+    expense = await _account(db, user_id, "Dining", AccountType.EXPENSE)
+    await _entry(
+        db,
+        user_id,
+        date(2025, 12, 20),
+        [(cash, Direction.DEBIT, Decimal("2000.00"), "SGD"), (equity, Direction.CREDIT, Decimal("2000.00"), "SGD")],
+    )
+    await _entry(
+        db,
+        user_id,
+        date(2025, 12, 28),
+        [(closed, Direction.DEBIT, Decimal("70.00"), "SGD"), (equity, Direction.CREDIT, Decimal("70.00"), "SGD")],
+    )
+    closed.is_active = False
+    await _entry(
+        db,
+        user_id,
+        date(2026, 1, 2),
+        [(usd_cash, Direction.DEBIT, Decimal("100.00"), "USD"), (equity, Direction.CREDIT, Decimal("100.00"), "USD")],
+    )
+    await _entry(
+        db,
+        user_id,
+        date(2026, 1, 3),
+        [(usd_cash, Direction.DEBIT, Decimal("40.00"), "JPY"), (equity, Direction.CREDIT, Decimal("40.00"), "JPY")],
+    )
+    await _entry(
+        db,
+        user_id,
+        date(2026, 1, 4),
+        [(expense, Direction.DEBIT, Decimal("55.55"), "SGD"), (card, Direction.CREDIT, Decimal("55.55"), "SGD")],
+    )
+    await _entry(
+        db,
+        user_id,
+        date(2026, 1, 5),
+        [(brokerage, Direction.DEBIT, Decimal("500.00"), "SGD"), (cash, Direction.CREDIT, Decimal("500.00"), "SGD")],
+    )
+    db.add_all(
+        [
+            FxRate(
+                base_currency="USD",
+                quote_currency="SGD",
+                rate_date=date(2025, 12, 1),
+                rate=Decimal("1.333333"),
+                source="test",
+            ),
+            FxRate(
+                base_currency="USD",
+                quote_currency="SGD",
+                rate_date=date(2026, 1, 4),
+                rate=Decimal("1.351111"),
+                source="test",
+            ),
+            ManagedPosition(
+                user_id=user_id,
+                account_id=brokerage.id,
+                asset_identifier="AAPL",
+                quantity=Decimal("5"),
+                cost_basis=Decimal("500.00"),
+                currency="SGD",
+                acquisition_date=date(2026, 1, 5),
+                status=PositionStatus.ACTIVE,
+                cost_basis_method=CostBasisMethod.FIFO,
+            ),
+            AtomicPosition(
+                user_id=user_id,
+                snapshot_date=date(2026, 1, 6),
+                asset_identifier="AAPL",
+                broker=brokerage.name,
+                quantity=Decimal("5"),
+                market_value=Decimal("612.34"),
+                currency="SGD",
+                asset_type=AssetType.STOCK,
+                sector="Technology",
+                geography="US",
+                dedup_hash=f"position-{uuid4().hex}",
+                source_documents={},
+            ),
+            ManualValuationSnapshot(
+                user_id=user_id,
+                component_type=ManualValuationComponentType.PROPERTY_VALUE,
+                liquidity_class=ManualValuationLiquidityClass.ILLIQUID,
+                value=Decimal("900.00"),
+                currency="USD",
+                as_of_date=date(2026, 1, 3),
+                source="Flat",
+            ),
+        ]
+    )
+    await db.commit()
+
+    report = await get_net_worth_timeseries(
+        db,
+        user_id,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 8),
+        granularity="daily",
+        currency="SGD",
+    )
+
+    for point in report["points"]:
+        balance_sheet = await generate_balance_sheet(
+            db, user_id, as_of_date=point["date"], currency="SGD", include_trust_signals=False
+        )
+        assert (point["total_assets"], point["total_liabilities"]) == (
+            balance_sheet["total_assets"],
+            balance_sheet["total_liabilities"],
+        ), point["date"]
+    assert report["points"][-1]["total_liabilities"] == Decimal("55.55")
 
 
 async def test_net_worth_timeseries_router(client):
@@ -0,0 +1,86 @@
+"""AC-reporting.package-document.12: readiness summary without rendering the package document."""
+
+from datetime import date, timedelta
+
+from src.config import settings
+from src.ledger import Account, AccountType
+from src.reporting import PackageAssembler, current_package_document_summary
+from src.reporting.base.types import PersonalReportingFrameworkId
+from src.reporting.extension import package_document
+from src.schemas.reporting import PersonalReportPackageDocumentLifecycle, PersonalReportPackageSnapshotStatus
+
+
+async def test_AC_reporting_package_document_12_summary_is_the_cached_readiness_fold(
+    db, test_user, monkeypatch
+) -> None:
+    """AC-reporting.package-document.12: same readiness as the preview; memoized until an input changes."""
+    user_id = test_user.id
+    today = date.today()
+    document = await PackageAssembler().assemble(
+        db,
+        user_id=user_id,
+        framework_id=PersonalReportingFrameworkId.US_GAAP_LIKE,
+        start_date=today - timedelta(days=365),
+        end_date=today,
+        as_of_date=today,
+        currency=settings.base_currency,
+    )
+
+    summary = await current_package_document_summary(db, user_id=user_id)
+    assert summary.readiness == document.readiness
+    assert summary.context == document.context
+    assert summary.package_id == document.package_id
+    assert summary.lifecycle is PersonalReportPackageDocumentLifecycle.PREVIEW
+    assert summary.status is PersonalReportPackageSnapshotStatus.DRAFT
+    # A preview never carries the durable identity of a frozen snapshot.
+    assert (summary.snapshot_id, summary.frozen_at) == (None, None)
+
+    async def no_document(*_args, **_kwargs):
+        raise AssertionError("the readiness summary must not assemble the document")
+
+    evaluations = 0
+    readiness = PackageAssembler.readiness
+
+    async def counted_readiness(self, *args, **kwargs):
+        nonlocal evaluations
+        evaluations += 1
+        return await readiness(self, *args, **kwargs)
+
+    monkeypatch.setattr(PackageAssembler, "assemble", no_document)
+    monkeypatch.setattr(PackageAssembler, "readiness", counted_readiness)
+
+    cached = await current_package_document_summary(db, user_id=user_id)
+    assert cached.model_dump(exclude={"generated_at"}) == summary.model_dump(exclude={"generated_at"})
+    # Only the readiness is memoized; every summary is stamped when it is served.
+    assert cached.generated_at > summary.generated_at
+    assert evaluations == 0
+
+    # A committed ledger write is a readiness input change.
+    db.add(Account(user_id=user_id, name="Cash", type=AccountType.ASSET, currency=settings.base_currency))
+    await db.commit()
+    refreshed = await current_package_document_summary(db, user_id=user_id)
+    assert evaluations == 1
+    assert refreshed.generated_at > summary.generated_at
+
+
+async def test_readiness_is_evaluated_per_section_without_building_the_sections(db, test_user, monkeypatch) -> None:
+    """AC-reporting.package-document.12: readiness reduces each section to its facts and skips the rest."""
+    today = date.today()
+    arguments = {
+        "user_id": test_user.id,
+        "framework_id": PersonalReportingFrameworkId.US_GAAP_LIKE,
+        "start_date": today - timedelta(days=365),
+        "end_date": today,
+        "as_of_date": today,
+        "currency": settings.base_currency,
+    }
+    document = await PackageAssembler().assemble(db, **arguments)
+
+    async def not_built(*_args, **_kwargs):
+        raise AssertionError("readiness must not build this")
+
+    monkeypatch.setattr(PackageAssembler, "_sections", not_built)
+    monkeypatch.setattr(package_document, "generate_annualized_income_schedule", not_built)
+    monkeypatch.setattr(package_document, "build_personal_report_package_traceability_payload", not_built)
+
+    assert await PackageAssembler().readiness(db, **arguments) == document.readiness
@@ -0,0 +1,99 @@
+"""AC-reporting.package-document.11: package sections run concurrently on one read snapshot."""
+
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.ledger import Account, AccountType
+from src.pricing import FxRate, get_exchange_rate
+from src.reporting.extension.package_sections import PackageSectionExecutor
+
+
+async def test_AC_reporting_package_document_11_sections_share_one_snapshot(db, db_engine, test_user) -> None:
+    """AC-reporting.package-document.11: bounded, ordered, snapshot-consistent; sequential after a write."""
+    user_id = test_user.id
+    db.add(Account(user_id=user_id, name="Cash", type=AccountType.ASSET, currency="SGD"))
+    await db.commit()
+
+    executor = await PackageSectionExecutor.open(db, max_concurrency=2)
+    assert executor.concurrent
+
+    # Committed after the export: invisible to every section.
+    other_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with other_maker() as other:
+        other.add(Account(user_id=user_id, name="Later", type=AccountType.ASSET, currency="SGD"))
+        await other.commit()
+
+    in_flight = peak = 0
+
+    async def count_accounts(session: AsyncSession) -> int:
+        nonlocal in_flight, peak
+        assert session is not db
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.05)
+            return await session.scalar(select(func.count()).select_from(Account).where(Account.user_id == user_id))
+        finally:
+            in_flight -= 1
+
+    assert await executor.gather(*(count_accounts for _ in range(4))) == (1, 1, 1, 1)
+    assert peak == 2
+
+    async def slow_failure(session: AsyncSession) -> None:
+        await asyncio.sleep(0.05)
+        raise ValueError("first")
+
+    async def fast_failure(session: AsyncSession) -> None:
+        raise ValueError("second")
+
+    with pytest.raises(ValueError, match="first"):
+        await executor.gather(slow_failure, fast_failure)
+
+    # Uncommitted writes cannot travel in a snapshot: run on the request session.
+    await db.rollback()
+    db.add(Account(user_id=user_id, name="Pending", type=AccountType.ASSET, currency="SGD"))
+    await db.flush()
+    sequential = await PackageSectionExecutor.open(db, max_concurrency=2)
+    assert not sequential.concurrent
+
+    async def on_request_session(session: AsyncSession) -> int:
+        assert session is db
+        return await session.scalar(select(func.count()).select_from(Account).where(Account.user_id == user_id))
+
+    assert await sequential.gather(on_request_session) == (3,)
+
+
+async def test_fx_rates_derived_in_sections_are_kept_on_the_request_session(db) -> None:
+    """Rates a section lazily derives outlive its rolled-back worker session, as on the sequential path."""
+    rate_date = date(2025, 6, 30)
+    db.add(FxRate(base_currency="USD", quote_currency="SGD", rate=Decimal("1.25"), rate_date=rate_date, source="test"))
+    await db.commit()
+
+    def stored_rate(base: str, quote: str):
+        return select(FxRate).where(
+            FxRate.base_currency == base, FxRate.quote_currency == quote, FxRate.rate_date == rate_date
+        )
+
+    executor = await PackageSectionExecutor.open(db, max_concurrency=2)
+    assert executor.concurrent
+
+    async def derive_inverse(session: AsyncSession) -> Decimal:
+        return await get_exchange_rate(session, "SGD", "USD", rate_date, lazy_load=True)
+
+    async def fail_after_deriving(session: AsyncSession) -> None:
+        await get_exchange_rate(session, "SGD", "USD", rate_date, lazy_load=True)
+        raise ValueError("section failed")
+
+    with pytest.raises(ValueError, match="section failed"):
+        await executor.gather(fail_after_deriving)
+    assert (await db.execute(stored_rate("SGD", "USD"))).scalar_one_or_none() is None
+
+    assert await executor.gather(derive_inverse, derive_inverse) == (Decimal("0.8"), Decimal("0.8"))
+    derived = (await db.execute(stored_rate("SGD", "USD"))).scalar_one()
+    assert derived.rate == Decimal("0.8")
+    assert derived.source == "derived:inverse:USD/SGD"
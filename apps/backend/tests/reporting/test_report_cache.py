@@ -0,0 +1,120 @@
+"""AC-reporting.report-cache: memoized statements keyed by ledger/pricing versions."""
+
+import pickle
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.audit import JournalEntrySourceType
+from src.ledger import Account, AccountType, Direction, JournalEntry, JournalEntryStatus, JournalLine
+from src.pricing.orm.market_data import FxRate
+from src.reporting import generate_balance_sheet, generate_cash_flow, generate_income_statement
+from src.reporting.extension.report_cache import (
+    FrozenDict,
+    InMemoryReportCache,
+    load_report_versions,
+    register_report_cache_backend,
+    report_cache_backend,
+)
+
+
+async def _post(db, user_id, entry_date: date, debit: Account, credit: Account, amount: str) -> None:
+    entry = JournalEntry(
+        user_id=user_id,
+        entry_date=entry_date,
+        memo=f"report cache {amount}",
+        source_type=JournalEntrySourceType.MANUAL,
+        status=JournalEntryStatus.POSTED,
+    )
+    db.add(entry)
+    await db.flush()
+    for account, direction in ((debit, Direction.DEBIT), (credit, Direction.CREDIT)):
+        db.add(
+            JournalLine(
+                journal_entry_id=entry.id,
+                account_id=account.id,
+                direction=direction,
+                amount=Decimal(amount),
+                currency="SGD",
+            )
+        )
+    await db.commit()
+
+
+async def test_AC_reporting_report_cache_1_serves_frozen_reports_until_versions_change(db, test_user) -> None:
+    """AC-reporting.report-cache.1: hits until a ledger/pricing write; results are deep-immutable."""
+    user_id = test_user.id
+    cash = Account(user_id=user_id, name="Cash", type=AccountType.ASSET, currency="SGD")
+    equity = Account(user_id=user_id, name="Owner Equity", type=AccountType.EQUITY, currency="SGD")
+    salary = Account(user_id=user_id, name="Salary", type=AccountType.INCOME, currency="SGD")
+    db.add_all([cash, equity, salary])
+    await db.commit()
+    await _post(db, user_id, date(2026, 1, 5), cash, equity, "1000.00")
+    backend = report_cache_backend()
+
+    first = await generate_balance_sheet(db, user_id, as_of_date=date(2026, 1, 31), currency="SGD")
+    again = await generate_balance_sheet(db, user_id, as_of_date=date(2026, 1, 31), currency="SGD")
+    assert again is first
+    assert backend.hits == 1
+
+    # Deep-immutable, but still a dict/list to every reader; dict() copies.
+    assert isinstance(first, FrozenDict)
+    assert first["liabilities"] == []
+    with pytest.raises(TypeError):
+        first["total_assets"] = Decimal("0")
+    with pytest.raises(TypeError):
+        first["assets"].append({})
+    with pytest.raises(TypeError):
+        first["assets"][0]["amount"] = Decimal("0")
+    copy = dict(first)
+    copy["total_assets"] = Decimal("0")
+    assert pickle.loads(pickle.dumps(first)) == first
+
+    income = await generate_income_statement(
+        db, user_id, start_date=date(2026, 1, 1), end_date=date(2026, 1, 31), currency="SGD"
+    )
+    assert (
+        await generate_income_statement(
+            db, user_id, start_date=date(2026, 1, 1), end_date=date(2026, 1, 31), currency="SGD"
+        )
+        is income
+    )
+    cash_flow = await generate_cash_flow(db, user_id, start_date=date(2026, 1, 1), end_date=date(2026, 1, 31))
+    assert await generate_cash_flow(db, user_id, start_date=date(2026, 1, 1), end_date=date(2026, 1, 31)) is cash_flow
+
+    # A committed ledger write moves only this user's ledger version.
+    ledger_version, pricing_version = await load_report_versions(db, user_id)
+    await _post(db, user_id, date(2026, 1, 20), cash, salary, "250.00")
+    assert await load_report_versions(db, user_id) != (ledger_version, pricing_version)
+    assert (await load_report_versions(db, user_id))[1] == pricing_version
+    fresh = await generate_balance_sheet(db, user_id, as_of_date=date(2026, 1, 31), currency="SGD")
+    assert fresh is not first
+    assert fresh["total_assets"] == Decimal("1250.00")
+
+    # A market-data write moves the shared pricing version.
+    ledger_version, pricing_version = await load_report_versions(db, user_id)
+    db.add(
+        FxRate(
+            base_currency="USD",
+            quote_currency="SGD",
+            rate=Decimal("1.35"),
+            rate_date=date(2026, 1, 31),
+            source="test",
+        )
+    )
+    await db.commit()
+    assert await load_report_versions(db, user_id) != (ledger_version, pricing_version)
+    assert (await load_report_versions(db, user_id))[0] == ledger_version
+    assert await generate_balance_sheet(db, user_id, as_of_date=date(2026, 1, 31), currency="SGD") is not fresh
+
+    # The in-process backend is a bounded LRU.
+    bounded = InMemoryReportCache(max_entries=1, ttl_seconds=60)
+    previous = register_report_cache_backend(bounded)
+    try:
+        await generate_balance_sheet(db, user_id, as_of_date=date(2026, 1, 10), currency="SGD")
+        await generate_balance_sheet(db, user_id, as_of_date=date(2026, 1, 31), currency="SGD")
+        assert len(bounded) == 1
+        assert bounded.evictions == 1
+    finally:
+        register_report_cache_backend(previous)
@@ -0,0 +1,84 @@
+"""AC-reporting.csv-export.2: streamed report exports in CSV, NDJSON and columnar row groups."""
+
+import csv
+import json
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+
+from src.reporting import ExportEncoding, ExportTable, balance_sheet_export_table, stream_export
+from src.reporting.extension.report_export import EXPORT_CHUNK_BYTES, EXPORT_ROW_GROUP_SIZE
+from src.routers import reports as reports_router
+
+_ASSET_LINES = 5000
+
+
+def _balance_sheet() -> dict:
+    return {
+        "as_of_date": date(2026, 1, 31),
+        "currency": "SGD",
+        "assets": [{"name": f"Cash {index}", "amount": Decimal("10.10")} for index in range(_ASSET_LINES)],
+        "liabilities": [{"name": 'Card, "Visa"', "amount": Decimal("-5.00")}],
+        "equity": [],
+        "total_assets": Decimal("50500.00"),
+        "total_liabilities": Decimal("-5.00"),
+        "total_equity": Decimal("0.00"),
+    }
+
+
+async def _chunks(encoding: ExportEncoding) -> list[bytes]:
+    return [chunk async for chunk in stream_export(balance_sheet_export_table(_balance_sheet()), encoding)]
+
+
+async def test_AC_reporting_csv_export_2_streams_bounded_chunks_in_every_encoding(client, monkeypatch) -> None:
+    """AC-reporting.csv-export.2: chunked as produced; CSV unchanged; NDJSON/columnar keep Decimal strings."""
+    report = _balance_sheet()
+    expected = StringIO()
+    writer = csv.writer(expected)
+    writer.writerow(["section", "account", "amount", "currency"])
+    for line in report["assets"]:
+        writer.writerow(["Assets", line["name"], line["amount"], "SGD"])
+    writer.writerow(["Liabilities", 'Card, "Visa"', Decimal("-5.00"), "SGD"])
+    writer.writerow(["Total Assets", "", report["total_assets"], "SGD"])
+    writer.writerow(["Total Liabilities", "", report["total_liabilities"], "SGD"])
+    writer.writerow(["Total Equity", "", report["total_equity"], "SGD"])
+
+    chunks = await _chunks(ExportEncoding.CSV)
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2 * EXPORT_CHUNK_BYTES for chunk in chunks)
+    assert b"".join(chunks).decode() == expected.getvalue()
+
+    rows = [json.loads(line) for line in b"".join(await _chunks(ExportEncoding.NDJSON)).decode().splitlines()]
+    assert len(rows) == _ASSET_LINES + 4
+    assert rows[0] == {"section": "Assets", "account": "Cash 0", "amount": "10.10", "currency": "SGD"}
+    assert rows[-3] == {"section": "Total Assets", "account": "", "amount": "50500.00", "currency": "SGD"}
+
+    groups = [json.loads(line) for line in b"".join(await _chunks(ExportEncoding.COLUMNAR)).decode().splitlines()]
+    assert groups[0]["row_count"] == EXPORT_ROW_GROUP_SIZE
+    assert sum(group["row_count"] for group in groups) == len(rows)
+    assert [amount for group in groups for amount in group["columns"]["amount"]] == [row["amount"] for row in rows]
+
+    async def fake_generate_balance_sheet(*_args, **_kwargs):
+        return report
+
+    monkeypatch.setattr(reports_router, "generate_balance_sheet", fake_generate_balance_sheet)
+    response = await client.get(
+        "/reports/export",
+        params={"report_type": "balance-sheet", "format": "columnar", "as_of_date": "2026-01-31"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-disposition"] == "attachment; filename=balance-sheet-2026-01-31.columnar.ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == groups
+
+
+@pytest.mark.parametrize("encoding", list(ExportEncoding))
+async def test_stream_export_of_an_empty_table_is_header_only(encoding: ExportEncoding) -> None:
+    async def no_rows():
+        return
+        yield
+
+    chunks = [chunk async for chunk in stream_export(ExportTable(columns=("a", "b"), rows=no_rows()), encoding)]
+    assert b"".join(chunks) == (b"a,b\r\n" if encoding is ExportEncoding.CSV else b"")
@@ -3,8 +3,9 @@
 A single user's full year of activity is low-thousands of journal lines. This
 gates (in the default CI lane) that the balance sheet, income statement, and
 cash flow still produce correct, tied-out numbers at that volume — guarding the
-income-statement Python-side aggregation against a silent O(n^2) regression — and
-keeps generation under a generous wall-clock backstop.
+income statement's SQL-side (account, currency, month, direction) aggregation
+against a silent regression back to per-line loading — and keeps generation
+under a real wall-clock budget.
 """
 
 import time
@@ -19,12 +20,12 @@ from src.reporting import generate_balance_sheet, generate_cash_flow, generate_i
 
 ENTRY_COUNT = 1000
 AMOUNT = Decimal("100.00")
-LATENCY_BUDGET_SECONDS = 30.0  # generous regression backstop, not a benchmark
+LATENCY_BUDGET_SECONDS = 5.0  # all three statements; the income statement reads 12 grouped rows
 
 
 async def test_AC5_20_year_scale_reporting_ties_out_within_budget(db: AsyncSession, test_user) -> None:
     """AC-reporting.year-scale.1: AC5.20.1: at a full year's transaction volume the three core statements
-    tie out and generate within a generous wall-clock budget."""
+    tie out and generate within a wall-clock budget."""
     user_id = test_user.id
     bank = Account(user_id=user_id, name="Bank", code="1001", type=AccountType.ASSET, currency="SGD")
     salary = Account(user_id=user_id, name="Salary", code="4001", type=AccountType.INCOME, currency="SGD")
@@ -61,6 +62,8 @@ async def test_AC5_20_year_scale_reporting_ties_out_within_budget(db: AsyncSessi
 
     expected_total = AMOUNT * ENTRY_COUNT  # 100000.00
     assert income_statement["total_income"] == expected_total
+    assert len(income_statement["trends"]) == 12
+    assert sum(trend["total_income"] for trend in income_statement["trends"]) == expected_total
     assert income_statement["net_income"] == expected_total
     assert balance_sheet["total_assets"] == expected_total
     assert balance_sheet["is_balanced"] is True
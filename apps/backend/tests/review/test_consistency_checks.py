@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import delete, event as sqlalchemy_event
 
 from src.extraction import DocumentType, UploadedDocument
 from src.extraction.orm.layer2 import AtomicTransaction, TransactionDirection
@@ -649,3 +650,59 @@ async def test_AC_consistency_checks_10_list_endpoint_rejects_unbounded_limit(cl
 
     response = await client.get("/statements/consistency-checks/list", params={"limit": 0})
     assert response.status_code == 422
+
+
+async def test_AC_consistency_checks_11_set_based_detection_with_one_idempotency_read(db, db_engine, user_id):
+    """AC-reconciliation.consistency-checks.11: grouping in SQL, one pending-check read per run."""
+
+    async def add(amount: str, direction: TransactionDirection, txn_date: date, description: str):
+        return await _add_txn(
+            db, user_id, amount=Decimal(amount), direction=direction, txn_date=txn_date, description=description
+        )
+
+    first = await add("8.00", TransactionDirection.OUT, date(2024, 5, 1), "Bakery")
+    second = await add("8.00", TransactionDirection.OUT, date(2024, 5, 2), "Bakery")
+    # Already under review, recorded with its ids in the other order.
+    db.add(
+        ConsistencyCheck(
+            user_id=user_id,
+            check_type=CheckType.DUPLICATE,
+            status=CheckStatus.PENDING,
+            related_txn_ids=sorted([str(first.id), str(second.id)], reverse=True),
+            details={},
+        )
+    )
+    # One (amount, direction, description) group spanning 10 days: never a duplicate.
+    for day in (10, 10, 11, 20):
+        await add("3.20", TransactionDirection.OUT, date(2024, 5, day), "Tram")
+    for index in range(20):
+        await add(f"{100 + index}.00", TransactionDirection.OUT, date(2024, 6, 1 + index), "To B")
+        await add(f"{100 + index}.00", TransactionDirection.IN, date(2024, 6, 1 + index), "From A")
+    await db.flush()
+
+    statements: list[str] = []
+
+    def capture_sql(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        if statement.lstrip().lower().startswith("select"):
+            statements.append(statement)
+
+    sqlalchemy_event.listen(db_engine.sync_engine, "before_cursor_execute", capture_sql)
+    try:
+        with patch(
+            "src.reconciliation.extension.consistency_checks.detect_anomalies",
+            new=AsyncMock(return_value=[]),
+        ):
+            checks = await run_all_consistency_checks(db, user_id, uuid4())
+    finally:
+        sqlalchemy_event.remove(db_engine.sync_engine, "before_cursor_execute", capture_sql)
+
+    assert [check for check in checks if check.check_type == CheckType.DUPLICATE] == []
+    assert len([check for check in checks if check.check_type == CheckType.TRANSFER_PAIR]) == 20
+    # pending-check keys, duplicate groups, transfer candidates, anomaly scan
+    assert len(statements) == 4
+
+    await db.execute(delete(ConsistencyCheck).where(ConsistencyCheck.check_type == CheckType.DUPLICATE))
+    duplicates = await detect_duplicates(db, user_id)
+    assert [check.details["count"] for check in duplicates] == [2]
+    assert duplicates[0].related_txn_ids == sorted([str(first.id), str(second.id)])
+    assert await detect_transfer_pairs(db, user_id) == []
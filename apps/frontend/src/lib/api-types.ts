@@ -669,6 +669,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/journal-entries/export": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Journal Lines
+         * @description Stream every journal line with its entry, account, FX and provenance columns.
+         */
+        get: operations["export_journal_lines_journal_entries_export_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/journal-entries/{entry_id}": {
         parameters: {
             query?: never;
@@ -1496,7 +1516,7 @@ export interface paths {
         };
         /**
          * Export Report
-         * @description Export reports in CSV format.
+         * @description Export a report as CSV, NDJSON rows or columnar NDJSON row groups, streamed as it is encoded.
          */
         get: operations["export_report_reports_export_get"];
         put?: never;
@@ -3869,12 +3889,18 @@ export interface components {
             /** Nodes */
             nodes: components["schemas"]["EvidenceLineageNode"][];
         };
+        /**
+         * ExportEncoding
+         * @description Wire encodings of a streamed export.
+         * @enum {string}
+         */
+        ExportEncoding: "csv" | "ndjson" | "columnar";
         /**
          * ExportFormat
          * @description Supported export formats.
          * @enum {string}
          */
-        ExportFormat: "csv";
+        ExportFormat: "csv" | "ndjson" | "columnar";
         /**
          * ExportReportType
          * @description Supported report types for export.
@@ -6091,6 +6117,13 @@ export interface components {
              * @description Maximum number of source transactions to consider.
              */
             limit?: number | null;
+            /**
+             * Mode
+             * @description full rescores every pending transaction; incremental rescores only those whose inputs changed since the last complete run.
+             * @default full
+             * @enum {string}
+             */
+            mode: "full" | "incremental";
             /** Statement Id */
             statement_id?: string | null;
         };
@@ -10809,6 +10842,107 @@ export interface operations {
             };
         };
     };
+    export_journal_lines_journal_entries_export_get: {
+        parameters: {
+            query?: {
+                format?: components["schemas"]["ExportEncoding"];
+                start_date?: string | null;
+                end_date?: string | null;
+                /** @description Only lines posted to these accounts */
+                account_id?: string[] | null;
+                status_filter?: components["schemas"]["JournalEntryStatus"] | null;
+                /** @description Resume after the row carrying this cursor */
+                after?: string | null;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Bad request */
+            400: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Unauthorized */
+            401: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Forbidden */
+            403: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Not found */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Conflict */
+            409: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+            /** @description Too many requests */
+            429: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+            /** @description Internal server error */
+            500: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["ErrorResponse"];
+                };
+            };
+        };
+    };
     get_journal_entry_journal_entries__entry_id__get: {
         parameters: {
             query?: never;
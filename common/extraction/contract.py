@@ -169,6 +169,9 @@ CONTRACT = PackageContract(
         # is only metrics-logged; publishing via the platform outbox is the
         # planned upgrade — package-internal, not a re-cutover) ──
         Unit(name="BalanceChainViolated", kind=Kind.DOMAIN_EVENT),
+        # Published through the platform outbox when a statement posts its
+        # entries; reconciliation's incremental matching run subscribes.
+        Unit(name="StatementPosted", kind=Kind.DOMAIN_EVENT, module="base/events.py"),
         Unit(name="DocumentSource", kind=Kind.VALUE_OBJECT, module="base/types.py"),
         Unit(
             name="ExtractedTransactionRow",
@@ -325,6 +328,7 @@ CONTRACT = PackageContract(
         "SourceProvenance",
         "SYSTEM_PROMPT",
         "Stage1Status",
+        "STATEMENT_POSTED_EVENT_TYPE",
         "StatementBalanceFact",
         "StatementIngestionConfigurationError",
         "StatementIngestionError",
@@ -336,6 +340,7 @@ CONTRACT = PackageContract(
         "ResolvedStatementContribution",
         "StatementEvidenceType",
         "StatementPostingDependencies",
+        "StatementPosted",
         "StatementPostingOutcome",
         "StatementPostingStatus",
         "StatementSourceType",
@@ -403,7 +408,7 @@ CONTRACT = PackageContract(
         "validate_balance_chain",
         "validation",
     ],
-    events=[],
+    events=["StatementPosted"],
     invariants=[
         Invariant(
             id="interface-equals-published-language",
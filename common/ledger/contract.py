@@ -64,7 +64,9 @@ collision-free as later slices add ACs without re-reading this file:
   76=reconciliation integration), each mirroring its source ``AC15.<g>`` group.
 - **group 77** — #1866 processing front-door, explicit-currency, and balance-space
   signature surgery; **group 78** is reserved for the parallel confidence-tier
-  single-owner slice; **group 79** — #1909 decision-anchored journal commands.
+  single-owner slice; **group 79** — #1909 decision-anchored journal commands;
+  **group 81** — the trigger-maintained daily-balance read model; **group 82** —
+  the streamed line-level journal export.
 
 (The aspirational ``AC-ledger.<entity>.<seq>`` form some docs advertise is not
 adopted: the live traceability regex in
@@ -158,6 +160,20 @@ CONTRACT = PackageContract(
         ),
         # data — the account-balance projection (read-model / leaf sink).
         Unit(name="AccountBalance", kind=Kind.PROJECTION, module="data/balance.py"),
+        # data — the trigger-maintained per-day cumulative totals the balance
+        # projection reads (latest row <= as_of), with its rebuild + drift check.
+        Unit(
+            name="AccountCurrencyTotals",
+            kind=Kind.PROJECTION,
+            module="data/daily_balance.py",
+        ),
+        # data — the line-level journal export: a column-only, keyset-ordered
+        # row stream over a server-side cursor, resumable by row cursor.
+        Unit(
+            name="stream_journal_lines",
+            kind=Kind.PROJECTION,
+            module="data/journal_export.py",
+        ),
         # processing — the in-transit (Processing) virtual account (#1420 slice 3b).
         # base: the account-identity value object + the transfer detection/scoring
         # policy + the TransferPair value object (all pure).
@@ -192,6 +208,7 @@ CONTRACT = PackageContract(
         Unit(name="JournalEntry", kind=Kind.AGGREGATE_ROOT),
         Unit(name="JournalLine", kind=Kind.ENTITY),
         Unit(name="JournalAuditLog", kind=Kind.ENTITY),
+        Unit(name="AccountDailyBalance", kind=Kind.ENTITY),
         Unit(name="Account", kind=Kind.AGGREGATE_ROOT),
         Unit(name="AccountType", kind=Kind.VALUE_OBJECT),
         Unit(name="JournalEntryStatus", kind=Kind.VALUE_OBJECT),
@@ -200,6 +217,8 @@ CONTRACT = PackageContract(
     implementations={"be": "apps/backend/src/ledger", "fe": None},
     interface=[
         "Account",
+        "AccountCurrencyTotals",
+        "AccountDailyBalanceDrift",
         "AccountNotFoundError",
         "AccountType",
         "AccountingError",
@@ -211,10 +230,12 @@ CONTRACT = PackageContract(
         "DecisionAnchorError",
         "Direction",
         "Entry",
+        "JOURNAL_EXPORT_COLUMNS",
         "JournalAuditLog",
         "JournalEntry",
         "JournalEntryAuthorityState",
         "JournalEntryStatus",
+        "JournalExportCursor",
         "JournalLine",
         "JournalLineContribution",
         "LedgerError",
@@ -238,6 +259,7 @@ CONTRACT = PackageContract(
         "create_transfer_out_entry",
         "derive_confidence_tier",
         "detect_transfer_pattern",
+        "find_account_daily_balance_drift",
         "find_transfer_pairs",
         "get_account_statement_coverage",
         "get_opening_balance_readiness",
@@ -248,14 +270,17 @@ CONTRACT = PackageContract(
         "ledger_trace_policy_registry",
         "list_journal_contributions",
         "list_processing_transfer_legs",
+        "load_account_currency_totals",
         "post_entry",
         "submit_anchored_journal_entry",
         "submit_manual_journal_entry",
         "validate_manual_journal_entry_for_post",
         "post_journal_entry",
         "post_opening_balance_entry",
+        "rebuild_account_daily_balances",
         "register_fx_revaluation_provider",
         "register_statement_coverage_reader",
+        "stream_journal_lines",
         "used_currencies",
         "worst_confidence_tier",
         "validate_fx_rates",
@@ -1590,6 +1615,19 @@ CONTRACT = PackageContract(
             priority="P0",
             status="done",
         ),
+        ACRecord(
+            id="AC-ledger.74.4",
+            statement=(
+                "Transfer pairing solves a max-weight assignment over every Processing "
+                "leg: it beats greedy OUT-order pairing and has no per-side entry cap."
+            ),
+            test=(
+                "apps/backend/tests/ledger/test_processing_account.py"
+                "::test_assignment_beats_greedy_and_has_no_entry_cap"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group 75: Pairing scoring functions (was EPIC-015 AC15.5.*) ──
         ACRecord(
             id="AC-ledger.75.1",
@@ -2482,6 +2520,39 @@ CONTRACT = PackageContract(
             status="done",
             proof_kind="exact",
         ),
+        # ── group 81: maintained daily-balance read model ──
+        ACRecord(
+            id="AC-ledger.81.1",
+            statement=(
+                "The per-(account, currency, day) cumulative totals stay equal to the raw "
+                "posted/reconciled line sums across post, backdated post, reconcile and "
+                "void, and the balance projections read from them; a drifted row is "
+                "reported by the consistency check and repaired by the rebuild."
+            ),
+            test=(
+                "apps/backend/tests/ledger/test_account_daily_balances.py"
+                "::test_AC_ledger_81_1_daily_balances_track_raw_line_sums"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        # ── group 82: streamed line-level journal export ──
+        ACRecord(
+            id="AC-ledger.82.1",
+            statement=(
+                "GET /journal-entries/export streams every journal line with its entry, "
+                "account, FX and provenance columns as CSV/NDJSON from a column-only "
+                "server-side cursor in (entry_date, entry id, line id) keyset order, "
+                "honours date/account/status filters, and resumes exactly after the "
+                "row whose cursor is passed as after."
+            ),
+            test=(
+                "apps/backend/tests/ledger/test_journal_export.py"
+                "::test_AC_ledger_82_1_journal_export_streams_resumable_keyset_rows"
+            ),
+            priority="P1",
+            status="done",
+        ),
     ],
     concepts=[
         ConceptRecord(
@@ -59,9 +59,14 @@ CONTRACT = PackageContract(
         "mark_fastapi_instrumentation_active",
         "record_ai_provider_call",
         "record_financial_invariant_violation",
+        "record_fx_rate_cache_eviction",
+        "record_fx_rate_cache_lookup",
         "record_http_request",
         "record_rate_limit_rejected",
+        "record_reconciliation_job",
         "record_reconciliation_match_outcome",
+        "record_report_cache_eviction",
+        "record_report_cache_lookup",
         "record_statement_parse_outcome",
         "run_with_async_parse_tracking",
         "safe_error_message",
@@ -173,6 +173,11 @@ CONTRACT = PackageContract(
             kind=Kind.DOMAIN_SERVICE,
             module="extension/performance.py",
         ),
+        Unit(
+            name="calculate_xirr_by_account",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/performance.py",
+        ),
         Unit(
             name="calculate_time_weighted_return",
             kind=Kind.DOMAIN_SERVICE,
@@ -249,6 +254,7 @@ CONTRACT = PackageContract(
         "calculate_money_weighted_return",
         "calculate_time_weighted_return",
         "calculate_xirr",
+        "calculate_xirr_by_account",
         "get_asset_class_allocation",
         "get_geography_allocation",
         "get_sector_allocation",
@@ -821,6 +827,21 @@ CONTRACT = PackageContract(
             priority="P1",
             status="done",
         ),
+        ACRecord(
+            id="AC-portfolio.performance.9",
+            statement=(
+                "XIRR, TWR and dividend yield resolve FX with one prefetch batch per call; "
+                "the XIRR root is found in float64 and accepted only by a Decimal Newton "
+                "step within tolerance; calculate_xirr_by_account computes every requested "
+                "account's XIRR in one call (None for an account without enough cash flows)."
+            ),
+            test=(
+                "apps/backend/tests/portfolio/test_performance_service.py"
+                "::test_AC_portfolio_performance_9_batched_fx_float_solver_and_per_account_xirr"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group allocation: allocation breakdowns + performance edge cases
         # (was EPIC-017 AC17.3.1-3, AC17.3.5 and AC17.3.7-14; AC17.3.4/.6
         # deduped into AC-portfolio.performance.2/.3 — same tests, same facts;
@@ -1027,6 +1048,23 @@ CONTRACT = PackageContract(
             priority="P1",
             status="done",
         ),
+        ACRecord(
+            id="AC-portfolio.valuation.6",
+            statement=(
+                "Holdings, unrealized P&L and performance valuation resolve the latest price "
+                "for every (asset_identifier, as_of) pair of a portfolio in bulk — one ranked "
+                "query per source — with the per-position precedence unchanged (MANUAL "
+                "override on the date > latest synced StockPrice on or before it > latest "
+                "AtomicPosition snapshot), so the number of SELECTs does not grow with the "
+                "number of positions."
+            ),
+            test=(
+                "apps/backend/tests/portfolio/test_portfolio_service.py"
+                "::test_AC_portfolio_valuation_6_bulk_price_resolution_keeps_precedence"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group api: portfolio HTTP surface (was EPIC-017 AC17.6.3-21,
         # migration closeout continuation, #1663 / #1717) ──
         ACRecord(
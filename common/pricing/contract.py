@@ -133,14 +133,15 @@ CONTRACT = PackageContract(
         ),
         # get_exchange_rate is a thin FX-specific wrapper: the identity rate
         # (a currency against itself) is a business rule that doesn't belong
-        # in subject-agnostic resolve(); everything else routes through the
-        # same PriceableSubject + resolve() path every other subject kind
-        # uses. #1610 P2 retired services/fx.py, making this the ONE FX
-        # lookup implementation: the lazy crawler-fallback, the fx_warnings
-        # side-channel, and average-rate windows are carried over
-        # (AC-pricing.fx.1/.3); the in-process TTL cache deliberately is NOT
-        # (PrefetchedFxRates covers the hot batch paths) — see
-        # extension/fx.py's docstring.
+        # in subject-agnostic resolve(); everything else is resolve()'s rule
+        # over the pair's crawled rows, answered by bisect from the
+        # session-scoped FxSeriesStore (AC-pricing.fx.4). #1610 P2 retired
+        # services/fx.py, making this the ONE FX lookup implementation: the
+        # lazy crawler-fallback, the fx_warnings side-channel, and
+        # average-rate windows are carried over (AC-pricing.fx.1/.3). The
+        # in-process TTL cache, first left behind, is back as the
+        # process-wide fx_rate_cache with write-through invalidation
+        # (AC-pricing.fx.5) — see extension/fx_cache.py's docstring.
         Unit(
             name="get_exchange_rate", kind=Kind.DOMAIN_SERVICE, module="extension/fx.py"
         ),
@@ -205,6 +206,11 @@ CONTRACT = PackageContract(
             kind=Kind.DOMAIN_SERVICE,
             module="extension/market_data/service.py",
         ),
+        Unit(
+            name="persist_fx_rates",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/market_data/service.py",
+        ),
         # run_market_data_scheduler/run_daily_market_data_sync: the daily
         # crawl orchestrator absorbed from services/market_data_scheduler.py
         # (#1610 P2). Scope discovery stays inverted: the composition root
@@ -378,6 +384,7 @@ CONTRACT = PackageContract(
         "ValuationService",
         "ValuationServiceError",
         "build_manual_valuation_lines",
+        "close_market_data_client",
         "convert_amount",
         "convert_money",
         "convert_to_base",
@@ -388,6 +395,7 @@ CONTRACT = PackageContract(
         "ingest_statement_price",
         "list_current_manual_valuation_facts",
         "next_market_data_sync_at",
+        "persist_fx_rates",
         "record_manual_valuation",
         "record_override",
         "pricing_trace_policy_registry",
@@ -652,6 +660,38 @@ CONTRACT = PackageContract(
             # replay with an exact-Decimal converted-value oracle.
             proof_kind="exact",
         ),
+        ACRecord(
+            id="AC-pricing.marketdata.14",
+            statement=(
+                "One FX/stock sync run reads latest and stored dates for all "
+                "scopes in one set query each, fetches provider series "
+                "concurrently under MARKET_DATA_SYNC_CONCURRENCY, and persists "
+                "each scope's missing days with a single multi-row INSERT ... "
+                "ON CONFLICT DO NOTHING; counters match the sequential sync."
+            ),
+            test=(
+                "apps/backend/tests/pricing/market_data/test_sync.py"
+                "::test_AC_pricing_marketdata_14_sync_fetches_concurrently_and_bulk_inserts"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-pricing.marketdata.15",
+            statement=(
+                "Yahoo/Stooq requests share one lifespan-closed keep-alive "
+                "client (HTTP/2 when h2 is installed) with at most "
+                "MARKET_DATA_PROVIDER_CONNECTIONS_PER_HOST requests per host; "
+                "identical in-flight requests (provider, symbol, range) share "
+                "one round trip, so concurrent FX bridge legs are fetched once."
+            ),
+            test=(
+                "apps/backend/tests/pricing/market_data/test_provider_client.py"
+                "::test_AC_pricing_marketdata_15_provider_client_pools_bounds_and_coalesces"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group manualvaluation: append-only manual valuation facts,
         # Axiom A (was EPIC-011 AC11.19, migration closeout continuation,
         # #1663 / #1710) ──
@@ -768,6 +808,37 @@ CONTRACT = PackageContract(
             priority="P1",
             status="done",
         ),
+        ACRecord(
+            id="AC-pricing.fx.4",
+            statement=(
+                "FX spot and average lookups are answered from a per-pair "
+                "sorted series (bisect + prefix sums) loaded once per "
+                "session, returning exactly what resolve() and a plain mean "
+                "over the same crawled candidates would."
+            ),
+            test=(
+                "apps/backend/tests/pricing/test_fx_series.py"
+                "::test_AC_pricing_fx_4_series_matches_resolve_and_mean"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-pricing.fx.5",
+            statement=(
+                "get_exchange_rate/get_average_rate share a process-wide "
+                "LRU + TTL cache of resolved rates that is invalidated on "
+                "every FX/override write and at the writer's commit, and "
+                "discards any fill read before an invalidation, so it never "
+                "serves a superseded rate."
+            ),
+            test=(
+                "apps/backend/tests/pricing/test_fx_cache.py"
+                "::test_AC_pricing_fx_5_cache_is_bounded_expiring_and_generation_guarded"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group providers: manual price update + provider symbol/ticker
         # handling (was EPIC-017 AC17.1.6/AC17.15/AC17.33, migration
         # closeout continuation, #1663 / #1710) ──
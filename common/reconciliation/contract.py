@@ -168,6 +168,22 @@ CONTRACT = PackageContract(
             kind=Kind.DOMAIN_SERVICE,
             module="extension/reviewed_disposition.py",
         ),
+        # Subscriber for extraction's StatementPosted outbox event: runs
+        # execute_matching in incremental mode for the statement's owner. The
+        # subscribe_incremental_matching wiring helper is called by main.py.
+        Unit(
+            name="run_incremental_matching",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/incremental.py",
+        ),
+        # Process-pool matching runner: scores the DB-free phases over picklable
+        # snapshots in worker processes, one run per user at a time, and writes
+        # the winners back in the caller's session.
+        Unit(
+            name="ReconciliationJobRunner",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/job_runner.py",
+        ),
     ],
     implementations={"be": "apps/backend/src/reconciliation", "fe": None},
     interface=[
@@ -190,6 +206,7 @@ CONTRACT = PackageContract(
         "RECONCILIATION_SEMANTIC_PROMPT",
         "ReconciliationConfig",
         "ReconciliationError",
+        "ReconciliationJobRunner",
         "ReconciliationMatch",
         "ReconciliationMatchJournalEntry",
         "ReconciliationStats",
@@ -236,6 +253,8 @@ CONTRACT = PackageContract(
         "reject_match",
         "resolve_check",
         "run_all_consistency_checks",
+        "run_incremental_matching",
+        "run_reconciliation_job",
         "score_amount",
         "score_business_logic",
         "score_date",
@@ -243,8 +262,11 @@ CONTRACT = PackageContract(
         "score_group",
         "score_single",
         "score_pattern",
+        "shutdown_reconciliation_jobs",
         "submit_reviewed_disposition",
+        "subscribe_incremental_matching",
         "sync_reconciliation_match_journal_entry_links",
+        "sync_reconciliation_match_journal_entry_links_bulk",
         "weighted_total",
     ],
     events=["WorkflowEvent.reconciliation_match_outcome"],
@@ -684,6 +706,155 @@ CONTRACT = PackageContract(
             priority="P1",
             status="done",
         ),
+        ACRecord(
+            id="AC-reconciliation.performance.3",
+            statement=(
+                "CandidateIndex.window and CandidateIndex.pruned return exactly the linear date-window "
+                "filter and prune_candidates output, in the same order, including amount ties at the "
+                "prune boundary."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_candidate_index.py"
+                "::test_pruned_matches_prune_candidates_including_ties"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.4",
+            statement=(
+                "SubsetSumEngine.combinations returns the same balanced 2- and 3-entry combinations "
+                "within the tolerance band, in the same order, as the itertools.combinations scan it "
+                "replaced."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_subset_sum.py"
+                "::test_combinations_match_itertools_oracle_in_order"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.5",
+            statement=(
+                "score_block produces the same weighted totals and score breakdowns as the scalar "
+                "score_amount/score_date/score_description/weighted_total path for every transaction- "
+                "candidate cell."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_batch_scoring.py"
+                "::test_score_block_matches_scalar_oracle"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.6",
+            statement=(
+                "DescriptionScorer.score equals score_description and DescriptionScorer.upper_bound never "
+                "falls below it, so prefiltered cells cannot hide a match."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_description_scorer.py"
+                "::test_score_matches_score_description_and_bound_holds"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.7",
+            statement=(
+                "load_pattern_history returns the accepted-match history score_pattern would query per "
+                "token, and seeds reconciliation_merchant_patterns for tokens it had not projected yet."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_pattern_history.py"
+                "::test_load_pattern_history_matches_score_pattern_and_seeds_projection"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.8",
+            statement=(
+                "execute_matching(mode='incremental') rescores only pending transactions created after "
+                "the user's watermark, near such a transaction, or near a journal entry updated after it; "
+                "a redelivered run with nothing new selects nothing."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_incremental_matching.py"
+                "::test_incremental_run_selects_only_transactions_whose_inputs_moved"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.9",
+            statement=(
+                "The reconciliation job runner scores a picklable matching snapshot in a spawned "
+                "worker process with results identical to in-process scoring."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_job_runner.py"
+                "::test_pool_scoring_matches_in_process_scoring"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.10",
+            statement=(
+                "Transfer pairing over 20,000 Processing legs finishes in under a second "
+                "and pairs every genuine transfer."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_performance.py"
+                "::test_pairing_20000_legs_is_sub_second"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.11",
+            statement=(
+                "An incremental run triggered by StatementPosted rescores that statement's pending "
+                "transactions even when the user's watermark alone would select none of them."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_incremental_matching.py"
+                "::test_statement_posted_run_rescores_the_statement_whatever_the_watermark"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.12",
+            statement=(
+                "The merchant-pattern projection keeps one entry per transaction and, after a transaction "
+                "is deleted, an accepted match is superseded, or a pending match is rejected, loads the "
+                "same history as the accepted-match query."
+            ),
+            test=(
+                "apps/backend/tests/reconciliation/test_pattern_history.py"
+                "::test_projection_matches_match_history_after_delete_supersede_and_reject"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reconciliation.performance.13",
+            statement=(
+                "Transfer pairing pairs a connected component of identical Processing legs above the "
+                "assignment cap greedily, best confidence first, without the O(k^3) assignment, and "
+                "pairs every leg once."
+            ),
+            test=(
+                "apps/backend/tests/ledger/test_processing_account.py"
+                "::test_oversized_component_pairs_greedily_without_the_assignment"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ============================= anomaly-detection (AC4.5) =============================
         ACRecord(
             id="AC-reconciliation.anomaly-detection.1",
@@ -1553,6 +1724,24 @@ CONTRACT = PackageContract(
             priority="P1",
             status="done",
         ),
+        ACRecord(
+            id="AC-reconciliation.consistency-checks.11",
+            statement=(
+                "Duplicate groups (amount, direction, 50-character description "
+                "prefix, <= 1-day spread) and transfer-pair candidates (OUT/IN "
+                "self-join on amount within the date tolerance) are found in SQL, "
+                "and run_all_consistency_checks reads the user's pending checks "
+                "once, keyed by an order-insensitive related_txn_fingerprint, so "
+                "a run issues a fixed number of statements however many groups "
+                "or candidates there are."
+            ),
+            test=(
+                "apps/backend/tests/review/test_consistency_checks.py"
+                "::test_AC_consistency_checks_11_set_based_detection_with_one_idempotency_read"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group stage2-batch (continued): reconcile-referenced-entry /
         # idempotent-retry half not yet covered by .1-.4 (was EPIC-016
         # AC16.24.4, #1821 Wave A pending-package move) ──
@@ -83,6 +83,7 @@ CONTRACT = PackageContract(
         Unit(name="NetWorthTimeSeriesPoint", kind=Kind.VALUE_OBJECT),
         Unit(name="AccountLineageLine", kind=Kind.VALUE_OBJECT),
         Unit(name="ReportSnapshot", kind=Kind.AGGREGATE_ROOT),
+        Unit(name="ReportCacheVersion", kind=Kind.ENTITY),
         # ── extension (report generation + lanes) ──
         Unit(
             name="generate_balance_sheet",
@@ -119,6 +120,16 @@ CONTRACT = PackageContract(
             kind=Kind.DOMAIN_SERVICE,
             module="extension/net_worth.py",
         ),
+        Unit(
+            name="build_net_worth_points",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/net_worth_series.py",
+        ),
+        Unit(
+            name="cached_report",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/report_cache.py",
+        ),
         Unit(
             name="get_net_worth_allocation_schedule",
             kind=Kind.DOMAIN_SERVICE,
@@ -159,6 +170,16 @@ CONTRACT = PackageContract(
             kind=Kind.DOMAIN_SERVICE,
             module="extension/package_document.py",
         ),
+        Unit(
+            name="PackageSectionExecutor",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/package_sections.py",
+        ),
+        Unit(
+            name="stream_export",
+            kind=Kind.DOMAIN_SERVICE,
+            module="extension/report_export.py",
+        ),
         Unit(
             name="ReportingReadRepository",
             kind=Kind.REPOSITORY,
@@ -181,6 +202,8 @@ CONTRACT = PackageContract(
         "PackageDocumentVersionError",
         "current_package_document_summary",
         "AnnualizedIncomeTotals",
+        "ExportEncoding",
+        "ExportTable",
         "PersonalReportingFrameworkId",
         "PolicyDimension",
         "ReportError",
@@ -202,7 +225,9 @@ CONTRACT = PackageContract(
         "_signed_amount",
         "assemble_framework_balance_sheet",
         "assemble_framework_income_statement",
+        "balance_sheet_export_table",
         "build_personal_report_package_traceability_payload",
+        "cash_flow_export_table",
         "derive_user_framework_policy_result",
         "generate_balance_sheet",
         "generate_annualized_income_schedule",
@@ -214,12 +239,13 @@ CONTRACT = PackageContract(
         "get_net_worth_allocation_schedule",
         "get_net_worth_timeseries",
         "income_bucket",
+        "income_statement_export_table",
         "is_valid_line_for_framework",
         "jsonable",
         "package_currency",
         "package_dates",
-        "package_snapshot_csv",
         "package_snapshot_document",
+        "package_snapshot_export_table",
         "package_snapshot_response",
         "package_snapshot_summary",
         # Composition-root injection ports (#1666/#1610): main.py and the
@@ -227,7 +253,11 @@ CONTRACT = PackageContract(
         # manual-valuation lines builder through these.
         "register_fx_gateway",
         "register_manual_valuation_lines_provider",
+        # Report-cache storage seam: a composition root may swap the
+        # per-process LRU for a shared backend.
+        "register_report_cache_backend",
         "resolve_line_currency",
+        "stream_export",
     ],
     events=[],
     invariants=[
@@ -1351,6 +1381,23 @@ CONTRACT = PackageContract(
             priority="P0",
             status="done",
         ),
+        ACRecord(
+            id="AC-reporting.csv-export.2",
+            statement=(
+                "Report and package snapshot exports encode their rows (account lines, "
+                "then totals) into bounded UTF-8 chunks as an async generator yields "
+                "them, without materializing the encoded document; the report itself "
+                "is built first. /reports/export also encodes the "
+                "same rows as NDJSON or as columnar NDJSON row groups with "
+                "Decimal amounts as strings."
+            ),
+            test=(
+                "apps/backend/tests/reporting/test_report_export.py"
+                "::test_AC_reporting_csv_export_2_streams_bounded_chunks_in_every_encoding"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group package-snapshot: durable package snapshot artifact (was
         # EPIC-005 AC5.19.1-3 — the frontend row AC5.19.4 stays in EPIC-005;
         # migration closeout continuation, #1663 / #1716) ──
@@ -1554,13 +1601,46 @@ CONTRACT = PackageContract(
             status="done",
             proof_kind="exact",
         ),
+        ACRecord(
+            id="AC-reporting.package-document.11",
+            statement=(
+                "PackageAssembler builds its independent sections and contribution lists "
+                "concurrently, each on its own session importing the request transaction's "
+                "snapshot, with bounded parallelism; results and the first failure follow "
+                "submission order, and a request transaction with uncommitted writes falls "
+                "back to the sequential run on the request session."
+            ),
+            test=(
+                "apps/backend/tests/reporting/test_package_sections.py"
+                "::test_AC_reporting_package_document_11_sections_share_one_snapshot"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        ACRecord(
+            id="AC-reporting.package-document.12",
+            statement=(
+                "current_package_document_summary carries the preview document's readiness "
+                "from PackageAssembler.readiness — policy, contributions, per-section invariant "
+                "facts and the manifest fold, without assembling the sections or the document — "
+                "memoized against the user's report-cache version, which statement, trace-decision, "
+                "ledger and valuation writes bump; generated_at is stamped on every call."
+            ),
+            test=(
+                "apps/backend/tests/reporting/test_package_readiness.py"
+                "::test_AC_reporting_package_document_12_summary_is_the_cached_readiness_fold"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group year-scale: year-scale reporting validation (was EPIC-005
         # AC5.20.1, migration closeout continuation, #1663 / #1716) ──
         ACRecord(
             id="AC-reporting.year-scale.1",
             statement=(
                 "At a full year's transaction volume the three statements tie out and generate "
-                "within a wall-clock backstop, guarding against a silent O(n^2) regression."
+                "within a 5s wall-clock budget; the income statement aggregates lines in SQL per "
+                "(account, currency, month, direction) instead of loading every journal line."
             ),
             # was AC5.20.1
             test=(
@@ -1967,6 +2047,39 @@ CONTRACT = PackageContract(
             priority="P1",
             status="done",
         ),
+        ACRecord(
+            id="AC-reporting.net-worth-timeseries.3",
+            statement=(
+                "The net-worth time series folds ledger deltas over the "
+                "window in one pass and overlays portfolio and manual "
+                "valuations as step functions, and every point equals "
+                "generate_balance_sheet's total assets and liabilities on "
+                "that date; daily series are capped at ten years."
+            ),
+            test=(
+                "apps/backend/tests/reporting/test_net_worth_timeseries.py"
+                "::test_AC_reporting_net_worth_timeseries_3_matches_per_point_balance_sheet"
+            ),
+            priority="P1",
+            status="done",
+        ),
+        # ── group report-cache: memoized statements keyed by data versions ──
+        ACRecord(
+            id="AC-reporting.report-cache.1",
+            statement=(
+                "generate_balance_sheet, generate_income_statement and "
+                "generate_cash_flow serve repeat calls from a bounded LRU "
+                "keyed by user, report kind, arguments and the trigger-stamped "
+                "ledger and pricing versions; any committed journal or "
+                "market-data write misses, and every result is deep-immutable."
+            ),
+            test=(
+                "apps/backend/tests/reporting/test_report_cache.py"
+                "::test_AC_reporting_report_cache_1_serves_frozen_reports_until_versions_change"
+            ),
+            priority="P1",
+            status="done",
+        ),
         # ── group portfolio-valuation-gate: brokerage portfolio value gate
         # (was EPIC-008 AC8.13.18/AC8.13.19, reporting-owned per the EPIC's own
         # migration note, #1821 Wave A pending-package move) ──